@@ -0,0 +1,56 @@
+"""
+Shared pytest fixtures of the root-level tests.
+
+raw_folder points the raw-data loaders at a temp _raw_data folder holding two tiny
+countries (USA, FRA), with the packed corpus disabled and a fresh COUNTRY_DATA_CACHE,
+so tests never read or write the real corpus.
+"""
+
+import os
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+USA = {
+    'Introduction': {'Background': {'text': 'Britain\'s American colonies broke with the mother country in 1776'}},
+    'Economy': {'Real GDP growth rate': {'text': '2.5% (2023 est.)'}},
+}
+FRA = {'Economy': {'Real GDP growth rate': {'text': '0.9% (2023 est.)'}}}
+
+
+def write_country(raw_folder: Path, iso3Code: str, data: dict) -> Path:
+    """Write `data` where get_country_file_path looks for the country under `raw_folder`."""
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import ISO3_TO_CIA
+
+    mapping = ISO3_TO_CIA[iso3Code]
+    path = raw_folder / mapping['region_folder'] / f"{mapping['cia_code']}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return path
+
+
+def rewrite_country(path: Path, data: dict) -> None:
+    """Rewrite a country file and move its mtime on, so even a same-size rewrite changes its stamp."""
+    stat = path.stat()
+    path.write_text(json.dumps(data), encoding='utf-8')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def raw_folder(tmp_path, monkeypatch):
+    from proj_004_cia.__config.config import Config
+    from proj_004_cia.a_04_iso_to_cia_code import iso3Code_to_cia_code
+
+    folder = tmp_path / '_raw_data'
+    write_country(folder, 'USA', USA)
+    write_country(folder, 'FRA', FRA)
+    monkeypatch.setattr(iso3Code_to_cia_code, 'get_raw_data_folder', lambda: str(folder))
+    monkeypatch.setattr(Config, 'COUNTRY_PACK_ENABLED', False)
+    monkeypatch.setattr(iso3Code_to_cia_code, 'COUNTRY_DATA_CACHE',
+                        iso3Code_to_cia_code.CountryDataCache(tokenize_at_load=False))
+    return folder
@@ -122,6 +122,54 @@ class Config:
     MAX_DATA_PROCESSING_WORKERS = int(
         os.getenv("MAX_DATA_PROCESSING_WORKERS", "4"))
     DATA_CACHE_TTL_SECONDS = int(os.getenv("DATA_CACHE_TTL_SECONDS", "3600"))
+    COUNTRY_DATA_CACHE_MAX_ENTRIES = int(
+        os.getenv("COUNTRY_DATA_CACHE_MAX_ENTRIES", "300"))
+    COUNTRY_DATA_CACHE_MAX_BYTES = int(
+        os.getenv("COUNTRY_DATA_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # 64MB
+    # Packed corpus (a_04_iso_to_cia_code/country_pack.py); empty path = '<_raw_data>.pack'
+    COUNTRY_PACK_ENABLED = os.getenv(
+        "COUNTRY_PACK_ENABLED", "true").lower() == "true"
+    COUNTRY_PACK_PATH = os.getenv("COUNTRY_PACK_PATH", "")
+    # On-disk CIA code index for c_00_transform_utils/_inspect_cia_property_data; empty path = '<_raw_data>.inspect_index.json'
+    INSPECT_INDEX_ENABLED = os.getenv(
+        "INSPECT_INDEX_ENABLED", "false").lower() == "true"
+    INSPECT_INDEX_PATH = os.getenv("INSPECT_INDEX_PATH", "")
+    # Parser benchmark (a_06_parser_benchmark): allowed slowdown per parser before --compare fails
+    PARSER_BENCHMARK_REGRESSION_PCT = float(
+        os.getenv("PARSER_BENCHMARK_REGRESSION_PCT", "25"))
+    # Memo size for c_00_transform_utils/parse_quantity (distinct value strings kept per process)
+    QUANTITY_PARSER_CACHE_SIZE = int(
+        os.getenv("QUANTITY_PARSER_CACHE_SIZE", "65536"))
+    # Regex instrumentation (a_06_parser_benchmark/regex_profiler.py): report defaults of its CLI
+    REGEX_PROFILE_JSON_PATH = os.getenv(
+        "REGEX_PROFILE_JSON_PATH", "regex_profile.json")
+    REGEX_PROFILE_TOP = int(os.getenv("REGEX_PROFILE_TOP", "30"))
+    # Split the markup of every raw string into HtmlTokens when a country is loaded
+    # (c_00_transform_utils/html_tokens.py); false = on the first html_tokens() lookup for that country
+    HTML_TOKENS_AT_LOAD = os.getenv(
+        "HTML_TOKENS_AT_LOAD", "true").lower() == "true"
+    # On-disk cache of return_*_data output (a_04_iso_to_cia_code/parsed_section_cache.py); off unless
+    # a batch entry point (run_all_features, z_reports) enables it or the variable is set to true;
+    # empty dir = '<_raw_data>.parsed_cache'
+    PARSED_CACHE_ENABLED = os.getenv(
+        "PARSED_CACHE_ENABLED", "false").lower() == "true"
+    PARSED_CACHE_DIR = os.getenv("PARSED_CACHE_DIR", "")
+    # Worker processes of extract_feature / extract_dict_feature / extract_string_feature when a get_* function
+    # does not pass workers= (t_nation_features_batch/country_pool.py); 1 = serial
+    FEATURE_EXTRACT_WORKERS = int(os.getenv("FEATURE_EXTRACT_WORKERS", "1"))
+    # Formats written by the feature save functions (t_nation_features_batch/feature_store.py):
+    # comma-separated 'pickle', 'json', 'py'; the .py Python-literal modules are opt-in
+    FEATURE_OUTPUT_FORMATS = os.getenv("FEATURE_OUTPUT_FORMATS", "pickle,json")
+    # Saved features kept in memory by load_feature()
+    FEATURE_LOAD_CACHE_MAX_ENTRIES = int(
+        os.getenv("FEATURE_LOAD_CACHE_MAX_ENTRIES", "256"))
+    # Disk cache of the numeric dict-feature matrix (t_nation_features_batch/feature_matrix.py);
+    # empty path = 'v_nation_features_dicts/_outputs/feature_matrix.npz'
+    FEATURE_MATRIX_CACHE_ENABLED = os.getenv(
+        "FEATURE_MATRIX_CACHE_ENABLED", "true").lower() == "true"
+    FEATURE_MATRIX_CACHE_PATH = os.getenv("FEATURE_MATRIX_CACHE_PATH", "")
+    # 'npz', or 'parquet' (written only when pyarrow is installed, npz otherwise)
+    FEATURE_MATRIX_CACHE_FORMAT = os.getenv("FEATURE_MATRIX_CACHE_FORMAT", "npz")
 
     # ═══════════════════════════════════════════════════════════════════════════════════════
     # 10. DATA SOURCE API KEYS - External data integration
@@ -0,0 +1,224 @@
+'''
+#   PURPOSE OF THIS FILE
+    >>> INDEXED, LAZILY LOADED STORE FOR THE BASE COUNTRY META DATA
+
+    base_country_meta.jsonl
+        line 1      header: {"version", "fields", "index": {iso3: [offset, length]}, "projections": {field: {iso3: value}}}
+        line 2..n   one compact JSON record per country; offsets are relative to the start of line 2
+
+    Only the header is read on first use. Records are decoded one at a time by
+    get_base_meta(iso3); the common code/name lookups are served from the
+    header's projections without touching the records at all.
+'''
+
+######################################################################################################################
+#   CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+import os
+import json
+import threading
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, Optional
+
+# ---------------------------------------------------------------------------------------------------------------------
+STORE_PATH = os.path.join(os.path.dirname(__file__), 'base_country_meta.jsonl')
+STORE_VERSION = 1
+
+# Fields copied into the header so the usual code/name lookups never decode a record
+PROJECTED_FIELDS = ('iso2Code', 'name', 'region', 'incomeLevel', 'capitalCity', 'currencyCode')
+
+######################################################################################################################
+#   STORE
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+class BaseMetaStore:
+    """
+    Read-only view of base_country_meta.jsonl.
+
+    The header is loaded on first access; every record read is a seek and a
+    single json.loads of that country's line.
+    """
+
+    def __init__(self, path: str = STORE_PATH):
+        self.path = path
+        self._header: Optional[Dict[str, Any]] = None
+        self._data_start = 0
+        self._lock = threading.Lock()
+
+    def _load_header(self) -> Dict[str, Any]:
+        header = self._header
+        if header is None:
+            with self._lock:
+                if self._header is None:
+                    with open(self.path, 'rb') as f:
+                        line = f.readline()
+                        header = json.loads(line)
+                        if header.get('version') != STORE_VERSION:
+                            raise ValueError(f"Unsupported base meta store version: {header.get('version')}")
+                        self._data_start = len(line)
+                    self._header = header
+                header = self._header
+        return header
+
+    @property
+    def index(self) -> Dict[str, Any]:
+        return self._load_header()['index']
+
+    def __contains__(self, iso3Code: str) -> bool:
+        return iso3Code in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def keys(self):
+        return self.index.keys()
+
+    def get(self, iso3Code: str) -> Optional[Dict[str, Any]]:
+        """Decode one country record, or None if the ISO3 code is unknown."""
+        entry = self.index.get(iso3Code)
+        if entry is None:
+            return None
+        offset, length = entry
+        with open(self.path, 'rb') as f:
+            f.seek(self._data_start + offset)
+            return json.loads(f.read(length))
+
+    def project(self, field: str) -> Dict[str, Any]:
+        """
+        Return {iso3: record[field]} for every country that has the field.
+
+        Projected fields come straight from the header; any other field decodes
+        every record once.
+        """
+        projections = self._load_header()['projections']
+        if field in projections:
+            return dict(projections[field])
+
+        values = {}
+        with open(self.path, 'rb') as f:
+            f.seek(self._data_start)
+            for line in f:
+                record = json.loads(line)
+                if field in record:
+                    values[record['iso3Code']] = record[field]
+        return values
+
+
+BASE_META_STORE = BaseMetaStore()
+
+
+######################################################################################################################
+#   ACCESSORS
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def get_base_meta(iso3Code: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the base meta record for an ISO3 code (a fresh dict), or None if unknown.
+
+    Examples:
+        >>> get_base_meta('USA')['iso2Code']
+        'US'
+    """
+    return BASE_META_STORE.get(iso3Code)
+
+
+def project_base_meta(field: str) -> Dict[str, Any]:
+    """Return {iso3Code: value} of a single field for every country."""
+    return BASE_META_STORE.project(field)
+
+
+def get_iso3_to_iso2() -> Dict[str, str]:
+    """Return the {iso3Code: iso2Code} mapping."""
+    return BASE_META_STORE.project('iso2Code')
+
+
+def get_iso2_to_iso3() -> Dict[str, str]:
+    """Return the {iso2Code: iso3Code} mapping (empty ISO2 codes are skipped)."""
+    return {iso2: iso3 for iso3, iso2 in get_iso3_to_iso2().items() if iso2}
+
+
+class LazyBaseMeta(Mapping):
+    """
+    Read-only mapping proxy with the shape of the old `base_country_meta` dict literal.
+
+    Records are decoded on access, so iterating keys or reading a few
+    countries never loads the whole data set.
+    """
+
+    def __init__(self, store: BaseMetaStore = BASE_META_STORE):
+        self._store = store
+
+    def __getitem__(self, iso3Code: str) -> Dict[str, Any]:
+        record = self._store.get(iso3Code)
+        if record is None:
+            raise KeyError(iso3Code)
+        return record
+
+    def __contains__(self, iso3Code: object) -> bool:
+        return iso3Code in self._store
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.keys())
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __repr__(self) -> str:
+        return f"<LazyBaseMeta {len(self)} countries from {self._store.path}>"
+
+
+######################################################################################################################
+#   BUILD
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def build_base_meta_store(base_meta: Mapping, path: str = STORE_PATH) -> int:
+    """
+    Compile a {iso3Code: record} mapping into the store file.
+
+    Returns:
+        int: Number of country records written
+    """
+    index = {}
+    projections = {field: {} for field in PROJECTED_FIELDS}
+    fields = set()
+    lines = []
+    offset = 0
+    for iso3Code, record in base_meta.items():
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+        index[iso3Code] = [offset, len(line)]
+        offset += len(line)
+        lines.append(line)
+        fields.update(record)
+        for field in PROJECTED_FIELDS:
+            if field in record:
+                projections[field][iso3Code] = record[field]
+
+    header = {
+        'version': STORE_VERSION,
+        'fields': sorted(fields),
+        'index': index,
+        'projections': projections,
+    }
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n')
+        f.writelines(lines)
+    os.replace(tmp_path, path)
+    return len(lines)
+
+
+######################################################################################################################
+#   TEST FUNCTION
+######################################################################################################################
+if __name__ == '__main__':
+    from pprint import pprint
+    # --------------------------------------------------------------------------------------------------
+    iso3Code = 'USA'  # Change to any ISO3 code: 'USA', 'FRA', 'DEU', etc.
+    # --------------------------------------------------------------------------------------------------
+    record = get_base_meta(iso3Code)
+    pprint({key: record[key] for key in ('iso3Code', 'iso2Code', 'name', 'region', 'capitalCity')})
+    print(f"{len(get_iso3_to_iso2())} iso3 -> iso2 pairs")
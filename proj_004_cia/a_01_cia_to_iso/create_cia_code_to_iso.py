@@ -17,7 +17,7 @@ import os
 import json
 # READ COUNTRY META DATA
 ###################################################################################################
-from proj_004_cia.__utils.e_Original.base_country_meta import base_country_meta
+from proj_004_cia.__utils.e_Original.base_country_meta_store import get_iso3_to_iso2
 # ---------------------------------------------------------------------------------------------------------------------
 from proj_004_cia.a_01_cia_to_iso.utils.country_name_to_code import country_name_to_code
 # ---------------------------------------------------------------------------------------------------------------------
@@ -41,25 +41,13 @@ def create_cia_code_to_iso():
     # GENERATE ISO 2 TO 3 CODES
     # ///////////////////////////////////////////////////////////////////////////////////////////////////
     # --------------------------------------------------------------------------------------------------
-    # CREATE A LIST OUT OF EVERY KEY IN THE COUNTRIES META DATA
-    ###################################################################################################
-    countryCodes = list(base_country_meta.keys())
-    # --------------------------------------------------------------------------------------------------
     # CREATE A DICTIONARY OF ISO2 AND ISO3 CODES
+    # (iso3 -> iso2 projection of the base meta store, no country records are decoded)
     ###################################################################################################
     iso3to2 = {
         'WLD': 'XX',
     }
-    # ITERATE OVER THE COUNTRY CODES
-    ###################################################################################################
-    for countryCode in countryCodes:
-        # GET THE ISO2 AND ISO3 CODES
-        ###################################################################################################
-        iso2Code = base_country_meta[countryCode]['iso2Code']
-        iso3Code = base_country_meta[countryCode]['iso3Code']
-        # ADD TO THE DICTIONARY
-        ###################################################################################################
-        iso3to2[iso3Code] = iso2Code
+    iso3to2.update(get_iso3_to_iso2())
 
     missing_iso3 = []
     # PLACE HOLDER FOR THE CIA CODE NAME
@@ -0,0 +1,89 @@
+"""
+Content hashes.
+
+The hashes the incremental stores compare to tell what went stale, shared so
+they always agree on what "the same raw section" and "the same parser code"
+mean:
+
+    parsed_section_cache   (a_04)  parsed return_*_data sections on disk
+    rebuild_manifest       (b_01)  which _data_per_country sections to re-parse
+
+Every hash is a 32-character blake2b hex digest.
+
+    hash_json(value)              the value as compact UTF-8 JSON, keys in their own order
+                                  (the raw files' order, which parsers can observe)
+    hash_source_trees(paths)      every .py file under the directories (or the .py file itself):
+                                  its path relative to proj_004_cia ('/'-separated) and its bytes,
+                                  in sorted order
+
+A section's parser code is its own c_XX package plus shared_parser_sources(): the
+transform utilities and the loaders that hand the raw data to old-style parsers.
+"""
+
+import os
+import json
+import hashlib
+from typing import Any, Iterable, List
+
+DIGEST_SIZE = 16
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Code every section parser depends on besides its own package, relative to proj_004_cia
+SHARED_PARSER_SOURCES = (
+    'c_00_transform_utils',
+    'a_04_iso_to_cia_code/iso3Code_to_cia_code.py',
+    'a_04_iso_to_cia_code/country_pack.py',
+)
+
+
+def shared_parser_sources() -> List[str]:
+    """Absolute paths of SHARED_PARSER_SOURCES."""
+    return [os.path.join(_PACKAGE_ROOT, *path.split('/')) for path in SHARED_PARSER_SOURCES]
+
+
+def new_digest():
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+def hash_bytes(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def hash_json(value: Any) -> str:
+    """Hash of a JSON value (None hashes like JSON null)."""
+    return hash_bytes(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+def _update_source_file(digest, path: str) -> None:
+    digest.update(os.path.relpath(path, _PACKAGE_ROOT).replace('\\', '/').encode('utf-8'))
+    with open(path, 'rb') as f:
+        digest.update(f.read())
+
+
+def update_source_tree(digest, directory: str) -> None:
+    """Feed every .py file under `directory` (path and content, __pycache__ skipped) into `digest`."""
+    if os.path.isfile(directory):
+        _update_source_file(digest, directory)
+        return
+    for folder, subfolders, files in os.walk(directory):
+        subfolders[:] = sorted(name for name in subfolders if name != '__pycache__')
+        for name in sorted(files):
+            if not name.endswith('.py'):
+                continue
+            _update_source_file(digest, os.path.join(folder, name))
+
+
+def hash_source_trees(directories: Iterable[str], salt: str = '') -> str:
+    """
+    Hash of the Python sources under `directories`, in the given order.
+
+    Args:
+        directories: Package directories or single .py files
+        salt: Mixed in first, e.g. a store's format version
+    """
+    digest = new_digest()
+    digest.update(salt.encode('utf-8'))
+    for directory in directories:
+        update_source_tree(digest, directory)
+    return digest.hexdigest()
@@ -0,0 +1,263 @@
+"""
+Packed CIA World Factbook corpus.
+
+Compiles every raw country JSON file under _raw_data into one packed file and
+reads it back through mmap, decoding only the sections that are asked for.
+
+Pack layout:
+    MAGIC (8 bytes) | index length (8 bytes, little-endian) | index (JSON) | section blobs
+
+The index holds, per ISO3 code, the (mtime_ns, size) stamp of the source file
+and the (offset, length) of every top-level section (Introduction, Geography,
+Economy, ...) in file order. Each section blob is the compact UTF-8 JSON of
+that section.
+
+Usage:
+    # Build (or rebuild) the pack
+    python -m proj_004_cia.a_04_iso_to_cia_code.country_pack
+
+    from proj_004_cia.a_04_iso_to_cia_code.country_pack import get_country_pack
+
+    pack = get_country_pack()            # None when no pack has been built
+    economy = pack.read_section('USA', 'Economy')
+"""
+
+import os
+import json
+import mmap
+import struct
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from proj_004_cia.__config.config import Config
+from proj_004_cia.__logger.logger import app_logger
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   FORMAT
+# ---------------------------------------------------------------------------------------------------------------------
+PACK_MAGIC = b'CIAPACK1'
+_HEADER = struct.Struct('<8sQ')
+PACK_VERSION = 1
+
+
+def get_pack_path() -> str:
+    """
+    Path of the packed corpus: Config.COUNTRY_PACK_PATH, or '<_raw_data>.pack' next to the raw folder.
+    """
+    if Config.COUNTRY_PACK_PATH:
+        return Config.COUNTRY_PACK_PATH
+
+    # Imported here: iso3Code_to_cia_code imports this module
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import get_raw_data_folder
+    return get_raw_data_folder().rstrip('\\/') + '.pack'
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   READER
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+class CountryPack:
+    """
+    Read-only, memory-mapped view of a packed corpus.
+
+    Only the index is decoded on open; section blobs are decoded on request.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, index_length = _HEADER.unpack_from(self._mm, 0)
+            if magic != PACK_MAGIC:
+                raise ValueError(f"Not a country pack: {path}")
+            index_start = _HEADER.size
+            index = json.loads(self._mm[index_start:index_start + index_length])
+            if index.get('version') != PACK_VERSION:
+                raise ValueError(f"Unsupported country pack version {index.get('version')}: {path}")
+        except Exception:
+            self.close()
+            raise
+
+        self._data_start = index_start + index_length
+        self._countries: Dict[str, Dict[str, Any]] = index['countries']
+
+    def close(self) -> None:
+        mm = getattr(self, '_mm', None)
+        if mm is not None:
+            mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __contains__(self, iso3Code: str) -> bool:
+        return iso3Code.upper() in self._countries
+
+    def __len__(self) -> int:
+        return len(self._countries)
+
+    def countries(self) -> List[str]:
+        return sorted(self._countries)
+
+    def stamp(self, iso3Code: str) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the source file when the pack was built."""
+        entry = self._countries.get(iso3Code.upper())
+        return tuple(entry['stamp']) if entry else None
+
+    def section_names(self, iso3Code: str) -> List[str]:
+        entry = self._countries.get(iso3Code.upper())
+        return [name for name, _, _ in entry['sections']] if entry else []
+
+    def _decode(self, offset: int, length: int) -> Any:
+        start = self._data_start + offset
+        return json.loads(self._mm[start:start + length])
+
+    def read_section(self, iso3Code: str, section: str, default: Any = None) -> Any:
+        """
+        Decode a single top-level section of a country.
+
+        Raises:
+            KeyError: If the country is not in the pack
+        """
+        entry = self._countries[iso3Code.upper()]
+        for name, offset, length in entry['sections']:
+            if name == section:
+                return self._decode(offset, length)
+        return default
+
+    def read_country(self, iso3Code: str) -> Dict[str, Any]:
+        """
+        Decode every section of a country, in source file order.
+
+        Raises:
+            KeyError: If the country is not in the pack
+        """
+        entry = self._countries[iso3Code.upper()]
+        return {name: self._decode(offset, length) for name, offset, length in entry['sections']}
+
+
+_PACK_LOCK = threading.Lock()
+_PACK_STATE: Dict[str, Any] = {'key': None, 'pack': None}
+
+
+def get_country_pack() -> Optional[CountryPack]:
+    """
+    Return the shared CountryPack, or None when packs are disabled or not built.
+
+    The pack is reopened when its file is rebuilt (path, mtime or size change).
+    """
+    if not Config.COUNTRY_PACK_ENABLED:
+        return None
+
+    path = get_pack_path()
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (path, stat.st_mtime_ns, stat.st_size)
+
+    with _PACK_LOCK:
+        if _PACK_STATE['key'] == key:
+            return _PACK_STATE['pack']
+
+        if _PACK_STATE['pack'] is not None:
+            _PACK_STATE['pack'].close()
+        try:
+            pack = CountryPack(path)
+        except (OSError, ValueError, struct.error) as e:
+            if app_logger:
+                app_logger.warning(f"Ignoring unreadable country pack {path}: {e}")
+            pack = None
+        _PACK_STATE['key'] = key
+        _PACK_STATE['pack'] = pack
+        return pack
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   BUILD
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def build_country_pack(output_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Compile every available raw country file into a packed corpus.
+
+    The pack is written to a temporary file and moved into place, so readers
+    never see a half-written pack.
+
+    Args:
+        output_path: Destination; defaults to get_pack_path()
+
+    Returns:
+        Dict with 'path', 'countries', 'sections', 'bytes' and 'skipped'
+    """
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import (
+        get_country_file_path, list_available_countries
+    )
+
+    output_path = output_path or get_pack_path()
+    countries: Dict[str, Dict[str, Any]] = {}
+    blobs: List[bytes] = []
+    offset = 0
+    n_sections = 0
+    skipped = []
+
+    for iso3Code in list_available_countries():
+        file_path = get_country_file_path(iso3Code)
+        try:
+            stat = os.stat(file_path)
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            skipped.append(iso3Code)
+            continue
+
+        sections = []
+        for name, value in data.items():
+            blob = json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            sections.append([name, offset, len(blob)])
+            blobs.append(blob)
+            offset += len(blob)
+        n_sections += len(sections)
+        countries[iso3Code] = {
+            'stamp': [stat.st_mtime_ns, stat.st_size],
+            'sections': sections,
+        }
+
+    index = json.dumps({'version': PACK_VERSION, 'countries': countries},
+                       separators=(',', ':')).encode('utf-8')
+
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(PACK_MAGIC, len(index)))
+        f.write(index)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, output_path)
+
+    return {
+        'path': output_path,
+        'countries': len(countries),
+        'sections': n_sections,
+        'bytes': os.path.getsize(output_path),
+        'skipped': skipped,
+    }
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   MAIN
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the packed CIA corpus from _raw_data")
+    parser.add_argument('--output', default=None, help="Pack path (default: <_raw_data>.pack)")
+    args = parser.parse_args()
+
+    stats = build_country_pack(args.output)
+    print(f"Packed {stats['countries']} countries / {stats['sections']} sections "
+          f"into {stats['path']} ({stats['bytes'] / 1024 / 1024:.1f} MB)")
+    if stats['skipped']:
+        print(f"Skipped (missing or unreadable): {', '.join(stats['skipped'])}")
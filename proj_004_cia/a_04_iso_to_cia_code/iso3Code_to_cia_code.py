@@ -4,6 +4,9 @@ ISO3 Code to CIA Code Mapping and Data Loading Utility.
 This module provides functions to:
 1. Map ISO3 codes to CIA codes and region names
 2. Load raw CIA World Factbook data by ISO3 code
+3. Cache decoded country data in a bounded, process-wide LRU
+4. Read from the packed corpus (country_pack.py) when it has been built,
+   falling back to the per-country JSON files otherwise
 
 Usage:
     from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
@@ -11,14 +14,32 @@ Usage:
     data = load_country_data('USA')  # Load United States data
     data = load_country_data('FRA')  # Load France data
     data = load_country_data('WLD')  # Load World data
+
+    # Cache management
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import COUNTRY_DATA_CACHE
+
+    COUNTRY_DATA_CACHE.warm(['USA', 'FRA'])
+    COUNTRY_DATA_CACHE.stats()  # {'hits': ..., 'misses': ..., ...}
+    COUNTRY_DATA_CACHE.clear()
+
+    # Single top-level section, without decoding the rest of the country when the pack exists
+    economy = load_country_section('USA', 'Economy')
+
+    # Markup of every raw string, split once per cached country (c_00_transform_utils.html_tokens)
+    tokens = load_country_tokens('USA')
 """
 
 import os
 import json
 import platform
-from typing import Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional, Tuple
 
+from proj_004_cia.__config.config import Config
 from proj_004_cia.a_02_cia_area_codes.utils.cia_code_names import cia_code_names
+from proj_004_cia.a_04_iso_to_cia_code.country_pack import get_country_pack
+from proj_004_cia.c_00_transform_utils.html_tokens import HtmlTokens, tokenize_country
 
 # ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 #   REGION NAME TO FOLDER MAPPING
@@ -98,23 +119,18 @@ def get_raw_data_folder() -> str:
         )
 
 
-def load_country_data(iso3Code: str) -> Dict[str, Any]:
+def get_country_file_path(iso3Code: str) -> str:
     """
-    Load CIA World Factbook raw data by ISO3 code.
+    Resolve the raw JSON file path for an ISO3 code.
 
     Args:
         iso3Code: Three-letter ISO country code (e.g., 'USA', 'FRA', 'WLD')
 
     Returns:
-        Dict containing the raw CIA data for the country
+        str: Absolute path of the country's raw JSON file
 
     Raises:
         ValueError: If ISO3 code is not found in the mapping
-        FileNotFoundError: If the JSON file doesn't exist
-
-    Examples:
-        >>> data = load_country_data('USA')
-        >>> data = load_country_data('WLD')
     """
     # Normalize to uppercase
     iso3Code = iso3Code.upper()
@@ -130,13 +146,308 @@ def load_country_data(iso3Code: str) -> Dict[str, Any]:
 
     # Build the file path
     raw_data_folder = get_raw_data_folder()
-    file_path = os.path.join(raw_data_folder, region_folder, f'{cia_code}.json')
+    return os.path.join(raw_data_folder, region_folder, f'{cia_code}.json')
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   COUNTRY DATA CACHE
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+class CountryDataCache:
+    """
+    Process-wide LRU cache of decoded country JSON.
+
+    Entries are keyed by ISO3 code and stamped with the source file's
+    (mtime_ns, size); a changed stamp invalidates the entry on the next lookup.
+    The cache is bounded both by entry count and by the total on-disk size of
+    the cached files, evicting least recently used entries first.
+
+    Cached dictionaries are shared between callers and must be treated as
+    read-only. Use ``load_country_data(iso3Code, use_cache=False)`` for a
+    private copy.
+
+    Each entry also holds the HtmlTokens of the country's strings with markup,
+    built when the country is loaded (``tokenize_at_load``) or on the first
+    ``peek_tokens`` / ``tokens`` call, and dropped with the entry.
+    """
 
-    # Load and return the data
+    def __init__(self, max_entries: int = 300, max_bytes: int = 64 * 1024 * 1024,
+                 tokenize_at_load: bool = True):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.tokenize_at_load = tokenize_at_load
+        self._entries: 'OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]' = OrderedDict()
+        self._tokens: Dict[str, Dict[str, HtmlTokens]] = {}
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def get(self, iso3Code: str) -> Dict[str, Any]:
+        """
+        Return decoded data for an ISO3 code, loading it on a miss.
+
+        Raises:
+            ValueError: If ISO3 code is not found in the mapping
+            FileNotFoundError: If the JSON file doesn't exist
+        """
+        iso3Code = iso3Code.upper()
+        file_path = get_country_file_path(iso3Code)
+        stamp = _source_stamp(iso3Code, file_path)
+
+        with self._lock:
+            entry = self._entries.get(iso3Code)
+            if entry is not None:
+                if entry[0] == stamp:
+                    self._entries.move_to_end(iso3Code)
+                    self.hits += 1
+                    return entry[1]
+                # File changed on disk since it was cached
+                self._discard(iso3Code)
+                self.invalidations += 1
+            self.misses += 1
+
+        data = _read_country(iso3Code, file_path, stamp)
+        tokens = tokenize_country(data) if self.tokenize_at_load else None
+
+        with self._lock:
+            if iso3Code in self._entries:
+                self._discard(iso3Code)
+            self._entries[iso3Code] = (stamp, data)
+            if tokens is not None:
+                self._tokens[iso3Code] = tokens
+            self._bytes += stamp[1]
+            self._evict()
+        return data
+
+    def peek(self, iso3Code: str, stamp: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """
+        Return cached data if present and still matching `stamp`, without loading on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(iso3Code)
+            if entry is None or entry[0] != stamp:
+                return None
+            self._entries.move_to_end(iso3Code)
+            self.hits += 1
+            return entry[1]
+
+    def peek_tokens(self, iso3Code: str) -> Optional[Dict[str, HtmlTokens]]:
+        """
+        {raw string: HtmlTokens} of a cached country, or None when it is not cached.
+
+        Not stamp-checked: tokens are looked up by the raw string itself, so they
+        stay correct for any text they contain.
+        """
+        iso3Code = iso3Code.upper()
+        with self._lock:
+            tokens = self._tokens.get(iso3Code)
+            if tokens is not None:
+                return tokens
+            entry = self._entries.get(iso3Code)
+        if entry is None:
+            return None
+        tokens = tokenize_country(entry[1])
+        with self._lock:
+            if self._entries.get(iso3Code) is entry:
+                tokens = self._tokens.setdefault(iso3Code, tokens)
+        return tokens
+
+    def tokens(self, iso3Code: str) -> Dict[str, HtmlTokens]:
+        """{raw string: HtmlTokens} of a country, loading it on a miss."""
+        self.get(iso3Code)
+        tokens = self.peek_tokens(iso3Code)
+        return tokens if tokens is not None else tokenize_country(self.get(iso3Code))
+
+    def warm(self, iso3_list: Optional[Iterable[str]] = None) -> int:
+        """
+        Preload country data into the cache.
+
+        Args:
+            iso3_list: ISO3 codes to load; defaults to every known country
+
+        Returns:
+            int: Number of countries successfully loaded
+        """
+        loaded = 0
+        for iso3Code in (iso3_list if iso3_list is not None else list_available_countries()):
+            try:
+                self.get(iso3Code)
+                loaded += 1
+            except (ValueError, OSError):
+                continue
+        return loaded
+
+    def clear(self) -> None:
+        """Drop every cached entry and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._tokens.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.invalidations = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current cache occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits / lookups) if lookups else 0.0,
+                'invalidations': self.invalidations,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'tokenized': len(self._tokens),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+    def __contains__(self, iso3Code: str) -> bool:
+        return iso3Code.upper() in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, iso3Code: str) -> None:
+        stamp, _ = self._entries.pop(iso3Code)
+        self._tokens.pop(iso3Code, None)
+        self._bytes -= stamp[1]
+
+    def _evict(self) -> None:
+        # Always keep the most recent entry, even if it alone exceeds max_bytes
+        while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self.evictions += 1
+
+
+def _read_country_file(file_path: str) -> Dict[str, Any]:
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
+def _source_stamp(iso3Code: str, file_path: str) -> Tuple[int, int]:
+    """
+    (mtime_ns, size) of the country's raw file; the packed stamp when only the pack is deployed.
+    """
+    try:
+        stat = os.stat(file_path)
+        return (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        pack = get_country_pack()
+        if pack is not None and iso3Code in pack:
+            return pack.stamp(iso3Code)
+        raise
+
+
+def country_source_stamp(iso3Code: str) -> Optional[Tuple[int, int]]:
+    """
+    (mtime_ns, size) the loaders key the country's raw data on, without reading it:
+    the raw file's, or the packed stamp when only the pack is deployed. None when unavailable.
+    """
+    try:
+        return _source_stamp(iso3Code, get_country_file_path(iso3Code))
+    except (ValueError, OSError):
+        return None
+
+
+def _read_country(iso3Code: str, file_path: str, stamp: Tuple[int, int]) -> Dict[str, Any]:
+    # The pack is only trusted for countries whose raw file has not changed since it was built
+    pack = get_country_pack()
+    if pack is not None and pack.stamp(iso3Code) == stamp:
+        return pack.read_country(iso3Code)
+    return _read_country_file(file_path)
+
+
+COUNTRY_DATA_CACHE = CountryDataCache(
+    max_entries=Config.COUNTRY_DATA_CACHE_MAX_ENTRIES,
+    max_bytes=Config.COUNTRY_DATA_CACHE_MAX_BYTES,
+    tokenize_at_load=Config.HTML_TOKENS_AT_LOAD,
+)
+
+
+def load_country_data(iso3Code: str, use_cache: bool = True) -> Dict[str, Any]:
+    """
+    Load CIA World Factbook raw data by ISO3 code.
+
+    Args:
+        iso3Code: Three-letter ISO country code (e.g., 'USA', 'FRA', 'WLD')
+        use_cache: Serve from COUNTRY_DATA_CACHE (shared, read-only result).
+            Pass False to read the file again and get a private copy.
+
+    Returns:
+        Dict containing the raw CIA data for the country
+
+    Raises:
+        ValueError: If ISO3 code is not found in the mapping
+        FileNotFoundError: If the JSON file doesn't exist
+
+    Examples:
+        >>> data = load_country_data('USA')
+        >>> data = load_country_data('WLD')
+    """
+    if use_cache:
+        return COUNTRY_DATA_CACHE.get(iso3Code)
+
+    iso3Code = iso3Code.upper()
+    file_path = get_country_file_path(iso3Code)
+    return _read_country(iso3Code, file_path, _source_stamp(iso3Code, file_path))
+
+
+def load_country_section(iso3Code: str, section: str, default: Any = None) -> Any:
+    """
+    Load a single top-level section (e.g. 'Economy') of a country's raw data.
+
+    Served from COUNTRY_DATA_CACHE when the country is already cached, then
+    from the packed corpus (decoding only that section), and finally from the
+    country's JSON file. The result may be shared and must be treated as read-only.
+
+    Args:
+        iso3Code: Three-letter ISO country code (e.g., 'USA', 'FRA', 'WLD')
+        section: Top-level section name (e.g., 'Introduction', 'Geography', 'Economy')
+        default: Returned when the country has no such section
+
+    Raises:
+        ValueError: If ISO3 code is not found in the mapping
+        FileNotFoundError: If neither the pack nor the JSON file has the country
+
+    Examples:
+        >>> economy = load_country_section('USA', 'Economy')
+    """
+    iso3Code = iso3Code.upper()
+    file_path = get_country_file_path(iso3Code)
+    stamp = _source_stamp(iso3Code, file_path)
+
+    cached = COUNTRY_DATA_CACHE.peek(iso3Code, stamp)
+    if cached is not None:
+        return cached.get(section, default)
+
+    pack = get_country_pack()
+    if pack is not None and pack.stamp(iso3Code) == stamp:
+        return pack.read_section(iso3Code, section, default)
+
+    return load_country_data(iso3Code).get(section, default)
+
+
+def load_country_tokens(iso3Code: str) -> Dict[str, HtmlTokens]:
+    """
+    HtmlTokens of every raw string with markup of a country, keyed by the raw string.
+
+    Served from COUNTRY_DATA_CACHE (loading the country on a miss). Parsers normally go through
+    c_00_transform_utils.html_tokens.html_tokens(text, iso3Code), which falls back to tokenizing
+    the text when the country is not cached.
+
+    Examples:
+        >>> tokens = load_country_tokens('FRA')
+    """
+    return COUNTRY_DATA_CACHE.tokens(iso3Code)
+
+
 def get_country_info(iso3Code: str) -> Optional[Dict[str, str]]:
     """
     Get country info (CIA code, region, name) by ISO3 code without loading data.
@@ -193,3 +504,5 @@ if __name__ == '__main__':
             print(f"\n{code} loaded successfully. Sections: {sections[:5]}...")
         except Exception as e:
             print(f"\n{code}: ERROR - {e}")
+
+    print(f"\nCache stats: {COUNTRY_DATA_CACHE.stats()}")
@@ -0,0 +1,56 @@
+"""
+Lock file.
+
+Cross-process mutual exclusion for the on-disk stores that several runs can
+update at once (the parsed-section cache index, the feature manifests): the
+lock is held while a file created with O_EXCL exists. A lock file older than
+stale_seconds is left over from a crashed run and is removed.
+
+Usage:
+    from proj_004_cia.a_04_iso_to_cia_code.lock_file import LockFile
+
+    with LockFile(os.path.join(directory, 'index.lock')):
+        ...  # read, merge and rewrite the index
+"""
+
+import os
+import time
+
+DEFAULT_STALE_SECONDS = 60.0
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+
+class LockFile:
+    """Holds `path` for the duration of a with block; not re-entrant, also excludes other threads."""
+
+    def __init__(self, path: str, timeout: float = DEFAULT_TIMEOUT_SECONDS,
+                 stale_seconds: float = DEFAULT_STALE_SECONDS):
+        self.path = path
+        self.timeout = timeout
+        self.stale_seconds = stale_seconds
+
+    def __repr__(self) -> str:
+        return f"LockFile({self.path!r})"
+
+    def __enter__(self) -> 'LockFile':
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_seconds:
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Lock file still held after {self.timeout:g}s: {self.path}")
+                time.sleep(0.01)
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,608 @@
+"""
+Parsed-section cache.
+
+Keeps the output of the return_*_data section parsers on disk, so a second
+feature extractor or z_reports run reads the parsed sections instead of
+parsing the corpus again.
+
+Entries are keyed by (ISO3 code, section) and are only served while both of
+their hashes (content_hash, shared with b_01_extract.rebuild_manifest) still match:
+
+    raw hash     blake2b of the section's raw subtree as compact UTF-8 JSON
+                 (the same bytes country_pack stores for it)
+    parser hash  blake2b of every .py file of the section's c_XX package and of
+                 content_hash.SHARED_PARSER_SOURCES (c_00_transform_utils and the
+                 raw-data loaders), the cache version and the Python version
+
+so editing a country file or any parser code turns the affected entries into
+misses, which are re-parsed and written again.
+
+The cache is off by default (Config.PARSED_CACHE_ENABLED); the batch entry
+points (run_all_features, z_reports) call enable_parsed_section_cache(), and an
+explicit PARSED_CACHE_ENABLED=false still wins over them.
+
+Cache directory layout:
+    index.json                  {'version', 'generation', 'entries': {'ISO|Section': entry}}
+    sections-<generation>.bin   pickled parsed sections, back to back
+
+where entry is [raw_hash, parser_hash, offset, length, crc32, created]. New
+values are buffered in memory and appended by flush() (also run at exit);
+the index is rewritten through a temporary file while holding a lock file,
+so concurrent runs never interleave writes. Overwritten and stale blobs stay
+in the data file until prune / compact rewrite it under a new generation.
+
+Usage:
+    python -m proj_004_cia.a_04_iso_to_cia_code.parsed_section_cache inspect
+    python -m proj_004_cia.a_04_iso_to_cia_code.parsed_section_cache prune --check-raw
+    python -m proj_004_cia.a_04_iso_to_cia_code.parsed_section_cache invalidate --sections Economy
+    python -m proj_004_cia.a_04_iso_to_cia_code.parsed_section_cache invalidate --all
+
+    from proj_004_cia.a_04_iso_to_cia_code.parsed_section_cache import cached_parse, country_parser
+
+    economy = cached_parse('Economy', return_economy_data, 'USA')
+    parse = country_parser(return_economy_data)        # iso3Code -> parsed, section looked up from the parser
+    economy = parse('USA')
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import atexit
+import pickle
+import threading
+import functools
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from proj_004_cia.__config.config import Config
+from proj_004_cia.__logger.logger import app_logger
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import (
+    get_raw_data_folder, load_country_data, load_country_section
+)
+from proj_004_cia.a_04_iso_to_cia_code.content_hash import hash_json, hash_source_trees, shared_parser_sources
+from proj_004_cia.a_04_iso_to_cia_code.lock_file import LockFile
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   FORMAT
+# ---------------------------------------------------------------------------------------------------------------------
+CACHE_VERSION = 1
+INDEX_NAME = 'index.json'
+LOCK_NAME = 'index.lock'
+_DATA_PREFIX = 'sections-'
+_DATA_SUFFIX = '.bin'
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# Entry fields
+_RAW_HASH, _PARSER_HASH, _OFFSET, _LENGTH, _CRC, _CREATED = range(6)
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def get_cache_dir() -> str:
+    """
+    Directory of the cache: Config.PARSED_CACHE_DIR, or '<_raw_data>.parsed_cache' next to the raw folder.
+    """
+    if Config.PARSED_CACHE_DIR:
+        return Config.PARSED_CACHE_DIR
+
+    return get_raw_data_folder().rstrip('\\/') + '.parsed_cache'
+
+
+def entry_key(iso3Code: str, section: str) -> str:
+    return f"{iso3Code.upper()}|{section}"
+
+
+def split_key(key: str) -> Tuple[str, str]:
+    iso3Code, _, section = key.partition('|')
+    return iso3Code, section
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   HASHES
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def hash_raw_section(value: Any) -> str:
+    """Hash of a raw section subtree (None for a missing section hashes like JSON null)."""
+    return hash_json(value)
+
+
+_PARSER_HASHES: Dict[str, str] = {}
+
+
+def parser_source_dirs(section: str) -> List[str]:
+    """
+    Package directories (and loader files) whose code can change a section's parsed output.
+
+    Raises:
+        KeyError: If no return_*_data parser is registered for the section
+    """
+    # Imported here: the section -> return_*_data map lives in z_reports, above this package
+    from proj_004_cia.z_reports.category_sections import get_return_module
+
+    module_name = get_return_module(section)
+    if module_name is None:
+        raise KeyError(f"No parser registered for section: {section}")
+    return [os.path.join(_PACKAGE_ROOT, module_name.split('.')[1])] + shared_parser_sources()
+
+
+def parser_version(section: str) -> str:
+    """
+    Hash of the parser code behind a section, computed once per process.
+
+    Raises:
+        KeyError: If no return_*_data parser is registered for the section
+    """
+    version = _PARSER_HASHES.get(section)
+    if version is not None:
+        return version
+
+    salt = f"{CACHE_VERSION}|{sys.version_info[0]}.{sys.version_info[1]}|{_PICKLE_PROTOCOL}"
+    version = _PARSER_HASHES[section] = hash_source_trees(parser_source_dirs(section), salt)
+    return version
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   CACHE
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+class ParsedSectionCache:
+    """
+    On-disk store of parsed sections.
+
+    The index is read on first use; get() serves entries from that snapshot and
+    from the values put() in this process, flush() merges the new values into
+    the index on disk.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._index: Optional[Dict[str, Any]] = None
+        self._pending: Dict[str, Tuple[str, str, bytes]] = {}
+        self._reader = None
+        self._reader_generation: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"ParsedSectionCache({self.directory!r})"
+
+    # ---- files ------------------------------------------------------------------------------------------------------
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.directory, INDEX_NAME)
+
+    def data_path(self, generation: str) -> str:
+        return os.path.join(self.directory, f"{_DATA_PREFIX}{generation}{_DATA_SUFFIX}")
+
+    def _lock_file(self) -> LockFile:
+        os.makedirs(self.directory, exist_ok=True)
+        return LockFile(os.path.join(self.directory, LOCK_NAME))
+
+    def _read_index_file(self) -> Dict[str, Any]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == CACHE_VERSION and isinstance(index.get('entries'), dict):
+                return index
+        except (OSError, ValueError):
+            pass
+        return {'version': CACHE_VERSION, 'generation': os.urandom(4).hex(), 'entries': {}}
+
+    def _write_index_file(self, index: Dict[str, Any]) -> None:
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(',', ':'))
+        os.replace(tmp_path, self.index_path)
+
+    def _set_index(self, index: Dict[str, Any]) -> None:
+        if self._reader is not None and self._reader_generation != index['generation']:
+            self._close_reader()
+        self._index = index
+
+    def _entries(self) -> Dict[str, List]:
+        if self._index is None:
+            self._set_index(self._read_index_file())
+        return self._index['entries']
+
+    def _close_reader(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+            self._reader_generation = None
+
+    def _read_blob(self, entry: List) -> Optional[bytes]:
+        generation = self._index['generation']
+        try:
+            if self._reader is None:
+                self._reader = open(self.data_path(generation), 'rb')
+                self._reader_generation = generation
+            self._reader.seek(entry[_OFFSET])
+            blob = self._reader.read(entry[_LENGTH])
+        except OSError:
+            return None
+        if len(blob) != entry[_LENGTH] or zlib.crc32(blob) != entry[_CRC]:
+            return None
+        return blob
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_reader()
+
+    # ---- lookups ----------------------------------------------------------------------------------------------------
+
+    def get(self, iso3Code: str, section: str, raw_hash: str, parser_hash: str) -> Tuple[bool, Any]:
+        """
+        Cached value of a section.
+
+        Returns:
+            (True, value) on a hit; (False, None) when the entry is missing, stale or unreadable
+        """
+        key = entry_key(iso3Code, section)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None and pending[0] == raw_hash and pending[1] == parser_hash:
+                blob = pending[2]
+            else:
+                entry = self._entries().get(key)
+                if entry is None or entry[_RAW_HASH] != raw_hash or entry[_PARSER_HASH] != parser_hash:
+                    blob = None
+                else:
+                    blob = self._read_blob(entry)
+            if blob is None:
+                self.misses += 1
+                return False, None
+        try:
+            value = pickle.loads(blob)
+        except Exception:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, value
+
+    def put(self, iso3Code: str, section: str, raw_hash: str, parser_hash: str, value: Any) -> bool:
+        """
+        Buffer a parsed section until the next flush().
+
+        Returns:
+            False if the value cannot be pickled (it is then simply not cached)
+        """
+        try:
+            blob = pickle.dumps(value, protocol=_PICKLE_PROTOCOL)
+        except Exception:
+            return False
+        with self._lock:
+            self._pending[entry_key(iso3Code, section)] = (raw_hash, parser_hash, blob)
+        return True
+
+    def flush(self) -> int:
+        """
+        Append the buffered values to the data file and merge them into the index on disk.
+
+        Returns:
+            Number of entries written
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            with self._lock_file():
+                # Re-read under the lock: other runs may have added entries or compacted meanwhile
+                index = self._read_index_file()
+                created = int(time.time())
+                with open(self.data_path(index['generation']), 'ab') as f:
+                    offset = f.seek(0, os.SEEK_END)
+                    for key, (raw_hash, parser_hash, blob) in self._pending.items():
+                        f.write(blob)
+                        index['entries'][key] = [raw_hash, parser_hash, offset, len(blob),
+                                                 zlib.crc32(blob), created]
+                        offset += len(blob)
+                self._write_index_file(index)
+            written = len(self._pending)
+            self._pending.clear()
+            self._set_index(index)
+            return written
+
+    # ---- maintenance ------------------------------------------------------------------------------------------------
+
+    def entries(self) -> Dict[str, List]:
+        """{'ISO|Section': [raw_hash, parser_hash, offset, length, crc32, created]} as on disk."""
+        with self._lock:
+            self._set_index(self._read_index_file())
+            return dict(self._index['entries'])
+
+    def _rewrite(self, select: Callable[[str, List], bool]) -> Dict[str, int]:
+        """Keep only the entries `select` accepts, writing their blobs to a new generation."""
+        with self._lock:
+            self.flush()
+            with self._lock_file():
+                index = self._read_index_file()
+                old_path = self.data_path(index['generation'])
+                bytes_before = self.data_bytes()
+                kept = {key: entry for key, entry in index['entries'].items() if select(key, entry)}
+                if not os.path.exists(old_path):
+                    kept = {}
+
+                generation = os.urandom(4).hex()
+                new_index = {'version': CACHE_VERSION, 'generation': generation, 'entries': {}}
+                offset = 0
+                with open(self.data_path(generation), 'wb') as out:
+                    if kept:
+                        with open(old_path, 'rb') as f:
+                            for key, entry in sorted(kept.items(), key=lambda item: item[1][_OFFSET]):
+                                f.seek(entry[_OFFSET])
+                                blob = f.read(entry[_LENGTH])
+                                if len(blob) != entry[_LENGTH] or zlib.crc32(blob) != entry[_CRC]:
+                                    continue
+                                out.write(blob)
+                                new_index['entries'][key] = [entry[_RAW_HASH], entry[_PARSER_HASH], offset,
+                                                             entry[_LENGTH], entry[_CRC], entry[_CREATED]]
+                                offset += entry[_LENGTH]
+                self._write_index_file(new_index)
+                self._close_reader()
+                self._set_index(new_index)
+                self._remove_old_generations(generation)
+            return {
+                'entries_before': len(index['entries']),
+                'entries_after': len(new_index['entries']),
+                'bytes_before': bytes_before,
+                'bytes_after': self.data_bytes(),
+            }
+
+    def _remove_old_generations(self, generation: str) -> None:
+        for name in os.listdir(self.directory):
+            if (name.startswith(_DATA_PREFIX) and name.endswith(_DATA_SUFFIX)
+                    and name != os.path.basename(self.data_path(generation))):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    # Still open in another process (Windows); the next compaction removes it
+                    pass
+
+    def data_bytes(self) -> int:
+        """Size of every data file in the directory."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return 0
+        return sum(os.path.getsize(os.path.join(self.directory, name)) for name in names
+                   if name.startswith(_DATA_PREFIX) and name.endswith(_DATA_SUFFIX))
+
+    def compact(self) -> Dict[str, int]:
+        """Drop overwritten blobs by rewriting the live entries into a new data file."""
+        return self._rewrite(lambda key, entry: True)
+
+    def invalidate(self, countries: Optional[Iterable[str]] = None,
+                   sections: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Remove the entries of the given countries and / or sections (None = any); both None clears the cache.
+        """
+        countries = {code.upper() for code in countries} if countries else None
+        sections = set(sections) if sections else None
+        with self._lock:
+            for key in list(self._pending):
+                iso3Code, section = split_key(key)
+                if (countries is None or iso3Code in countries) and (sections is None or section in sections):
+                    del self._pending[key]
+
+        def keep(key: str, entry: List) -> bool:
+            iso3Code, section = split_key(key)
+            return not ((countries is None or iso3Code in countries) and (sections is None or section in sections))
+
+        return self._rewrite(keep)
+
+    def prune(self, check_raw: bool = False) -> Dict[str, int]:
+        """
+        Remove the entries no run can hit any more, then compact.
+
+        Entries of unknown sections and entries whose parser hash differs from the current
+        code are always removed; with check_raw, so are entries whose raw hash differs from
+        the current corpus (or whose country is no longer available).
+        """
+        current_raw: Dict[str, Optional[str]] = {}
+        if check_raw:
+            current_raw = current_raw_hashes(split_key(key) for key in self.entries())
+
+        def keep(key: str, entry: List) -> bool:
+            _, section = split_key(key)
+            try:
+                if entry[_PARSER_HASH] != parser_version(section):
+                    return False
+            except KeyError:
+                return False
+            return not check_raw or current_raw.get(key) == entry[_RAW_HASH]
+
+        return self._rewrite(keep)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry counts per section (fresh = parser hash matches the current code), sizes and this process's hits."""
+        sections: Dict[str, Dict[str, int]] = {}
+        live_bytes = 0
+        for key, entry in self.entries().items():
+            _, section = split_key(key)
+            row = sections.setdefault(section, {'entries': 0, 'fresh': 0, 'bytes': 0})
+            row['entries'] += 1
+            row['bytes'] += entry[_LENGTH]
+            live_bytes += entry[_LENGTH]
+            try:
+                row['fresh'] += entry[_PARSER_HASH] == parser_version(section)
+            except KeyError:
+                pass
+        return {
+            'directory': self.directory,
+            'generation': self._index['generation'],
+            'entries': sum(row['entries'] for row in sections.values()),
+            'live_bytes': live_bytes,
+            'data_bytes': self.data_bytes(),
+            'sections': dict(sorted(sections.items())),
+            'hits': self.hits,
+            'misses': self.misses,
+            'pending': len(self._pending),
+        }
+
+
+def current_raw_hashes(keys: Iterable[Tuple[str, str]]) -> Dict[str, Optional[str]]:
+    """{'ISO|Section': raw hash in the current corpus, or None when the country cannot be loaded}."""
+    hashes: Dict[str, Optional[str]] = {}
+    for iso3Code, section in keys:
+        try:
+            hashes[entry_key(iso3Code, section)] = hash_raw_section(load_country_section(iso3Code, section))
+        except (ValueError, OSError, KeyError):
+            hashes[entry_key(iso3Code, section)] = None
+    return hashes
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   SHARED CACHE
+# ---------------------------------------------------------------------------------------------------------------------
+
+_CACHE_LOCK = threading.Lock()
+_CACHE_STATE: Dict[str, Any] = {'directory': None, 'cache': None, 'atexit': False}
+
+
+def get_parsed_section_cache() -> Optional[ParsedSectionCache]:
+    """Return the shared cache, or None when Config.PARSED_CACHE_ENABLED is off."""
+    if not Config.PARSED_CACHE_ENABLED:
+        return None
+
+    directory = get_cache_dir()
+    with _CACHE_LOCK:
+        cache = _CACHE_STATE['cache']
+        if cache is not None and _CACHE_STATE['directory'] == directory:
+            return cache
+        if cache is not None:
+            cache.flush()
+            cache.close()
+        cache = _CACHE_STATE['cache'] = ParsedSectionCache(directory)
+        _CACHE_STATE['directory'] = directory
+        if not _CACHE_STATE['atexit']:
+            atexit.register(flush_parsed_section_cache)
+            _CACHE_STATE['atexit'] = True
+        return cache
+
+
+def enable_parsed_section_cache() -> bool:
+    """
+    Turn the shared cache on for this process and the worker processes it starts.
+
+    Leaves it off when PARSED_CACHE_ENABLED is set in the environment to anything but true.
+
+    Returns:
+        Whether the cache is enabled
+    """
+    if os.getenv('PARSED_CACHE_ENABLED') is None:
+        Config.PARSED_CACHE_ENABLED = True
+        # Spawned workers build Config from the environment again
+        os.environ['PARSED_CACHE_ENABLED'] = 'true'
+    return Config.PARSED_CACHE_ENABLED
+
+
+def flush_parsed_section_cache() -> int:
+    """Write the shared cache's buffered values (0 when there is none)."""
+    cache = _CACHE_STATE['cache']
+    if cache is None:
+        return 0
+    try:
+        return cache.flush()
+    except (OSError, TimeoutError) as e:
+        if app_logger:
+            app_logger.warning(f"Parsed-section cache not written ({cache.directory}): {e}")
+        return 0
+
+
+def cached_parse(section: str, parser_func: Callable, iso3Code: str, data: Optional[dict] = None) -> Any:
+    """
+    parser_func(data, iso3Code), served from the cache while the raw section and the parser code are unchanged.
+
+    Args:
+        section: Top-level raw section the parser reads (e.g. 'Economy')
+        parser_func: The section's return_*_data function (or its LazyParser)
+        iso3Code: ISO3 code of the country
+        data: The country's raw data; None = look the entry up with load_country_section and
+              load the whole country only on a miss
+
+    Raises:
+        ValueError / FileNotFoundError: As load_country_data, when the country cannot be loaded
+    """
+    cache = get_parsed_section_cache()
+    try:
+        parser_hash = parser_version(section) if cache is not None else None
+    except KeyError:
+        parser_hash = None
+    if parser_hash is None:
+        return parser_func(load_country_data(iso3Code) if data is None else data, iso3Code)
+
+    raw = load_country_section(iso3Code, section) if data is None else data.get(section)
+    raw_hash = hash_raw_section(raw)
+    hit, value = cache.get(iso3Code, section, raw_hash, parser_hash)
+    if hit:
+        return value
+    if data is None:
+        data = load_country_data(iso3Code)
+    value = parser_func(data, iso3Code)
+    cache.put(iso3Code, section, raw_hash, parser_hash, value)
+    return value
+
+
+def country_parser(parser_func: Callable) -> Callable[[str], Any]:
+    """
+    iso3Code -> parser_func(load_country_data(iso3Code), iso3Code).
+
+    When parser_func is a return_*_data function (or its LazyParser) the result goes through
+    cached_parse, so a hit only decodes the one raw section it hashes.
+
+    Examples:
+        >>> from proj_004_cia.c_06_economy.return_economy_data import return_economy_data
+        >>> parse = country_parser(return_economy_data)
+        >>> economy = parse('USA')
+    """
+    # Imported here: the section -> return_*_data map lives in z_reports, above this package
+    from proj_004_cia.z_reports.category_sections import category_of_parser
+
+    section = category_of_parser(parser_func)
+    if section is None:
+        return lambda iso3Code: parser_func(load_country_data(iso3Code), iso3Code)
+    return functools.partial(cached_parse, section, parser_func)
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   MAIN
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect, prune or invalidate the parsed-section cache")
+    parser.add_argument('--dir', default=None, help="cache directory (default: <_raw_data>.parsed_cache)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('inspect', help="entries per section, sizes and staleness")
+    prune_parser = commands.add_parser('prune', help="remove stale entries and compact the data file")
+    prune_parser.add_argument('--check-raw', action='store_true',
+                              help="also remove entries whose raw section changed (loads every cached country)")
+    invalidate_parser = commands.add_parser('invalidate', help="remove entries by country and / or section")
+    invalidate_parser.add_argument('--countries', nargs='*', default=None, help="ISO3 codes")
+    invalidate_parser.add_argument('--sections', nargs='*', default=None, help="section names, e.g. Economy")
+    invalidate_parser.add_argument('--all', action='store_true', help="remove every entry")
+    args = parser.parse_args()
+
+    cache = ParsedSectionCache(args.dir or get_cache_dir())
+    if args.command == 'inspect':
+        stats = cache.stats()
+        print(f"{stats['directory']}  (generation {stats['generation']})")
+        print(f"{stats['entries']:,} entries, {stats['live_bytes'] / 1024 / 1024:.1f} MB live "
+              f"/ {stats['data_bytes'] / 1024 / 1024:.1f} MB on disk")
+        print(f"{'section':<24}{'entries':>9}{'fresh':>9}{'stale':>9}{'MB':>9}")
+        for section, row in stats['sections'].items():
+            print(f"{section:<24}{row['entries']:>9}{row['fresh']:>9}{row['entries'] - row['fresh']:>9}"
+                  f"{row['bytes'] / 1024 / 1024:>9.2f}")
+    else:
+        if args.command == 'prune':
+            result = cache.prune(check_raw=args.check_raw)
+        else:
+            if not (args.all or args.countries or args.sections):
+                parser.error("invalidate needs --countries, --sections or --all")
+            result = cache.invalidate(None if args.all else args.countries, None if args.all else args.sections)
+        print(f"{result['entries_before']:,} -> {result['entries_after']:,} entries, "
+              f"{result['bytes_before'] / 1024 / 1024:.1f} -> {result['bytes_after'] / 1024 / 1024:.1f} MB")
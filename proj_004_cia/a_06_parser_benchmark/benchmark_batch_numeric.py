@@ -0,0 +1,117 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Check and time c_00_transform_utils.batch_numeric against the scalar functions it batches.
+
+Every string of the raw corpus is run through extract_numeric_value / parse_percentage_data
+one at a time and through extract_numeric_values / parse_percentage_values in one call.
+The per-element results are compared for every option combination, then both ways are timed.
+Both paths run the same per-string tokenizer, so expect the batch calls to be on par (numeric)
+to about x1.2 (percentages); the batch API is for building columns, not for speed.
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_batch_numeric
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_batch_numeric --repeat 5
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import sys
+import math
+from typing import Any, Dict, List
+from proj_004_cia.__logger.logger import app_logger
+from proj_004_cia.a_06_parser_benchmark.benchmark_clean_text import load_corpus_strings, _best_time
+from proj_004_cia.c_00_transform_utils.extract_numeric_value import extract_numeric_value
+from proj_004_cia.c_00_transform_utils.parse_percentage_data import parse_percentage_data
+from proj_004_cia.c_00_transform_utils.batch_numeric import (
+    extract_numeric_values, parse_percentage_values, STATUS_PARSED, STATUS_BARE_NUMBER
+)
+
+#######################################################################################################################
+# ELEMENT-WISE COMPARISON
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _same_float(a: Any, b: float) -> bool:
+    if a is None:
+        return math.isnan(b)
+    return float(a) == b
+
+
+def numeric_mismatches(texts: List[Any], unit: str = None, allow_ranges: bool = True) -> List[str]:
+    columns = extract_numeric_values(texts, unit=unit, allow_ranges=allow_ranges)
+    mismatches = []
+    for i, text in enumerate(texts):
+        expected = extract_numeric_value(text, unit=unit, allow_ranges=allow_ranges)
+        if not _same_float(expected, columns['value'][i]):
+            mismatches.append(f"extract_numeric_value({text!r}) = {expected!r}, batch {columns['value'][i]!r}")
+    return mismatches
+
+
+def percentage_mismatches(texts: List[Any], return_decimal: bool = True, extract_year: bool = True) -> List[str]:
+    columns = parse_percentage_values(texts, return_decimal=return_decimal, extract_year=extract_year)
+    mismatches = []
+    for i, text in enumerate(texts):
+        expected = parse_percentage_data(text, return_decimal=return_decimal, extract_year=extract_year)
+        rebuilt: Dict[str, Any] = {}
+        if columns['status'][i] in (STATUS_PARSED, STATUS_BARE_NUMBER):
+            rebuilt['value'] = float(columns['value'][i])
+            if return_decimal:
+                rebuilt['percentage'] = float(columns['percentage'][i])
+            if columns['year'][i]:
+                rebuilt['year'] = int(columns['year'][i])
+            rebuilt['is_estimate'] = bool(columns['is_estimate'][i])
+            rebuilt['original_text'] = text
+            if columns['period'][i]:
+                rebuilt['period'] = columns['period'][i]
+        if rebuilt != expected:
+            mismatches.append(f"parse_percentage_data({text!r}) = {expected!r}, batch {rebuilt!r}")
+    return mismatches
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check and benchmark the batch numeric extractors")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per variant, fastest kept")
+    args = parser.parse_args()
+
+    strings: List[Any] = load_corpus_strings()
+    strings += [None, '', '   ', 5, 'NA', 'Negligible', '..%', '1.2.3 percent', 'between 5 and 9 kg',
+                '10 to 20-30', '1,000-2,000', '0000% (0000)']
+    print(f"{len(strings):,} corpus strings")
+
+    # The scalar functions log every miss; silence them while comparing and timing
+    app_logger.disabled = True
+    try:
+        mismatches = []
+        for allow_ranges in (True, False):
+            mismatches += numeric_mismatches(strings, allow_ranges=allow_ranges)
+        mismatches += numeric_mismatches(strings, unit='km')
+        for return_decimal in (True, False):
+            for extract_year in (True, False):
+                mismatches += percentage_mismatches(strings, return_decimal, extract_year)
+        for line in mismatches[:10]:
+            print(f"  MISMATCH {line}")
+        print(f"Results identical to the scalar functions: {not mismatches}")
+
+        timings = {
+            'extract_numeric_value x N': _best_time(lambda: [extract_numeric_value(s) for s in strings], args.repeat),
+            'extract_numeric_values': _best_time(lambda: extract_numeric_values(strings), args.repeat),
+            'parse_percentage_data x N': _best_time(lambda: [parse_percentage_data(s) for s in strings], args.repeat),
+            'parse_percentage_values': _best_time(lambda: parse_percentage_values(strings), args.repeat),
+        }
+    finally:
+        app_logger.disabled = False
+
+    print("=" * 70)
+    names = list(timings)
+    for scalar, batch in (names[0:2], names[2:4]):
+        print(f"{scalar:<30} {timings[scalar] * 1000:10.1f} ms")
+        print(f"{batch:<30} {timings[batch] * 1000:10.1f} ms   x{timings[scalar] / timings[batch]:.2f}")
+    sys.exit(1 if mismatches else 0)
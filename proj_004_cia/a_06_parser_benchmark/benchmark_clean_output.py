@@ -0,0 +1,132 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Benchmark c_00_transform_utils.clean_output over full 13-section country packs.
+
+Each country's pack is built by running every section registry (the same
+parse_section call return_*_data makes, minus the final clean_output). The packs
+are then cleaned by the previous recursive implementation (kept below as
+_reference_clean_output), by clean_output and by clean_output(in_place=True). The
+outputs are checked for equality and the timings printed.
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_clean_output
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_clean_output --countries USA FRA WLD --repeat 10
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import re
+import sys
+import copy
+import html
+import time
+from typing import Any, Dict, List, Optional
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, list_available_countries
+from proj_004_cia.a_06_parser_benchmark.benchmark_parsers import SECTION_REGISTRIES, get_registry
+from proj_004_cia.c_00_transform_utils.clean_output import clean_output
+
+#######################################################################################################################
+# REFERENCE IMPLEMENTATION - clean_output before the fast path
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _reference_clean_output(data: Any) -> Any:
+    if isinstance(data, dict):
+        return {k: _reference_clean_output(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [_reference_clean_output(item) for item in data]
+    elif isinstance(data, str):
+        return _reference_clean_string(data)
+    else:
+        return data
+
+
+def _reference_clean_string(text: str) -> str:
+    if not text:
+        return text
+    text = html.unescape(text)
+    text = text.replace('’', "'")
+    text = text.replace('‘', "'")
+    text = text.replace('“', '"')
+    text = text.replace('”', '"')
+    text = text.replace('–', '-')
+    text = text.replace('—', '--')
+    text = re.sub(r'[ \t]+', ' ', text)
+    return text.strip()
+
+
+#######################################################################################################################
+# COUNTRY PACKS
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def build_country_packs(countries: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """{iso3Code: {section: uncleaned section pack}} for every section registry."""
+    registries = [get_registry(section) for section in SECTION_REGISTRIES]
+    packs = {}
+    for iso3Code in countries or list_available_countries():
+        try:
+            data = load_country_data(iso3Code)
+        except (ValueError, OSError):
+            continue
+        packs[iso3Code] = {registry.section: registry.parse_section(data, iso3Code) for registry in registries}
+    return packs
+
+
+def _count_strings(data: Any) -> int:
+    if isinstance(data, str):
+        return 1
+    if isinstance(data, dict):
+        return sum(_count_strings(value) for value in data.values())
+    if isinstance(data, list):
+        return sum(_count_strings(value) for value in data)
+    return 0
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark clean_output on full country packs")
+    parser.add_argument('--countries', nargs='*', default=None, help="ISO3 codes (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per variant, fastest kept")
+    args = parser.parse_args()
+
+    packs = build_country_packs(args.countries)
+    print(f"{len(packs)} country packs, {sum(_count_strings(pack) for pack in packs.values()):,} strings")
+
+    expected = {iso3Code: _reference_clean_output(pack) for iso3Code, pack in packs.items()}
+    identical = all(clean_output(pack) == expected[iso3Code] for iso3Code, pack in packs.items())
+    in_place_copies = copy.deepcopy(packs)
+    identical_in_place = all(clean_output(pack, in_place=True) == expected[iso3Code]
+                             for iso3Code, pack in in_place_copies.items())
+    print(f"Output identical: copy={identical} in_place={identical_in_place}")
+
+    timings = {}
+    for name in ('previous clean_output', 'clean_output', 'clean_output(in_place=True)'):
+        best = None
+        for _ in range(args.repeat):
+            # In-place runs need fresh packs; the copy is made outside the timed region
+            inputs = copy.deepcopy(packs) if 'in_place' in name else packs
+            start = time.perf_counter()
+            for pack in inputs.values():
+                if name == 'previous clean_output':
+                    _reference_clean_output(pack)
+                elif name == 'clean_output':
+                    clean_output(pack)
+                else:
+                    clean_output(pack, in_place=True)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None or elapsed < best else best
+        timings[name] = best
+
+    print("=" * 70)
+    reference = timings['previous clean_output']
+    for name, elapsed in timings.items():
+        print(f"{name:<30} {elapsed * 1000:10.1f} ms   x{reference / elapsed:.2f}")
+    sys.exit(0 if identical and identical_in_place else 1)
@@ -0,0 +1,144 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Micro-benchmark of c_00_transform_utils.clean_text over every string in the raw corpus.
+
+Runs the current clean_text / clean_text_many and the previous implementation
+(sequential str.replace + uncompiled re.sub, kept below as _reference_clean_text)
+over the same strings, checks the outputs are byte-identical for every flag
+combination and prints the speedup.
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_clean_text
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_clean_text --repeat 5
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import re
+import sys
+import html
+import time
+from typing import Any, Callable, List
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, list_available_countries
+from proj_004_cia.c_00_transform_utils.clean_text import clean_text, clean_text_many
+
+FLAG_COMBINATIONS = [(False, False), (True, False), (False, True), (True, True)]
+
+#######################################################################################################################
+# REFERENCE IMPLEMENTATION - clean_text before the single-pass rewrite (logging removed)
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _reference_clean_text(text: str, preserve_formatting: bool = False, remove_notes: bool = False) -> str:
+    if not isinstance(text, str) or not text:
+        return ""
+
+    html_entities = {
+        '&amp;': '&', '&lt;': '<', '&gt;': '>', '&quot;': '"',
+        '&apos;': "'", '&nbsp;': ' ', '&mdash;': '—', '&ndash;': '–',
+        '&rsquo;': "'", '&lsquo;': "'", '&rdquo;': '"', '&ldquo;': '"',
+        '&hellip;': '...', '&bull;': '•', '&middot;': '·',
+        '&deg;': '°', '&plusmn;': '±', '&times;': '×', '&divide;': '÷',
+        '&frac12;': '½', '&frac14;': '¼', '&frac34;': '¾',
+        '&euro;': '€', '&pound;': '£', '&yen;': '¥', '&cent;': '¢',
+    }
+    for entity, replacement in html_entities.items():
+        text = text.replace(entity, replacement)
+    text = html.unescape(text)
+
+    if preserve_formatting:
+        text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
+        text = re.sub(r'<p[^>]*>', '\n', text, flags=re.IGNORECASE)
+        text = re.sub(r'</p>', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'<[^>]+>', '', text)
+
+    if remove_notes:
+        text = re.sub(r'\([^)]*\)', '', text)
+        text = re.sub(r'\[[^\]]*\]', '', text)
+
+    if preserve_formatting:
+        text = re.sub(r'[ \t]+', ' ', text)
+        text = re.sub(r'\n\s*\n', '\n\n', text)
+    else:
+        text = re.sub(r'\s+', ' ', text)
+
+    text = text.replace('’', "'")
+    text = text.replace('‘', "'")
+    text = text.replace('“', '"')
+    text = text.replace('”', '"')
+    text = text.replace('–', '-')
+    text = text.replace('—', '--')
+    return text.strip()
+
+
+#######################################################################################################################
+# CORPUS
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _collect_strings(node: Any, out: List[str]) -> None:
+    if isinstance(node, str):
+        out.append(node)
+    elif isinstance(node, dict):
+        for value in node.values():
+            _collect_strings(value, out)
+    elif isinstance(node, list):
+        for value in node:
+            _collect_strings(value, out)
+
+
+def load_corpus_strings() -> List[str]:
+    """Every string value of every raw country file, in file order."""
+    strings: List[str] = []
+    for iso3Code in list_available_countries():
+        try:
+            _collect_strings(load_country_data(iso3Code), strings)
+        except (ValueError, OSError):
+            continue
+    return strings
+
+
+def _best_time(function: Callable[[], Any], repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None or elapsed < best else best
+    return best
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark clean_text against the previous implementation")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per variant, fastest kept")
+    args = parser.parse_args()
+
+    strings = load_corpus_strings()
+    print(f"{len(strings):,} corpus strings, {sum(map(len, strings)) / 1024 / 1024:.1f} MB")
+
+    mismatches = 0
+    for preserve_formatting, remove_notes in FLAG_COMBINATIONS:
+        for text in strings:
+            expected = _reference_clean_text(text, preserve_formatting, remove_notes)
+            if clean_text(text, preserve_formatting, remove_notes) != expected:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"  MISMATCH preserve_formatting={preserve_formatting} remove_notes={remove_notes}: {text[:80]!r}")
+    print(f"Output identical for all {len(FLAG_COMBINATIONS)} flag combinations: {mismatches == 0}")
+
+    reference = _best_time(lambda: [_reference_clean_text(text) for text in strings], args.repeat)
+    current = _best_time(lambda: [clean_text(text) for text in strings], args.repeat)
+    batch = _best_time(lambda: clean_text_many(strings), args.repeat)
+    print("=" * 70)
+    print(f"{'previous clean_text':<30} {reference * 1000:10.1f} ms")
+    print(f"{'clean_text':<30} {current * 1000:10.1f} ms   x{reference / current:.2f}")
+    print(f"{'clean_text_many':<30} {batch * 1000:10.1f} ms   x{reference / batch:.2f}")
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,101 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Memory benchmark for representation='compact' (c_00_transform_utils.compact_records).
+
+Every country is parsed through the 13 return_*_data functions twice, once per
+representation, and the parsed corpus is held in memory the way the API holds it.
+tracemalloc measures what each corpus keeps alive. The compact corpus is then
+expanded with to_dict() and checked against the dict corpus (same JSON).
+
+A first, unmeasured pass warms the parser caches so that only the output is counted.
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_compact_records
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_compact_records --countries USA FRA DEU WLD
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import gc
+import sys
+import json
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional, Tuple
+from proj_004_cia.__logger.logger import app_logger
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, list_available_countries
+from proj_004_cia.z_reports.category_sections import CATEGORY_PARSERS
+from proj_004_cia.c_00_transform_utils.compact_records import REPRESENTATIONS, expand_output
+
+#######################################################################################################################
+# CORPUS
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def load_raw_corpus(countries: Optional[List[str]] = None) -> Dict[str, dict]:
+    raw = {}
+    for iso3Code in countries or list_available_countries():
+        try:
+            raw[iso3Code] = load_country_data(iso3Code)
+        except (ValueError, OSError):
+            continue
+    return raw
+
+
+def parse_corpus(raw: Dict[str, dict], representation: str) -> Dict[str, Dict[str, Any]]:
+    """{iso3Code: {category: return_*_data(..., representation=representation)}}"""
+    return {iso3Code: {category: parser(data, iso3Code, representation=representation)
+                       for category, parser in CATEGORY_PARSERS.items()}
+            for iso3Code, data in raw.items()}
+
+
+def measure(raw: Dict[str, dict], representation: str) -> Tuple[Dict[str, Dict[str, Any]], int, float]:
+    """(corpus, bytes kept alive by it, seconds to build it)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        corpus = parse_corpus(raw, representation)
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return corpus, retained, elapsed
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare memory held by the dict and compact representations")
+    parser.add_argument('--countries', nargs='*', default=None, help="ISO3 codes (default: all)")
+    args = parser.parse_args()
+
+    raw = load_raw_corpus(args.countries)
+    print(f"{len(raw)} countries x {len(CATEGORY_PARSERS)} sections")
+
+    app_logger.disabled = True
+    try:
+        parse_corpus(raw, 'dict')
+        results = {representation: measure(raw, representation) for representation in REPRESENTATIONS}
+    finally:
+        app_logger.disabled = False
+
+    dict_corpus = results['dict'][0]
+    compact_corpus = results['compact'][0]
+    identical = json.dumps(expand_output(compact_corpus), default=str) == json.dumps(dict_corpus, default=str)
+
+    print("=" * 70)
+    baseline = results['dict'][1]
+    for representation, (_, retained, elapsed) in results.items():
+        print(f"{representation:<8} {retained / 2 ** 20:9.1f} MiB   x{baseline / retained:.2f}   "
+              f"built in {elapsed:6.2f} s")
+    print(f"to_dict() output identical to representation='dict': {identical}")
+    sys.exit(0 if identical else 1)
@@ -0,0 +1,83 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Parity harness and benchmark for t_nation_features_batch (single-pass feature extraction).
+
+Every discovered feature is extracted twice:
+    per feature   its own get_*() function (one pass over the countries per feature)
+    single pass   run_feature_specs() (each parser once per country)
+and the two results must be identical, including key order.
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_feature_batch
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_feature_batch --kinds dict --features gini budget
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import sys
+import json
+import time
+from typing import Any, Dict, List, Tuple
+from proj_004_cia.__logger.logger import app_logger
+from proj_004_cia.t_nation_features_batch.feature_specs import KINDS, FeatureSpec
+from proj_004_cia.t_nation_features_batch.run_all_features import (
+    FEATURE_PACKAGES, discover_feature_specs, run_feature_specs, select_feature_specs
+)
+from proj_004_cia.u_nation_feature_strings.base_extractor import extract_string_feature
+from proj_004_cia.v_nation_features_dicts.base_extractor import extract_dict_feature
+from proj_004_cia.w_nation_feature_arrays.base_extractor import extract_feature
+
+EXTRACT_FUNCTIONS = {'string': extract_string_feature, 'dict': extract_dict_feature, 'array': extract_feature}
+
+#######################################################################################################################
+# PER FEATURE
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def run_per_feature(specs: List[FeatureSpec]) -> Tuple[Dict[str, Dict[str, Any]], float]:
+    """{kind: {name: result}} from each feature's own base extractor call, and the seconds it took."""
+    results: Dict[str, Dict[str, Any]] = {}
+    start = time.perf_counter()
+    for spec in specs:
+        extract = EXTRACT_FUNCTIONS[spec.kind]
+        results.setdefault(spec.kind, {})[spec.name] = extract(spec.parser_func, spec.extractor_func, spec.name)
+    return results, time.perf_counter() - start
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare per-feature and single-pass feature extraction")
+    parser.add_argument('--kinds', nargs='*', choices=KINDS, default=None, help="feature kinds (default: all)")
+    parser.add_argument('--features', nargs='*', default=None, help="feature names (default: all)")
+    args = parser.parse_args()
+
+    specs = select_feature_specs(discover_feature_specs(FEATURE_PACKAGES), args.kinds, args.features)
+    print(f"{len(specs)} features")
+
+    app_logger.disabled = True
+    try:
+        start = time.perf_counter()
+        batch = run_feature_specs(specs, verbose=True)
+        batch_seconds = time.perf_counter() - start
+        per_feature, per_feature_seconds = run_per_feature(specs)
+    finally:
+        app_logger.disabled = False
+
+    differences = [f"{spec.kind}:{spec.name}" for spec in specs
+                   if json.dumps(batch[spec.kind][spec.name], default=str)
+                   != json.dumps(per_feature[spec.kind][spec.name], default=str)]
+
+    print("=" * 70)
+    print(f"per feature  {per_feature_seconds:8.1f} s")
+    print(f"single pass  {batch_seconds:8.1f} s   x{per_feature_seconds / batch_seconds:.1f}")
+    print(f"differences {len(differences)}")
+    for line in differences[:20]:
+        print(f"    {line}")
+    sys.exit(0 if not differences else 1)
@@ -0,0 +1,222 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Compatibility harness and benchmark for t_nation_features_batch.feature_matrix.
+
+The dict features are extracted once (run_feature_specs) and flattened with
+build_feature_matrix.
+
+1. Parity: every matrix cell must be the number found at its column's path in
+   the country's dict, every number of the dicts (other than years) must be in
+   a cell, and the .npz round trip and to_dataframe() must give back the same
+   values, years and estimate flags.
+2. Ranking and correlation: rank() must match ranks computed by walking the
+   dicts (1 + countries with a greater value), and correlation() must match a
+   pairwise Pearson over the countries having both values, and pandas' corr().
+3. Cost: extract + build against reading the .npz cache, and ranking /
+   correlating every column by dict walks against the vectorized methods.
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_feature_matrix
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_feature_matrix --repeat 5
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import os
+import sys
+import math
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from proj_004_cia.a_06_parser_benchmark.benchmark_clean_text import _best_time
+from proj_004_cia.t_nation_features_batch.feature_matrix import (
+    YEAR_UNKNOWN, FeatureMatrix, build_feature_matrix, load_feature_matrix, save_feature_matrix
+)
+from proj_004_cia.t_nation_features_batch.feature_specs import DICT
+from proj_004_cia.t_nation_features_batch.run_all_features import (
+    discover_feature_specs, run_feature_specs, select_feature_specs
+)
+
+_YEAR_KEYS = ('year', 'timestamp', 'date', 'est_year')
+_YEAR_SUFFIXES = ('_year', '_date', '_timestamp')
+
+#######################################################################################################################
+# DICT WALKS
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def value_at(data: Any, path: Tuple[str, ...]) -> Optional[float]:
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data if _is_number(data) else None
+
+
+def count_numbers(data: Any) -> int:
+    """Numbers in a dict, other than years."""
+    count = 0
+    for key, value in (data.items() if isinstance(data, dict) else ()):
+        if isinstance(value, dict):
+            count += count_numbers(value)
+        elif _is_number(value) and key not in _YEAR_KEYS and not key.endswith(_YEAR_SUFFIXES):
+            count += 1
+    return count
+
+
+def column_values(features: Dict[str, Dict[str, Any]], matrix: FeatureMatrix) -> List[Dict[str, float]]:
+    """{iso3Code: value} of every column, the way the analytics jobs flattened the dicts."""
+    columns = []
+    for column in matrix.columns:
+        values = {}
+        for iso3Code, data in features[column.feature].items():
+            value = value_at(data, column.path)
+            if value is not None and not math.isnan(value):
+                values[iso3Code] = float(value)
+        columns.append(values)
+    return columns
+
+
+def walk_ranks(values: Dict[str, float]) -> Dict[str, int]:
+    ordered = sorted(values.values(), reverse=True)
+    first = {}
+    for position, value in enumerate(ordered, 1):
+        first.setdefault(value, position)
+    return {iso3Code: first[value] for iso3Code, value in values.items()}
+
+
+def walk_pearson(x: Dict[str, float], y: Dict[str, float], min_periods: int = 3) -> float:
+    shared = [iso3Code for iso3Code in x if iso3Code in y]
+    if len(shared) < min_periods:
+        return math.nan
+    xs = [x[iso3Code] for iso3Code in shared]
+    ys = [y[iso3Code] for iso3Code in shared]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    cov = sum((a - mean_x) * (b - mean_y) for a, b in zip(xs, ys))
+    var_x = sum((a - mean_x) ** 2 for a in xs)
+    var_y = sum((b - mean_y) ** 2 for b in ys)
+    if var_x <= 0 or var_y <= 0:
+        return math.nan
+    return max(-1.0, min(1.0, cov / math.sqrt(var_x * var_y)))
+
+
+def walk_correlation(columns: List[Dict[str, float]]) -> np.ndarray:
+    corr = np.empty((len(columns), len(columns)))
+    for i, x in enumerate(columns):
+        for j in range(i, len(columns)):
+            corr[i, j] = corr[j, i] = walk_pearson(x, columns[j])
+    return corr
+
+
+#######################################################################################################################
+# PARITY
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _same(a: np.ndarray, b: np.ndarray, tolerance: float = 0.0) -> bool:
+    if a.shape != b.shape or not np.array_equal(np.isnan(a), np.isnan(b)):
+        return False
+    present = ~np.isnan(a)
+    return bool(np.all(np.abs(a[present] - b[present]) <= tolerance))
+
+
+def compare_matrix(features: Dict[str, Dict[str, Any]], matrix: FeatureMatrix, directory: str) -> List[str]:
+    differences = []
+    columns = column_values(features, matrix)
+    row_of = {iso3Code: row for row, iso3Code in enumerate(matrix.countries)}
+
+    for i, (column, values) in enumerate(zip(matrix.columns, columns)):
+        expected = np.full(len(matrix.countries), np.nan)
+        for iso3Code, value in values.items():
+            expected[row_of[iso3Code]] = value
+        if not _same(expected, matrix.values[:, i]):
+            differences.append(f"{column.name}: cells differ from the dict values")
+
+    numbers = sum(count_numbers(data) for feature in features.values() for data in feature.values())
+    cells = int((~matrix.missing()).sum())
+    if numbers != cells:
+        differences.append(f"{numbers} numbers in the dicts, {cells} cells")
+
+    path = save_feature_matrix(matrix, os.path.join(directory, 'feature_matrix.npz'))
+    loaded = load_feature_matrix(path)
+    if (loaded.countries != matrix.countries or loaded.columns != matrix.columns or loaded.key != matrix.key
+            or not _same(loaded.values, matrix.values) or not np.array_equal(loaded.years, matrix.years)
+            or not np.array_equal(loaded.estimates, matrix.estimates)):
+        differences.append("npz round trip differs")
+
+    frame = matrix.to_dataframe(metadata=True)
+    names = matrix.names
+    if not _same(frame[names].astype('float64').to_numpy(), matrix.values):
+        differences.append("to_dataframe values differ")
+    years = frame[[f"{name}.year" for name in names]].fillna(YEAR_UNKNOWN).astype('int64').to_numpy()
+    if not np.array_equal(years, matrix.years):
+        differences.append("to_dataframe years differ")
+
+    ranks = matrix.rank()
+    for i, (column, values) in enumerate(zip(matrix.columns, columns)):
+        expected = np.full(len(matrix.countries), np.nan)
+        for iso3Code, rank in walk_ranks(values).items():
+            expected[row_of[iso3Code]] = rank
+        if not _same(expected, ranks[:, i]):
+            differences.append(f"{column.name}: rank differs")
+
+    _, corr = matrix.correlation()
+    if not _same(walk_correlation(columns), corr, 1e-9):
+        differences.append("correlation differs from the pairwise dict walk")
+    if not _same(frame[names].astype('float64').corr(min_periods=3).to_numpy(), corr, 1e-9):
+        differences.append("correlation differs from pandas corr()")
+    return differences
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parity and speed of the numeric dict-feature matrix")
+    parser.add_argument('--repeat', type=int, default=3, help="timing repetitions (best is kept)")
+    args = parser.parse_args()
+
+    specs = select_feature_specs(discover_feature_specs(), [DICT])
+    features = run_feature_specs(specs)[DICT]
+    matrix = build_feature_matrix(features)
+    directory = tempfile.mkdtemp(prefix='feature_matrix_')
+    try:
+        differences = compare_matrix(features, matrix, directory)
+        path = os.path.join(directory, 'feature_matrix.npz')
+
+        extract_time = _best_time(lambda: build_feature_matrix(run_feature_specs(specs)[DICT]), args.repeat)
+        build_time = _best_time(lambda: build_feature_matrix(features), args.repeat)
+        load_time = _best_time(lambda: load_feature_matrix(path), args.repeat)
+        size = os.path.getsize(path)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    walk_rank_time = _best_time(lambda: [walk_ranks(values) for values in column_values(features, matrix)],
+                                args.repeat)
+    rank_time = _best_time(matrix.rank, args.repeat)
+    walk_corr_time = _best_time(lambda: walk_correlation(column_values(features, matrix)), args.repeat)
+    corr_time = _best_time(matrix.correlation, args.repeat)
+
+    print(f"{len(features)} dict features -> {matrix}, npz {size / 1024:.0f} KB")
+    print("=" * 70)
+    print(f"extract + build                      {extract_time * 1000:9.1f} ms")
+    print(f"build from extracted dicts           {build_time * 1000:9.1f} ms")
+    print(f"load .npz cache                      {load_time * 1000:9.1f} ms   x{extract_time / load_time:.0f}")
+    print(f"rank every column (dict walk)        {walk_rank_time * 1000:9.1f} ms")
+    print(f"rank every column (vectorized)       {rank_time * 1000:9.1f} ms   x{walk_rank_time / rank_time:.0f}")
+    print(f"correlate every pair (dict walk)     {walk_corr_time * 1000:9.1f} ms")
+    print(f"correlate every pair (vectorized)    {corr_time * 1000:9.1f} ms   x{walk_corr_time / corr_time:.0f}")
+    print(f"differences {len(differences)}")
+    for difference in differences[:10]:
+        print(f"    {difference}")
+    sys.exit(0 if not differences else 1)
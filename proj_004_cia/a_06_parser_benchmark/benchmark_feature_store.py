@@ -0,0 +1,161 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Compatibility harness and benchmark for t_nation_features_batch.feature_store.
+
+Every feature is extracted once (run_all_features, no save) and written to a
+temporary directory in all three formats.
+
+1. Parity: load_feature must return exactly the extracted dict (pickle), the
+   JSON file must hold its JSON form, and the opt-in .py module, imported the
+   way consumers import it, must hold the same value as the JSON file.
+2. Legacy: how many features the old '": null" -> ": None"' string-replace
+   writer turned into a different value (text containing ': null', ': true',
+   ': false', or nulls inside lists).
+3. Load time of every feature: importing the .py modules (compiled, as on a
+   first import), json.load, pickle.load through load_all_features, and
+   load_all_features again from its in-memory LRU.
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_feature_store
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_feature_store --repeat 5
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import importlib.util
+from typing import Any, Dict, List, Tuple
+from proj_004_cia.a_06_parser_benchmark.benchmark_clean_text import _best_time
+from proj_004_cia.t_nation_features_batch.feature_store import (
+    FORMATS, JSON, PY, clear_feature_cache, load_all_features, load_feature, read_manifest
+)
+from proj_004_cia.t_nation_features_batch.run_all_features import (
+    discover_feature_specs, run_feature_specs, save_feature_results
+)
+
+#######################################################################################################################
+# HELPERS
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _legacy_python_format(data: Any) -> str:
+    """The writer the base extractors used before python_literal."""
+    json_str = json.dumps(data, indent=4, ensure_ascii=False, default=str)
+    json_str = json_str.replace(': null', ': None')
+    json_str = json_str.replace(': true', ': True')
+    json_str = json_str.replace(': false', ': False')
+    return json_str
+
+
+def _json_form(data: Any) -> Any:
+    return json.loads(json.dumps(data, ensure_ascii=False, default=str))
+
+
+def import_python_output(path: str) -> Any:
+    """The feature literal of a generated .py module, imported (and compiled) like a consumer would."""
+    spec = importlib.util.spec_from_file_location(f"_feature_{os.path.basename(path)[:-3]}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return next(value for name, value in vars(module).items() if name.isupper())
+
+
+def saved_files(output_root: str) -> List[Tuple[str, str, Dict[str, str]]]:
+    """(kind, name, {format: path}) of every saved feature."""
+    files = []
+    for kind in sorted(os.listdir(output_root)):
+        directory = os.path.join(output_root, kind)
+        for name, entry in read_manifest(directory)['features'].items():
+            files.append((kind, name, {fmt: os.path.join(directory, file) for fmt, file in entry['files'].items()}))
+    return files
+
+
+#######################################################################################################################
+# PARITY
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def compare_saved(results: Dict[str, Dict[str, Dict[str, Any]]], output_root: str) -> Tuple[List[str], List[str]]:
+    """(differences, features the legacy writer corrupts)."""
+    differences, legacy = [], []
+    for kind, name, files in saved_files(output_root):
+        expected = results[kind][name]
+        directory = os.path.join(output_root, kind)
+        if load_feature(name, kind, directory) != expected:
+            differences.append(f"{kind}:{name} load_feature")
+        with open(files[JSON], 'r', encoding='utf-8') as f:
+            json_value = json.load(f)
+        if json_value != _json_form(expected):
+            differences.append(f"{kind}:{name} json")
+        if import_python_output(files[PY]) != json_value:
+            differences.append(f"{kind}:{name} py")
+        try:
+            legacy_value = eval(_legacy_python_format(expected), {'__builtins__': {}})
+        except Exception:
+            legacy_value = None
+        if legacy_value != json_value:
+            legacy.append(f"{kind}:{name}")
+    return differences, legacy
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parity and load time of the feature output formats")
+    parser.add_argument('--repeat', type=int, default=3, help="timing repetitions (best is kept)")
+    args = parser.parse_args()
+
+    sys.dont_write_bytecode = True
+    specs = discover_feature_specs()
+    results = run_feature_specs(specs)
+    output_root = tempfile.mkdtemp(prefix='feature_store_')
+    try:
+        save_feature_results(specs, results, output_root, FORMATS)
+        files = saved_files(output_root)
+        differences, legacy = compare_saved(results, output_root)
+
+        sizes = {fmt: sum(os.path.getsize(paths[fmt]) for _, _, paths in files) for fmt in FORMATS}
+        directories = [os.path.join(output_root, kind) for kind in sorted(os.listdir(output_root))]
+
+        def load_json() -> None:
+            for _, _, paths in files:
+                with open(paths[JSON], 'r', encoding='utf-8') as f:
+                    json.load(f)
+
+        def load_cold() -> None:
+            clear_feature_cache()
+            for directory in directories:
+                load_all_features(output_dir=directory)
+
+        def load_warm() -> None:
+            for directory in directories:
+                load_all_features(output_dir=directory)
+
+        py_time = _best_time(lambda: [import_python_output(paths[PY]) for _, _, paths in files], args.repeat)
+        json_time = _best_time(load_json, args.repeat)
+        cold_time = _best_time(load_cold, args.repeat)
+        warm_time = _best_time(load_warm, args.repeat)
+    finally:
+        shutil.rmtree(output_root, ignore_errors=True)
+
+    print(f"{len(files)} features: "
+          + ", ".join(f"{fmt} {size / 1024 / 1024:.1f} MB" for fmt, size in sizes.items()))
+    print("=" * 70)
+    print(f"import every .py module (compiled)   {py_time * 1000:9.1f} ms")
+    print(f"json.load every .json file           {json_time * 1000:9.1f} ms   x{py_time / json_time:.1f}")
+    print(f"load_all_features (pickle)           {cold_time * 1000:9.1f} ms   x{py_time / cold_time:.1f}")
+    print(f"load_all_features (in-memory LRU)    {warm_time * 1000:9.3f} ms")
+    print(f"legacy .py writer changed the value of {len(legacy)} feature(s): {', '.join(legacy[:8])}")
+    print(f"differences {len(differences)}")
+    for difference in differences[:10]:
+        print(f"    {difference}")
+    sys.exit(0 if not differences else 1)
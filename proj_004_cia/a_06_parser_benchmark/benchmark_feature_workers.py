@@ -0,0 +1,108 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Compatibility harness and benchmark for the workers= process pool of the three
+base extractors (t_nation_features_batch.country_pool).
+
+For every discovered feature (or the ones named with --features):
+
+1. Parity: extract_feature / extract_dict_feature / extract_string_feature with
+   workers=N must return the same dict, in the same key order, as workers=1, and
+   report the same failed countries.
+2. Progress: the callback must be called once per country, ending at (total, total).
+3. Cost: wall time of both runs. The parsed-section cache is disabled so every
+   run parses; the speed-up is bounded by the cores of the machine.
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_feature_workers
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_feature_workers --workers 8 --features industries gini
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from proj_004_cia.__config.config import Config
+from proj_004_cia.t_nation_features_batch.feature_specs import ARRAY, DICT, STRING, FeatureSpec
+from proj_004_cia.t_nation_features_batch.run_all_features import discover_feature_specs, select_feature_specs
+from proj_004_cia.u_nation_feature_strings.base_extractor import extract_string_feature
+from proj_004_cia.v_nation_features_dicts.base_extractor import extract_dict_feature
+from proj_004_cia.w_nation_feature_arrays.base_extractor import extract_feature
+
+EXTRACTORS = {
+    STRING: extract_string_feature,
+    DICT: extract_dict_feature,
+    ARRAY: extract_feature,
+}
+
+#######################################################################################################################
+# RUNS
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def run_spec(spec: FeatureSpec, workers: int) -> Tuple[Dict[str, Any], List[str], List[Tuple[int, int]], float]:
+    """(result, failed ISO3 codes, progress calls, seconds) of one base extractor run."""
+    errors, calls = [], []
+    start = time.perf_counter()
+    result = EXTRACTORS[spec.kind](spec.parser_func, spec.extractor_func, spec.name, workers=workers,
+                                   progress=lambda done, total: calls.append((done, total)), errors=errors)
+    elapsed = time.perf_counter() - start
+    return result, [error.iso3Code for error in errors], calls, elapsed
+
+
+def compare_spec(spec: FeatureSpec, workers: int) -> Tuple[Optional[str], float, float]:
+    """(difference or None, serial seconds, pool seconds) for one feature."""
+    serial, serial_failed, serial_calls, serial_time = run_spec(spec, 1)
+    pooled, pooled_failed, pooled_calls, pooled_time = run_spec(spec, workers)
+
+    if list(serial.items()) != list(pooled.items()):
+        return "values or key order differ", serial_time, pooled_time
+    if serial_failed != pooled_failed:
+        return f"failed countries differ: {serial_failed[:3]} / {pooled_failed[:3]}", serial_time, pooled_time
+    for calls in (serial_calls, pooled_calls):
+        total = calls[-1][1] if calls else 0
+        if [done for done, _ in calls] != list(range(1, total + 1)):
+            return "progress calls out of order", serial_time, pooled_time
+    return None, serial_time, pooled_time
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parity and speed of the base extractors' process pool")
+    parser.add_argument('--workers', type=int, default=max(2, os.cpu_count() or 1), help="pool size (default: cores)")
+    parser.add_argument('--kinds', nargs='*', default=None, help="feature kinds (default: all)")
+    parser.add_argument('--features', nargs='*', default=None, help="feature names (default: all)")
+    args = parser.parse_args()
+
+    # Parse every country in both runs; workers started with spawn re-read the environment
+    Config.PARSED_CACHE_ENABLED = False
+    os.environ['PARSED_CACHE_ENABLED'] = 'false'
+
+    specs: Sequence[FeatureSpec] = select_feature_specs(discover_feature_specs(), args.kinds, args.features)
+    differences = []
+    serial_total = pooled_total = 0.0
+    print(f"{len(specs)} features, workers=1 vs workers={args.workers} ({os.cpu_count()} cores)")
+    print("=" * 70)
+    for spec in specs:
+        difference, serial_time, pooled_time = compare_spec(spec, args.workers)
+        serial_total += serial_time
+        pooled_total += pooled_time
+        print(f"{spec.kind:<7}{spec.name:<40}{serial_time:7.2f} s{pooled_time:7.2f} s"
+              f"{'' if difference is None else '   ' + difference}")
+        if difference is not None:
+            differences.append(f"{spec.kind}:{spec.name}: {difference}")
+
+    print("=" * 70)
+    print(f"total  serial {serial_total:.1f} s   pool {pooled_total:.1f} s   x{serial_total / pooled_total:.2f}")
+    print(f"differences {len(differences)}")
+    for difference in differences[:10]:
+        print(f"    {difference}")
+    sys.exit(0 if not differences else 1)
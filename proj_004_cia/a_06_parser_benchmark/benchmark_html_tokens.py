@@ -0,0 +1,91 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Compatibility harness and benchmark for c_00_transform_utils.html_tokens.
+
+1. Parity: for every string in _raw_data, HtmlTokens.plain must equal the
+   re.sub(r'<[^>]+>', '', text) the parsers used to run, and the segments must
+   join back to it.
+2. Cost: time to tokenize every country once (what COUNTRY_DATA_CACHE pays at load).
+3. Lookup: strip_tags(text, iso3Code) served from the cached tokens against the
+   per-call re.sub, over every string with markup.
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_html_tokens
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_html_tokens --repeat 5
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import re
+import sys
+from typing import Dict, List, Tuple
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import (
+    COUNTRY_DATA_CACHE, load_country_data, list_available_countries
+)
+from proj_004_cia.a_06_parser_benchmark.benchmark_clean_text import _best_time
+from proj_004_cia.c_00_transform_utils.html_tokens import iter_markup_strings, strip_tags, tokenize_country
+
+_REFERENCE_TAG_RE = r'<[^>]+>'
+
+#######################################################################################################################
+# CORPUS
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def load_countries() -> Dict[str, dict]:
+    countries = {}
+    for iso3Code in list_available_countries():
+        try:
+            countries[iso3Code] = load_country_data(iso3Code)
+        except (ValueError, OSError):
+            continue
+    return countries
+
+
+def markup_strings(countries: Dict[str, dict]) -> List[Tuple[str, str]]:
+    """(iso3Code, raw string) for every string with markup."""
+    return [(iso3Code, text) for iso3Code, data in countries.items() for text in iter_markup_strings(data)]
+
+
+def compare_plain(countries: Dict[str, dict]) -> List[str]:
+    """Strings whose tokens disagree with the reference tag strip."""
+    differences = []
+    for data in countries.values():
+        for text, tokens in tokenize_country(data).items():
+            expected = re.sub(_REFERENCE_TAG_RE, '', text)
+            if tokens.plain != expected or ''.join(t for _, t in tokens.segments) != expected:
+                differences.append(text[:80])
+    return differences
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parity and cost of the load-time HTML tokens")
+    parser.add_argument('--repeat', type=int, default=3, help="timing repetitions (best is kept)")
+    args = parser.parse_args()
+
+    countries = load_countries()
+    pairs = markup_strings(countries)
+    print(f"{len(countries)} countries, {len(pairs):,} strings with markup")
+
+    differences = compare_plain(countries)
+    tokenize = _best_time(lambda: [tokenize_country(data) for data in countries.values()], args.repeat)
+    regex = _best_time(lambda: [re.sub(_REFERENCE_TAG_RE, '', text) for _, text in pairs], args.repeat)
+    COUNTRY_DATA_CACHE.warm(countries)
+    cached = _best_time(lambda: [strip_tags(text, iso3Code) for iso3Code, text in pairs], args.repeat)
+
+    print("=" * 70)
+    print(f"tokenize every country once          {tokenize:7.3f} s")
+    print(f"re.sub over every markup string      {regex:7.3f} s")
+    print(f"strip_tags from the cached tokens    {cached:7.3f} s   x{regex / cached:.2f}")
+    print(f"differences {len(differences)}")
+    for text in differences[:10]:
+        print(f"    {text!r}")
+    sys.exit(0 if not differences else 1)
@@ -0,0 +1,206 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Compatibility harness and benchmark for the streaming list parsers
+(iter_text_to_list, iter_list_from_string and c_00_transform_utils.aggregate_items).
+
+1. Parity: the previous parse_text_to_list / parse_list_from_string (kept below as
+   _reference_*) and the current generator-backed versions are run over every string
+   in _raw_data, for every option combination; the outputs must be identical.
+2. Speed: best-of-N time of both versions over the corpus (default options).
+3. Memory: an aggregate_all_possible_items-style job (distinct items of every string)
+   is run the old way (one list per string, kept and merged at the end) and with
+   unique_items(); tracemalloc reports the peak of each.
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_list_streaming
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_list_streaming --repeat 5 --default-options-only
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import re
+import sys
+import itertools
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+from proj_004_cia.__logger.logger import app_logger
+from proj_004_cia.a_06_parser_benchmark.benchmark_clean_text import load_corpus_strings, _best_time
+from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.parse_text_to_list import parse_text_to_list
+from proj_004_cia.c_00_transform_utils.parse_list_from_string import parse_list_from_string
+from proj_004_cia.c_00_transform_utils.aggregate_items import unique_items
+
+#######################################################################################################################
+# REFERENCE IMPLEMENTATIONS - before the generator rewrite (logging removed)
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _reference_parse_text_to_list(text: str, respect_parentheses: bool = True,
+                                  smart_splitting: bool = True, clean_items: bool = True) -> List[str]:
+    if not isinstance(text, str) or not text.strip():
+        return []
+    try:
+        cleaned_text = clean_text(text) if clean_items else text.strip()
+        delimiters = [';', ','] if not smart_splitting else [';', ',', '|', '\n']
+        best_delimiter = ';'
+        if smart_splitting:
+            delimiter_counts = {}
+            in_parentheses = 0
+            for char in cleaned_text:
+                if char == '(':
+                    in_parentheses += 1
+                elif char == ')':
+                    in_parentheses = max(0, in_parentheses - 1)
+                elif char in delimiters and in_parentheses == 0:
+                    delimiter_counts[char] = delimiter_counts.get(char, 0) + 1
+            if delimiter_counts:
+                best_delimiter = max(delimiter_counts, key=delimiter_counts.get)
+        if respect_parentheses:
+            segments = []
+            buffer = []
+            open_parentheses = 0
+            for char in cleaned_text:
+                if char == best_delimiter and open_parentheses == 0:
+                    segments.append(''.join(buffer).strip())
+                    buffer = []
+                else:
+                    buffer.append(char)
+                    if char == '(':
+                        open_parentheses += 1
+                    elif char == ')':
+                        open_parentheses = max(0, open_parentheses - 1)
+            if buffer:
+                segments.append(''.join(buffer).strip())
+        else:
+            segments = cleaned_text.split(best_delimiter)
+        result = []
+        for segment in segments:
+            segment = clean_text(segment.strip()) if clean_items else segment.strip()
+            if segment:
+                result.append(segment)
+        return result
+    except Exception:
+        return []
+
+
+def _reference_parse_list_from_string(data_string: str, delimiter: str = ',', strip_items: bool = True,
+                                      remove_empty: bool = True, clean_items: bool = True,
+                                      smart_delimiters: bool = True) -> List[str]:
+    if not isinstance(data_string, str) or not data_string.strip():
+        return []
+    try:
+        text = data_string.strip()
+        if smart_delimiters:
+            delimiter_candidates = [';', ',', '|', '\n', '•', '–', '-']
+            delimiter_counts = {d: text.count(d) for d in delimiter_candidates}
+            best_delimiter = max(delimiter_counts, key=delimiter_counts.get)
+            if delimiter_counts[best_delimiter] > 0:
+                delimiter = best_delimiter
+        if '•' in text or re.search(r'\d+\.\s+', text):
+            text = re.sub(r'[•\-–]\s*', delimiter + ' ', text)
+            text = re.sub(r'\d+\.\s+', delimiter + ' ', text)
+        processed_items = []
+        for item in text.split(delimiter):
+            if strip_items:
+                item = item.strip()
+            if clean_items:
+                item = clean_text(item)
+            item = re.sub(r'^(and\s+|or\s+)', '', item, flags=re.IGNORECASE)
+            item = re.sub(r'\s+(etc\.?|among others)$', '', item, flags=re.IGNORECASE)
+            if remove_empty and not item:
+                continue
+            processed_items.append(item)
+        return processed_items
+    except Exception:
+        return []
+
+
+#######################################################################################################################
+# PARITY
+# ---------------------------------------------------------------------------------------------------------------------
+
+# (current, reference, names of the boolean options)
+PARSERS: Dict[str, Tuple[Callable[..., List[str]], Callable[..., List[str]], List[str]]] = {
+    'parse_text_to_list': (parse_text_to_list, _reference_parse_text_to_list,
+                           ['respect_parentheses', 'smart_splitting', 'clean_items']),
+    'parse_list_from_string': (parse_list_from_string, _reference_parse_list_from_string,
+                               ['strip_items', 'remove_empty', 'clean_items', 'smart_delimiters']),
+}
+
+
+def compare_outputs(strings: List[Any], default_options_only: bool = False) -> Dict[str, List[str]]:
+    """{parser name: ["<options> <string>", ...] for every differing output}"""
+    differences = {}
+    for name, (current, reference, option_names) in PARSERS.items():
+        differences[name] = []
+        combinations = [()] if default_options_only else itertools.product((True, False), repeat=len(option_names))
+        for values in combinations:
+            options = dict(zip(option_names, values))
+            for text in strings:
+                if current(text, **options) != reference(text, **options):
+                    differences[name].append(f"{options} {text[:80]!r}")
+    return differences
+
+
+#######################################################################################################################
+# MEMORY
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _aggregate_with_lists(strings: List[str]) -> set:
+    per_string = [parse_text_to_list(text) for text in strings]
+    merged = set()
+    for items in per_string:
+        merged.update(items)
+    return merged
+
+
+def peak_memory(function: Callable[[], Any]) -> Tuple[Any, int]:
+    tracemalloc.start()
+    try:
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parity, speed and memory of the streaming list parsers")
+    parser.add_argument('--repeat', type=int, default=3, help="timing repetitions (best is kept)")
+    parser.add_argument('--default-options-only', action='store_true', help="only check the default options")
+    args = parser.parse_args()
+
+    strings = load_corpus_strings()
+    print(f"{len(strings):,} corpus strings")
+
+    app_logger.disabled = True
+    try:
+        differences = compare_outputs(strings, args.default_options_only)
+
+        print("=" * 70)
+        for name, (current, reference, _) in PARSERS.items():
+            before = _best_time(lambda: [reference(text) for text in strings], args.repeat)
+            after = _best_time(lambda: [current(text) for text in strings], args.repeat)
+            print(f"{name:<24} previous {before:7.3f} s   current {after:7.3f} s   x{before / after:.2f}   "
+                  f"differences {len(differences[name])}")
+            for line in differences[name][:10]:
+                print(f"    {line}")
+
+        listed, listed_peak = peak_memory(lambda: _aggregate_with_lists(strings))
+        streamed, streamed_peak = peak_memory(lambda: unique_items(strings))
+    finally:
+        app_logger.disabled = False
+
+    print(f"distinct items: lists {len(listed):,} / streamed {len(streamed):,}   "
+          f"peak {listed_peak / 2 ** 20:.1f} MiB -> {streamed_peak / 2 ** 20:.1f} MiB")
+    ok = listed == streamed and not any(differences.values())
+    sys.exit(0 if ok else 1)
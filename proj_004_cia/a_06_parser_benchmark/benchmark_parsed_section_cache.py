@@ -0,0 +1,142 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Compatibility harness and benchmark for a_04_iso_to_cia_code.parsed_section_cache.
+
+1. Parity: for every category and country, the value read back from the on-disk
+   cache must equal a fresh return_*_data(load_country_data(iso3Code), iso3Code).
+2. Runs: wall time of the single-pass feature runner and of one array extractor,
+   each in a fresh process, with the cache disabled, cold (empty cache) and warm.
+
+Everything is written to a temporary cache directory, removed at the end.
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_parsed_section_cache
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_parsed_section_cache --categories Economy Geography
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+from typing import Dict, List, Optional, Sequence
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, list_available_countries
+from proj_004_cia.a_04_iso_to_cia_code.parsed_section_cache import (
+    ParsedSectionCache, cached_parse, flush_parsed_section_cache
+)
+from proj_004_cia.z_reports.category_sections import CATEGORY_PARSERS
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Commands timed in a fresh process each, so nothing is served from this process's memory
+RUNS = {
+    'all features (single pass)': [sys.executable, '-m', 'proj_004_cia.t_nation_features_batch.run_all_features',
+                                   '--no-save'],
+    'one array extractor': [sys.executable, '-c',
+                            'from proj_004_cia.w_nation_feature_arrays.extract_agricultural_products_array_per_country '
+                            'import get_agricultural_products; get_agricultural_products()'],
+}
+
+#######################################################################################################################
+# PARITY
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def compare_cached(cache_dir: str, categories: Sequence[str], countries: Sequence[str]) -> List[str]:
+    """(category, country) pairs whose cached value differs from a fresh parse."""
+    from proj_004_cia.__config.config import Config
+
+    Config.PARSED_CACHE_ENABLED = True
+    Config.PARSED_CACHE_DIR = cache_dir
+    differences = []
+    for category in categories:
+        parser = CATEGORY_PARSERS[category]
+        expected = {}
+        for iso3Code in countries:
+            try:
+                expected[iso3Code] = parser(load_country_data(iso3Code), iso3Code)
+                cached_parse(category, parser, iso3Code)
+            except Exception as e:
+                differences.append(f"{category} {iso3Code}: {e}")
+
+        # A new reader sees only what was flushed to disk
+        flush_parsed_section_cache()
+        reader = ParsedSectionCache(cache_dir)
+        entries = reader.entries()
+        for iso3Code, value in expected.items():
+            entry = entries.get(f"{iso3Code}|{category}")
+            hit, cached = (False, None) if entry is None else reader.get(iso3Code, category, entry[0], entry[1])
+            if not hit or cached != value:
+                differences.append(f"{category} {iso3Code}")
+        reader.close()
+    return differences
+
+
+#######################################################################################################################
+# RUNS
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def time_run(command: List[str], cache_dir: str, enabled: bool) -> Optional[float]:
+    """Wall time of a command in a fresh process, None if it failed."""
+    env = dict(os.environ, PARSED_CACHE_DIR=cache_dir, PARSED_CACHE_ENABLED='true' if enabled else 'false')
+    start = time.perf_counter()
+    completed = subprocess.run(command, cwd=_PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - start
+    return elapsed if completed.returncode == 0 else None
+
+
+def time_runs(cache_dir: str) -> Dict[str, Dict[str, Optional[float]]]:
+    """{run: {'disabled', 'cold', 'warm': seconds}}; the cache is emptied before each cold run."""
+    timings = {}
+    for name, command in RUNS.items():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        timings[name] = {
+            'disabled': time_run(command, cache_dir, enabled=False),
+            'cold': time_run(command, cache_dir, enabled=True),
+            'warm': time_run(command, cache_dir, enabled=True),
+        }
+    return timings
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parity and run times of the parsed-section cache")
+    parser.add_argument('--categories', nargs='*', default=None, help="categories to check (default: all)")
+    parser.add_argument('--skip-runs', action='store_true', help="parity only")
+    args = parser.parse_args()
+
+    categories = args.categories or list(CATEGORY_PARSERS)
+    countries = list_available_countries()
+    root = tempfile.mkdtemp(prefix='parsed_cache_')
+    try:
+        differences = compare_cached(os.path.join(root, 'parity'), categories, countries)
+        stats = ParsedSectionCache(os.path.join(root, 'parity')).stats()
+        timings = {} if args.skip_runs else time_runs(os.path.join(root, 'runs'))
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    print(f"{len(categories)} categories x {len(countries)} countries: {stats['entries']:,} entries, "
+          f"{stats['live_bytes'] / 1024 / 1024:.1f} MB")
+    print("=" * 70)
+    print(f"{'run':<30}{'disabled':>10}{'cold':>10}{'warm':>10}")
+    for name, row in timings.items():
+        cells = ''.join(f"{row[key]:>9.2f}s" if row[key] is not None else f"{'failed':>10}"
+                        for key in ('disabled', 'cold', 'warm'))
+        print(f"{name:<30}{cells}")
+    print(f"differences {len(differences)}")
+    for difference in differences[:10]:
+        print(f"    {difference}")
+    failed = any(value is None for row in timings.values() for value in row.values())
+    sys.exit(0 if not differences and not failed else 1)
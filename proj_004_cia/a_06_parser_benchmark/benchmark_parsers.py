@@ -0,0 +1,370 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Benchmark every registered parser (all 13 section registries) against every country.
+
+Per parser it reports wall time, calls per second, p50/p95/max per country, the
+slowest countries and, in a separate tracemalloc pass, the peak bytes allocated per
+call and the memory blocks a call leaves behind (caches, leaks).
+
+Results can be stored as a JSON baseline; compare mode fails (exit code 1) when a
+parser got slower than the baseline by more than Config.PARSER_BENCHMARK_REGRESSION_PCT
+percent. Each country is timed best-of-3 by default to keep the gate stable.
+
+Usage:
+    # Write the baseline
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_parsers --save-baseline
+
+    # Later: fail on regressions
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_parsers --compare --threshold 20
+
+    # Narrow the run
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_parsers --sections Economy Energy --countries USA FRA WLD
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import gc
+import os
+import sys
+import json
+import math
+import time
+import platform
+import importlib
+import tracemalloc
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from proj_004_cia.__config.config import Config
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, list_available_countries
+from proj_004_cia.c_00_transform_utils.parser_registry import ParserRegistry, ParserSpec, WORLD
+
+#######################################################################################################################
+# CONSTANTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+BENCHMARK_VERSION = 1
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'analysis_folder', 'parser_benchmark_baseline.json')
+
+# Raw section name -> (dispatcher module, registry name)
+SECTION_REGISTRIES: Dict[str, Tuple[str, str]] = {
+    'Introduction': ('proj_004_cia.c_01_intoduction.helper.get_introduction', 'INTRODUCTION_REGISTRY'),
+    'Geography': ('proj_004_cia.c_02_geography.helper.get_geography', 'GEOGRAPHY_REGISTRY'),
+    'People and Society': ('proj_004_cia.c_03_society.helper.get_society', 'SOCIETY_REGISTRY'),
+    'Environment': ('proj_004_cia.c_04_environment.helper.get_environment', 'ENVIRONMENT_REGISTRY'),
+    'Government': ('proj_004_cia.c_05_government.helper.get_government', 'GOVERNMENT_REGISTRY'),
+    'Economy': ('proj_004_cia.c_06_economy.helper.get_economy', 'ECONOMY_REGISTRY'),
+    'Energy': ('proj_004_cia.c_07_energy.helper.get_energy', 'ENERGY_REGISTRY'),
+    'Communications': ('proj_004_cia.c_08_communications.helper.get_communications', 'COMMUNICATIONS_REGISTRY'),
+    'Transportation': ('proj_004_cia.c_09_transportation.helper.get_transportation', 'TRANSPORTATION_REGISTRY'),
+    'Military and Security': ('proj_004_cia.c_10_military.helper.get_military', 'MILITARY_REGISTRY'),
+    'Space': ('proj_004_cia.c_11_space.helper.get_space', 'SPACE_REGISTRY'),
+    'Terrorism': ('proj_004_cia.c_12_terrorism.helper.get_terrorism', 'TERRORISM_REGISTRY'),
+    'Transnational Issues': ('proj_004_cia.c_13_issues.helper.get_issues', 'ISSUES_REGISTRY'),
+}
+
+#######################################################################################################################
+# HELPERS
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def get_registry(section: str) -> ParserRegistry:
+    module_name, registry_name = SECTION_REGISTRIES[section]
+    return getattr(importlib.import_module(module_name), registry_name)
+
+
+def parser_id(registry: ParserRegistry, spec: ParserSpec) -> str:
+    """Stable benchmark key of a parser, e.g. 'Economy/gini' or 'Space/space:world'."""
+    suffix = ':world' if spec.scope == WORLD else ''
+    return f"{registry.section}/{spec.key}{suffix}"
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank percentile
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _time_call(spec: ParserSpec, section: Dict[str, Any], iso3Code: str, repeat: int) -> Tuple[float, bool]:
+    """Best-of-`repeat` wall time of one parser call in ms, and whether it raised."""
+    best = None
+    failed = False
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        try:
+            spec(section, iso3Code)
+        except Exception:
+            failed = True
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None or elapsed < best else best
+    return best / 1e6, failed
+
+
+def _measure_allocations(spec: ParserSpec, section: Dict[str, Any], iso3Code: str) -> Tuple[int, int]:
+    """(peak bytes, blocks still alive afterwards) of one parser call; tracemalloc must be running."""
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    try:
+        spec(section, iso3Code)
+    except Exception:
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename') if stat.count_diff > 0)
+    return max(0, peak - base), blocks
+
+
+#######################################################################################################################
+# BENCHMARK
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def benchmark_parsers(sections: Optional[List[str]] = None,
+                      countries: Optional[List[str]] = None,
+                      repeat: int = 3,
+                      track_allocations: bool = True,
+                      allocation_countries: int = 20,
+                      slowest: int = 5) -> Dict[str, Any]:
+    """
+    Run every parser of the selected sections against every selected country.
+
+    Country data is loaded once up front so the timings cover parsing, plus whatever
+    an old-style parser reloads by itself.
+
+    Args:
+        sections: Raw section names (keys of SECTION_REGISTRIES); default all
+        countries: ISO3 codes; default every available country (WLD included)
+        repeat: Calls per country, the fastest one is kept
+        track_allocations: Run the tracemalloc pass (slow, done separately from timing)
+        allocation_countries: Countries sampled per parser in the tracemalloc pass
+        slowest: Number of slowest countries kept per parser
+
+    Returns:
+        Benchmark result dict with a 'parsers' entry per parser id
+    """
+    sections = sections or list(SECTION_REGISTRIES)
+    countries = countries or list_available_countries()
+    country_data = {}
+    for iso3Code in countries:
+        try:
+            country_data[iso3Code] = load_country_data(iso3Code)
+        except (ValueError, OSError):
+            continue
+
+    results: Dict[str, Dict[str, Any]] = {}
+    run_start = time.perf_counter()
+
+    for section_name in sections:
+        registry = get_registry(section_name)
+        section_views = {iso3Code: registry.section_data(data) for iso3Code, data in country_data.items()}
+
+        for spec in registry:
+            # Import a lazily bound parser and run one untimed pass so first-call costs
+            # (imports, regex compiles, interpreter warm-up) stay out of the timings
+            spec.parser
+            for iso3Code, section in section_views.items():
+                if spec.applies_to(iso3Code):
+                    try:
+                        spec(section, iso3Code)
+                    except Exception:
+                        pass
+
+            timings = []
+            errors = 0
+            # Same as timeit: keep collector pauses out of the measurements
+            gc.collect()
+            gc.disable()
+            try:
+                for iso3Code, section in section_views.items():
+                    if not spec.applies_to(iso3Code):
+                        continue
+                    elapsed_ms, failed = _time_call(spec, section, iso3Code, repeat)
+                    timings.append((elapsed_ms, iso3Code))
+                    errors += failed
+            finally:
+                gc.enable()
+
+            values = sorted(elapsed for elapsed, _ in timings)
+            total_ms = sum(values)
+            results[parser_id(registry, spec)] = {
+                'section': registry.section,
+                'key': spec.key,
+                'parser': spec.parser_name,
+                'calls': len(values),
+                'errors': errors,
+                'total_ms': round(total_ms, 4),
+                'calls_per_sec': round(len(values) / (total_ms / 1000), 1) if total_ms else None,
+                'p50_ms': round(_percentile(values, 50), 4),
+                'p95_ms': round(_percentile(values, 95), 4),
+                'max_ms': round(values[-1], 4) if values else 0.0,
+                'slowest': [[iso3Code, round(elapsed, 4)]
+                            for elapsed, iso3Code in sorted(timings, reverse=True)[:slowest]],
+                'per_country_ms': {iso3Code: round(elapsed, 4) for elapsed, iso3Code in timings},
+            }
+
+            if track_allocations and timings:
+                # Sample the slowest countries: they are the interesting ones for allocations too
+                sample = [iso3Code for _, iso3Code in sorted(timings, reverse=True)[:allocation_countries]]
+                tracemalloc.start()
+                try:
+                    measured = [_measure_allocations(spec, section_views[iso3Code], iso3Code)
+                                for iso3Code in sample]
+                finally:
+                    tracemalloc.stop()
+                results[parser_id(registry, spec)].update({
+                    'alloc_sampled_calls': len(measured),
+                    'alloc_peak_bytes_max': max(peak for peak, _ in measured),
+                    'alloc_retained_blocks_mean': round(sum(blocks for _, blocks in measured) / len(measured), 1),
+                })
+
+    return {
+        'version': BENCHMARK_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'countries': len(country_data),
+        'sections': sections,
+        'repeat': repeat,
+        'elapsed_seconds': round(time.perf_counter() - run_start, 2),
+        'parsers': results,
+    }
+
+
+#######################################################################################################################
+# BASELINE
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def save_benchmark(result: Dict[str, Any], path: str = DEFAULT_BASELINE_PATH) -> str:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_benchmark(path: str = DEFAULT_BASELINE_PATH) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        result = json.load(f)
+    if result.get('version') != BENCHMARK_VERSION:
+        raise ValueError(f"Unsupported benchmark baseline version {result.get('version')}: {path}")
+    return result
+
+
+def compare_benchmarks(current: Dict[str, Any],
+                       baseline: Dict[str, Any],
+                       threshold_pct: Optional[float] = None,
+                       metric: str = 'total_ms',
+                       min_delta_ms: float = 1.0) -> List[Dict[str, Any]]:
+    """
+    Return the parsers whose `metric` grew by more than `threshold_pct` percent.
+
+    Differences smaller than `min_delta_ms` are treated as noise, and parsers
+    missing from the baseline are skipped. When a run covers a different set of
+    countries than the baseline, total_ms is compared over the shared countries.
+    """
+    if threshold_pct is None:
+        threshold_pct = Config.PARSER_BENCHMARK_REGRESSION_PCT
+
+    regressions = []
+    for pid, stats in current['parsers'].items():
+        base = baseline['parsers'].get(pid)
+        if not base or base.get(metric) is None or stats.get(metric) is None:
+            continue
+        before, after = base[metric], stats[metric]
+        if metric == 'total_ms' and base.get('calls') != stats['calls']:
+            # Different country selection: compare totals over the countries both runs timed
+            shared = base.get('per_country_ms', {}).keys() & stats.get('per_country_ms', {}).keys()
+            if not shared:
+                continue
+            before = sum(base['per_country_ms'][iso3Code] for iso3Code in shared)
+            after = sum(stats['per_country_ms'][iso3Code] for iso3Code in shared)
+        if after - before < min_delta_ms:
+            continue
+        change_pct = (after - before) / before * 100 if before else float('inf')
+        if change_pct > threshold_pct:
+            regressions.append({'parser': pid, 'metric': metric, 'baseline': round(before, 4),
+                                'current': after, 'change_pct': round(change_pct, 1)})
+    return sorted(regressions, key=lambda r: r['change_pct'], reverse=True)
+
+
+#######################################################################################################################
+# REPORT
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def print_report(result: Dict[str, Any], top: int = 25) -> None:
+    parsers = sorted(result['parsers'].items(), key=lambda item: item[1]['total_ms'], reverse=True)
+    total_ms = sum(stats['total_ms'] for _, stats in parsers)
+    print(f"\n{len(parsers)} parsers x {result['countries']} countries, repeat={result['repeat']}: "
+          f"{total_ms / 1000:.2f}s parsing ({result['elapsed_seconds']}s wall)")
+    print("=" * 140)
+    print(f"{'parser':<60} {'calls':>6} {'total ms':>10} {'calls/s':>10} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'peak KiB':>9} {'kept':>7}  slowest")
+    print("-" * 140)
+    for pid, stats in parsers[:top]:
+        peak = stats.get('alloc_peak_bytes_max')
+        blocks = stats.get('alloc_retained_blocks_mean')
+        slowest = ', '.join(f"{iso3Code} {elapsed:.2f}" for iso3Code, elapsed in stats['slowest'][:3])
+        print(f"{pid[:60]:<60} {stats['calls']:>6} {stats['total_ms']:>10.2f} {stats['calls_per_sec'] or 0:>10.0f} "
+              f"{stats['p50_ms']:>8.3f} {stats['p95_ms']:>8.3f} "
+              f"{(peak / 1024 if peak is not None else 0):>9.1f} {(blocks or 0):>7.0f}  {slowest}")
+    errors = {pid: stats['errors'] for pid, stats in parsers if stats['errors']}
+    if errors:
+        print(f"\nParsers that raised: {errors}")
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark every section parser against every country")
+    parser.add_argument('--sections', nargs='*', default=None, choices=list(SECTION_REGISTRIES),
+                        help="Raw section names (default: all)")
+    parser.add_argument('--countries', nargs='*', default=None, help="ISO3 codes (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="Calls per country, fastest kept")
+    parser.add_argument('--no-alloc', action='store_true', help="Skip the tracemalloc pass")
+    parser.add_argument('--output', default=None, help="Also write this run's results to a JSON file")
+    parser.add_argument('--save-baseline', nargs='?', const=DEFAULT_BASELINE_PATH, default=None,
+                        help="Store the run as the baseline")
+    parser.add_argument('--compare', nargs='?', const=DEFAULT_BASELINE_PATH, default=None,
+                        help="Compare against a stored baseline; exit 1 on regressions")
+    parser.add_argument('--threshold', type=float, default=None,
+                        help="Allowed slowdown in percent (default: Config.PARSER_BENCHMARK_REGRESSION_PCT)")
+    parser.add_argument('--metric', default='total_ms', choices=['total_ms', 'p50_ms', 'p95_ms'],
+                        help="Metric compared against the baseline")
+    parser.add_argument('--min-delta-ms', type=float, default=1.0,
+                        help="Ignore slowdowns smaller than this many ms (noise floor)")
+    parser.add_argument('--top', type=int, default=25, help="Rows in the printed report")
+    args = parser.parse_args()
+
+    result = benchmark_parsers(sections=args.sections,
+                               countries=args.countries,
+                               repeat=args.repeat,
+                               track_allocations=not args.no_alloc)
+    print_report(result, top=args.top)
+
+    if args.output:
+        print(f"\nResults written to {save_benchmark(result, args.output)}")
+    if args.save_baseline:
+        print(f"\nBaseline written to {save_benchmark(result, args.save_baseline)}")
+
+    if args.compare:
+        threshold = args.threshold if args.threshold is not None else Config.PARSER_BENCHMARK_REGRESSION_PCT
+        regressions = compare_benchmarks(result, load_benchmark(args.compare), threshold, args.metric,
+                                         args.min_delta_ms)
+        print(f"\nCompared {args.metric} against {args.compare} (threshold {threshold:.0f}%)")
+        for regression in regressions:
+            print(f"  REGRESSION {regression['parser']}: {regression['baseline']:.2f} -> "
+                  f"{regression['current']:.2f} ms ({regression['change_pct']:+.1f}%)")
+        if regressions:
+            sys.exit(1)
+        print("  No regressions")
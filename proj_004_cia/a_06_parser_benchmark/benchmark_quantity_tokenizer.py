@@ -0,0 +1,268 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Compatibility harness and benchmark for c_00_transform_utils.quantity_tokenizer.
+
+extract_numeric_value and parse_percentage_data now read one token stream instead of
+looping over substring tests and regexes. The previous implementations are kept below
+(_reference_*) and both versions are run over every string in _raw_data. Each difference
+is put in a category:
+
+    false magnitude      the old code took 'k' / 'm' / 'b' / 't' (...) out of an ordinary word
+                         ("km", "est.", "tonnes") and multiplied the number by it
+    magnitude order      the old code took the first magnitude of its lookup table ("million" before
+                         "trillion"); the tokenizer takes the first one in the text
+    false estimate       the old code read 'est' inside a word ("west", "highest") as an estimate
+    thousands separator  the old patterns split "1,234" at the comma (e.g. "1,234%" -> 234)
+    old parse error      the old code matched a stray '.' ("S. SMITH") as a number and failed
+    other                anything else - the harness fails when there are any
+
+Usage:
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_quantity_tokenizer
+    python -m proj_004_cia.a_06_parser_benchmark.benchmark_quantity_tokenizer --samples 10 --repeat 5
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import re
+import sys
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Union
+from proj_004_cia.__logger.logger import app_logger
+from proj_004_cia.a_06_parser_benchmark.benchmark_clean_text import load_corpus_strings, _best_time
+from proj_004_cia.c_00_transform_utils.extract_numeric_value import extract_numeric_value
+from proj_004_cia.c_00_transform_utils.parse_percentage_data import parse_percentage_data
+from proj_004_cia.c_00_transform_utils.quantity_tokenizer import tokenize_quantity, MAGNITUDE, ESTIMATE, YEAR
+
+#######################################################################################################################
+# REFERENCE IMPLEMENTATIONS - before the tokenizer (logging removed)
+# ---------------------------------------------------------------------------------------------------------------------
+
+_REFERENCE_MAGNITUDES = {
+    'thousand': 1_000, 'k': 1_000,
+    'million': 1_000_000, 'm': 1_000_000, 'mn': 1_000_000,
+    'billion': 1_000_000_000, 'b': 1_000_000_000, 'bn': 1_000_000_000,
+    'trillion': 1_000_000_000_000, 't': 1_000_000_000_000, 'tn': 1_000_000_000_000
+}
+
+
+def _reference_extract_numeric_value(text: str, unit: str = None, allow_ranges: bool = True) -> Union[float, None]:
+    if not text or not isinstance(text, str):
+        return None
+    try:
+        original_text = text.strip()
+        working_text = original_text.lower()
+        special_values = {
+            'na': None, 'n/a': None, 'not available': None,
+            'negligible': 0, 'trace': 0.001, 'less than 1': 0.5
+        }
+        if working_text in special_values:
+            return special_values[working_text]
+        if unit:
+            unit_lower = unit.lower()
+            if unit_lower in working_text:
+                working_text = working_text.replace(unit_lower, '').strip()
+        multiplier = 1
+        for magnitude, mult_value in _REFERENCE_MAGNITUDES.items():
+            if magnitude in working_text:
+                multiplier = mult_value
+                working_text = working_text.replace(magnitude, '').strip()
+                break
+        range_patterns = [
+            r'(\d+(?:\.\d+)?)\s*[-–—]\s*(\d+(?:\.\d+)?)',
+            r'(\d+(?:\.\d+)?)\s+to\s+(\d+(?:\.\d+)?)',
+            r'between\s+(\d+(?:\.\d+)?)\s+and\s+(\d+(?:\.\d+)?)'
+        ]
+        if allow_ranges:
+            for pattern in range_patterns:
+                match = re.search(pattern, working_text)
+                if match:
+                    min_val = float(match.group(1)) * multiplier
+                    max_val = float(match.group(2)) * multiplier
+                    return (min_val + max_val) / 2
+        match = re.search(r'(\d+(?:,\d{3})*(?:\.\d+)?)', working_text.replace(',', ''))
+        if match:
+            return float(match.group(1).replace(',', '')) * multiplier
+        return None
+    except Exception:
+        return None
+
+
+def _reference_parse_percentage_data(data_string: str, return_decimal: bool = True,
+                                     extract_year: bool = True) -> dict:
+    if not isinstance(data_string, str) or not data_string.strip():
+        return {}
+    try:
+        text = data_string.strip()
+        result = {}
+        percentage_patterns = [
+            r'([\d.]+)%\s*\((\d{4})\s*est\.?\)',
+            r'([\d.]+)%\s*\((\d{4})\)',
+            r'([\d.]+)\s*percent\s*\((\d{4})\)',
+            r'([\d.]+)%',
+            r'([\d.]+)\s*percent',
+        ]
+        percentage_value = None
+        year_value = None
+        is_estimate = False
+        for pattern in percentage_patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                percentage_value = float(match.group(1))
+                if len(match.groups()) > 1:
+                    year_value = int(match.group(2))
+                if 'est' in text.lower():
+                    is_estimate = True
+                break
+        if percentage_value is None:
+            number_match = re.search(r'([\d.]+)', text)
+            if number_match:
+                percentage_value = float(number_match.group(1))
+            else:
+                raise ValueError(f"No percentage value found in: {text}")
+        if return_decimal:
+            result['value'] = percentage_value / 100
+            result['percentage'] = percentage_value
+        else:
+            result['value'] = percentage_value
+        if extract_year and year_value:
+            result['year'] = year_value
+        result['is_estimate'] = is_estimate
+        result['original_text'] = data_string
+        if 'annual' in text.lower():
+            result['period'] = 'annual'
+        elif 'monthly' in text.lower():
+            result['period'] = 'monthly'
+        return result
+    except Exception:
+        return {}
+
+
+#######################################################################################################################
+# DIFF CATEGORIES
+# ---------------------------------------------------------------------------------------------------------------------
+
+SHORT_TEXT_CHARS = 80
+
+_SEPARATED_NUMBER_RE = re.compile(r'\d,\d{3}')
+_REFERENCE_NUMBER_RE = re.compile(r'([\d.]+)')
+
+
+def _reference_number_fails(text: str) -> bool:
+    match = _REFERENCE_NUMBER_RE.search(text)
+    if not match:
+        return False
+    try:
+        float(match.group(1))
+    except ValueError:
+        return True
+    return False
+
+
+def _reference_magnitude(text: str) -> Optional[str]:
+    working_text = text.strip().lower()
+    return next((magnitude for magnitude in _REFERENCE_MAGNITUDES if magnitude in working_text), None)
+
+
+def _numeric_category(text: str) -> str:
+    magnitude = _reference_magnitude(text)
+    tokens = tokenize_quantity(text.strip())
+    magnitudes = [token.text for token in tokens if token.kind == MAGNITUDE]
+    if magnitude and magnitude not in magnitudes:
+        return 'false magnitude'
+    if magnitude and magnitudes[0] != magnitude:
+        return 'magnitude order'
+    if _SEPARATED_NUMBER_RE.search(text):
+        return 'thousands separator'
+    return 'other'
+
+
+def _percentage_category(text: str, old: dict, new: dict) -> str:
+    changed = {key for key in set(old) | set(new) if old.get(key) != new.get(key)}
+    tokens = tokenize_quantity(text.strip())
+    has_estimate = any(token.kind == ESTIMATE or (token.kind == YEAR and 'est' in token.text) for token in tokens)
+    if changed == {'is_estimate'} and old.get('is_estimate') and not has_estimate:
+        return 'false estimate'
+    if not old and _reference_number_fails(text):
+        return 'old parse error'
+    if _SEPARATED_NUMBER_RE.search(text):
+        return 'thousands separator'
+    return 'other'
+
+
+def compare_outputs(strings: List[Any]) -> Dict[str, Dict[str, List[str]]]:
+    """{function: {category: [description, ...]}} for every string whose output changed."""
+    differences: Dict[str, Dict[str, List[str]]] = {'extract_numeric_value': defaultdict(list),
+                                                   'parse_percentage_data': defaultdict(list)}
+    for text in strings:
+        old = _reference_extract_numeric_value(text)
+        new = extract_numeric_value(text)
+        if old != new:
+            differences['extract_numeric_value'][_numeric_category(text)].append(f"{text!r}: {old!r} -> {new!r}")
+
+        old = _reference_parse_percentage_data(text)
+        new = parse_percentage_data(text)
+        if old != new:
+            category = _percentage_category(text, old, new)
+            differences['parse_percentage_data'][category].append(
+                f"{text!r}: {({k: v for k, v in old.items() if k != 'original_text'})} -> "
+                f"{({k: v for k, v in new.items() if k != 'original_text'})}")
+    return differences
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Diff and benchmark the quantity tokenizer against the old parsers")
+    parser.add_argument('--samples', type=int, default=3, help="Examples printed per category")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per variant, fastest kept")
+    args = parser.parse_args()
+
+    strings: List[Any] = load_corpus_strings()
+    print(f"{len(strings):,} corpus strings")
+
+    # Both versions log every miss; silence them while comparing and timing
+    app_logger.disabled = True
+    try:
+        differences = compare_outputs(strings)
+        # Field values ("12,429 km", "4.88% (2023 est.)") are what the parsers see; prose is timed separately.
+        # 'cold' clears the token memo before every run, 'warm' re-reads strings that are already memoized.
+        short = [s for s in strings if len(s) <= SHORT_TEXT_CHARS]
+        timings = {}
+        for label, subset in ((f'all strings ({len(strings):,})', strings),
+                              (f'<= {SHORT_TEXT_CHARS} chars ({len(short):,})', short)):
+            for function, reference in ((extract_numeric_value, _reference_extract_numeric_value),
+                                        (parse_percentage_data, _reference_parse_percentage_data)):
+                def cold_run():
+                    tokenize_quantity.cache_clear()
+                    return [function(s) for s in subset]
+
+                timings[f'{function.__name__}, {label}'] = (
+                    _best_time(lambda: [reference(s) for s in subset], args.repeat),
+                    _best_time(cold_run, args.repeat),
+                    _best_time(lambda: [function(s) for s in subset], args.repeat))
+    finally:
+        app_logger.disabled = False
+
+    unexplained = 0
+    for function_name, categories in differences.items():
+        total = sum(len(items) for items in categories.values())
+        print("=" * 100)
+        print(f"{function_name}: {total:,} of {len(strings):,} outputs changed")
+        for category, items in sorted(categories.items()):
+            print(f"  {category:<22} {len(items):>7,}")
+            for item in items[:args.samples]:
+                print(f"      {item[:150]}")
+        unexplained += len(categories.get('other', []))
+
+    print("=" * 100)
+    for function_name, (reference, cold, warm) in timings.items():
+        print(f"{function_name:<46} previous {reference * 1000:7.1f} ms   "
+              f"cold {cold * 1000:7.1f} ms x{reference / cold:.2f}   warm {warm * 1000:7.1f} ms x{reference / warm:.2f}")
+    print(f"Unexplained differences: {unexplained}")
+    sys.exit(1 if unexplained else 0)
@@ -0,0 +1,376 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Opt-in instrumentation of the `re` calls made by the parsers.
+
+While enabled, re.search / match / fullmatch / sub / subn / findall / finditer / split / compile
+are replaced by timed wrappers. Calls made from proj_004_cia modules are recorded per pattern
+and per calling function (module:function): call count, cumulative time and how many calls
+missed re's internal cache and compiled the pattern. Patterns compiled with re.compile while
+enabled are handed out as a thin proxy so that their methods are timed too (patterns compiled
+before enabling are not seen). Calls from anywhere else go straight to `re`.
+
+The proxy passes isinstance(p, re.Pattern) (re itself relies on that once the profiler is disabled),
+but type(p) is not re.Pattern: code that checks the exact type sees a _ProfiledPattern.
+
+finditer is timed up to the iterator it returns; the iteration itself is not.
+
+Enable it:
+    - for a whole script or module, from this CLI (installed before it imports anything; the text
+      report goes to stderr and the JSON to --json, default Config.REGEX_PROFILE_JSON_PATH)
+    - around a block:
+          with regex_profile() as profiler:
+              ...
+          print(profiler.report())
+
+Usage:
+    # Full corpus run through every return_*_data function
+    python -m proj_004_cia.a_06_parser_benchmark.regex_profiler
+    python -m proj_004_cia.a_06_parser_benchmark.regex_profiler --countries USA FRA --top 50 --json regex_profile.json
+
+    # Any script or module, with its own arguments
+    python -m proj_004_cia.a_06_parser_benchmark.regex_profiler --run path/to/script.py --its-args
+    python -m proj_004_cia.a_06_parser_benchmark.regex_profiler -m proj_004_cia.t_nation_features_batch.run_all_features
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import re
+import sys
+import json
+import time
+import runpy
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from proj_004_cia.__config.config import Config
+
+#######################################################################################################################
+# RECORDING
+# ---------------------------------------------------------------------------------------------------------------------
+
+PACKAGE_PREFIX = 'proj_004_cia.'
+
+# re entry points wrapped while enabled, with the position of their `flags` argument
+_FLAGS_POSITION = {
+    'search': 2, 'match': 2, 'fullmatch': 2, 'findall': 2, 'finditer': 2,
+    'sub': 4, 'subn': 4, 'split': 3, 'compile': 1,
+}
+_PATTERN_METHODS = ('search', 'match', 'fullmatch', 'findall', 'finditer', 'sub', 'subn', 'split')
+_ORIGINAL = {name: getattr(re, name) for name in _FLAGS_POSITION}
+
+
+def _caller(depth: int = 2) -> Optional[str]:
+    """'module:function' of the frame calling into re, or None when it is outside the package."""
+    frame = sys._getframe(depth)
+    module = frame.f_globals.get('__name__', '')
+    if module == '__main__':
+        # A package module run with -m is recorded under its own name
+        spec = frame.f_globals.get('__spec__')
+        module = spec.name if spec is not None else module
+    if not module.startswith(PACKAGE_PREFIX):
+        return None
+    return f"{module[len(PACKAGE_PREFIX):]}:{frame.f_code.co_name}"
+
+
+def _is_cached(pattern: Any, flags: int) -> bool:
+    # re keeps compiled patterns in a dict keyed (type(pattern), pattern, flags)
+    if isinstance(pattern, re.Pattern):
+        return True
+    return (type(pattern), pattern, flags) in getattr(re, '_cache', {})
+
+
+class _PatternStats:
+    __slots__ = ('calls', 'seconds', 'compiles', 'functions', 'callers')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.compiles = 0
+        self.functions: Dict[str, int] = {}
+        self.callers: Dict[str, List[float]] = {}     # caller -> [calls, seconds]
+
+
+class RegexProfiler:
+    """
+    Records re calls made from proj_004_cia while enabled.
+
+    enable() / disable() nest (the wrappers stay installed until the last disable()).
+    """
+
+    def __init__(self):
+        self.stats: Dict[Tuple[str, int], _PatternStats] = {}
+        self._depth = 0
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # install / remove
+    # ------------------------------------------------------------------------------------------------------------------
+
+    @property
+    def enabled(self) -> bool:
+        return self._depth > 0
+
+    def enable(self) -> None:
+        if self._depth == 0:
+            for name in _FLAGS_POSITION:
+                setattr(re, name, self._wrap_function(name))
+        self._depth += 1
+
+    def disable(self) -> None:
+        if self._depth == 0:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            for name, function in _ORIGINAL.items():
+                setattr(re, name, function)
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+    def __enter__(self) -> 'RegexProfiler':
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # wrappers
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def record(self, pattern: Any, flags: int, function: str, caller: str, seconds: float, compiled: bool) -> None:
+        if isinstance(pattern, re.Pattern):
+            pattern, flags = pattern.pattern, pattern.flags
+        key = (pattern if isinstance(pattern, str) else repr(pattern), int(flags) & ~int(re.UNICODE))
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = _PatternStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.compiles += compiled
+        stats.functions[function] = stats.functions.get(function, 0) + 1
+        per_caller = stats.callers.get(caller)
+        if per_caller is None:
+            stats.callers[caller] = [1, seconds]
+        else:
+            per_caller[0] += 1
+            per_caller[1] += seconds
+
+    def _wrap_function(self, name: str) -> Callable:
+        original = _ORIGINAL[name]
+        flags_position = _FLAGS_POSITION[name]
+        perf_counter = time.perf_counter
+        record = self.record
+
+        def wrapper(pattern, *args, **kwargs):
+            if isinstance(pattern, _ProfiledPattern):
+                pattern = pattern.compiled
+                if name == 'compile':
+                    return original(pattern, *args, **kwargs)
+            caller = _caller()
+            if caller is None:
+                return original(pattern, *args, **kwargs)
+            if 'flags' in kwargs:
+                flags = kwargs['flags']
+            else:
+                flags = args[flags_position - 1] if len(args) >= flags_position else 0
+            compiled = not _is_cached(pattern, flags)
+            start = perf_counter()
+            result = original(pattern, *args, **kwargs)
+            record(pattern, flags, name, caller, perf_counter() - start, compiled)
+            if name == 'compile':
+                return _ProfiledPattern(result, self)
+            return result
+
+        wrapper.__name__ = name
+        wrapper.__wrapped__ = original
+        return wrapper
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # report
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def to_json(self) -> Dict[str, Any]:
+        """Report as a JSON-ready dict, patterns sorted by cumulative time."""
+        patterns = []
+        for (pattern, flags), stats in sorted(self.stats.items(), key=lambda item: -item[1].seconds):
+            patterns.append({
+                'pattern': pattern,
+                'flags': flags,
+                'calls': stats.calls,
+                'seconds': stats.seconds,
+                'compiles': stats.compiles,
+                'functions': stats.functions,
+                'callers': [{'caller': caller, 'calls': calls, 'seconds': seconds}
+                            for caller, (calls, seconds) in sorted(stats.callers.items(), key=lambda c: -c[1][1])],
+            })
+        return {
+            'calls': sum(p['calls'] for p in patterns),
+            'seconds': sum(p['seconds'] for p in patterns),
+            'compiles': sum(p['compiles'] for p in patterns),
+            'patterns': patterns,
+        }
+
+    def report(self, top: int = 30, callers: int = 3) -> str:
+        """Text report of the `top` patterns by cumulative time, each with its main callers."""
+        data = self.to_json()
+        lines = [f"Regex profile: {data['calls']:,} calls, {len(data['patterns']):,} patterns, "
+                 f"{data['seconds'] * 1000:,.1f} ms, {data['compiles']:,} compiles",
+                 f"{'calls':>10} {'total ms':>10} {'mean us':>8} {'compiles':>8}  pattern / callers"]
+        for entry in data['patterns'][:top]:
+            mean_us = entry['seconds'] / entry['calls'] * 1e6
+            flags = f"  [{re.RegexFlag(entry['flags'])!r}]" if entry['flags'] else ''
+            lines.append(f"{entry['calls']:>10,} {entry['seconds'] * 1000:>10.1f} {mean_us:>8.1f} "
+                         f"{entry['compiles']:>8,}  {entry['pattern'][:90]!r}{flags}")
+            for caller in entry['callers'][:callers]:
+                lines.append(f"{'':>40}  {caller['calls']:>8,} {caller['seconds'] * 1000:>8.1f} ms  {caller['caller']}")
+        return '\n'.join(lines)
+
+    def write_json(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(self.to_json(), handle, indent=2)
+
+    def emit_report(self, json_path: Optional[str] = None, top: Optional[int] = None) -> None:
+        """Print the text report to stderr and write the JSON report."""
+        print(self.report(top if top is not None else Config.REGEX_PROFILE_TOP), file=sys.stderr)
+        json_path = json_path if json_path is not None else Config.REGEX_PROFILE_JSON_PATH
+        if json_path:
+            self.write_json(json_path)
+            print(f"Regex profile JSON written to {json_path}", file=sys.stderr)
+
+
+class _ProfiledPattern:
+    """A compiled pattern whose matching methods are timed; everything else is the real Pattern."""
+
+    __slots__ = ('compiled', '_profiler')
+
+    def __init__(self, compiled: re.Pattern, profiler: RegexProfiler):
+        self.compiled = compiled
+        self._profiler = profiler
+
+    # isinstance(p, re.Pattern) falls back to __class__; re.Pattern cannot be subclassed
+    @property
+    def __class__(self) -> type:
+        return re.Pattern
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.compiled, name)
+
+    def __repr__(self) -> str:
+        return repr(self.compiled)
+
+    def __eq__(self, other: Any) -> bool:
+        return self.compiled == (other.compiled if isinstance(other, _ProfiledPattern) else other)
+
+    def __hash__(self) -> int:
+        return hash(self.compiled)
+
+    def __copy__(self) -> '_ProfiledPattern':
+        return self
+
+    def __deepcopy__(self, memo: dict) -> '_ProfiledPattern':
+        return self
+
+    def __reduce__(self):
+        return _ORIGINAL['compile'], (self.compiled.pattern, self.compiled.flags)
+
+
+def _timed_method(name: str) -> Callable:
+    def method(self, *args, **kwargs):
+        bound = getattr(self.compiled, name)
+        caller = _caller()
+        if caller is None or not self._profiler.enabled:
+            return bound(*args, **kwargs)
+        start = time.perf_counter()
+        result = bound(*args, **kwargs)
+        self._profiler.record(self.compiled, 0, name, caller, time.perf_counter() - start, False)
+        return result
+
+    method.__name__ = name
+    return method
+
+
+for _name in _PATTERN_METHODS:
+    setattr(_ProfiledPattern, _name, _timed_method(_name))
+
+######################################################################################################################
+# PROCESS-WIDE PROFILER
+######################################################################################################################
+
+PROFILER = RegexProfiler()
+
+
+@contextmanager
+def regex_profile(reset: bool = True) -> Iterator[RegexProfiler]:
+    """Profile re calls made inside the block with the process-wide profiler."""
+    if reset and not PROFILER.enabled:
+        PROFILER.reset()
+    PROFILER.enable()
+    try:
+        yield PROFILER
+    finally:
+        PROFILER.disable()
+
+
+def profile_corpus(countries: Optional[List[str]] = None) -> None:
+    """Run every country through every return_*_data function (parser errors are skipped)."""
+    from proj_004_cia.__logger.logger import app_logger
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, list_available_countries
+    from proj_004_cia.z_reports.category_sections import CATEGORY_PARSERS
+
+    app_logger.disabled = True
+    start = time.perf_counter()
+    parsed = 0
+    try:
+        for iso3Code in countries or list_available_countries():
+            try:
+                data = load_country_data(iso3Code)
+            except (ValueError, OSError):
+                continue
+            parsed += 1
+            for category_parser in CATEGORY_PARSERS.values():
+                try:
+                    category_parser(data, iso3Code)
+                except Exception:
+                    pass
+    finally:
+        app_logger.disabled = False
+    print(f"{parsed} countries parsed in {time.perf_counter() - start:.2f} s (instrumented)")
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Profile parser regex use over a full corpus run, a script or a module")
+    parser.add_argument('--countries', nargs='*', default=None, help="ISO3 codes (default: all)")
+    parser.add_argument('--top', type=int, default=Config.REGEX_PROFILE_TOP, help="Patterns in the text report")
+    parser.add_argument('--json', default=Config.REGEX_PROFILE_JSON_PATH, help="JSON report path ('' to skip)")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--run', metavar='SCRIPT', default=None, help="Profile this script instead of the corpus run")
+    target.add_argument('-m', dest='module', default=None, help="Profile this module (run as __main__)")
+    # Everything after --run SCRIPT / -m MODULE belongs to the profiled program
+    argv = sys.argv[1:]
+    split = next((i for i, arg in enumerate(argv) if arg in ('--run', '-m')), len(argv))
+    args = parser.parse_args(argv[:split + 2])
+    target_args = argv[split + 2:]
+
+    # Enabled before the parsers are imported, so their module-level re.compile patterns are seen too
+    with regex_profile() as profiler:
+        try:
+            if args.run or args.module:
+                sys.argv = [args.run or args.module] + target_args
+                if args.run:
+                    runpy.run_path(args.run, run_name='__main__')
+                else:
+                    runpy.run_module(args.module, run_name='__main__', alter_sys=True)
+            else:
+                profile_corpus(args.countries)
+        except SystemExit as exit_request:
+            if exit_request.code not in (None, 0):
+                print(f"Profiled program exited with {exit_request.code!r}", file=sys.stderr)
+
+    profiler.emit_report(json_path=args.json, top=args.top)
@@ -12,29 +12,33 @@ Enhanced with region and country filtering capabilities.
 import os
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from tqdm import tqdm
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from proj_004_cia.__logger.logger import app_logger
+from proj_004_cia.__config.config import Config
 # Import custom modules
 from proj_004_cia.a_02_cia_area_codes.utils.cia_code_names import cia_code_names
 from proj_004_cia.a_01_cia_to_iso.utils.cia_region_names import cia_region_names
+from proj_004_cia.b_01_extract.rebuild_manifest import RebuildManifest, hash_header, plan_country
+from proj_004_cia.c_00_transform_utils.parser_registry import LazyParser
 
 
-# Import section generators
+# Section generators - bound lazily, only the sections that actually run get imported
 # proj_004_cia.c_01_intoduction.return_introduction_data
-from proj_004_cia.c_01_intoduction.return_introduction_data import return_introduction_data
-from proj_004_cia.c_02_geography.return_geography_data import return_geography_data
-from proj_004_cia.c_03_society.return_society_data import return_society_data
-from proj_004_cia.c_04_environment.return_environment_data import return_environment_data
-from proj_004_cia.c_05_government.return_government_data import return_government_data
-from proj_004_cia.c_06_economy.return_economy_data import return_economy_data
-from proj_004_cia.c_07_energy.return_energy_data import return_energy_data
-from proj_004_cia.c_08_communications.return_communications_data import return_communications_data
-from proj_004_cia.c_09_transportation.return_transportation_data import return_transportation_data
-from proj_004_cia.c_10_military.return_military_data import return_military_data
-from proj_004_cia.c_11_space.return_space_data import return_space_data
-from proj_004_cia.c_12_terrorism.return_terrorism_data import return_terrorism_data
-from proj_004_cia.c_13_issues.return_issues_data import return_issues_data
+return_introduction_data = LazyParser('proj_004_cia.c_01_intoduction.return_introduction_data')
+return_geography_data = LazyParser('proj_004_cia.c_02_geography.return_geography_data')
+return_society_data = LazyParser('proj_004_cia.c_03_society.return_society_data')
+return_environment_data = LazyParser('proj_004_cia.c_04_environment.return_environment_data')
+return_government_data = LazyParser('proj_004_cia.c_05_government.return_government_data')
+return_economy_data = LazyParser('proj_004_cia.c_06_economy.return_economy_data')
+return_energy_data = LazyParser('proj_004_cia.c_07_energy.return_energy_data')
+return_communications_data = LazyParser('proj_004_cia.c_08_communications.return_communications_data')
+return_transportation_data = LazyParser('proj_004_cia.c_09_transportation.return_transportation_data')
+return_military_data = LazyParser('proj_004_cia.c_10_military.return_military_data')
+return_space_data = LazyParser('proj_004_cia.c_11_space.return_space_data')
+return_terrorism_data = LazyParser('proj_004_cia.c_12_terrorism.return_terrorism_data')
+return_issues_data = LazyParser('proj_004_cia.c_13_issues.return_issues_data')
 
 #######################################################################################################################
 # UTILITY FUNCTIONS
@@ -238,6 +242,195 @@ def determine_target_countries(countries: Optional[List[str]] = None, region: Op
     return sorted(list(target_countries))
 
 
+#######################################################################################################################
+# COUNTRY WORKER
+# ---------------------------------------------------------------------------------------------------------------------
+
+# (manifest holding the country's entry, output path, force, plan_only)
+RebuildTask = Tuple[RebuildManifest, str, bool, bool]
+
+SECTION_NAMES = [
+    "introduction", "geography", "government", "society", "economy", "environment", "energy",
+    "communications", "transportation", "military", "space", "terrorism", "issues"
+]
+
+# List of sections to be updated (prioritized by coverage and importance)
+ALL_SECTIONS = [
+    # High coverage, simple
+    ("introduction", return_introduction_data),
+    # High coverage, moderate complexity
+    ("geography", return_geography_data),
+    # High coverage, important for analysis
+
+    ("government", return_government_data),
+    # High coverage, demographic data
+    # ("society", return_society_data),
+    # High coverage, critical for analysis
+    # ("economy", return_economy_data),
+    # Growing importance
+    # ("environment", return_environment_data),
+    # Strategic importance
+    # ("energy", return_energy_data),
+    # Infrastructure data
+    # ("communications", return_communications_data),
+    # Infrastructure data
+    # ("transportation", return_transportation_data),
+    # Security analysis
+    # ("military", return_military_data),
+    # Future capabilities
+    # ("space", return_space_data),
+    # Security analysis
+    # ("terrorism", return_terrorism_data),
+    # International relations
+    # ("issues", return_issues_data)
+]
+
+
+def get_sections(skip_sections: Optional[List[str]] = None) -> List[Tuple[str, Any]]:
+    """Return the (section name, generator) pairs to run, minus any skipped sections."""
+    return [(name, func) for name, func in ALL_SECTIONS
+            if not skip_sections or name not in skip_sections]
+
+
+def process_country_file(task: Tuple[str, str, str, Optional[List[str]], Optional[RebuildTask]]) -> Dict[str, Any]:
+    """
+    Plan and parse one country's JSON file into its metadata dictionary.
+
+    Runs in a worker process, so it only takes and returns picklable values and
+    never writes files; the caller merges results and writes outputs in order.
+    The raw file is decoded once, here: the rebuild plan hashes the decoded data
+    and only the stale sections are parsed, merged into the saved previous ones.
+
+    Args:
+        task: (cia_region, cia_region_folder, file, skip_sections, rebuild);
+            rebuild is (manifest holding this country's entry, output path, force,
+            plan_only), or None to parse every section without a plan
+
+    Returns:
+        Dict with 'iso3Code', 'meta' (None if the country was skipped, unchanged
+        or only planned), 'plan' ({'header', 'current', 'stale', 'partial'} or None),
+        'errors' and per-section 'section_stats'
+    """
+    cia_region, cia_region_folder, file, skip_sections, rebuild = task
+    region_name = cia_region_names.get(cia_region, 'Unknown Region')
+    result = {'file': file, 'iso3Code': None, 'country_name': None, 'meta': None, 'plan': None,
+              'errors': 0, 'section_stats': {}}
+
+    try:
+        cia_file_code = file.replace('.json', '')
+        country_info = cia_code_names.get(cia_file_code, {})
+
+        if not country_info:
+            if app_logger:
+                app_logger.warning(
+                    f"No country info found for code: {cia_file_code}")
+            result['errors'] += 1
+            return result
+
+        iso3Code = country_info.get('iso3Code')
+        result['iso3Code'] = iso3Code
+        result['country_name'] = country_info.get('country_name', 'Unknown Country')
+        file_path = os.path.join(cia_region_folder, file)
+        data = load_json_file(file_path)
+
+        if not data:
+            if app_logger:
+                app_logger.error(
+                    f"Data is empty for file: {file_path}")
+            result['errors'] += 1
+            return result
+
+        sections = get_sections(skip_sections)
+        only_sections = None
+        previous = None
+        if rebuild is not None:
+            # Incremental rebuild: keep only the sections that are stale
+            manifest, output_path, force, plan_only = rebuild
+            header = hash_header(result['country_name'], region_name)
+            current, stale, previous = plan_country(
+                manifest, iso3Code, data, output_path, header, sections, force=force)
+            result['plan'] = {'header': header, 'current': current, 'stale': stale,
+                              'partial': previous is not None}
+            if not stale or plan_only:
+                return result
+            if previous is not None:
+                only_sections = stale
+
+        # Build the country metadata dictionary
+        country_cia_meta = {
+            'country_name': country_info.get('country_name', 'Unknown Country'),
+            'region': region_name,
+            'introduction': {},
+            'geography': {},
+            'society': {},
+            'environment': {},
+            'government': {},
+            'economy': {},
+            'energy': {},
+            'communications': {},
+            'transportation': {},
+            'military': {},
+            'space': {},
+            'terrorism': {},
+            'issues': {}
+        }
+
+        # Update sections in a loop with detailed tracking
+        for section_name, function in sections:
+            if only_sections is not None and section_name not in only_sections:
+                continue
+            stats = result['section_stats'].setdefault(section_name, {'success': 0, 'errors': 0})
+            try:
+                section_data = function(data, iso3Code)
+                country_cia_meta[section_name].update(section_data)
+                stats['success'] += 1
+
+                if app_logger:
+                    app_logger.data(f"Successfully processed {section_name}",
+                                    source=f"{iso3Code}_{section_name}",
+                                    records=len(section_data) if isinstance(section_data, dict) else 1)
+            except Exception as e:
+                stats['errors'] += 1
+                if app_logger:
+                    app_logger.error(
+                        f"Error updating '{section_name}' section for {iso3Code} - {country_info.get('country_name', 'Unknown Country')} - {cia_file_code} - {cia_region}: {e}")
+                result['errors'] += 1
+
+        if previous is not None:
+            # Partial rebuild: merge the fresh sections into the previous ones
+            previous.update({key: value for key, value in country_cia_meta.items()
+                             if key in ('country_name', 'region') or key in only_sections})
+            country_cia_meta = previous
+        result['meta'] = country_cia_meta
+
+    except Exception as e:
+        if app_logger:
+            app_logger.error(
+                f"Unexpected error processing file {file}: {e}")
+        result['errors'] += 1
+
+    return result
+
+
+def iter_country_results(tasks: List[Tuple[str, str, str, Optional[List[str]], Optional[RebuildTask]]], workers: int):
+    """
+    Yield process_country_file results in task order.
+
+    With more than one worker the tasks are spread over a process pool in
+    chunks; executor.map keeps results in submission order, so merging and
+    file writes stay deterministic whatever order the workers finish in.
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield process_country_file(task)
+        return
+
+    workers = min(workers, len(tasks))
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(process_country_file, tasks, chunksize=chunksize)
+
+
 #######################################################################################################################
 # MAIN FUNCTION
 # ---------------------------------------------------------------------------------------------------------------------
@@ -245,7 +438,12 @@ def determine_target_countries(countries: Optional[List[str]] = None, region: Op
 def extract_usa_cia_to_local(countries: Optional[List[str]] = None,
                              region: Optional[str] = None,
                              enable_performance_monitoring: bool = True,
-                             skip_sections: Optional[List[str]] = None) -> Dict[str, Any]:
+                             skip_sections: Optional[List[str]] = None,
+                             workers: Optional[int] = None,
+                             force: bool = False,
+                             dry_run: bool = False,
+                             raw_data_folder: Optional[str] = None,
+                             local_usa_cia_save_dir: Optional[str] = None) -> Dict[str, Any]:
     """
     Generate original CIA metadata for each country by parsing the JSON files and writing Python files.
 
@@ -254,6 +452,16 @@ def extract_usa_cia_to_local(countries: Optional[List[str]] = None,
         region: Optional region name (folder name like 'europe' or display name like 'Europe')
         enable_performance_monitoring: Whether to track processing time and performance metrics
         skip_sections: Optional list of section names to skip during processing
+        workers: Number of worker processes (default: Config.MAX_DATA_PROCESSING_WORKERS).
+            1 processes countries in this process, one after another.
+        force: Rebuild every targeted country/section, ignoring the rebuild manifest
+        dry_run: Only report which country/section pairs would be rebuilt; nothing is parsed or written
+        raw_data_folder: Folder of the raw CIA JSON files (default: the project's _raw_data)
+        local_usa_cia_save_dir: Output folder (default: the project's _data_per_country)
+
+    Only country/section pairs whose raw subtree or parser sources changed since the
+    last run (see rebuild_manifest.py) are parsed again; untouched sections of a
+    country are carried over from the sections saved with the manifest.
 
     Returns:
         Dictionary with processing summary including section-level statistics
@@ -273,11 +481,20 @@ def extract_usa_cia_to_local(countries: Optional[List[str]] = None,
 
         # Process with specific sections skipped
         extract_usa_cia_to_local(countries=['USA'], skip_sections=['terrorism', 'military'])
+
+        # Full regeneration on 16 worker processes
+        extract_usa_cia_to_local(workers=16, force=True)
+
+        # What would a rerun rebuild?
+        extract_usa_cia_to_local(dry_run=True)
     """
 
     import time
     start_time = time.time()
 
+    if workers is None:
+        workers = Config.MAX_DATA_PROCESSING_WORKERS
+
     if app_logger:
         app_logger.agent("🚀 Starting CIA metadata extraction process",
                          agent_name="CIAExtractor", action="initialize")
@@ -296,30 +513,29 @@ def extract_usa_cia_to_local(countries: Optional[List[str]] = None,
                 f"Processing {len(target_iso3_codes)} countries: {', '.join(target_iso3_codes[:10])}{'...' if len(target_iso3_codes) > 10 else ''}")
 
         # Setup directories
-        raw_data_folder = r'C:\Users\bayoa\impact_projects\claude_solve_cia\proj_004_cia\_raw_data'
-        local_usa_cia_save_dir = r'C:\Users\bayoa\impact_projects\claude_solve_cia\proj_004_cia\_data_per_country'
+        if raw_data_folder is None:
+            raw_data_folder = r'C:\Users\bayoa\impact_projects\claude_solve_cia\proj_004_cia\_raw_data'
+        if local_usa_cia_save_dir is None:
+            local_usa_cia_save_dir = r'C:\Users\bayoa\impact_projects\claude_solve_cia\proj_004_cia\_data_per_country'
 
         # Initialize tracking variables
         original_cia_meta = {}
         processed_count = 0
         error_count = 0
-        section_stats = {section: {'success': 0, 'errors': 0} for section, _ in [
-            ("introduction", None), ("geography", None), ("government", None),
-            ("society", None), ("economy", None), ("environment", None),
-            ("energy", None), ("communications", None), ("transportation", None),
-            ("military", None), ("space", None), ("terrorism", None), ("issues", None)
-        ]}
+        section_stats = {section: {'success': 0, 'errors': 0} for section in SECTION_NAMES}
+        sections = get_sections(skip_sections)
 
         # Define non-country regions and special handling regions
         non_country_regions = ['antarctica', 'meta', 'oceans']
         special_regions = ['world']  # Regions that need different processing
 
-        # Get all region directories
-        all_directories = [d for d in os.listdir(
-            raw_data_folder) if os.path.isdir(os.path.join(raw_data_folder, d))]
+        # Get all region directories (sorted so tasks, merges and writes run in a stable order)
+        all_directories = sorted(d for d in os.listdir(
+            raw_data_folder) if os.path.isdir(os.path.join(raw_data_folder, d)))
 
-        # Process each region
-        for cia_region in tqdm(all_directories, desc='Processing Regions'):
+        # Collect one task per target country file
+        tasks = []
+        for cia_region in all_directories:
             if cia_region in non_country_regions:
                 if app_logger:
                     app_logger.info(
@@ -336,8 +552,8 @@ def extract_usa_cia_to_local(countries: Optional[List[str]] = None,
 
             region_name = cia_region_names.get(cia_region, 'Unknown Region')
             cia_region_folder = os.path.join(raw_data_folder, cia_region)
-            all_files = [f for f in os.listdir(
-                cia_region_folder) if f.endswith('.json')]
+            all_files = sorted(f for f in os.listdir(
+                cia_region_folder) if f.endswith('.json'))
 
             # Filter files to only process target countries
             files_to_process = []
@@ -355,128 +571,104 @@ def extract_usa_cia_to_local(countries: Optional[List[str]] = None,
                         f"No target countries found in region {region_name}")
                 continue
 
-            # Process each country's JSON file in the region
-            for file in tqdm(files_to_process, desc=f'Processing Countries in {region_name}'):
-                try:
-                    cia_file_code = file.replace('.json', '')
-                    country_info = cia_code_names.get(cia_file_code, {})
-
-                    if not country_info:
-                        if app_logger:
-                            app_logger.warning(
-                                f"No country info found for code: {cia_file_code}")
-                        error_count += 1
-                        continue
-
-                    iso3Code = country_info.get('iso3Code')
-                    file_path = os.path.join(cia_region_folder, file)
-                    data = load_json_file(file_path)
-
-                    if not data:
-                        if app_logger:
-                            app_logger.error(
-                                f"Data is empty for file: {file_path}")
-                        error_count += 1
-                        continue
-
-                    # Build the country metadata dictionary
-                    country_cia_meta = {
-                        'country_name': country_info.get('country_name', 'Unknown Country'),
-                        'region': region_name,
-                        'introduction': {},
-                        'geography': {},
-                        'society': {},
-                        'environment': {},
-                        'government': {},
-                        'economy': {},
-                        'energy': {},
-                        'communications': {},
-                        'transportation': {},
-                        'military': {},
-                        'space': {},
-                        'terrorism': {},
-                        'issues': {}
-                    }
-
-                    # List of sections to be updated (prioritized by coverage and importance)
-                    all_sections = [
-                        # High coverage, simple
-                        ("introduction", return_introduction_data),
-                        # High coverage, moderate complexity
-                        ("geography", return_geography_data),
-                        # High coverage, important for analysis
-
-                        ("government", return_government_data),
-                        # High coverage, demographic data
-                        # ("society", return_society_data),
-                        # High coverage, critical for analysis
-                        # ("economy", return_economy_data),
-                        # Growing importance
-                        # ("environment", return_environment_data),
-                        # Strategic importance
-                        # ("energy", return_energy_data),
-                        # Infrastructure data
-                        # ("communications", return_communications_data),
-                        # Infrastructure data
-                        # ("transportation", return_transportation_data),
-                        # Security analysis
-                        # ("military", return_military_data),
-                        # Future capabilities
-                        # ("space", return_space_data),
-                        # Security analysis
-                        # ("terrorism", return_terrorism_data),
-                        # International relations
-                        # ("issues", return_issues_data)
-                    ]
-
-                    # Filter out skipped sections
-                    sections = [(name, func) for name, func in all_sections
-                                if not skip_sections or name not in skip_sections]
-
-                    # Update sections in a loop with detailed tracking
-                    for section_name, function in sections:
-                        try:
-                            section_data = function(data, iso3Code)
-                            country_cia_meta[section_name].update(section_data)
-                            section_stats[section_name]['success'] += 1
-
-                            if app_logger:
-                                app_logger.data(f"Successfully processed {section_name}",
-                                                source=f"{iso3Code}_{section_name}",
-                                                records=len(section_data) if isinstance(section_data, dict) else 1)
-                        except Exception as e:
-                            section_stats[section_name]['errors'] += 1
-                            if app_logger:
-                                app_logger.error(
-                                    f"Error updating '{section_name}' section for {iso3Code} - {country_info.get('country_name', 'Unknown Country')} - {cia_file_code} - {cia_region}: {e}")
-                            error_count += 1
-
-                    # Write the country metadata to a Python file
-                    country_variable_name = f'{iso3Code}_cia_meta'
-                    country_file_name = f'{country_variable_name}.py'
-                    country_file_path = os.path.join(
-                        local_usa_cia_save_dir, country_file_name)
-                    write_country_meta_file(
-                        country_file_path, country_variable_name, country_cia_meta)
-
-                    # Add to the main metadata dictionary
-                    original_cia_meta[iso3Code] = country_cia_meta
-                    processed_count += 1
-
-                    if app_logger:
-                        app_logger.success(
-                            f"✅ Processed {country_info.get('country_name', 'Unknown Country')} ({iso3Code})")
-                        if enable_performance_monitoring:
-                            processing_time = time.time() - start_time
-                            app_logger.performance(f"Country processing",
-                                                   duration=processing_time * 1000,
-                                                   operation=f"process_{iso3Code}")
-
-                except Exception as e:
-                    if app_logger:
-                        app_logger.error(
-                            f"Unexpected error processing file {file}: {e}")
-                    error_count += 1
+            tasks.extend((cia_region, cia_region_folder, file, skip_sections)
+                         for file in files_to_process)
+
+        # Incremental rebuild: each worker plans its own country against its manifest entry
+        manifest = RebuildManifest.load(local_usa_cia_save_dir)
+        planned_tasks = []
+        for cia_region, cia_region_folder, file, _ in tasks:
+            iso3Code = cia_code_names.get(file.replace('.json', ''), {}).get('iso3Code')
+            rebuild = None
+            if iso3Code:
+                # Only this country's entry travels to the worker
+                entry = manifest.countries.get(iso3Code)
+                country_manifest = RebuildManifest(manifest.path, {iso3Code: entry} if entry else {})
+                output_path = os.path.join(local_usa_cia_save_dir, f'{iso3Code}_cia_meta.py')
+                rebuild = (country_manifest, output_path, force, dry_run)
+            planned_tasks.append((cia_region, cia_region_folder, file, skip_sections, rebuild))
+        tasks = planned_tasks
+
+        if app_logger:
+            app_logger.info(f"Processing {len(tasks)} country files with {max(1, workers)} worker(s)"
+                            f"{' (forced)' if force else ''}{' (dry run)' if dry_run else ''}")
+
+        # Merge results and write files in task order
+        rebuild_report = {}
+        unchanged = []
+        for result in tqdm(iter_country_results(tasks, workers), total=len(tasks), desc='Processing Countries'):
+            error_count += result['errors']
+            for section_name, stats in result['section_stats'].items():
+                section_stats[section_name]['success'] += stats['success']
+                section_stats[section_name]['errors'] += stats['errors']
+
+            iso3Code = result['iso3Code']
+            plan = result['plan']
+            if plan is not None:
+                if not plan['stale']:
+                    unchanged.append(iso3Code)
+                    continue
+                rebuild_report[iso3Code] = plan['stale']
+
+            country_cia_meta = result['meta']
+            if country_cia_meta is None:
+                continue
+
+            try:
+                # Write the country metadata to a Python file
+                country_variable_name = f'{iso3Code}_cia_meta'
+                country_file_name = f'{country_variable_name}.py'
+                country_file_path = os.path.join(
+                    local_usa_cia_save_dir, country_file_name)
+                write_country_meta_file(
+                    country_file_path, country_variable_name, country_cia_meta)
+
+                # Record what produced this file; failed sections stay stale
+                if plan is not None:
+                    manifest.save_sections(iso3Code, country_cia_meta)
+                    recorded = {}
+                    if plan['partial']:
+                        # Skipped sections were carried over unchanged
+                        recorded.update(manifest.recorded_sections(iso3Code))
+                    for section_name, hashes in plan['current'].items():
+                        if section_name in plan['stale'] and result['section_stats'].get(section_name, {}).get('errors'):
+                            recorded.pop(section_name, None)
+                            continue
+                        recorded[section_name] = hashes
+                    manifest.record(iso3Code, country_file_name, plan['header'], recorded)
+
+                # Add to the main metadata dictionary
+                original_cia_meta[iso3Code] = country_cia_meta
+                processed_count += 1
+
+                if app_logger:
+                    app_logger.success(
+                        f"✅ Processed {result['country_name']} ({iso3Code})")
+                    if enable_performance_monitoring:
+                        processing_time = time.time() - start_time
+                        app_logger.performance(f"Country processing",
+                                               duration=processing_time * 1000,
+                                               operation=f"process_{iso3Code}")
+
+            except Exception as e:
+                if app_logger:
+                    app_logger.error(
+                        f"Unexpected error processing file {result['file']}: {e}")
+                error_count += 1
+
+        if app_logger:
+            app_logger.info(f"Rebuild plan: {len(rebuild_report)} countries stale, {len(unchanged)} unchanged")
+
+        if dry_run:
+            return {
+                "status": "dry_run",
+                "would_rebuild": rebuild_report,
+                "unchanged": unchanged,
+                "sections_processed": [name for name, _ in sections],
+            }
+
+        if rebuild_report:
+            manifest.save()
 
         # Final summary with detailed analytics
         total_time = time.time() - start_time
@@ -508,7 +700,10 @@ def extract_usa_cia_to_local(countries: Optional[List[str]] = None,
             "section_statistics": section_stats,
             "success_rate": (processed_count / (processed_count + error_count)) * 100 if (processed_count + error_count) > 0 else 0,
             "processing_time_seconds": total_time,
-            "sections_processed": [name for name, _ in sections] if 'sections' in locals() else []
+            "sections_processed": [name for name, _ in sections],
+            "workers": max(1, workers),
+            "rebuilt_sections": rebuild_report,
+            "unchanged": unchanged
         }
 
     except Exception as e:
@@ -523,19 +718,33 @@ def extract_usa_cia_to_local(countries: Optional[List[str]] = None,
 # ---------------------------------------------------------------------------------------------------------------------
 
 if __name__ == '__main__':
-    # Example usage demonstrations
-
-    # Process all countries (original behavior)
-    # result = extract_usa_cia_to_local()
-
-    # Process specific countries
-    result = extract_usa_cia_to_local(countries=['USA', 'ESP', 'FRA', 'NGA'])
+    import argparse
 
-    # Process all countries in Europe
-    # result = extract_usa_cia_to_local(region='europe')
-
-    # Process all European countries plus USA and Japan
-    # result = extract_usa_cia_to_local(countries=['USA', 'JPN'], region='Europe')
-
-    # For testing, run with default behavior
-    # extract_usa_cia_to_local()
+    # Example usage demonstrations
+    #   python -m proj_004_cia.b_01_extract.extract_usa_cia_to_local                     # USA, ESP, FRA, NGA
+    #   python -m proj_004_cia.b_01_extract.extract_usa_cia_to_local --all --workers 16  # all countries
+    #   python -m proj_004_cia.b_01_extract.extract_usa_cia_to_local --region europe --dry-run
+    #   python -m proj_004_cia.b_01_extract.extract_usa_cia_to_local --countries USA JPN --force
+    parser = argparse.ArgumentParser(description="Generate _data_per_country from the CIA raw data")
+    parser.add_argument('--countries', nargs='*', default=['USA', 'ESP', 'FRA', 'NGA'],
+                        help="ISO3 codes to process")
+    parser.add_argument('--all', action='store_true', help="Process every country")
+    parser.add_argument('--region', default=None, help="Region folder or display name")
+    parser.add_argument('--skip-sections', nargs='*', default=None, help="Section names to skip")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes (default: Config.MAX_DATA_PROCESSING_WORKERS)")
+    parser.add_argument('--force', action='store_true', help="Rebuild everything, ignoring the manifest")
+    parser.add_argument('--dry-run', action='store_true', help="Only report what would be rebuilt")
+    args = parser.parse_args()
+
+    result = extract_usa_cia_to_local(countries=None if args.all or args.region else args.countries,
+                                      region=args.region,
+                                      skip_sections=args.skip_sections,
+                                      workers=args.workers,
+                                      force=args.force,
+                                      dry_run=args.dry_run)
+
+    if args.dry_run:
+        print(f"Would rebuild {len(result['would_rebuild'])} countries, {len(result['unchanged'])} unchanged")
+        for iso3Code, stale_sections in result['would_rebuild'].items():
+            print(f"  {iso3Code}: {', '.join(stale_sections)}")
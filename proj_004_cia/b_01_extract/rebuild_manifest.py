@@ -0,0 +1,232 @@
+'''
+PURPOSE OF THIS FILE
+--------------------
+Incremental rebuild manifest for _data_per_country.
+
+For every country and section the manifest records a content hash of the raw
+subtree the section is parsed from and a hash of the parser sources that produced
+it. extract_usa_cia_to_local only re-parses (and rewrites) country/section pairs
+whose hashes no longer match.
+
+The manifest lives next to the generated files: _data_per_country/_rebuild_manifest.json
+The parsed sections of every written country are kept beside it, pickled as
+parsed (_data_per_country/_rebuild_sections/<ISO3>.pkl), so a partial rebuild
+merges into exactly what the parsers returned rather than the display output,
+whose curly quotes write_country_meta_file replaces.
+'''
+
+#######################################################################################################################
+# CORE IMPORTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+import os
+import sys
+import json
+import pickle
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from proj_004_cia.__logger.logger import app_logger
+from proj_004_cia.a_04_iso_to_cia_code.content_hash import (
+    hash_bytes, hash_json, hash_source_trees, shared_parser_sources
+)
+
+#######################################################################################################################
+# CONSTANTS
+# ---------------------------------------------------------------------------------------------------------------------
+
+MANIFEST_FILE_NAME = '_rebuild_manifest.json'
+# 2: hashes from a_04_iso_to_cia_code.content_hash (blake2b); version 1 manifests rebuild everything once
+MANIFEST_VERSION = 2
+SECTIONS_DIR_NAME = '_rebuild_sections'
+
+# Output section -> top-level raw section it is parsed from
+SECTION_RAW_KEYS = {
+    'introduction': 'Introduction',
+    'geography': 'Geography',
+    'society': 'People and Society',
+    'environment': 'Environment',
+    'government': 'Government',
+    'economy': 'Economy',
+    'energy': 'Energy',
+    'communications': 'Communications',
+    'transportation': 'Transportation',
+    'military': 'Military and Security',
+    'space': 'Space',
+    'terrorism': 'Terrorism',
+    'issues': 'Transnational Issues',
+}
+
+#######################################################################################################################
+# HASHING
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def hash_raw_section(data: Dict[str, Any], section_name: str) -> str:
+    """Content hash of the raw subtree an output section is parsed from."""
+    return hash_json(data.get(SECTION_RAW_KEYS.get(section_name, section_name)))
+
+
+def hash_header(country_name: str, region_name: str) -> str:
+    """Hash of the per-country header fields; a change rebuilds every section."""
+    return hash_bytes(f"{country_name}\x00{region_name}".encode('utf-8'))
+
+
+def _package_dir(module_name: str) -> str:
+    module = sys.modules.get(module_name)
+    if module is None:
+        __import__(module_name)
+        module = sys.modules[module_name]
+    path = getattr(module, '__file__', None)
+    if path is None:
+        # Namespace package
+        return list(module.__path__)[0]
+    # Package __init__ or a module at the root of its section package
+    return os.path.dirname(path)
+
+
+@lru_cache(maxsize=None)
+def hash_parser_sources(generator_module: str) -> str:
+    """
+    Hash of every parser module a section generator depends on.
+
+    Covers the generator's whole section package (return_*_data, helper/get_*,
+    helper/utils/parse_*) plus content_hash.SHARED_PARSER_SOURCES: the shared
+    transform utilities and the raw-data loaders.
+    """
+    return hash_source_trees([_package_dir(generator_module)] + shared_parser_sources())
+
+
+#######################################################################################################################
+# MANIFEST
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+class RebuildManifest:
+    """
+    Per-country, per-section record of the inputs that produced _data_per_country.
+
+    Entry layout:
+        {iso3Code: {'file': 'USA_cia_meta.py', 'header': <hash>,
+                    'sections': {section: {'raw': <hash>, 'parser': <hash>}}}}
+    """
+
+    def __init__(self, path: str, countries: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.path = path
+        self.countries = countries or {}
+
+    @classmethod
+    def load(cls, save_dir: str) -> 'RebuildManifest':
+        """Load the manifest stored in `save_dir`; a missing or unreadable manifest starts empty."""
+        path = os.path.join(save_dir, MANIFEST_FILE_NAME)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = json.load(f)
+            if content.get('version') == MANIFEST_VERSION:
+                return cls(path, content.get('countries', {}))
+            if app_logger:
+                app_logger.warning(f"Ignoring rebuild manifest with unknown version: {path}")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            if app_logger:
+                app_logger.warning(f"Ignoring unreadable rebuild manifest {path}: {e}")
+        return cls(path)
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'countries': self.countries},
+                      f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def stale_sections(self,
+                       iso3Code: str,
+                       output_path: str,
+                       header: str,
+                       current: Dict[str, Dict[str, str]]) -> List[str]:
+        """
+        Return the sections of `current` whose recorded hashes differ.
+
+        Every section is stale when the country is unknown, its output file is
+        missing or its header changed.
+        """
+        entry = self.countries.get(iso3Code)
+        if not entry or entry.get('header') != header or not os.path.exists(output_path):
+            return list(current)
+
+        recorded = entry.get('sections', {})
+        return [section for section, hashes in current.items() if recorded.get(section) != hashes]
+
+    def record(self,
+               iso3Code: str,
+               file_name: str,
+               header: str,
+               sections: Dict[str, Dict[str, str]]) -> None:
+        """Replace a country's entry with the hashes of the sections just written."""
+        self.countries[iso3Code] = {'file': file_name, 'header': header, 'sections': sections}
+
+    def recorded_sections(self, iso3Code: str) -> Dict[str, Dict[str, str]]:
+        return dict(self.countries.get(iso3Code, {}).get('sections', {}))
+
+    def sections_path(self, iso3Code: str) -> str:
+        return os.path.join(os.path.dirname(self.path), SECTIONS_DIR_NAME, f"{iso3Code}.pkl")
+
+    def save_sections(self, iso3Code: str, meta: Dict[str, Any]) -> None:
+        """Keep the country metadata just written, as parsed, for the next partial rebuild."""
+        path = self.sections_path(iso3Code)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': MANIFEST_VERSION, 'meta': meta}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    def load_sections(self, iso3Code: str) -> Optional[Dict[str, Any]]:
+        """Country metadata saved by save_sections; None when missing, unreadable or of another version."""
+        path = self.sections_path(iso3Code)
+        try:
+            with open(path, 'rb') as f:
+                content = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            if app_logger:
+                app_logger.warning(f"Ignoring unreadable rebuild sections {path}: {e}")
+            return None
+        if not isinstance(content, dict) or content.get('version') != MANIFEST_VERSION:
+            return None
+        return content.get('meta')
+
+
+def _generator_module(func: Any) -> str:
+    # LazyParser generators know their module without importing it
+    return getattr(func, 'module_name', None) or func.__module__
+
+
+def plan_country(manifest: RebuildManifest,
+                 iso3Code: str,
+                 data: Dict[str, Any],
+                 output_path: str,
+                 header: str,
+                 sections: List[Tuple[str, Any]],
+                 force: bool = False) -> Tuple[Dict[str, Dict[str, str]], List[str], Optional[Dict[str, Any]]]:
+    """
+    Decide what to rebuild for one country.
+
+    Returns:
+        (current hashes per section, stale section names, previous meta to merge
+        the fresh sections into, or None when the whole file is rebuilt)
+    """
+    current = {
+        name: {'raw': hash_raw_section(data, name), 'parser': hash_parser_sources(_generator_module(func))}
+        for name, func in sections
+    }
+    stale = list(current) if force else manifest.stale_sections(iso3Code, output_path, header, current)
+
+    previous = None
+    if stale and len(stale) < len(current):
+        previous = manifest.load_sections(iso3Code)
+        if previous is None:
+            # Cannot reuse the untouched sections: rebuild the whole country
+            stale = list(current)
+    return current, stale, previous
@@ -14,40 +14,119 @@ Date: 2025-07-08
 import os
 import json
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Tuple
 
 # Import required modules
 from proj_004_cia.__logger.logger import app_logger
+from proj_004_cia.__config.config import Config
 from proj_004_cia.a_01_cia_to_iso.utils.cia_region_names import cia_region_names
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import ISO3_TO_CIA
 
-# Build cia_code_names dynamically from available JSON files
-def _build_cia_code_names():
-    """Build CIA code to ISO mapping from actual JSON files."""
-    code_names = {}
-    raw_data_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '_raw_data')
+_RAW_DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), '_raw_data')
+INSPECT_INDEX_VERSION = 1
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   CIA CODE MAP - built on first use from the directory listing, never from file contents
+# ---------------------------------------------------------------------------------------------------------------------
 
-    for region_folder in os.listdir(raw_data_path):
+
+def _build_cia_code_names(raw_data_path: str = _RAW_DATA_PATH) -> Dict[str, Dict[str, str]]:
+    """Build the CIA code -> {'iso3Code', 'region_name'} map from the _raw_data folder listing."""
+    code_names = {}
+    for region_folder in sorted(os.listdir(raw_data_path)):
         region_path = os.path.join(raw_data_path, region_folder)
-        if os.path.isdir(region_path):
-            for json_file in os.listdir(region_path):
-                if json_file.endswith('.json'):
-                    cia_code = json_file[:-5]  # Remove .json
-                    try:
-                        with open(os.path.join(region_path, json_file), 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        # Try to get ISO3 code from the data
-                        gov_data = data.get('Government', {})
-                        country_name = gov_data.get('Country name', {})
-                        # Use cia_code as fallback for iso3Code
-                        code_names[cia_code] = {
-                            'iso3Code': cia_code.upper(),
-                            'region_name': cia_region_names.get(region_folder, region_folder)
-                        }
-                    except Exception:
-                        pass
+        if not os.path.isdir(region_path):
+            continue
+        for json_file in sorted(os.listdir(region_path)):
+            if json_file.endswith('.json'):
+                cia_code = json_file[:-5]  # Remove .json
+                # Use cia_code as fallback for iso3Code
+                code_names[cia_code] = {
+                    'iso3Code': cia_code.upper(),
+                    'region_name': cia_region_names.get(region_folder, region_folder)
+                }
     return code_names
 
-cia_code_names = _build_cia_code_names()
+
+def _folder_stamps(raw_data_path: str) -> Dict[str, int]:
+    """mtime_ns of the raw folder and of each region folder; adding or removing a file changes them."""
+    stamps = {'.': os.stat(raw_data_path).st_mtime_ns}
+    with os.scandir(raw_data_path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                stamps[entry.name] = entry.stat().st_mtime_ns
+    return stamps
+
+
+def get_inspect_index_path() -> str:
+    """Path of the on-disk inspector index: Config.INSPECT_INDEX_PATH or '<_raw_data>.inspect_index.json'."""
+    return Config.INSPECT_INDEX_PATH or _RAW_DATA_PATH.rstrip('\\/') + '.inspect_index.json'
+
+
+def _load_index(path: str, stamps: Dict[str, int]) -> Optional[Dict[str, Dict[str, str]]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if index.get('version') != INSPECT_INDEX_VERSION or index.get('stamps') != stamps:
+        return None
+    return index.get('cia_code_names')
+
+
+def _save_index(path: str, stamps: Dict[str, int], code_names: Dict[str, Dict[str, str]]) -> None:
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INSPECT_INDEX_VERSION, 'stamps': stamps, 'cia_code_names': code_names}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write inspector index {path}: {e}")
+
+
+_CODE_NAMES_LOCK = threading.Lock()
+_CODE_NAMES_STATE: Dict[str, Any] = {'code_names': None}
+
+
+def get_cia_code_names(use_index: Optional[bool] = None) -> Dict[str, Dict[str, str]]:
+    """
+    Return the CIA code map, building it once per process.
+
+    Args:
+        use_index: Read/write the on-disk index (see get_inspect_index_path); defaults to
+                   Config.INSPECT_INDEX_ENABLED. The index is rebuilt whenever a raw data
+                   folder changes.
+    """
+    code_names = _CODE_NAMES_STATE['code_names']
+    if code_names is not None:
+        return code_names
+
+    if use_index is None:
+        use_index = Config.INSPECT_INDEX_ENABLED
+
+    with _CODE_NAMES_LOCK:
+        if _CODE_NAMES_STATE['code_names'] is None:
+            code_names = None
+            if use_index:
+                stamps = _folder_stamps(_RAW_DATA_PATH)
+                index_path = get_inspect_index_path()
+                code_names = _load_index(index_path, stamps)
+            if code_names is None:
+                code_names = _build_cia_code_names()
+                if use_index:
+                    _save_index(index_path, stamps, code_names)
+            _CODE_NAMES_STATE['code_names'] = code_names
+        return _CODE_NAMES_STATE['code_names']
+
+
+def __getattr__(name: str):
+    # `cia_code_names` used to be built at import time; keep the name importable
+    if name == 'cia_code_names':
+        return get_cia_code_names()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -254,21 +333,15 @@ def _find_json_file_for_country(iso3_code: str, all_jsons_folder: str) -> Option
             logger.warning("World data file (world/xx.json) not found")
             return None
 
-    # Find the CIA code for this ISO3 code
-    cia_code = None
-    region_folder = None
-
-    for code, country_info in cia_code_names.items():
-        if country_info.get('iso3Code') == iso3_code:
-            cia_code = code
-            region_name = country_info.get('region_name', '')
+    # Real ISO3 codes resolve through ISO3_TO_CIA
+    mapping = ISO3_TO_CIA.get(iso3_code.upper())
+    if mapping:
+        json_file_path = os.path.join(all_jsons_folder, mapping['region_folder'], f"{mapping['cia_code']}.json")
+        if os.path.exists(json_file_path):
+            return json_file_path
 
-            # Find the region folder name
-            for folder_name, display_name in cia_region_names.items():
-                if display_name.lower() == region_name.lower():
-                    region_folder = folder_name
-                    break
-            break
+    # Otherwise treat the code as an upper-cased CIA code (e.g. 'US')
+    cia_code, region_folder = _find_cia_code(iso3_code)
 
     if not cia_code or not region_folder:
         logger.warning(f"CIA code or region not found for {iso3_code}")
@@ -285,6 +358,20 @@ def _find_json_file_for_country(iso3_code: str, all_jsons_folder: str) -> Option
         return None
 
 
+def _find_cia_code(code: str) -> Tuple[Optional[str], Optional[str]]:
+    """Return (cia_code, region_folder) for an upper-cased CIA code, or (None, None)."""
+    for cia_code, country_info in get_cia_code_names().items():
+        if country_info.get('iso3Code') == code:
+            region_name = country_info.get('region_name', '')
+
+            # Find the region folder name
+            for folder_name, display_name in cia_region_names.items():
+                if display_name.lower() == region_name.lower():
+                    return cia_code, folder_name
+            return cia_code, None
+    return None, None
+
+
 def _get_sample_countries(limit: int = 10) -> List[str]:
     """
     Get a diverse sample of countries for testing.
@@ -310,7 +397,7 @@ def _get_sample_countries(limit: int = 10) -> List[str]:
 
     # If we need more, add additional countries
     if len(sample_countries) < limit:
-        all_iso3_codes = [info.get('iso3Code') for info in cia_code_names.values()
+        all_iso3_codes = [info.get('iso3Code') for info in get_cia_code_names().values()
                           if info.get('iso3Code') and info.get('iso3Code') not in sample_countries]
 
         additional_needed = limit - len(sample_countries)
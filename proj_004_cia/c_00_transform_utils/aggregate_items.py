@@ -0,0 +1,117 @@
+######################################################################################################################
+# CORE IMPORTS
+# proj_004_cia\c_00_transform_utils\aggregate_items.py
+# ---------------------------------------------------------------------------------------------------------------------
+from collections import Counter
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Set
+from proj_004_cia.__logger.logger import app_logger
+from proj_004_cia.c_00_transform_utils.parse_text_to_list import iter_text_to_list
+# ---------------------------------------------------------------------------------------------------------------------
+
+######################################################################################################################
+# STREAMING LIST AGGREGATION
+# ---------------------------------------------------------------------------------------------------------------------
+# aggregate_all_possible_items-style jobs ("every natural resource named anywhere", "how many countries list
+# each industry") only need the set / counts of items, not one list per country. The helpers below feed the
+# generator parsers (iter_text_to_list, iter_list_from_string) straight into a set or Counter, and
+# iter_field_texts() loads one country at a time, so no per-country list is ever built.
+######################################################################################################################
+
+Splitter = Callable[..., Iterator[str]]
+
+
+def iter_items(texts: Iterable[Any], splitter: Splitter = iter_text_to_list, **options: Any) -> Iterator[str]:
+    """
+    Chain the items of many texts (non-strings are skipped by the splitter).
+
+    A text that fails to parse is logged and skipped; items it already yielded are kept.
+    """
+    for text in texts:
+        try:
+            yield from splitter(text, **options)
+        except Exception as e:
+            if app_logger:
+                app_logger.error(f"Error splitting text into items: {e}")
+
+
+def unique_items(texts: Iterable[Any], splitter: Splitter = iter_text_to_list, **options: Any) -> Set[str]:
+    """
+    Set of every item of every text.
+
+    Examples:
+        >>> sorted(unique_items(["coal, timber", "timber; gold"]))
+        ['coal', 'gold', 'timber']
+    """
+    return set(iter_items(texts, splitter, **options))
+
+
+def count_items(texts: Iterable[Any],
+                splitter: Splitter = iter_text_to_list,
+                per_text: bool = True,
+                **options: Any) -> Counter:
+    """
+    Counter of items over many texts.
+
+    Args:
+        texts: Iterable of raw strings (typically one per country)
+        splitter: Generator parser, e.g. iter_text_to_list or iter_list_from_string
+        per_text: Count an item at most once per text ("number of countries listing it");
+                  False counts every occurrence
+        **options: Passed to the splitter
+
+    Examples:
+        >>> count_items(["coal, coal, timber", "timber"])
+        Counter({'timber': 2, 'coal': 1})
+    """
+    counts = Counter()
+    if not per_text:
+        counts.update(iter_items(texts, splitter, **options))
+        return counts
+    for text in texts:
+        counts.update(set(iter_items((text,), splitter, **options)))
+    return counts
+
+
+def iter_field_texts(field_path: Sequence[str],
+                     countries: Optional[Iterable[str]] = None,
+                     with_code: bool = False) -> Iterator[Any]:
+    """
+    Lazily yield the 'text' of one raw field for each country, loading one country at a time.
+
+    Args:
+        field_path: Keys down to the field, e.g. ('Geography', 'Natural resources')
+        countries: ISO3 codes (default: every available country)
+        with_code: Yield (iso3Code, text) pairs instead of texts
+
+    Countries without the field are skipped.
+    """
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, list_available_countries
+
+    for iso3Code in countries if countries is not None else list_available_countries():
+        try:
+            node = load_country_data(iso3Code)
+        except (ValueError, OSError):
+            continue
+        for key in field_path:
+            node = node.get(key) if isinstance(node, dict) else None
+        text = node.get('text') if isinstance(node, dict) else node
+        if isinstance(text, str) and text:
+            yield (iso3Code, text) if with_code else text
+
+
+def count_field_items(field_path: Sequence[str],
+                      countries: Optional[Iterable[str]] = None,
+                      splitter: Splitter = iter_text_to_list,
+                      **options: Any) -> Counter:
+    """Number of countries listing each item of one raw list field."""
+    return count_items(iter_field_texts(field_path, countries), splitter, **options)
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    counts = count_field_items(('Geography', 'Natural resources'))
+    print(f"{len(counts)} distinct natural resources")
+    for item, count in counts.most_common(20):
+        print(f"{count:5d}  {item}")
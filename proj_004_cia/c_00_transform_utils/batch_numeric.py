@@ -0,0 +1,265 @@
+######################################################################################################################
+# CORE IMPORTS
+# proj_004_cia\c_00_transform_utils\batch_numeric.py
+# ---------------------------------------------------------------------------------------------------------------------
+import math
+import numpy as np
+from proj_004_cia.__logger.logger import app_logger
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from proj_004_cia.c_00_transform_utils.quantity_tokenizer import (
+    read_numeric_text, read_percentage_text, SPECIAL_VALUES,
+    STATUS_PARSED, STATUS_RANGE, STATUS_SPECIAL, STATUS_BARE_NUMBER, STATUS_NO_MATCH, STATUS_EMPTY, STATUS_ERROR
+)
+# ---------------------------------------------------------------------------------------------------------------------
+
+######################################################################################################################
+# BATCH NUMERIC EXTRACTION
+# ---------------------------------------------------------------------------------------------------------------------
+# Column-wise versions of extract_numeric_value and parse_percentage_data: one call turns every country's
+# text for a field into NumPy arrays. Both read the same quantity_tokenizer tokens as the scalar
+# functions, so element by element the results are exactly theirs.
+#
+# This is a convenience wrapper, not a faster parser: each string still goes through read_numeric_text /
+# read_percentage_text in a Python loop (tokenize_quantity's lru_cache already absorbs repeated texts), and
+# only the magnitudes, range midpoints, decimals and the output are array operations. Over the raw
+# corpus that is on par with calling extract_numeric_value per string and about x1.2 for percentages.
+######################################################################################################################
+
+STATUS_NAMES = {
+    STATUS_PARSED: 'parsed', STATUS_RANGE: 'range', STATUS_SPECIAL: 'special',
+    STATUS_BARE_NUMBER: 'bare_number', STATUS_NO_MATCH: 'no_match',
+    STATUS_EMPTY: 'empty', STATUS_ERROR: 'error',
+}
+
+######################################################################################################################
+# EXTRACT NUMERIC VALUES
+######################################################################################################################
+
+
+def extract_numeric_values(texts: Sequence[Any],
+                           unit: str = None,
+                           allow_ranges: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Batch extract_numeric_value: one array element per input text.
+
+    Args:
+        texts: Raw strings (None / non-strings allowed)
+        unit: Expected unit; its words are never read as magnitudes (as in extract_numeric_value)
+        allow_ranges: Whether to handle range values (e.g., "15-25")
+
+    Returns:
+        Dict of equal-length arrays:
+            - value: float64, extract_numeric_value(text) with None as NaN (range -> midpoint)
+            - min / max: float64, range bounds (NaN unless status == STATUS_RANGE)
+            - multiplier: float64, magnitude multiplier applied (1 when none)
+            - is_range: bool
+            - status: int8 STATUS_* code
+
+    Examples:
+        >>> columns = extract_numeric_values(["15-25 years", "NA", None])
+        >>> columns['value']
+        array([20., nan, nan])
+        >>> columns['status']
+        array([1, 2, 5], dtype=int8)
+    """
+    count = len(texts)
+    # Filled per element as plain lists (cheaper than NumPy item assignment), converted once below
+    status = [STATUS_NO_MATCH] * count
+    multiplier = [1] * count
+    first = [math.nan] * count      # single value or range min, before the multiplier
+    second = [math.nan] * count     # range max, before the multiplier
+    special = [math.nan] * count
+
+    for i, text in enumerate(texts):
+        if not text or not isinstance(text, str):
+            status[i] = STATUS_EMPTY
+            continue
+
+        original_text = text.strip()
+        working_text = original_text.lower()
+        if working_text in SPECIAL_VALUES:
+            status[i] = STATUS_SPECIAL
+            if SPECIAL_VALUES[working_text] is not None:
+                special[i] = SPECIAL_VALUES[working_text]
+            continue
+
+        try:
+            status[i], number, upper, multiplier[i] = read_numeric_text(
+                original_text, unit=unit, allow_ranges=allow_ranges)
+        except Exception:
+            status[i] = STATUS_ERROR
+            continue
+        if number is not None:
+            first[i] = number
+        if upper is not None:
+            second[i] = upper
+
+    status = np.array(status, dtype=np.int8)
+    multiplier = np.array(multiplier, dtype=np.float64)
+    first = np.array(first, dtype=np.float64)
+    second = np.array(second, dtype=np.float64)
+    special = np.array(special, dtype=np.float64)
+
+    # Vectorized post-processing: magnitudes, range midpoints, special values
+    is_range = status == STATUS_RANGE
+    scaled_first = first * multiplier
+    range_min = np.where(is_range, scaled_first, np.nan)
+    range_max = np.where(is_range, second * multiplier, np.nan)
+    value = np.where(is_range, (range_min + range_max) / 2, scaled_first)
+    value = np.where(status == STATUS_SPECIAL, special, value)
+
+    no_match = int(np.count_nonzero(status == STATUS_NO_MATCH))
+    if no_match:
+        app_logger.warning(f"No numeric value found in {no_match} of {count} texts")
+
+    return {
+        'value': value,
+        'min': range_min,
+        'max': range_max,
+        'multiplier': multiplier,
+        'is_range': is_range,
+        'status': status,
+    }
+
+
+######################################################################################################################
+# PARSE PERCENTAGE VALUES
+######################################################################################################################
+
+
+def parse_percentage_values(data_strings: Sequence[Any],
+                            return_decimal: bool = True,
+                            extract_year: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Batch parse_percentage_data: one array element per input string.
+
+    Args:
+        data_strings: Raw strings (None / non-strings allowed)
+        return_decimal: Whether 'value' is a decimal (0.15) or a percent (15)
+        extract_year: Whether to extract year information
+
+    Returns:
+        Dict of equal-length arrays (NaN / 0 / None where parse_percentage_data has no key):
+            - value: float64, result['value']
+            - percentage: float64, result['percentage'] (NaN when return_decimal is False)
+            - year: int32, result['year'], 0 when absent
+            - is_estimate: bool
+            - period: object, 'annual' / 'monthly' / None
+            - status: int8 STATUS_* code; parse_percentage_data returns {} unless
+              status is STATUS_PARSED or STATUS_BARE_NUMBER
+
+    Examples:
+        >>> columns = parse_percentage_values(["15.2% (2023 est.)", "about 3", ""])
+        >>> columns['value'], columns['year'], columns['status']
+        (array([0.152, 0.03 , nan]), array([2023, 0, 0], dtype=int32), array([0, 3, 5], dtype=int8))
+    """
+    count = len(data_strings)
+    status = [STATUS_NO_MATCH] * count
+    percentage = [math.nan] * count
+    year = [0] * count
+    is_estimate = [False] * count
+    period = [None] * count
+
+    for i, data_string in enumerate(data_strings):
+        if not isinstance(data_string, str) or not data_string.strip():
+            status[i] = STATUS_EMPTY
+            continue
+
+        text = data_string.strip()
+        lowered = text.lower()
+        try:
+            code, parsed_value, parsed_year, is_estimate[i] = read_percentage_text(text)
+        except Exception:
+            status[i] = STATUS_ERROR
+            continue
+        status[i] = code
+        if code == STATUS_NO_MATCH:
+            continue
+        percentage[i] = parsed_value
+        if extract_year and parsed_year:
+            year[i] = parsed_year
+
+        if 'annual' in lowered:
+            period[i] = 'annual'
+        elif 'monthly' in lowered:
+            period[i] = 'monthly'
+
+    status = np.array(status, dtype=np.int8)
+    percentage = np.array(percentage, dtype=np.float64)
+    year = np.array(year, dtype=np.int32)
+    is_estimate = np.array(is_estimate, dtype=bool)
+    period = np.array(period, dtype=object)
+
+    # Vectorized post-processing
+    if return_decimal:
+        value = percentage / 100
+    else:
+        value, percentage = percentage, np.full(count, np.nan)
+
+    failed = int(np.count_nonzero(status >= STATUS_NO_MATCH)) - int(np.count_nonzero(status == STATUS_EMPTY))
+    if failed:
+        app_logger.warning(f"No percentage value parsed in {failed} of {count} texts")
+
+    return {
+        'value': value,
+        'percentage': percentage,
+        'year': year,
+        'is_estimate': is_estimate,
+        'period': period,
+        'status': status,
+    }
+
+
+######################################################################################################################
+# CROSS-COUNTRY COLUMNS
+######################################################################################################################
+
+
+def collect_field_texts(category: str, field: str, subfield: str = None,
+                        iso3Codes: Sequence[str] = None) -> Tuple[List[str], List[Optional[str]]]:
+    """
+    Gather one raw field's 'text' for every country, aligned with the ISO3 list.
+
+    Args:
+        category: Raw category, e.g. 'Economy'
+        field: Field name, e.g. 'Inflation rate (consumer prices)'
+        subfield: Optional nested key, e.g. 'Inflation rate (consumer prices) 2023'
+        iso3Codes: Countries to read (default: every ISO3_TO_CIA country)
+
+    Returns:
+        (iso3Codes, texts) - texts[i] is None where the country has no such field
+
+    Examples:
+        >>> codes, texts = collect_field_texts('People and Society', 'Population growth rate')
+        >>> parse_percentage_values(texts)['value']
+    """
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, ISO3_TO_CIA
+
+    codes = list(iso3Codes) if iso3Codes is not None else list(ISO3_TO_CIA.keys())
+    texts = []
+    for iso3Code in codes:
+        try:
+            node = load_country_data(iso3Code).get(category, {}).get(field)
+        except (ValueError, OSError, AttributeError):
+            node = None
+        if subfield and isinstance(node, dict):
+            node = node.get(subfield)
+        if isinstance(node, dict):
+            node = node.get('text')
+        texts.append(node if isinstance(node, str) else None)
+    return codes, texts
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    codes, texts = collect_field_texts('People and Society', 'Population growth rate')
+    columns = parse_percentage_values(texts)
+    print(f"Population growth rate: {len(codes)} countries")
+    for code, text, value, year, code_status in list(zip(codes, texts, columns['value'], columns['year'],
+                                                         columns['status']))[:8]:
+        print(f"  {code}  {str(text)[:30]:<32} value={value:<10.4g} year={year}  {STATUS_NAMES[code_status]}")
+
+    columns = extract_numeric_values(["15-25 years", "2.5 million", "NA", "negligible", None, "1,234.5"])
+    print(columns)
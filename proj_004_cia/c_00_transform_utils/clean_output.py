@@ -8,13 +8,23 @@ import html
 import re
 from typing import Any, Dict, List, Union
 
+# A string needs _clean_string only if it holds an entity candidate, a typographic quote/dash,
+# a tab or double space, or leading/trailing whitespace; everything else is returned as is
+_NEEDS_CLEANING_RE = re.compile('[&\u2018\u2019\u201c\u201d\u2013\u2014\t]|  |\\A\\s|\\s\\Z')
+_SPACES_TABS_RE = re.compile(r'[ \t]+')
 
-def clean_output(data: Any) -> Any:
+
+def clean_output(data: Any, in_place: bool = False) -> Any:
     """
     Recursively clean all string values in a nested data structure.
 
+    Traversal is iterative (no recursion limit on deep structures) and strings
+    that are already clean are kept without being rebuilt.
+
     Args:
         data: Any data structure (dict, list, str, etc.)
+        in_place: Clean dicts and lists in place instead of returning new ones.
+                  Only use it on structures nothing else holds a reference to.
 
     Returns:
         The same structure with all strings cleaned of HTML entities
@@ -23,15 +33,41 @@ def clean_output(data: Any) -> Any:
         >>> clean_output({'name': 'São Paulo &atilde;', 'items': ['test &rsquo;']})
         {'name': 'São Paulo ã', 'items': ["test '"]}
     """
-    if isinstance(data, dict):
-        return {k: clean_output(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [clean_output(item) for item in data]
-    elif isinstance(data, str):
+    if isinstance(data, str):
         return _clean_string(data)
-    else:
+    if not isinstance(data, (dict, list)):
         return data
 
+    needs_cleaning = _NEEDS_CLEANING_RE.search
+    root = data if in_place else _copy_container(data)
+    stack = [root]
+    seen = set()
+
+    while stack:
+        container = stack.pop()
+        if in_place:
+            # A container reachable twice must only be cleaned once (unescape is not idempotent)
+            if id(container) in seen:
+                continue
+            seen.add(id(container))
+
+        entries = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, value in entries:
+            if isinstance(value, str):
+                if value and needs_cleaning(value):
+                    container[key] = _clean_string(value)
+            elif isinstance(value, (dict, list)):
+                if not in_place:
+                    value = container[key] = _copy_container(value)
+                stack.append(value)
+
+    return root
+
+
+def _copy_container(container: Union[Dict, List]) -> Union[Dict, List]:
+    # Plain dict/list copies, like the comprehensions clean_output used to rebuild with
+    return dict(container) if isinstance(container, dict) else list(container)
+
 
 def _clean_string(text: str) -> str:
     """
@@ -52,7 +88,7 @@ def _clean_string(text: str) -> str:
     text = text.replace('\u2014', '--') # Em dash
 
     # Normalize whitespace (but preserve intentional newlines)
-    text = re.sub(r'[ \t]+', ' ', text)
+    text = _SPACES_TABS_RE.sub(' ', text)
     text = text.strip()
 
     return text
@@ -4,8 +4,50 @@
 # ---------------------------------------------------------------------------------------------------------------------
 import re
 import html
+from typing import Iterable, List
 from proj_004_cia.__logger.logger import app_logger
 
+######################################################################################################################
+# COMPILED PATTERNS AND TABLES
+# ---------------------------------------------------------------------------------------------------------------------
+# Named entities decoded before html.unescape, with the project's own replacements
+# ('&hellip;' -> '...', '&nbsp;' -> ' ', ...). '&amp;' is decoded first, so '&amp;lt;' ends up as '<'.
+HTML_ENTITIES = {
+    '&lt;': '<', '&gt;': '>', '&quot;': '"',
+    '&apos;': "'", '&nbsp;': ' ', '&mdash;': '—', '&ndash;': '–',
+    '&rsquo;': "'", '&lsquo;': "'", '&rdquo;': '"', '&ldquo;': '"',
+    '&hellip;': '...', '&bull;': '•', '&middot;': '·',
+    '&deg;': '°', '&plusmn;': '±', '&times;': '×', '&divide;': '÷',
+    '&frac12;': '½', '&frac14;': '¼', '&frac34;': '¾',
+    '&euro;': '€', '&pound;': '£', '&yen;': '¥', '&cent;': '¢',
+}
+_ENTITY_RE = re.compile('|'.join(re.escape(entity) for entity in HTML_ENTITIES))
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_P_OPEN_RE = re.compile(r'<p[^>]*>', re.IGNORECASE)
+_P_CLOSE_RE = re.compile(r'</p>', re.IGNORECASE)
+_PARENTHESES_RE = re.compile(r'\([^)]*\)')
+_BRACKETS_RE = re.compile(r'\[[^\]]*\]')
+_SPACES_TABS_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Typographic quotes and dashes -> ASCII
+# (guarded str.replace calls: much faster than str.translate with a dict table)
+_PUNCTUATION_REPLACEMENTS = (
+    ('\u2019', "'"),   # Right single quotation mark
+    ('\u2018', "'"),   # Left single quotation mark
+    ('\u201c', '"'),   # Left double quotation mark
+    ('\u201d', '"'),   # Right double quotation mark
+    ('\u2013', '-'),   # En dash
+    ('\u2014', '--'),  # Em dash
+)
+
+
+def _replace_entity(match: re.Match) -> str:
+    return HTML_ENTITIES[match.group()]
+
+
 ######################################################################################################################
 # ENHANCED CLEAN TEXT UTILITY
 ######################################################################################################################
@@ -36,59 +78,40 @@ def clean_text(text: str, preserve_formatting: bool = False, remove_notes: bool
     try:
         original_text = text
 
-        # Step 1: Handle HTML entities first
-        html_entities = {
-            '&amp;': '&', '&lt;': '<', '&gt;': '>', '&quot;': '"',
-            '&apos;': "'", '&nbsp;': ' ', '&mdash;': '—', '&ndash;': '–',
-            '&rsquo;': "'", '&lsquo;': "'", '&rdquo;': '"', '&ldquo;': '"',
-            '&hellip;': '...', '&bull;': '•', '&middot;': '·',
-            '&deg;': '°', '&plusmn;': '±', '&times;': '×', '&divide;': '÷',
-            '&frac12;': '½', '&frac14;': '¼', '&frac34;': '¾',
-            '&euro;': '€', '&pound;': '£', '&yen;': '¥', '&cent;': '¢',
-        }
-        for entity, replacement in html_entities.items():
-            text = text.replace(entity, replacement)
-
-        # Also use html.unescape for any remaining entities (numeric codes, etc.)
-        text = html.unescape(text)
+        # Step 1: HTML entities - project table in one pass, then html.unescape for the rest
+        if '&' in text:
+            text = _ENTITY_RE.sub(_replace_entity, text.replace('&amp;', '&'))
+            text = html.unescape(text)
 
         # Step 2: Remove or preserve HTML tags based on context
-        if preserve_formatting:
-            # Convert some HTML tags to readable equivalents
-            text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-            text = re.sub(r'<p[^>]*>', '\n', text, flags=re.IGNORECASE)
-            text = re.sub(r'</p>', '', text, flags=re.IGNORECASE)
-
-        # Remove all remaining HTML tags but preserve content
-        text = re.sub(r'<[^>]+>', '', text)
+        if '<' in text:
+            if preserve_formatting:
+                # Convert some HTML tags to readable equivalents
+                text = _BR_RE.sub('\n', text)
+                text = _P_OPEN_RE.sub('\n', text)
+                text = _P_CLOSE_RE.sub('', text)
+            # Remove all remaining HTML tags but preserve content
+            text = _TAG_RE.sub('', text)
 
         # Step 3: Handle notes and parenthetical content
         if remove_notes:
-            # Remove content in parentheses and brackets
-            text = re.sub(r'\([^)]*\)', '', text)
-            text = re.sub(r'\[[^\]]*\]', '', text)
+            text = _PARENTHESES_RE.sub('', text)
+            text = _BRACKETS_RE.sub('', text)
 
-        # Step 4: Normalize whitespace
+        # Step 4: Typographic quotes and dashes to ASCII (pure-ASCII strings have none)
+        if not text.isascii():
+            for character, replacement in _PUNCTUATION_REPLACEMENTS:
+                if character in text:
+                    text = text.replace(character, replacement)
+
+        # Steps 5-6: Normalize whitespace and strip
         if preserve_formatting:
             # Preserve intentional line breaks but clean up excess spaces
-            # Multiple spaces/tabs to single space
-            text = re.sub(r'[ \t]+', ' ', text)
-            # Multiple newlines to double newline
-            text = re.sub(r'\n\s*\n', '\n\n', text)
+            text = _SPACES_TABS_RE.sub(' ', text)
+            text = _BLANK_LINES_RE.sub('\n\n', text).strip()
         else:
-            # Standard whitespace normalization
-            text = re.sub(r'\s+', ' ', text)
-
-        # Step 5: Clean up punctuation and special characters
-        text = text.replace('\u2019', "'")  # Right single quotation mark
-        text = text.replace('\u2018', "'")  # Left single quotation mark
-        text = text.replace('\u201c', '"')  # Left double quotation mark
-        text = text.replace('\u201d', '"')  # Right double quotation mark
-        text = text.replace('\u2013', '-')  # En dash
-        text = text.replace('\u2014', '--')  # Em dash
-
-        # Step 6: Final cleanup
-        text = text.strip()
+            # Collapse every whitespace run to one space and trim the ends
+            text = ' '.join(text.split())
 
         # Log if significant changes were made
         if len(original_text) - len(text) > 50:
@@ -100,4 +123,15 @@ def clean_text(text: str, preserve_formatting: bool = False, remove_notes: bool
     except Exception as e:
         app_logger.error(f"Error cleaning text: {e}")
         return text.strip() if isinstance(text, str) else ""
+
+
+def clean_text_many(texts: Iterable[str], preserve_formatting: bool = False, remove_notes: bool = False) -> List[str]:
+    """
+    Clean a batch of strings; same result as [clean_text(t, ...) for t in texts].
+
+    Examples:
+        >>> clean_text_many(["<b>Paris</b>", "Lyon&nbsp;&amp; Nice", None])
+        ['Paris', 'Lyon & Nice', '']
+    """
+    return [clean_text(text, preserve_formatting, remove_notes) for text in texts]
 ######################################################################################################################
@@ -0,0 +1,162 @@
+######################################################################################################################
+# CORE IMPORTS
+# proj_004_cia\c_00_transform_utils\compact_records.py
+# ---------------------------------------------------------------------------------------------------------------------
+import sys
+import keyword
+from collections.abc import Mapping
+from typing import Any, Dict, Optional, Tuple
+# ---------------------------------------------------------------------------------------------------------------------
+
+######################################################################################################################
+# COMPACT RECORDS
+# ---------------------------------------------------------------------------------------------------------------------
+# Opt-in memory-lean form of the return_*_data output (representation='compact').
+#
+# Every dict whose keys are plain identifiers ({'year': 2023, 'value': 1.2, 'unit': 'USD', 'is_estimate': True})
+# becomes an instance of a __slots__ class generated once per key tuple: no per-record hash table, only one
+# pointer per field. Records are read-only Mappings (record['value'], record.get('unit'), record.value) and
+# to_dict() / expand_output() give back exactly the dict output. Short strings (units, labels) are interned
+# so the thousands of 'USD' / 'km' / '%' values share one object.
+######################################################################################################################
+
+DICT = 'dict'
+COMPACT = 'compact'
+REPRESENTATIONS = (DICT, COMPACT)
+
+# Key tuples are data driven (a few hundred in the full corpus); past this many, dicts are kept as dicts
+MAX_RECORD_TYPES = 4096
+# Longer strings (descriptions, notes) are rarely repeated and are kept as they are
+INTERN_MAX_CHARS = 64
+
+
+class CompactRecord(Mapping):
+    """
+    Base class of the generated record types; one subclass per key tuple.
+
+    Examples:
+        >>> record = compact_output({'year': 2023, 'value': 1.2, 'is_estimate': True})
+        >>> record['value'], record.year, record == {'year': 2023, 'value': 1.2, 'is_estimate': True}
+        (1.2, 2023, True)
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+
+    def __init__(self, *values: Any):
+        for field, value in zip(self._fields, values):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only; use to_dict() for a mutable copy")
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._field_set
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{f}={getattr(self, f)!r}' for f in self._fields)})"
+
+    def __reduce__(self):
+        # Generated classes cannot be pickled by name; rebuild them from the key tuple
+        return _rebuild_record, (self._fields, tuple(getattr(self, f) for f in self._fields))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The record (and everything nested in it) as the plain dict output."""
+        return {field: expand_output(getattr(self, field)) for field in self._fields}
+
+
+# Method / attribute names of CompactRecord: a slot with one of these names would hide it
+_RESERVED_NAMES = frozenset(dir(CompactRecord))
+
+_RECORD_TYPES: Dict[Tuple[str, ...], Optional[type]] = {}
+
+
+def _record_type(keys: Tuple[Any, ...]) -> Optional[type]:
+    """The record class for a key tuple, or None when those keys cannot be slots."""
+    try:
+        return _RECORD_TYPES[keys]
+    except KeyError:
+        pass
+    record_type = None
+    if len(_RECORD_TYPES) < MAX_RECORD_TYPES and all(
+            isinstance(key, str) and key.isidentifier() and not keyword.iskeyword(key)
+            and not key.startswith('_') and key not in _RESERVED_NAMES for key in keys):
+        record_type = type(f"Record_{'_'.join(keys)}"[:80], (CompactRecord,),
+                           {'__slots__': keys, '_fields': keys, '_field_set': frozenset(keys)})
+    _RECORD_TYPES[keys] = record_type
+    return record_type
+
+
+def _rebuild_record(keys: Tuple[str, ...], values: Tuple[Any, ...]) -> Any:
+    record_type = _record_type(keys)
+    return record_type(*values) if record_type else dict(zip(keys, values))
+
+
+######################################################################################################################
+# CONVERSION
+######################################################################################################################
+
+
+def compact_output(data: Any) -> Any:
+    """
+    Convert a (cleaned) return_*_data result to its compact form.
+
+    Dicts become CompactRecords where their keys allow it (others stay dicts, with their
+    values converted), lists stay lists and short strings are interned.
+    """
+    if isinstance(data, dict):
+        values = [compact_output(value) for value in data.values()]
+        record_type = _record_type(tuple(data))
+        if record_type is None:
+            return dict(zip(data, values))
+        return record_type(*values)
+    if isinstance(data, list):
+        return [compact_output(item) for item in data]
+    if isinstance(data, str) and len(data) <= INTERN_MAX_CHARS:
+        return sys.intern(data)
+    return data
+
+
+def expand_output(data: Any) -> Any:
+    """Inverse of compact_output: plain dicts / lists with today's JSON shape."""
+    if isinstance(data, CompactRecord):
+        return data.to_dict()
+    if isinstance(data, dict):
+        return {key: expand_output(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [expand_output(item) for item in data]
+    return data
+
+
+def apply_representation(data: Any, representation: str = DICT) -> Any:
+    """Return a cleaned section pack in the requested representation ('dict' or 'compact')."""
+    if representation == DICT:
+        return data
+    if representation == COMPACT:
+        return compact_output(data)
+    raise ValueError(f"Unknown representation '{representation}', expected one of {REPRESENTATIONS}")
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    series = {'current_account_data': [{'year': 2023, 'value': -818.8e9, 'unit': 'USD', 'is_estimate': True},
+                                       {'year': 2022, 'value': -971.6e9, 'unit': 'USD', 'is_estimate': True}],
+              'by_partner': {'China': 0.16, 'Mexico': 0.15}}
+    compact = compact_output(series)
+    print(compact)
+    print(compact['current_account_data'][0]['value'], compact.current_account_data[1].year)
+    print(expand_output(compact) == series, compact == series)
@@ -3,9 +3,11 @@
 # C:\Users\bayoa\impact_projects\claude_solve_cia\proj_004_cia\c_00_transform_utils\extract_and_parse.py
 # ---------------------------------------------------------------------------------------------------------------------
 import inspect
+import threading
+import weakref
 from proj_004_cia.__logger.logger import app_logger
 from typing import Dict, Any, List, Optional, Union, Tuple
-from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import iso3Code_to_cia_code
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import ISO3_TO_CIA
 
 
 def _is_new_style_parser(parser_function) -> bool:
@@ -17,26 +19,88 @@ def _is_new_style_parser(parser_function) -> bool:
 
     Returns True if NEW style, False if OLD style.
     """
+    return resolve_parser_adapter(parser_function).style == NEW_STYLE
+
+
+######################################################################################################################
+# PARSER ADAPTERS
+# ---------------------------------------------------------------------------------------------------------------------
+#   The calling convention of a parser is resolved once (inspect.signature is slow) and cached
+#   by function identity. Registries resolve their parsers at import time.
+######################################################################################################################
+NEW_STYLE = 'new'          # parse_X(data, iso3Code)
+OLD_STYLE = 'old'          # parse_X(iso3Code) - parser reloads the country file
+OLD_STYLE_PASS = 'old_pass'  # parse_X(iso3Code, pass_data=data) - OLD style fed the extracted subtree
+
+
+class ParserAdapter:
+    """
+    Pre-bound `call(data, iso3Code)` for a parser, whatever its calling convention.
+    """
+
+    __slots__ = ('parser_function', 'style', '__weakref__')
+
+    def __init__(self, parser_function, style: str):
+        self.parser_function = parser_function
+        self.style = style
+
+    def __call__(self, data: Any, iso3Code: str) -> Any:
+        if self.style == NEW_STYLE:
+            return self.parser_function(data, iso3Code)
+        if self.style == OLD_STYLE_PASS:
+            return self.parser_function(iso3Code, pass_data=data)
+        # Compatibility shim; parsers should be converted to NEW style
+        return self.parser_function(iso3Code)
+
+
+def _detect_style(parser_function) -> str:
     try:
-        sig = inspect.signature(parser_function)
-        params = list(sig.parameters.values())
-
-        if not params:
-            return True  # Default to NEW style
-
-        first_param = params[0]
-        # Check if first parameter annotation is dict or if name suggests data
-        if first_param.annotation == dict:
-            return True
-        if first_param.annotation == str or first_param.name == 'iso3Code':
-            return False
-        # Check by parameter name pattern
-        if first_param.name.endswith('_data') or first_param.name == 'data':
-            return True
-
-        return True  # Default to NEW style
+        params = list(inspect.signature(parser_function).parameters.values())
     except Exception:
-        return True  # Default to NEW style on error
+        return NEW_STYLE  # Default to NEW style on error
+
+    if not params:
+        return NEW_STYLE  # Default to NEW style
+
+    first_param = params[0]
+    # Check if first parameter annotation is dict or if name suggests data
+    if first_param.annotation == dict:
+        return NEW_STYLE
+    if first_param.annotation == str or first_param.name == 'iso3Code':
+        if any(param.name == 'pass_data' for param in params):
+            return OLD_STYLE_PASS
+        return OLD_STYLE
+    # Check by parameter name pattern
+    if first_param.name.endswith('_data') or first_param.name == 'data':
+        return NEW_STYLE
+
+    return NEW_STYLE  # Default to NEW style
+
+
+_PARSER_ADAPTERS = weakref.WeakKeyDictionary()
+_ADAPTERS_LOCK = threading.Lock()
+
+
+def resolve_parser_adapter(parser_function) -> ParserAdapter:
+    """
+    Return the cached ParserAdapter for `parser_function`, resolving its signature on first use.
+    """
+    try:
+        return _PARSER_ADAPTERS[parser_function]
+    except KeyError:
+        pass
+    except TypeError:
+        # Not weak-referenceable (e.g. some builtins): resolve without caching
+        return ParserAdapter(parser_function, _detect_style(parser_function))
+
+    adapter = ParserAdapter(parser_function, _detect_style(parser_function))
+    with _ADAPTERS_LOCK:
+        return _PARSER_ADAPTERS.setdefault(parser_function, adapter)
+
+
+def _country_name(iso3Code: str) -> str:
+    return ISO3_TO_CIA.get(iso3Code, {}).get('country_name', 'Unknown')
+
 
 ######################################################################################################################
 # ENHANCED EXTRACT AND PARSE UTILITY
@@ -100,15 +164,9 @@ def extract_and_parse(main_data: Dict[str, Any],
 
         # Parse the data
         try:
-            # Detect parser style and call accordingly
-            if _is_new_style_parser(parser_function):
-                # NEW style: parse_X(data, iso3Code)
-                parsed_result = parser_function(data, iso3Code)
-            else:
-                # OLD style: parse_X(iso3Code) - parser loads data internally
-                # Note: OLD style parsers ignore the extracted data and reload it
-                # This is a compatibility shim; parsers should be converted to NEW style
-                parsed_result = parser_function(iso3Code)
+            # Convention resolved once per parser; OLD style parsers get the extracted subtree
+            # when they accept `pass_data`, otherwise they reload the (cached) country file
+            parsed_result = resolve_parser_adapter(parser_function)(data, iso3Code)
 
             # Validate parsed result
             if parsed_result is None and not allow_empty:
@@ -120,15 +178,13 @@ def extract_and_parse(main_data: Dict[str, Any],
             return parsed_result
 
         except Exception as e:
-            country_info = iso3Code_to_cia_code().get(iso3Code, {})
             if app_logger:
-                app_logger.error(f"Parser error in '{parser_function.__name__}' for {parser_name} "
-                                 f"in {iso3Code} ({country_info.get('country_name', 'Unknown')}): {e}")
+                app_logger.error(f"Parser error in '{getattr(parser_function, '__name__', parser_name)}' "
+                                 f"for {parser_name} in {iso3Code} ({_country_name(iso3Code)}): {e}")
             return default_value if default_value is not None else {}
 
     except Exception as e:
-        country_info = iso3Code_to_cia_code().get(iso3Code, {})
         if app_logger:
             app_logger.error(f"Extraction error for '{parser_name}' "
-                             f"in {iso3Code} ({country_info.get('country_name', 'Unknown')}): {e}")
+                             f"in {iso3Code} ({_country_name(iso3Code)}): {e}")
         return default_value if default_value is not None else {}
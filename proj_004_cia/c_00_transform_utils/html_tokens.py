@@ -0,0 +1,222 @@
+######################################################################################################################
+# CORE IMPORTS
+# proj_004_cia\c_00_transform_utils\html_tokens.py
+# ---------------------------------------------------------------------------------------------------------------------
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+# ---------------------------------------------------------------------------------------------------------------------
+
+######################################################################################################################
+# HTML TOKENS
+# ---------------------------------------------------------------------------------------------------------------------
+# Raw texts carry a little markup: <em> labels sub-regions ("<em>metropolitan France:</em> coal, ..."),
+# <strong> / <b> label notes and sub-fields ("<strong>note:</strong> ..."), <br> separates lines and a few
+# fields are wrapped in <p>. Every raw string that contains markup is split once into HtmlTokens:
+#
+#     plain     the text with every tag removed - exactly re.sub(r'<[^>]+>', '', raw)
+#     segments  (label, text) runs of that plain text; label is 'em', 'strong', 'b' or None, and
+#               ('br', '') marks a line break
+#
+# tokenize_country() runs this over a whole country at load time; COUNTRY_DATA_CACHE keeps the result next to
+# the decoded data and parsers look it up with html_tokens(text, iso3Code) instead of re-running tag regexes.
+######################################################################################################################
+
+# Tags whose content is labelled; every other tag (<p>, <small>, <h3>, ...) is dropped, keeping its content
+LABEL_TAGS = frozenset({'em', 'strong', 'b'})
+BREAK = 'br'
+
+# Any '<...>' run: the same pattern the parsers strip, so `plain` matches their output exactly
+_MARKUP_RE = re.compile(r'<[^>]+>')
+_TAG_NAME_RE = re.compile(r'<\s*(/?)\s*([a-zA-Z][a-zA-Z0-9]*)')
+
+Segment = Tuple[Optional[str], str]
+
+
+class HtmlTokens:
+    """
+    One raw text split into plain text and labelled segments.
+
+    Examples:
+        >>> tokens = tokenize_html('<em>metropolitan France:</em> coal, timber; <em>French Guiana</em><em>:</em> gold')
+        >>> tokens.plain
+        'metropolitan France: coal, timber; French Guiana: gold'
+        >>> tokens.sections('em')
+        [('metropolitan France:', ' coal, timber; '), ('French Guiana:', ' gold')]
+    """
+
+    __slots__ = ('raw', 'plain', 'segments')
+
+    def __init__(self, raw: str, plain: str, segments: Tuple[Segment, ...]):
+        self.raw = raw
+        self.plain = plain
+        self.segments = segments
+
+    def __repr__(self) -> str:
+        return f"HtmlTokens(plain={self.plain[:60]!r}, segments={len(self.segments)})"
+
+    @property
+    def has_markup(self) -> bool:
+        return self.raw != self.plain
+
+    def labelled(self, label: str) -> List[str]:
+        """Texts of the runs carrying `label` (adjacent runs merged)."""
+        return [name for name, _ in self.sections(label) if name is not None]
+
+    def without(self, label: str) -> str:
+        """The plain text minus the runs carrying `label` (e.g. a note without its '<strong>note:</strong>')."""
+        return ''.join(text for name, text in self.segments if name != label)
+
+    def sections(self, label: str) -> List[Tuple[Optional[str], str]]:
+        """
+        (label text, following text) pairs, splitting the plain text at each `label` run.
+
+        Adjacent runs with the label are merged ("<em>French Guiana</em><em>:</em>" -> 'French Guiana:');
+        text before the first label is returned with None. Line breaks are kept as '\\n'.
+        """
+        sections: List[Tuple[Optional[str], str]] = []
+        name: Optional[str] = None
+        body: List[str] = []
+        previous_is_label = False
+        for segment_label, text in self.segments:
+            if segment_label == label:
+                if previous_is_label:
+                    name += text
+                    continue
+                if name is not None or body:
+                    sections.append((name, ''.join(body)))
+                name, body = text, []
+                previous_is_label = True
+                continue
+            body.append('\n' if segment_label == BREAK else text)
+            previous_is_label = False
+        if name is not None or body:
+            sections.append((name, ''.join(body)))
+        return sections
+
+    def lines(self) -> List[str]:
+        """The plain text split at <br> tags."""
+        lines, current = [], []
+        for label, text in self.segments:
+            if label == BREAK:
+                lines.append(''.join(current))
+                current = []
+            else:
+                current.append(text)
+        lines.append(''.join(current))
+        return lines
+
+
+######################################################################################################################
+# TOKENIZE
+######################################################################################################################
+
+
+def tokenize_html(text: str) -> HtmlTokens:
+    """Split one raw string into HtmlTokens (markup-free text is returned as a single segment)."""
+    if '<' not in text:
+        return HtmlTokens(text, text, ((None, text),) if text else ())
+
+    segments: List[Segment] = []
+    open_labels: List[str] = []
+    position = 0
+    for match in _MARKUP_RE.finditer(text):
+        if match.start() > position:
+            segments.append((open_labels[-1] if open_labels else None, text[position:match.start()]))
+        position = match.end()
+
+        tag = _TAG_NAME_RE.match(match.group())
+        if tag is None:
+            continue
+        closing, name = tag.group(1), tag.group(2).lower()
+        if name == BREAK:
+            segments.append((BREAK, ''))
+        elif name in LABEL_TAGS:
+            if not closing:
+                open_labels.append(name)
+            elif name in open_labels:
+                # Close the innermost matching tag (and anything left open inside it)
+                del open_labels[len(open_labels) - 1 - open_labels[::-1].index(name):]
+    if position < len(text):
+        segments.append((open_labels[-1] if open_labels else None, text[position:]))
+
+    plain = ''.join(segment_text for _, segment_text in segments)
+    return HtmlTokens(text, plain, tuple(segments))
+
+
+def iter_markup_strings(data: Any) -> Iterator[str]:
+    """Every string containing '<' in a nested raw dict / list."""
+    if isinstance(data, str):
+        if '<' in data:
+            yield data
+    elif isinstance(data, dict):
+        for value in data.values():
+            yield from iter_markup_strings(value)
+    elif isinstance(data, list):
+        for value in data:
+            yield from iter_markup_strings(value)
+
+
+def tokenize_country(data: Any) -> Dict[str, HtmlTokens]:
+    """{raw string: HtmlTokens} for every string with markup in one country's raw data."""
+    tokens: Dict[str, HtmlTokens] = {}
+    for text in iter_markup_strings(data):
+        if text not in tokens:
+            tokens[text] = tokenize_html(text)
+    return tokens
+
+
+######################################################################################################################
+# LOOKUP
+######################################################################################################################
+
+_peek_country_tokens = None
+
+
+def html_tokens(text: Any, iso3Code: Optional[str] = None) -> HtmlTokens:
+    """
+    HtmlTokens of a raw string, from the tokens cached with the loaded country when there are any.
+
+    Args:
+        text: Raw string (other values are converted with str())
+        iso3Code: Country the text belongs to; when that country is in COUNTRY_DATA_CACHE the
+                  load-time tokens are reused, otherwise the text is tokenized on the spot
+
+    Examples:
+        >>> html_tokens('<strong>note:</strong> leased by the US').without('strong')
+        ' leased by the US'
+    """
+    global _peek_country_tokens
+    if not isinstance(text, str):
+        text = str(text)
+    if '<' not in text:
+        return HtmlTokens(text, text, ((None, text),) if text else ())
+    if iso3Code:
+        if _peek_country_tokens is None:
+            # Imported here: the loader itself imports this module to tokenize countries
+            from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import COUNTRY_DATA_CACHE
+            _peek_country_tokens = COUNTRY_DATA_CACHE.peek_tokens
+        country_tokens = _peek_country_tokens(iso3Code)
+        if country_tokens is not None:
+            tokens = country_tokens.get(text)
+            if tokens is not None:
+                return tokens
+    return tokenize_html(text)
+
+
+def strip_tags(text: Any, iso3Code: Optional[str] = None) -> str:
+    """Text without markup; same result as re.sub(r'<[^>]+>', '', text)."""
+    return html_tokens(text, iso3Code).plain
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
+
+    usa = load_country_data('USA')
+    country_tokens = tokenize_country(usa)
+    print(f"USA: {len(country_tokens)} strings with markup")
+    for raw, tokens in list(country_tokens.items())[:5]:
+        print(repr(raw[:70]))
+        print('   ', tokens.sections('strong')[:3])
@@ -5,14 +5,99 @@
 import re
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
 from proj_004_cia.__logger.logger import app_logger
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Union, Tuple
 # ---------------------------------------------------------------------------------------------------------------------
 
+# Smart detection picks the most frequent of these (the first one on ties, only if present at all)
+DELIMITER_CANDIDATES = (';', ',', '|', '\n', '•', '–', '-')
+
+_NUMBERED_ITEM_RE = re.compile(r'\d+\.\s+')
+_BULLET_RE = re.compile(r'[•\-–]\s*')
+_LEADING_CONJUNCTION_RE = re.compile(r'^(and\s+|or\s+)', re.IGNORECASE)
+_TRAILING_ETC_RE = re.compile(r'\s+(etc\.?|among others)$', re.IGNORECASE)
+
 ######################################################################################################################
 # ENHANCED LIST PARSING
 ######################################################################################################################
 
 
+def _iter_split(text: str, delimiter: str) -> Iterator[str]:
+    """Lazy str.split(delimiter)."""
+    if not delimiter:
+        raise ValueError("empty separator")
+    start = 0
+    step = len(delimiter)
+    while True:
+        end = text.find(delimiter, start)
+        if end < 0:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + step
+
+
+def _resolve_delimiter(text: str, delimiter: str, smart_delimiters: bool) -> str:
+    if smart_delimiters:
+        delimiter_counts = {d: text.count(d) for d in DELIMITER_CANDIDATES}
+
+        # Find the most frequent delimiter (but at least 1 occurrence)
+        best_delimiter = max(delimiter_counts, key=delimiter_counts.get)
+        if delimiter_counts[best_delimiter] > 0:
+            return best_delimiter
+    return delimiter
+
+
+def _iter_items(text: str,
+                delimiter: str,
+                strip_items: bool,
+                remove_empty: bool,
+                clean_items: bool) -> Iterator[str]:
+    """Items of stripped, non-empty text split on an already resolved delimiter."""
+    # Special handling for bullet points and numbered lists
+    if '•' in text or _NUMBERED_ITEM_RE.search(text):
+        # Handle bullet points
+        text = _BULLET_RE.sub(delimiter + ' ', text)
+        # Handle numbered lists
+        text = _NUMBERED_ITEM_RE.sub(delimiter + ' ', text)
+
+    for item in _iter_split(text, delimiter):
+        if strip_items:
+            item = item.strip()
+
+        if clean_items:
+            item = clean_text(item)
+
+        # Remove common prefixes/suffixes
+        item = _LEADING_CONJUNCTION_RE.sub('', item)
+        item = _TRAILING_ETC_RE.sub('', item)
+
+        if remove_empty and not item:
+            continue
+
+        yield item
+
+
+def iter_list_from_string(data_string: str,
+                          delimiter: str = ',',
+                          strip_items: bool = True,
+                          remove_empty: bool = True,
+                          clean_items: bool = True,
+                          smart_delimiters: bool = True) -> Iterator[str]:
+    """
+    Generator form of parse_list_from_string: yields the same items one at a time. Unexpected
+    errors propagate (parse_list_from_string logs them and returns []).
+
+    Examples:
+        >>> list(iter_list_from_string("coal; iron ore; and timber etc."))
+        ['coal', 'iron ore', 'timber']
+    """
+    if not isinstance(data_string, str) or not data_string.strip():
+        return iter(())
+    text = data_string.strip()
+    return _iter_items(text, _resolve_delimiter(text, delimiter, smart_delimiters),
+                       strip_items, remove_empty, clean_items)
+
+
 def parse_list_from_string(data_string: str,
                            delimiter: str = ',',
                            strip_items: bool = True,
@@ -31,52 +116,15 @@ def parse_list_from_string(data_string: str,
         smart_delimiters: Whether to auto-detect best delimiter
 
     Returns:
-        List of cleaned strings
+        List of cleaned strings (see iter_list_from_string for the streaming form)
     """
     if not isinstance(data_string, str) or not data_string.strip():
         return []
 
     try:
         text = data_string.strip()
-
-        # Smart delimiter detection
-        if smart_delimiters:
-            delimiter_candidates = [';', ',', '|', '\n', '•', '–', '-']
-            delimiter_counts = {d: text.count(d) for d in delimiter_candidates}
-
-            # Find the most frequent delimiter (but at least 1 occurrence)
-            best_delimiter = max(delimiter_counts, key=delimiter_counts.get)
-            if delimiter_counts[best_delimiter] > 0:
-                delimiter = best_delimiter
-
-        # Special handling for bullet points and numbered lists
-        if '•' in text or re.search(r'\d+\.\s+', text):
-            # Handle bullet points
-            text = re.sub(r'[•\-–]\s*', delimiter + ' ', text)
-            # Handle numbered lists
-            text = re.sub(r'\d+\.\s+', delimiter + ' ', text)
-
-        # Split the string
-        items = text.split(delimiter)
-
-        # Process each item
-        processed_items = []
-        for item in items:
-            if strip_items:
-                item = item.strip()
-
-            if clean_items:
-                item = clean_text(item)
-
-            # Remove common prefixes/suffixes
-            item = re.sub(r'^(and\s+|or\s+)', '', item, flags=re.IGNORECASE)
-            item = re.sub(r'\s+(etc\.?|among others)$',
-                          '', item, flags=re.IGNORECASE)
-
-            if remove_empty and not item:
-                continue
-
-            processed_items.append(item)
+        delimiter = _resolve_delimiter(text, delimiter, smart_delimiters)
+        processed_items = list(_iter_items(text, delimiter, strip_items, remove_empty, clean_items))
 
         if app_logger and len(processed_items) > 0:
             app_logger.debug(
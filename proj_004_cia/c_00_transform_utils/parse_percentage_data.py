@@ -3,9 +3,9 @@
 # CORE IMPORTS
 # C:\Users\bayoa\impact_projects\claude_solve_cia\proj_004_cia\c_00_transform_utils\parse_percentage_data.py
 # ---------------------------------------------------------------------------------------------------------------------
-import re
 from proj_004_cia.__logger.logger import app_logger
 from typing import Dict, Any, List, Optional, Union, Tuple
+from proj_004_cia.c_00_transform_utils.quantity_tokenizer import read_percentage_text, STATUS_NO_MATCH
 # ---------------------------------------------------------------------------------------------------------------------
 
 ######################################################################################################################
@@ -40,39 +40,13 @@ def parse_percentage_data(data_string: str,
         text = data_string.strip()
         result = {}
 
-        # Enhanced percentage extraction patterns
-        percentage_patterns = [
-            r'([\d.]+)%\s*\((\d{4})\s*est\.?\)',        # 15.2% (2023 est.)
-            r'([\d.]+)%\s*\((\d{4})\)',                 # 15.2% (2023)
-            r'([\d.]+)\s*percent\s*\((\d{4})\)',        # 15.2 percent (2023)
-            r'([\d.]+)%',                               # 15.2%
-            r'([\d.]+)\s*percent',                      # 15.2 percent
-        ]
-
-        percentage_value = None
-        year_value = None
-        is_estimate = False
-
-        for pattern in percentage_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                percentage_value = float(match.group(1))
-
-                if len(match.groups()) > 1:
-                    year_value = int(match.group(2))
-
-                if 'est' in text.lower():
-                    is_estimate = True
-
-                break
-
-        if percentage_value is None:
-            # Try to extract just a number and assume it's a percentage
-            number_match = re.search(r'([\d.]+)', text)
-            if number_match:
-                percentage_value = float(number_match.group(1))
-            else:
-                raise ValueError(f"No percentage value found in: {text}")
+        # Plain quantities are read directly, anything else in one scan into number / percent / year /
+        # estimate tokens (see quantity_tokenizer):
+        # "15.2% (2023 est.)", "15.2% (2023)", "15.2 percent (2023)", "15.2%", "15.2 percent",
+        # else the first number in the text
+        status, percentage_value, year_value, is_estimate = read_percentage_text(text)
+        if status == STATUS_NO_MATCH:
+            raise ValueError(f"No percentage value found in: {text}")
 
         # Convert to decimal if requested
         if return_decimal:
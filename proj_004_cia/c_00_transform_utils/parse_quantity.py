@@ -0,0 +1,177 @@
+######################################################################################################################
+# CORE IMPORTS
+# proj_004_cia\c_00_transform_utils\parse_quantity.py
+# ---------------------------------------------------------------------------------------------------------------------
+import re
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple
+from proj_004_cia.__config.config import Config
+from proj_004_cia.__logger.logger import app_logger
+
+######################################################################################################################
+# PROFILES
+# ---------------------------------------------------------------------------------------------------------------------
+# Each section parsed CIA quantities ("4.941 billion metric tonnes of CO2 (2022 est.)") with its own copy
+# of the same extractor; the copies differ only in the switches below.
+
+
+class QuantityProfile(NamedTuple):
+    label: str                  # used in error messages
+    allow_currency: bool        # number may carry '$' ("-$818.822 billion")
+    strip_all_notes: bool       # drop every "(...)" (True) or only a trailing one (False)
+    unit_first_word: bool       # unit is the first word after the number ("km") or the whole remainder
+    percent_fallback: bool      # "18.5% (2023 est.)" -> value 18.5, unit '%'
+
+
+QUANTITY_PROFILES = {
+    'economy': QuantityProfile('economy', True, False, False, True),
+    'energy': QuantityProfile('energy', False, False, False, True),
+    'communications': QuantityProfile('communications', False, False, False, True),
+    'transportation': QuantityProfile('transport', False, True, True, False),
+}
+
+RESULT_KEYS = ('value', 'raw_value', 'magnitude', 'unit', 'year', 'is_estimate', 'text')
+_EMPTY_RESULT = dict(zip(RESULT_KEYS, (None, None, None, None, None, False, None)))
+
+MAGNITUDES = {
+    'trillion': 1_000_000_000_000,
+    'billion': 1_000_000_000,
+    'million': 1_000_000,
+    'thousand': 1_000,
+}
+
+######################################################################################################################
+# COMPILED PATTERNS
+# ---------------------------------------------------------------------------------------------------------------------
+_YEAR_RE = re.compile(r'\((\d{4})(?:\s*est\.?)?\)')
+_TRAILING_NOTE_RE = re.compile(r'\s*\([^)]*\)\s*$')
+_ANY_NOTE_RE = re.compile(r'\s*\([^)]*\)\s*')
+_NUMBER_RE = re.compile(r'^[\s]*(-?\d+(?:,\d{3})*(?:\.\d+)?)')
+_CURRENCY_NUMBER_RE = re.compile(r'^[\s]*(-?\$?-?\d+(?:,\d{3})*(?:\.\d+)?)')
+_MAGNITUDE_WORD_RES = {mag: re.compile(rf'\b{mag}\b', re.IGNORECASE) for mag in MAGNITUDES}
+_LEADING_SEPARATORS_RE = re.compile(r'^[\s,]+')
+_TRAILING_SEPARATORS_RE = re.compile(r'[\s,]+$')
+_UNIT_WORD_RE = re.compile(r'^([a-zA-Z\-]+)')
+_PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+
+######################################################################################################################
+# QUANTITY PARSER
+######################################################################################################################
+
+
+def parse_quantity(text: str, profile: str = 'economy') -> Dict[str, Any]:
+    """
+    Parse a CIA quantity string into value / magnitude / unit / year / estimate components.
+
+    Results are memoized per (text, profile) in a bounded LRU (Config.QUANTITY_PARSER_CACHE_SIZE);
+    every call returns a fresh copy, so callers may modify it.
+
+    Args:
+        text: Raw text like "4.941 billion metric tonnes of CO2 (2022 est.)"
+        profile: One of QUANTITY_PROFILES ('economy', 'energy', 'communications', 'transportation')
+
+    Returns:
+        Dict with keys value, raw_value, magnitude, unit, year, is_estimate, text
+
+    Examples:
+        >>> parse_quantity("-$818.822 billion (2023 est.)")['value']
+        -818822000000.0
+
+        >>> parse_quantity("41,009 km (2012)", 'transportation')['unit']
+        'km'
+    """
+    if not text or not isinstance(text, str):
+        return dict(_EMPTY_RESULT)
+    return _parse_quantity_cached(text, profile).copy()
+
+
+@lru_cache(maxsize=Config.QUANTITY_PARSER_CACHE_SIZE)
+def _parse_quantity_cached(text: str, profile_name: str) -> Dict[str, Any]:
+    profile = QUANTITY_PROFILES[profile_name]
+    value = raw_value = magnitude_found = unit = year = None
+    is_estimate = False
+    clean_text = None
+
+    try:
+        clean_text = text.strip()
+
+        lowered = clean_text.lower()
+        is_estimate = 'est.' in lowered or 'est)' in lowered
+
+        # Year from parenthesis - (2022 est.) or (2022)
+        year_match = _YEAR_RE.search(clean_text)
+        if year_match:
+            year = int(year_match.group(1))
+
+        # Remove the year/estimate portion for further parsing
+        if profile.strip_all_notes:
+            text_without_year = _ANY_NOTE_RE.sub(' ', clean_text).strip()
+        else:
+            text_without_year = _TRAILING_NOTE_RE.sub('', clean_text).strip()
+
+        multiplier = 1
+        working_text = text_without_year.lower()
+        for mag, mult in MAGNITUDES.items():
+            if mag in working_text:
+                multiplier = mult
+                magnitude_found = mag
+                break
+
+        # First number: "4.941", "20,879", "94" (and "$3.052" / "-$818.822" for currency profiles)
+        number_re = _CURRENCY_NUMBER_RE if profile.allow_currency else _NUMBER_RE
+        num_match = number_re.search(text_without_year)
+        if num_match:
+            raw_value = float(num_match.group(1).replace(',', '').replace('$', ''))
+            value = raw_value * multiplier
+
+            # Unit - everything after the number, minus the magnitude word
+            unit_text = text_without_year[num_match.end():].strip()
+            if magnitude_found:
+                unit_text = _MAGNITUDE_WORD_RES[magnitude_found].sub('', unit_text).strip()
+
+            if profile.unit_first_word:
+                unit_match = _UNIT_WORD_RE.match(unit_text)
+                if unit_match:
+                    unit = unit_match.group(1)
+            else:
+                # unit_text is already stripped, so only a leading/trailing comma needs the regexes
+                if unit_text.startswith(','):
+                    unit_text = _LEADING_SEPARATORS_RE.sub('', unit_text)
+                if unit_text.endswith(','):
+                    unit_text = _TRAILING_SEPARATORS_RE.sub('', unit_text)
+                if unit_text:
+                    unit = unit_text
+
+        if value is None and profile.percent_fallback:
+            pct_match = _PERCENT_RE.search(clean_text)
+            if pct_match:
+                raw_value = value = float(pct_match.group(1))
+                unit = '%'
+
+    except Exception as e:
+        # Memoized: logged once per distinct string
+        app_logger.error(f"Error parsing {profile.label} value '{text}': {e}")
+
+    return dict(zip(RESULT_KEYS, (value, raw_value, magnitude_found, unit, year, is_estimate, clean_text)))
+
+
+# lru_cache-style introspection on the public function
+parse_quantity.cache_info = _parse_quantity_cached.cache_info
+parse_quantity.cache_clear = _parse_quantity_cached.cache_clear
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    test_cases = [
+        ("4.941 billion metric tonnes of CO2 (2022 est.)", 'energy'),
+        ("-$818.822 billion (2023 est.)", 'economy'),
+        ("18.5% (2023 est.)", 'economy'),
+        ("293,564.2 km (2014)", 'transportation'),
+        ("NA", 'communications'),
+    ]
+    for test, profile in test_cases:
+        print(f"[{profile}] {test!r}")
+        print(f"  {parse_quantity(test, profile)}")
+    print(parse_quantity.cache_info())
@@ -2,17 +2,98 @@
 # CORE IMPORTS
 # proj_004_cia\c_00_transform_utils\parse_text_to_list.py
 # ---------------------------------------------------------------------------------------------------------------------
+import re
 from proj_004_cia.__logger.logger import app_logger
-from typing import List
+from typing import Iterator, List
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
 
 # ----------------------------------------------------------------------------------------------------------------------
 
+# Smart splitting picks the most frequent of these outside parentheses (';' when there is none)
+SMART_DELIMITERS = (';', ',', '|', '\n')
+DEFAULT_DELIMITER = ';'
+
+# Only parentheses and delimiters matter to the splitter; one compiled scan skips everything else
+_STRUCTURE_RE = re.compile(r'[();,|\n]')
+_SPLITTERS = {delimiter: re.compile(r'[()' + re.escape(delimiter) + r']') for delimiter in SMART_DELIMITERS}
+
 
 ######################################################################################################################
 # ENHANCED LIST PARSING WITH CONTEXT AWARENESS
 ######################################################################################################################
 
+def _best_delimiter(text: str) -> str:
+    """Most frequent SMART_DELIMITERS character outside parentheses (ties: the first seen)."""
+    delimiter_counts = {}
+    depth = 0
+    for match in _STRUCTURE_RE.finditer(text):
+        char = match.group()
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(0, depth - 1)
+        elif depth == 0:
+            delimiter_counts[char] = delimiter_counts.get(char, 0) + 1
+    if delimiter_counts:
+        return max(delimiter_counts, key=delimiter_counts.get)
+    return DEFAULT_DELIMITER
+
+
+def _split_outside_parentheses(text: str, delimiter: str) -> Iterator[str]:
+    """Yield the pieces of text between `delimiter`s that are not inside parentheses."""
+    splitter = _SPLITTERS.get(delimiter) or re.compile(r'[()' + re.escape(delimiter) + r']')
+    depth = 0
+    start = 0
+    for match in splitter.finditer(text):
+        char = match.group()
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(0, depth - 1)
+        elif depth == 0:
+            yield text[start:match.start()]
+            start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
+def iter_text_to_list(text: str,
+                      respect_parentheses: bool = True,
+                      smart_splitting: bool = True,
+                      clean_items: bool = True) -> Iterator[str]:
+    """
+    Generator form of parse_text_to_list: yields the same items one at a time, without
+    building the intermediate segment lists. Unexpected errors propagate (parse_text_to_list
+    logs them and returns []).
+
+    Examples:
+        >>> list(iter_text_to_list("coal, iron ore (hematite, magnetite), timber"))
+        ['coal', 'iron ore (hematite, magnetite)', 'timber']
+    """
+    if not isinstance(text, str) or not text.strip():
+        return
+
+    # Clean the text first
+    cleaned_text = clean_text(text) if clean_items else text.strip()
+
+    # Smart delimiter detection (';' otherwise)
+    delimiter = _best_delimiter(cleaned_text) if smart_splitting else DEFAULT_DELIMITER
+
+    # Parse with respect to parentheses if requested
+    if respect_parentheses:
+        segments = _split_outside_parentheses(cleaned_text, delimiter)
+    else:
+        segments = cleaned_text.split(delimiter)
+
+    # Clean and filter segments
+    for segment in segments:
+        segment = segment.strip()
+        if clean_items:
+            segment = clean_text(segment)
+        if segment:
+            yield segment
+
+
 def parse_text_to_list(text: str,
                        respect_parentheses: bool = True,
                        smart_splitting: bool = True,
@@ -27,75 +108,10 @@ def parse_text_to_list(text: str,
         clean_items: Whether to clean each list item
 
     Returns:
-        List of parsed and cleaned strings
+        List of parsed and cleaned strings (see iter_text_to_list for the streaming form)
     """
-    if not isinstance(text, str) or not text.strip():
-        return []
-
     try:
-        # Clean the text first
-        if clean_items:
-            cleaned_text = clean_text(text)
-        else:
-            cleaned_text = text.strip()
-
-        # Smart delimiter detection
-        delimiters = [';', ','] if not smart_splitting else [
-            ';', ',', '|', '\n']
-        best_delimiter = ';'  # Default
-
-        if smart_splitting:
-            # Count occurrences of each delimiter outside parentheses
-            delimiter_counts = {}
-            in_parentheses = 0
-
-            for char in cleaned_text:
-                if char == '(':
-                    in_parentheses += 1
-                elif char == ')':
-                    in_parentheses = max(0, in_parentheses - 1)
-                elif char in delimiters and in_parentheses == 0:
-                    delimiter_counts[char] = delimiter_counts.get(char, 0) + 1
-
-            if delimiter_counts:
-                best_delimiter = max(
-                    delimiter_counts, key=delimiter_counts.get)
-
-        # Parse with respect to parentheses if requested
-        if respect_parentheses:
-            segments = []
-            buffer = []
-            open_parentheses = 0
-
-            for char in cleaned_text:
-                if char == best_delimiter and open_parentheses == 0:
-                    segments.append(''.join(buffer).strip())
-                    buffer = []
-                else:
-                    buffer.append(char)
-                    if char == '(':
-                        open_parentheses += 1
-                    elif char == ')':
-                        open_parentheses = max(0, open_parentheses - 1)
-
-            if buffer:
-                segments.append(''.join(buffer).strip())
-        else:
-            # Simple split
-            segments = cleaned_text.split(best_delimiter)
-
-        # Clean and filter segments
-        result = []
-        for segment in segments:
-            if clean_items:
-                segment = clean_text(segment.strip())
-            else:
-                segment = segment.strip()
-
-            if segment:
-                result.append(segment)
-
-        return result
+        return list(iter_text_to_list(text, respect_parentheses, smart_splitting, clean_items))
 
     except Exception as e:
         if app_logger:
@@ -0,0 +1,316 @@
+######################################################################################################################
+# CORE IMPORTS
+# C:\Users\bayoa\impact_projects\claude_solve_cia\proj_004_cia\c_00_transform_utils\parser_registry.py
+# ---------------------------------------------------------------------------------------------------------------------
+import importlib
+from proj_004_cia.__logger.logger import app_logger
+from typing import Dict, Any, Callable, Iterable, List, Optional
+from proj_004_cia.c_00_transform_utils.extract_and_parse import extract_and_parse, resolve_parser_adapter
+# ----------------------------------------------------------------------------------------------------------------------
+
+######################################################################################################################
+# CALLING CONVENTIONS
+# ---------------------------------------------------------------------------------------------------------------------
+#   EXTRACT       extract_and_parse(section, key_path, parser, iso3Code)
+#   SUBTREE       parser(section.get(key_path, {}))
+#   SUBTREE_ISO3  parser(section.get(key_path, {}), iso3Code)
+#   ISO3          parser(iso3Code)                  - OLD style, parser loads its own data
+#   SECTION       parser(section, iso3Code)         - whole-section parsers and custom handlers
+######################################################################################################################
+EXTRACT = 'extract'
+SUBTREE = 'subtree'
+SUBTREE_ISO3 = 'subtree_iso3'
+ISO3 = 'iso3'
+SECTION = 'section'
+
+CONVENTIONS = (EXTRACT, SUBTREE, SUBTREE_ISO3, ISO3, SECTION)
+
+# Which countries parse_section emits a spec for; dispatch() still runs a spec for any country
+# unless it is registered with strict_scope=True
+ALL = 'all'
+COUNTRY = 'country'   # every ISO3 code except WLD
+WORLD = 'world'       # WLD only
+
+SCOPES = (ALL, COUNTRY, WORLD)
+
+
+######################################################################################################################
+# LAZY PARSER REFERENCES
+######################################################################################################################
+
+
+class LazyParser:
+    """
+    Stand-in for a parser function that imports its module on first use.
+
+    The get_* dispatchers bind their parsers through LazyParser so that importing
+    a section (or a single return_*_data module) does not import every parser
+    module behind it; a parser module is only loaded the first time one of its
+    fields is parsed.
+
+    Args:
+        module_name: Dotted module path (e.g. 'proj_004_cia.c_06_economy.helper.utils.parse_gini')
+        attr: Function name inside the module, defaults to the last component of module_name
+
+    Examples:
+        >>> parse_gini = LazyParser('proj_004_cia.c_06_economy.helper.utils.parse_gini')
+        >>> parse_gini.__name__
+        'parse_gini'
+    """
+
+    __slots__ = ('module_name', '__name__', '_target')
+
+    def __init__(self, module_name: str, attr: Optional[str] = None):
+        self.module_name = module_name
+        self.__name__ = attr or module_name.rsplit('.', 1)[-1]
+        self._target = None
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._target is not None
+
+    def resolve(self) -> Callable:
+        """Import the module (once) and return the real function."""
+        target = self._target
+        if target is None:
+            target = self._target = getattr(importlib.import_module(self.module_name), self.__name__)
+        return target
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = 'resolved' if self._target is not None else 'unresolved'
+        return f"<LazyParser {self.module_name}.{self.__name__} ({state})>"
+
+
+def resolve_parser(parser: Callable) -> Callable:
+    """Return the real function behind a LazyParser; any other callable is returned as is."""
+    if isinstance(parser, LazyParser):
+        return parser.resolve()
+    return parser
+
+
+######################################################################################################################
+# PARSER SPEC
+######################################################################################################################
+
+
+class ParserSpec:
+    """
+    One output field of a section: where its raw data lives and how to parse it.
+
+    Args:
+        key: Output key in the section pack (e.g. 'geo_area_total_sq_km')
+        parser: Parser callable or LazyParser (resolved on first call)
+        key_path: Dot-separated raw key path inside the section (e.g. "Area.total")
+        convention: One of CONVENTIONS, decides how the parser is called
+        info: Dispatcher name accepted by get_*(info=...), defaults to key
+        scope: One of SCOPES; None inherits the registry default
+        is_world_data: Forwarded to extract_and_parse for EXTRACT specs
+        strict_scope: dispatch() returns the default outside the scope too (the world_* entries)
+    """
+
+    __slots__ = ('key', '_parser', 'key_path', 'convention', 'info', 'scope', 'is_world_data', 'strict_scope',
+                 'parser_name')
+
+    def __init__(self,
+                 key: str,
+                 parser: Callable,
+                 key_path: Optional[str] = None,
+                 convention: str = EXTRACT,
+                 info: Optional[str] = None,
+                 scope: Optional[str] = None,
+                 is_world_data: bool = False,
+                 strict_scope: bool = False):
+        if convention not in CONVENTIONS:
+            raise ValueError(f"Unknown calling convention '{convention}' for '{key}'")
+        if scope is not None and scope not in SCOPES:
+            raise ValueError(f"Unknown scope '{scope}' for '{key}'")
+        if convention in (EXTRACT, SUBTREE, SUBTREE_ISO3) and not key_path:
+            raise ValueError(f"Convention '{convention}' requires a key_path for '{key}'")
+
+        self.key = key
+        self._parser = parser
+        self.key_path = key_path
+        self.convention = convention
+        self.info = info or key
+        self.scope = scope
+        self.is_world_data = is_world_data
+        self.strict_scope = strict_scope
+        self.parser_name = getattr(parser, '__name__', key)
+
+        if not isinstance(parser, LazyParser):
+            self._prepare(parser)
+
+    def _prepare(self, parser: Callable) -> None:
+        # Resolve the parser's calling convention once rather than on every extract_and_parse call
+        if self.convention == EXTRACT:
+            resolve_parser_adapter(parser)
+
+    @property
+    def parser(self) -> Callable:
+        """The parser function; a LazyParser is imported and swapped in on first access."""
+        parser = self._parser
+        if isinstance(parser, LazyParser):
+            parser = self._parser = parser.resolve()
+            self._prepare(parser)
+        return parser
+
+    def applies_to(self, iso3Code: str) -> bool:
+        if self.scope == WORLD:
+            return iso3Code == 'WLD'
+        if self.scope == COUNTRY:
+            return iso3Code != 'WLD'
+        return True
+
+    def __call__(self, section: Dict[str, Any], iso3Code: str) -> Any:
+        convention = self.convention
+        parser = self.parser
+        if convention == EXTRACT:
+            return extract_and_parse(
+                main_data=section,
+                key_path=self.key_path,
+                parser_function=parser,
+                iso3Code=iso3Code,
+                parser_name=self.parser_name,
+                is_world_data=self.is_world_data
+            )
+        if convention == SUBTREE:
+            return parser(section.get(self.key_path, {}))
+        if convention == SUBTREE_ISO3:
+            return parser(section.get(self.key_path, {}), iso3Code)
+        if convention == ISO3:
+            return parser(iso3Code)
+        return parser(section, iso3Code)
+
+    def __repr__(self) -> str:
+        return (f"ParserSpec(key={self.key!r}, parser={self.parser_name}, key_path={self.key_path!r}, "
+                f"convention={self.convention!r}, scope={self.scope!r})")
+
+
+######################################################################################################################
+# PARSER REGISTRY
+######################################################################################################################
+
+
+class ParserRegistry:
+    """
+    Ordered, import-time table of a section's output fields.
+
+    Replaces the per-call `if info == ...` chains in the get_* dispatchers:
+    dispatch() finds a field in O(1) and parse_section() builds the whole
+    section pack in a single pass, in registry order.
+
+    Args:
+        section: Top-level raw section name (e.g. "Economy")
+        specs: ParserSpec entries in output order
+        default_scope: Scope applied to specs that do not set one
+        default: Value returned for unknown or out-of-scope fields
+        require_section: Return `default` for every field when the raw section is missing
+    """
+
+    def __init__(self,
+                 section: str,
+                 specs: Iterable[ParserSpec],
+                 default_scope: str = ALL,
+                 default: Any = None,
+                 require_section: bool = False):
+        self.section = section
+        self.default = default
+        self.require_section = require_section
+        self.specs: List[ParserSpec] = []
+        self._by_info: Dict[str, List[ParserSpec]] = {}
+        self._keys = set()
+
+        for spec in specs:
+            if spec.scope is None:
+                spec.scope = default_scope
+            if (spec.key, spec.scope) in self._keys:
+                raise ValueError(f"Duplicate output key '{spec.key}' ({spec.scope}) in {section} registry")
+            self._keys.add((spec.key, spec.scope))
+            self.specs.append(spec)
+            self._by_info.setdefault(spec.info, []).append(spec)
+
+    def __contains__(self, info: str) -> bool:
+        return info in self._by_info
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def __iter__(self):
+        return iter(self.specs)
+
+    def get_spec(self, info: str, iso3Code: str) -> Optional[ParserSpec]:
+        """
+        Return the spec dispatch() runs for `info`: the first one in scope for `iso3Code`, else the first
+        one registered without strict_scope (the get_* if-chains ran every field for every country).
+        """
+        specs = self._by_info.get(info, ())
+        for spec in specs:
+            if spec.applies_to(iso3Code):
+                return spec
+        for spec in specs:
+            if not spec.strict_scope:
+                return spec
+        return None
+
+    def _default(self) -> Any:
+        # Never hand out the shared default container itself
+        if isinstance(self.default, (dict, list)):
+            return type(self.default)()
+        return self.default
+
+    def section_data(self, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        if not data:
+            return {}
+        return data.get(self.section, {})
+
+    def dispatch(self, data: Optional[Dict[str, Any]], info: str, iso3Code: str) -> Any:
+        """
+        Parse a single field; the registry-backed body of every get_* dispatcher.
+        """
+        if data is None:
+            return self._default()
+
+        spec = self.get_spec(info, iso3Code)
+        if spec is None:
+            return self._default()
+
+        section = self.section_data(data)
+        if self.require_section and not section:
+            if app_logger:
+                app_logger.warning(f"No '{self.section}' section found for {iso3Code}")
+            return self._default()
+
+        return spec(section, iso3Code)
+
+    def parse_section(self,
+                      data: Optional[Dict[str, Any]],
+                      iso3Code: str,
+                      fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Build the section pack in one pass over the registry.
+
+        Args:
+            data: Raw country data (as returned by load_country_data)
+            iso3Code: Country ISO3 code
+            fields: Optional subset of output keys to parse; registry order is kept
+
+        Returns:
+            Dict of output key -> parsed value for every spec in scope
+        """
+        wanted = set(fields) if fields is not None else None
+        section = self.section_data(data)
+        missing = self.require_section and not section
+        if missing and app_logger:
+            app_logger.warning(f"No '{self.section}' section found for {iso3Code}")
+
+        cia_pack = {}
+        for spec in self.specs:
+            if wanted is not None and spec.key not in wanted:
+                continue
+            if not spec.applies_to(iso3Code):
+                continue
+            cia_pack[spec.key] = self._default() if missing else spec(section, iso3Code)
+        return cia_pack
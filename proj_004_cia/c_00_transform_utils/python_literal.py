@@ -0,0 +1,93 @@
+######################################################################################################################
+# CORE IMPORTS
+# proj_004_cia\c_00_transform_utils\python_literal.py
+# ---------------------------------------------------------------------------------------------------------------------
+import json
+import math
+from typing import Any, List
+# ---------------------------------------------------------------------------------------------------------------------
+
+######################################################################################################################
+# PYTHON LITERAL
+# ---------------------------------------------------------------------------------------------------------------------
+# Generated .py outputs (feature _outputs, z_reports) hold one big literal laid out like json.dumps(indent=4).
+# Replacing ': null' / ': true' / ': false' in the JSON text also rewrote those words inside strings and missed
+# them in lists, so the literal is written directly: strings keep their JSON escapes (valid Python), None / True /
+# False are Python names, and non-finite floats are spelled float('nan') / float('inf').
+######################################################################################################################
+
+_INDENT = '    '
+
+
+def _key(key: Any) -> str:
+    # Keys as json.dumps turns them into strings
+    if isinstance(key, str):
+        return json.dumps(key, ensure_ascii=False)
+    if key is None or isinstance(key, bool):
+        return json.dumps(json.dumps(key))
+    return json.dumps(str(key), ensure_ascii=False)
+
+
+def _scalar(value: Any) -> str:
+    if value is None:
+        return 'None'
+    if value is True:
+        return 'True'
+    if value is False:
+        return 'False'
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        if math.isfinite(value):
+            return float.__repr__(value)
+        return f"float('{value}')"
+    # Anything else is written as its str(), like json.dumps(default=str)
+    return json.dumps(str(value), ensure_ascii=False)
+
+
+def _write(value: Any, level: int, out: List[str]) -> None:
+    if isinstance(value, dict):
+        if not value:
+            out.append('{}')
+            return
+        inner = '\n' + _INDENT * (level + 1)
+        out.append('{')
+        for i, (key, item) in enumerate(value.items()):
+            out.append(inner if i == 0 else ',' + inner)
+            out.append(_key(key))
+            out.append(': ')
+            _write(item, level + 1, out)
+        out.append('\n' + _INDENT * level + '}')
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            out.append('[]')
+            return
+        inner = '\n' + _INDENT * (level + 1)
+        out.append('[')
+        for i, item in enumerate(value):
+            out.append(inner if i == 0 else ',' + inner)
+            _write(item, level + 1, out)
+        out.append('\n' + _INDENT * level + ']')
+    else:
+        out.append(_scalar(value))
+
+
+def python_literal(data: Any) -> str:
+    """
+    Python source for `data`, laid out like json.dumps(data, indent=4, ensure_ascii=False, default=str).
+
+    Examples:
+        >>> print(python_literal({'note': 'value: null', 'flags': [None, True]}))
+        {
+            "note": "value: null",
+            "flags": [
+                None,
+                True
+            ]
+        }
+    """
+    out: List[str] = []
+    _write(data, 0, out)
+    return ''.join(out)
@@ -0,0 +1,260 @@
+######################################################################################################################
+# CORE IMPORTS
+# proj_004_cia\c_00_transform_utils\quantity_tokenizer.py
+# ---------------------------------------------------------------------------------------------------------------------
+import re
+from functools import lru_cache, partial
+from typing import NamedTuple, Optional, Sequence, Tuple
+from proj_004_cia.__config.config import Config
+# ---------------------------------------------------------------------------------------------------------------------
+
+######################################################################################################################
+# QUANTITY TOKENIZER
+# ---------------------------------------------------------------------------------------------------------------------
+# One scan of a CIA quantity string ("1.2 million bbl/day (2023 est.)", "15-25%", "between 5 and 9 years")
+# into typed tokens, shared by extract_numeric_value, parse_percentage_data and batch_numeric.
+# Magnitudes are whole words ("million", "bn") or suffixes glued to a number ("10k", "2.5bn"), so the
+# letters of ordinary words ("km", "tonnes", "west") are never read as magnitudes or estimates.
+######################################################################################################################
+
+# Token kinds - text that is none of these (unit names, prose, punctuation) is skipped
+NUMBER = 'NUMBER'          # 1,234.5 / .5  (value = float)
+MAGNITUDE = 'MAGNITUDE'    # million / bn / the 'k' of "10k"  (value = multiplier)
+PERCENT = 'PERCENT'        # % / percent / percentage
+YEAR = 'YEAR'              # (2023) / (2023 est.)  (value = year)
+DASH = 'DASH'              # - – —
+TO = 'TO'
+BETWEEN = 'BETWEEN'
+AND = 'AND'
+ESTIMATE = 'ESTIMATE'      # est / est. / estimate(d/s)
+
+# Parse status codes, shared with batch_numeric
+STATUS_PARSED = 0        # value found
+STATUS_RANGE = 1         # extract_numeric_value: "15-25", "10 to 20", "between 5 and 9"
+STATUS_SPECIAL = 2       # extract_numeric_value: 'na', 'negligible', 'trace', ... (value may be None)
+STATUS_BARE_NUMBER = 3   # parse_percentage_data: no '%' / 'percent' next to a number, first number used
+STATUS_NO_MATCH = 4      # no number in the text
+STATUS_EMPTY = 5         # None, non-string or blank
+STATUS_ERROR = 6         # unexpected failure; the scalar functions return their empty result
+
+SPECIAL_VALUES = {
+    'na': None, 'n/a': None, 'not available': None,
+    'negligible': 0, 'trace': 0.001, 'less than 1': 0.5
+}
+
+MAGNITUDE_WORDS = {
+    'thousand': 1_000,
+    'million': 1_000_000, 'mn': 1_000_000,
+    'billion': 1_000_000_000, 'bn': 1_000_000_000,
+    'trillion': 1_000_000_000_000, 'tn': 1_000_000_000_000,
+}
+# Single letters only count when glued to a number ("10k", "5m", "3b", "2t")
+MAGNITUDE_SUFFIXES = dict(MAGNITUDE_WORDS, k=1_000, m=1_000_000, b=1_000_000_000, t=1_000_000_000_000)
+
+_KEYWORDS = dict({'to': TO, 'between': BETWEEN, 'and': AND,
+                  'est': ESTIMATE, 'estimate': ESTIMATE, 'estimated': ESTIMATE, 'estimates': ESTIMATE},
+                 **{word: MAGNITUDE for word in MAGNITUDE_WORDS})
+
+# Connectors only matter in front of a number ("to 25", "between 5 and 9"), so prose 'and' / 'to' is skipped.
+# The leading lookahead rejects most characters (and every letter inside a word) before trying the alternatives.
+_TOKEN_RE = re.compile(r'''
+    (?=[(\d.%\-–—p]|\b[abemt])
+    (?:
+      (?P<YEAR>\((?P<year>\d{4})(?:\s*est\.?)?\))
+    | (?P<NUMBER>\d+(?:,\d{3})*(?:\.\d+)?|\.\d+)
+      (?:(?P<suffix>thousand|million|billion|trillion|mn|bn|tn|k|m|b|t)(?![a-z0-9]))?
+    | (?P<PERCENT>%|percent[a-z]*)
+    | (?P<DASH>[-–—])
+    | \b(?P<CONNECTOR>to|between|and)(?=\s+\.?\d)
+    | \b(?P<KEYWORD>est|estimated?|estimates|thousand|million|billion|trillion|mn|bn|tn)\b
+    )
+''', re.VERBOSE)
+_DIGIT_RE = re.compile(r'\d')
+# The commonest field values are a lone number, optionally followed by '%' and a "(2023 est.)" year:
+# "12,429", "4.88% (2023 est.)", "0.6 (2022)". Nothing in them can be a magnitude, range or connector,
+# so read_*_text read them straight off this match instead of tokenizing.
+_PLAIN_QUANTITY_RE = re.compile(r'(\d+(?:,\d{3})*(?:\.\d+)?)(?:\s*(%))?(?:\s*\((\d{4})(?:\s*(est)\.?)?\))?',
+                                re.IGNORECASE)
+
+
+class QuantityToken(NamedTuple):
+    kind: str
+    text: str
+    value: Optional[float] = None
+    adjacent: bool = False     # only whitespace between this token and the previous one
+
+
+# tuple.__new__ skips the generated Python-level __new__ (tokens are built in a hot loop)
+_token = partial(tuple.__new__, QuantityToken)
+
+
+######################################################################################################################
+# TOKENIZE
+######################################################################################################################
+
+
+@lru_cache(maxsize=Config.QUANTITY_PARSER_CACHE_SIZE)
+def tokenize_quantity(text: str) -> Tuple[QuantityToken, ...]:
+    """
+    Scan text once (case-insensitively) into QuantityTokens; text without a digit gives ().
+    Memoized like parse_quantity (Config.QUANTITY_PARSER_CACHE_SIZE); tokens are immutable tuples.
+
+    Examples:
+        >>> [(t.kind, t.value) for t in tokenize_quantity("2.5bn km (2023 est.)")]
+        [('NUMBER', 2.5), ('MAGNITUDE', 1000000000), ('YEAR', 2023)]
+    """
+    # Every reading needs a number, so text without a digit has nothing to tokenize
+    if not _DIGIT_RE.search(text):
+        return ()
+    lowered = text.lower()
+    tokens = []
+    append = tokens.append
+    previous_end = -1
+    for match in _TOKEN_RE.finditer(lowered):
+        start, end = match.span()
+        adjacent = previous_end == start or (previous_end >= 0 and lowered[previous_end:start].isspace())
+        previous_end = end
+        kind = match.lastgroup
+        if kind == NUMBER or kind == 'suffix':
+            # lastgroup is the last group closed: 'suffix' for a number with a glued magnitude
+            number = match.group(NUMBER)
+            append(_token((NUMBER, number, float(number.replace(',', '')), adjacent)))
+            if kind == 'suffix':
+                suffix = match.group('suffix')
+                append(_token((MAGNITUDE, suffix, MAGNITUDE_SUFFIXES[suffix], True)))
+        elif kind == YEAR:
+            append(_token((YEAR, match.group(YEAR), int(match.group('year')), adjacent)))
+        elif kind == 'CONNECTOR' or kind == 'KEYWORD':
+            word = match.group(kind)
+            append(_token((_KEYWORDS[word], word, MAGNITUDE_WORDS.get(word), adjacent)))
+        else:
+            append(_token((kind, match.group(kind), None, adjacent)))
+    return tuple(tokens)
+
+
+######################################################################################################################
+# READERS
+######################################################################################################################
+
+
+def read_numeric(tokens: Sequence[QuantityToken], unit: str = None,
+                 allow_ranges: bool = True) -> Tuple[int, float, Optional[float], int]:
+    """
+    Numeric reading used by extract_numeric_value.
+
+    The multiplier is the first magnitude in the text (ignoring words of `unit`). Ranges are tried
+    in the order "15-25", "15 to 25", "between 15 and 25", each may carry a magnitude on its first
+    number ("5k-10k"). Otherwise the first number is used.
+
+    Returns:
+        (status, first, second, multiplier) - first/second are the unscaled number / range bounds
+        (second is None unless status == STATUS_RANGE; first is None for STATUS_NO_MATCH)
+    """
+    unit_words = unit.lower().split() if unit else ()
+    multiplier = 1
+    for token in tokens:
+        if token.kind == MAGNITUDE and token.text not in unit_words:
+            multiplier = token.value
+            break
+
+    count = len(tokens)
+    if allow_ranges and count >= 3:
+        for connector in (DASH, TO):
+            for i in range(count - 2):
+                if tokens[i].kind != NUMBER:
+                    continue
+                j = i + 2 if tokens[i + 1].kind == MAGNITUDE and tokens[i + 1].adjacent else i + 1
+                if (j + 1 < count and tokens[j].kind == connector and tokens[j].adjacent
+                        and tokens[j + 1].kind == NUMBER and tokens[j + 1].adjacent):
+                    return STATUS_RANGE, tokens[i].value, tokens[j + 1].value, multiplier
+        for i in range(count - 3):
+            if tokens[i].kind == BETWEEN and tokens[i + 1].kind == NUMBER and tokens[i + 1].adjacent:
+                j = i + 3 if tokens[i + 2].kind == MAGNITUDE and tokens[i + 2].adjacent else i + 2
+                if (j + 1 < count and tokens[j].kind == AND and tokens[j].adjacent
+                        and tokens[j + 1].kind == NUMBER and tokens[j + 1].adjacent):
+                    return STATUS_RANGE, tokens[i + 1].value, tokens[j + 1].value, multiplier
+
+    # First number in the text; a "(2020)" year counts as one when it comes first
+    for token in tokens:
+        if token.kind == NUMBER or token.kind == YEAR:
+            return STATUS_PARSED, float(token.value), None, multiplier
+    return STATUS_NO_MATCH, None, None, multiplier
+
+
+def read_percentage(tokens: Sequence[QuantityToken]) -> Tuple[int, Optional[float], Optional[int], bool]:
+    """
+    Percentage reading used by parse_percentage_data.
+
+    A number directly followed by '%' / 'percent' wins, preferring (in this order) one followed by
+    "(2023 est.)", by "(2023)" and then any; the year is kept for the first two. With no percent
+    sign the first number in the text is used (STATUS_BARE_NUMBER, never an estimate).
+
+    Returns:
+        (status, percentage, year or None, is_estimate)
+    """
+    best = None
+    count = len(tokens)
+    for i in range(count - 1):
+        if tokens[i].kind != NUMBER or tokens[i + 1].kind != PERCENT or not tokens[i + 1].adjacent:
+            continue
+        sign = tokens[i + 1].text == '%'
+        year_token = tokens[i + 2] if i + 2 < count and tokens[i + 2].kind == YEAR and tokens[i + 2].adjacent else None
+        estimated_year = year_token is not None and 'est' in year_token.text
+        if year_token and sign and estimated_year:
+            rank = 0
+        elif year_token and not estimated_year:
+            rank = 1 if sign else 2
+        else:
+            rank, year_token = (3 if sign else 4), None
+        if best is None or rank < best[0]:
+            best = (rank, tokens[i].value, year_token.value if year_token else None)
+            if rank == 0:
+                break
+
+    if best:
+        is_estimate = any(token.kind == ESTIMATE or (token.kind == YEAR and 'est' in token.text)
+                          for token in tokens)
+        return STATUS_PARSED, best[1], best[2], is_estimate
+
+    # First number in the text; a "(2020)" year counts as one when it comes first
+    for token in tokens:
+        if token.kind == NUMBER or token.kind == YEAR:
+            return STATUS_BARE_NUMBER, float(token.value), None, False
+    return STATUS_NO_MATCH, None, None, False
+
+
+def read_numeric_text(text: str, unit: str = None,
+                      allow_ranges: bool = True) -> Tuple[int, float, Optional[float], int]:
+    """
+    read_numeric of stripped text; a plain quantity ("12,429", "4.88% (2023 est.)") is read without tokenizing.
+    """
+    plain = _PLAIN_QUANTITY_RE.fullmatch(text)
+    if plain:
+        return STATUS_PARSED, float(plain.group(1).replace(',', '')), None, 1
+    return read_numeric(tokenize_quantity(text), unit=unit, allow_ranges=allow_ranges)
+
+
+def read_percentage_text(text: str) -> Tuple[int, Optional[float], Optional[int], bool]:
+    """
+    read_percentage of stripped text; a plain quantity ("4.88% (2023 est.)", "0.6") is read without tokenizing.
+    """
+    plain = _PLAIN_QUANTITY_RE.fullmatch(text)
+    if not plain:
+        return read_percentage(tokenize_quantity(text))
+    number, percent, year, estimate = plain.groups()
+    if not percent:
+        return STATUS_BARE_NUMBER, float(number.replace(',', '')), None, False
+    return STATUS_PARSED, float(number.replace(',', '')), int(year) if year else None, estimate is not None
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    for sample in ["2.5bn km (2023 est.)", "15-25 years", "between 5 and 9 thousand",
+                   "4.88% (2023 est.)", "12,429 km", "highest 3.5 percent"]:
+        tokens = tokenize_quantity(sample)
+        print(f"{sample!r}")
+        print(f"  tokens:     {[(t.kind, t.text, t.adjacent) for t in tokens]}")
+        print(f"  numeric:    {read_numeric(tokens)}")
+        print(f"  percentage: {read_percentage(tokens)}")
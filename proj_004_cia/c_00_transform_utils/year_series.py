@@ -0,0 +1,185 @@
+######################################################################################################################
+# CORE IMPORTS
+# proj_004_cia\c_00_transform_utils\year_series.py
+# ---------------------------------------------------------------------------------------------------------------------
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+from proj_004_cia.c_00_transform_utils.parse_quantity import parse_quantity
+# ---------------------------------------------------------------------------------------------------------------------
+
+######################################################################################################################
+# YEAR SERIES
+# ---------------------------------------------------------------------------------------------------------------------
+# The raw JSON stores time series as sibling "<Metric> <Year>" keys:
+#
+#     "Real GDP (purchasing power parity)": {
+#         "Real GDP (purchasing power parity) 2023": {"text": "$24.662 trillion (2023 est.)"},
+#         "Real GDP (purchasing power parity) 2022": {"text": "$24.048 trillion (2022 est.)"},
+#         "note": "data are in 2021 dollars"
+#     }
+#
+# extract_year_series() reads any such subtree once into a columnar YearSeries (newest year first);
+# the per-metric parsers only choose the output keys.
+######################################################################################################################
+
+_YEAR_KEY_RE = re.compile(r'(\d{4})')
+
+
+@lru_cache(maxsize=4096)
+def year_of_key(key: str) -> Optional[int]:
+    """First 4-digit run of a raw key ("Exports 2023" -> 2023); keys repeat across countries, so memoized."""
+    match = _YEAR_KEY_RE.search(key)
+    return int(match.group(1)) if match else None
+
+
+class YearSeries:
+    """
+    Columnar multi-year series, newest year first (years with equal value keep raw order).
+
+    Columns are parallel lists: years (int), values (float or None), units (str or None),
+    is_estimate (bool) and texts (the raw text of each year).
+
+    Examples:
+        >>> series = extract_year_series({"Exports 2023": {"text": "$3.052 trillion (2023 est.)"},
+        ...                               "Exports 2022": {"text": "$2.995 trillion (2022 est.)"}})
+        >>> series.years, series.values
+        ([2023, 2022], [3052000000000.0, 2995000000000.0])
+    """
+
+    __slots__ = ('years', 'values', 'units', 'is_estimate', 'texts')
+
+    def __init__(self,
+                 years: Optional[List[int]] = None,
+                 values: Optional[List[Optional[float]]] = None,
+                 units: Optional[List[Optional[str]]] = None,
+                 is_estimate: Optional[List[bool]] = None,
+                 texts: Optional[List[str]] = None):
+        self.years = years if years is not None else []
+        self.values = values if values is not None else [None] * len(self.years)
+        self.units = units if units is not None else [None] * len(self.years)
+        self.is_estimate = is_estimate if is_estimate is not None else [False] * len(self.years)
+        self.texts = texts if texts is not None else [''] * len(self.years)
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    def __iter__(self) -> Iterator[Tuple[int, Optional[float], Optional[str], bool]]:
+        return zip(self.years, self.values, self.units, self.is_estimate)
+
+    def __repr__(self) -> str:
+        return f"YearSeries(years={self.years}, values={self.values}, units={self.units})"
+
+    def to_records(self, include_unit: bool = True) -> List[Dict[str, Any]]:
+        """
+        One dict per year in the parsers' historical shape: 'year' always, 'value' / 'unit' /
+        'is_estimate' only when set.
+        """
+        records = []
+        for year, value, unit, is_estimate in self:
+            entry = {'year': year}
+            if value is not None:
+                entry['value'] = value
+            if include_unit and unit:
+                entry['unit'] = unit
+            if is_estimate:
+                entry['is_estimate'] = is_estimate
+            records.append(entry)
+        return records
+
+    def to_fields(self, prefix: str, include_unit: bool = True) -> Dict[str, Any]:
+        """
+        The standard multi-year output block:
+            {prefix}_data, {prefix}_latest_value, {prefix}_latest_year, {prefix}_unit
+        (empty when the series is empty; latest value / unit only when present)
+        """
+        fields = {}
+        if not self.years:
+            return fields
+        fields[f'{prefix}_data'] = self.to_records(include_unit)
+        if self.values[0] is not None:
+            fields[f'{prefix}_latest_value'] = self.values[0]
+        fields[f'{prefix}_latest_year'] = self.years[0]
+        if include_unit and self.units[0]:
+            fields[f'{prefix}_unit'] = self.units[0]
+        return fields
+
+
+######################################################################################################################
+# EXTRACT
+######################################################################################################################
+
+
+def extract_year_series(subtree: Mapping[str, Any], profile: Optional[str] = 'economy') -> YearSeries:
+    """
+    Read every "<Metric> <Year>": {"text": ...} entry of a raw subtree into a YearSeries.
+
+    Args:
+        subtree: Raw field dict; 'note' and keys without a year or non-empty 'text' are skipped
+        profile: parse_quantity profile used for value / unit / is_estimate, or None to only
+                 collect years and texts (for fields whose text is not a quantity)
+
+    Returns:
+        YearSeries sorted newest year first
+    """
+    rows = []
+    if not isinstance(subtree, Mapping):
+        return YearSeries()
+    for key, node in subtree.items():
+        if key == 'note' or not isinstance(node, dict) or 'text' not in node:
+            continue
+        year = year_of_key(key)
+        text = node.get('text', '')
+        if year is None or not text:
+            continue
+        if profile is None:
+            rows.append((year, None, None, False, text))
+        else:
+            parsed = parse_quantity(text, profile)
+            rows.append((year, parsed['value'], parsed['unit'], parsed['is_estimate'], text))
+
+    if not rows:
+        return YearSeries()
+    rows.sort(key=lambda row: row[0], reverse=True)
+    years, values, units, is_estimate, texts = (list(column) for column in zip(*rows))
+    return YearSeries(years, values, units, is_estimate, texts)
+
+
+def stack_year_series(series_by_country: Mapping[str, YearSeries]) -> Dict[str, Any]:
+    """
+    Long-format NumPy columns for many countries' series of one metric (one row per country-year).
+
+    Returns:
+        {'iso3Code': object, 'year': int32, 'value': float64 (NaN when missing),
+         'unit': object, 'is_estimate': bool}
+    """
+    import numpy as np
+
+    codes, years, values, units, estimates = [], [], [], [], []
+    for iso3Code, series in series_by_country.items():
+        codes.extend([iso3Code] * len(series))
+        years.extend(series.years)
+        values.extend(series.values)
+        units.extend(series.units)
+        estimates.extend(series.is_estimate)
+    return {
+        'iso3Code': np.array(codes, dtype=object),
+        'year': np.array(years, dtype=np.int32),
+        'value': np.array([np.nan if value is None else value for value in values], dtype=np.float64),
+        'unit': np.array(units, dtype=object),
+        'is_estimate': np.array(estimates, dtype=bool),
+    }
+
+
+######################################################################################################################
+#   MAIN
+######################################################################################################################
+if __name__ == '__main__':
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
+
+    by_country = {}
+    for iso3Code in ['USA', 'CHN', 'DEU']:
+        subtree = load_country_data(iso3Code).get('Economy', {}).get('Real GDP (purchasing power parity)', {})
+        by_country[iso3Code] = extract_year_series(subtree)
+        print(iso3Code, by_country[iso3Code])
+    print(stack_year_series(by_country))
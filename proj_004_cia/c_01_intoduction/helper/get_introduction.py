@@ -3,25 +3,15 @@
 # ---------------------------------------------------------------------------------------------------------------------
 
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.parser_registry import ParserRegistry, ParserSpec, SECTION
 
 
-def get_introduction(data: dict, info: str, iso3Code: str) -> str:
+def parse_background(introduction: dict, iso3Code: str) -> str:
     """
-    Retrieve the introduction background text from the data.
-
-    Parameters:
-    - data: The dictionary containing the country's data.
-    - info: The specific information to retrieve (should be 'background' for this function).
-    - iso3Code: The ISO3 code of the country.
-
-    Returns:
-    - A string containing the cleaned background text.
+    Clean the 'Background' text of the Introduction section.
     """
-    if info != 'background':
-        return ''
-
     # Access the background text safely
-    background_info = data.get("Introduction", {}).get("Background", {})
+    background_info = introduction.get("Background", {})
     text = background_info.get('text', '')
 
     # Handle cases where text might not be available
@@ -35,6 +25,30 @@ def get_introduction(data: dict, info: str, iso3Code: str) -> str:
     return cleaned_text
 
 
+INTRODUCTION_REGISTRY = ParserRegistry(
+    section="Introduction",
+    default='',
+    specs=[
+        ParserSpec('background', parse_background, convention=SECTION),
+    ]
+)
+
+
+def get_introduction(data: dict, info: str, iso3Code: str) -> str:
+    """
+    Retrieve the introduction background text from the data.
+
+    Parameters:
+    - data: The dictionary containing the country's data.
+    - info: The specific information to retrieve (should be 'background' for this function).
+    - iso3Code: The ISO3 code of the country.
+
+    Returns:
+    - A string containing the cleaned background text.
+    """
+    return INTRODUCTION_REGISTRY.dispatch(data, info, iso3Code)
+
+
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 #   TEST FUNCTION
 # ---------------------------------------------------------------------------------------------------------------------
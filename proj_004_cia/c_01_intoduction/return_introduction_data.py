@@ -12,8 +12,9 @@
 import json
 import os
 # get_introduction ----------------------------------------------------------------------------------------------------
-from proj_004_cia.c_01_intoduction.helper.get_introduction import get_introduction
+from proj_004_cia.c_01_intoduction.helper.get_introduction import INTRODUCTION_REGISTRY
 from proj_004_cia.c_00_transform_utils.clean_output import clean_output
+from proj_004_cia.c_00_transform_utils.compact_records import apply_representation
 
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 #   CORE FUNCTION
@@ -23,7 +24,9 @@ from proj_004_cia.c_00_transform_utils.clean_output import clean_output
 
 def return_introduction_data(
         data: dict,
-        iso3Code: str
+        iso3Code: str,
+        fields=None,
+        representation: str = 'dict'
 ) -> dict:
     """
     Build and return the introduction section of the CIA metadata.
@@ -31,6 +34,8 @@ def return_introduction_data(
     Parameters:
     - data: The dictionary containing the country's data.
     - iso3Code: The ISO3 code of the country.
+    - fields: Optional subset of output keys to parse (default: all).
+    - representation: 'dict' (default) or 'compact' slotted records (see compact_records).
 
     Returns:
     - A dictionary containing the introduction information.
@@ -38,16 +43,14 @@ def return_introduction_data(
     # 1. INTRODUCTION
     # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
     # ---------------------------------------------------------------------------------------------------------------------------
-    cia_pack = {
-        # NOTE: 'INTRODUCTION'
-        # >>> ['background']
-        # ---------------------------------------------------------------------------------------------------------------------------
-        'background': get_introduction(data=data, info='background', iso3Code=iso3Code),
-    }
+    # NOTE: 'INTRODUCTION'
+    # >>> ['background'], declared in INTRODUCTION_REGISTRY (get_introduction)
+    # ---------------------------------------------------------------------------------------------------------------------------
+    cia_pack = INTRODUCTION_REGISTRY.parse_section(data, iso3Code, fields=fields)
     ###################################################################################################
     # RETURN
     # --------------------------------------------------------------------------------------------------
-    return clean_output(cia_pack)
+    return apply_representation(clean_output(cia_pack), representation)
 
 
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
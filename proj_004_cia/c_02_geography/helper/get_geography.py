@@ -3,7 +3,6 @@
 # ---------------------------------------------------------------------------------------------------------------------
 
 import os
-import re
 import json
 import logging
 
@@ -15,33 +14,41 @@ from proj_004_cia.c_00_transform_utils.parse_percentage_data import parse_percen
 from proj_004_cia.c_00_transform_utils.parse_list_from_string import parse_list_from_string
 from proj_004_cia.c_00_transform_utils.parse_text_field import parse_text_field
 from proj_004_cia.c_00_transform_utils.parse_text_and_note import parse_text_and_note
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 # ---------------------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_00_transform_utils.extract_and_parse import extract_and_parse
+from proj_004_cia.c_00_transform_utils.parser_registry import (
+    LazyParser, ParserRegistry, ParserSpec, SECTION, COUNTRY, WORLD
+)
 # ---------------------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_02_geography.helper.utils.parse_location import parse_location
-from proj_004_cia.c_02_geography.helper.utils.parse_area_comparative import parse_area_comparative
-from proj_004_cia.c_02_geography.helper.utils.parse_area_data import parse_area_data
-from proj_004_cia.c_02_geography.helper.utils.parse_coastline_data import parse_coastline_data
-from proj_004_cia.c_02_geography.helper.utils.parse_geographic_coordinates import parse_geographic_coordinates
-from proj_004_cia.c_02_geography.helper.utils.parse_land_boundaries_master import parse_land_boundaries_master
-from proj_004_cia.c_02_geography.helper.utils.parse_map_references import parse_map_references
-from proj_004_cia.c_02_geography.helper.utils.parse_maritime_claims import parse_maritime_claims, parse_wld_maritime_claims
-from proj_004_cia.c_02_geography.helper.utils.parse_terrain import parse_terrain
-from proj_004_cia.c_02_geography.helper.utils.parse_wld_climate import parse_wld_climate
-from proj_004_cia.c_02_geography.helper.utils.parse_wld_terrain import parse_wld_terrain
-from proj_004_cia.c_02_geography.helper.utils.parse_elevation import parse_elevation, parse_wld_elevation
-from proj_004_cia.c_02_geography.helper.utils.parse_land_use import parse_land_use
-from proj_004_cia.c_02_geography.helper.utils.parse_irrigated_land import parse_irrigated_land
-from proj_004_cia.c_02_geography.helper.utils.parse_major_lakes import parse_major_lakes, parse_wld_major_lakes
-from proj_004_cia.c_02_geography.helper.utils.parse_major_rivers import parse_major_rivers, parse_wld_major_rivers
-from proj_004_cia.c_02_geography.helper.utils.parse_major_watersheds import parse_major_watersheds
-from proj_004_cia.c_02_geography.helper.utils.parse_major_aquifers import parse_major_aquifers, parse_wld_major_aquifers
-from proj_004_cia.c_02_geography.helper.utils.parse_natural_resources import parse_natural_resources
-from proj_004_cia.c_02_geography.helper.utils.parse_wonders_of_the_world import parse_wonders_of_the_world
-from proj_004_cia.c_02_geography.helper.utils.parse_natural_hazards import parse_natural_hazards
-from proj_004_cia.c_02_geography.helper.utils.parse_population_distribution import parse_population_distribution
-from proj_004_cia.c_02_geography.helper.utils.parse_geography_note import parse_geography_note
-from proj_004_cia.c_02_geography.helper.utils.parse_geography_world import parse_geography_world
+parse_location = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_location')
+parse_area_comparative = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_area_comparative')
+parse_area_data = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_area_data')
+parse_coastline_data = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_coastline_data')
+parse_geographic_coordinates = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_geographic_coordinates')
+parse_land_boundaries_master = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_land_boundaries_master')
+parse_map_references = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_map_references')
+parse_maritime_claims = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_maritime_claims')
+parse_wld_maritime_claims = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_maritime_claims', 'parse_wld_maritime_claims')
+parse_terrain = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_terrain')
+parse_wld_climate = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_wld_climate')
+parse_wld_terrain = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_wld_terrain')
+parse_elevation = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_elevation')
+parse_wld_elevation = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_elevation', 'parse_wld_elevation')
+parse_land_use = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_land_use')
+parse_irrigated_land = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_irrigated_land')
+parse_major_lakes = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_major_lakes')
+parse_wld_major_lakes = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_major_lakes', 'parse_wld_major_lakes')
+parse_major_rivers = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_major_rivers')
+parse_wld_major_rivers = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_major_rivers', 'parse_wld_major_rivers')
+parse_major_watersheds = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_major_watersheds')
+parse_major_aquifers = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_major_aquifers')
+parse_wld_major_aquifers = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_major_aquifers', 'parse_wld_major_aquifers')
+parse_natural_resources = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_natural_resources')
+parse_wonders_of_the_world = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_wonders_of_the_world')
+parse_natural_hazards = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_natural_hazards')
+parse_population_distribution = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_population_distribution')
+parse_geography_note = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_geography_note')
+parse_geography_world = LazyParser('proj_004_cia.c_02_geography.helper.utils.parse_geography_world')
 # ----------------------------------------------------------------------------------------------------------------------
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -52,562 +59,190 @@ logging.basicConfig(level=logging.WARNING,
 # ---------------------------------------------------------------------------------------------------------------------
 
 
-def get_geography(data={}, info={}, iso3Code={}):
-    """
-    Function to extract geography information based on the 'info' parameter.
-    """
-    # Define 'geography' at the beginning of the function
-    geography = data.get("Geography", {})
-
-    if not geography:
-        logging.warning(f"No 'Geography' section found for {iso3Code}")
-        return {}
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # WORLD-SPECIFIC: Return comprehensive World geography data
-    # --------------------------------------------------------------------------------------------------
-    if info == 'world_geography' and iso3Code == 'WLD':
-        return parse_geography_world(geography, iso3Code)
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 1 >>> 'GEO AREA'
-    # --------------------------------------------------------------------------------------------------
-    if info == 'location':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Location",
-            parser_function=parse_location,
-            iso3Code=iso3Code,
-            parser_name="parse_location"
-        )
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 2 >>> 'GEOGRAPHIC OVERVIEW' (World data only)
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'geographic_overview':
-        # Check if iso3Code corresponds to 'World'
-        if iso3Code != 'WLD':
-            logging.warning(
-                f"'Geographic overview' is only available for the World data.")
-            return {}
-
-        # Try to get the 'Geographic overview' data from 'Geography' section
-        geographic_overview_data = data.get(
-            "Geography", {}).get('Geographic overview', {})
-        if not geographic_overview_data:
-            logging.warning(
-                f"No 'Geographic overview' data found for {iso3Code}")
-            return {}
-
-        text = geographic_overview_data.get('text', '')
-        if not text:
-            logging.warning(
-                f"No text in 'Geographic overview' data for {iso3Code}")
-            return {}
-
-        # Clean the text (remove HTML tags and extra whitespace)
-        cleaned_text = clean_text(text)
-
-        return cleaned_text
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 3 >>> 'GEOGRAPHIC COORDINATES'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'geographic_coordinates':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Geographic coordinates",
-            parser_function=parse_geographic_coordinates,
-            iso3Code=iso3Code,
-            parser_name="Geographic coordinates"
-        )
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 4 >>> 'MAP REFERENCES'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'map_references':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Map references",
-            parser_function=parse_map_references,
-            iso3Code=iso3Code,
-            parser_name="Map references"
-        )
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 5 >>> 'AREA'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'area_total':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Area.total",
-            parser_function=parse_area_data,
-            iso3Code=iso3Code,
-            parser_name="total area"
-        )
-
-    elif info == 'area_land':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Area.land",
-            parser_function=parse_area_data,
-            iso3Code=iso3Code,
-            parser_name="land area"
-        )
-
-    elif info == 'area_water':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Area.water",
-            parser_function=parse_area_data,
-            iso3Code=iso3Code,
-            parser_name="water area"
-        )
-
-    elif info == 'area_note':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Area.note",
-            parser_function=lambda data, _: re.sub(r'<[^>]+>', '', data),
-            iso3Code=iso3Code,
-            parser_name="area note"
-        )
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 6 >>> 'AREA - COMPARATIVE'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'area_comparative':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Area - comparative",
-            parser_function=parse_area_comparative,
-            iso3Code=iso3Code,
-            parser_name="Area - comparative"
-        )
-    # ----------------------------------------------------------------------------------------------------
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 7A >>> 'LAND BOUNDARIES'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'land_boundaries':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Land boundaries",
-            parser_function=parse_land_boundaries_master,
-            iso3Code=iso3Code,
-            parser_name="Land boundaries"
-        )
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 7B >>> 'WLD LAND BOUNDARIES' (World data only)
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'wld_land_boundaries':
-        try:
-            # Check if iso3Code corresponds to 'World'
-            if iso3Code != 'WLD':
-                logging.warning(
-                    f"'World Land Boundaries' is only available for the World data.")
-                return {}
-
-            # Try to get the 'Land boundaries' data from 'Geography' section
-            land_boundaries_data = geography.get('Land boundaries', {})
-            if not land_boundaries_data:
-                logging.warning(
-                    f"No 'Land boundaries' data found for {iso3Code}")
-                return {}
-
-            # Attempt to retrieve 'text' within 'Land boundaries' data
-            try:
-                text = land_boundaries_data.get('text', '')
-                if not text:
-                    logging.warning(
-                        f"No text in 'Land boundaries' data for {iso3Code}")
-                    return {}
-
-                # Clean the text (remove HTML tags and extra whitespace)
-                cleaned_text = clean_text(text)
-                return cleaned_text
-            except Exception as e:
-                logging.error(
-                    f"Error accessing 'text' field in 'Land boundaries' data for {iso3Code}: {e}")
-                return {}
-
-        except Exception as e:
-            logging.error(
-                f"Error extracting 'Land boundaries' data for {iso3Code}: {e}")
-        return {}
+######################################################################################################################
+#   CUSTOM HANDLERS
+# ---------------------------------------------------------------------------------------------------------------------
+#   Fields that are not a plain extract_and_parse call. Each takes (geography, iso3Code) and keeps the
+#   original behaviour: empty raw data or a parser error returns {}.
+# ---------------------------------------------------------------------------------------------------------------------
 
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 8 >>> 'COASTLINE'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'coastline':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Coastline",
-            parser_function=parse_coastline_data,
-            iso3Code=iso3Code,
-            parser_name="Coastline"
-        )
 
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 9 >>> 'MARITIME CLAIMS'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'maritime_claims':
+def _strip_html_tags(data, iso3Code):
+    return strip_tags(data, iso3Code)
 
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Maritime claims",
-            parser_function=parse_maritime_claims,
-            iso3Code=iso3Code,
-            parser_name="Maritime claims"
-        )
 
-    elif info == 'wld_maritime_claims':
+def _clean_text_field(key):
+    def handler(geography, iso3Code):
         try:
-            # Try to extract 'Maritime claims' data
-            maritime_claims_data = geography.get('Maritime claims', {})
-            if not maritime_claims_data:
-                logging.warning(
-                    f"No 'Maritime claims' data found for world level processing")
+            field_data = geography.get(key, {})
+            if not field_data:
+                logging.warning(f"No '{key}' data found for {iso3Code}")
                 return {}
 
-            # Try to parse the extracted data
-            try:
-                return parse_wld_maritime_claims(maritime_claims_data=maritime_claims_data)
-            except Exception as e:
-                logging.error(
-                    f"Error in 'parse_wld_maritime_claims': {e}")
-                return {}
-
-        except Exception as e:
-            logging.error(
-                f"Error extracting 'Maritime claims' data for world level processing: {e}")
-            return {}
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 10 >>> 'CLIMATE'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'climate':
-        try:
-            # Try to extract 'Climate' data
-            climate_data = geography.get('Climate', {})
-            if not climate_data:
-                logging.warning(
-                    f"No 'Climate' data found for {iso3Code}")
-                return {}
-
-            # Try to parse the extracted data
-            try:
-                return parse_text_and_note(data=climate_data, main_key='climate', iso3Code=iso3Code)
-            except Exception as e:
-                logging.error(
-                    f"Error in 'parse_text_and_note' for 'climate' data for {iso3Code}: {e}")
+            text = field_data.get('text', '')
+            if not text:
+                logging.warning(f"No text in '{key}' data for {iso3Code}")
                 return {}
 
+            # Clean the text (remove HTML tags and extra whitespace)
+            return clean_text(text)
         except Exception as e:
-            logging.error(
-                f"Error extracting 'Climate' data for {iso3Code}: {e}")
+            logging.error(f"Error extracting '{key}' data for {iso3Code}: {e}")
             return {}
 
-    elif info == 'wld_climate':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Climate",
-            parser_function=parse_wld_climate,
-            iso3Code=iso3Code,
-            parser_name="World Climate",
-            is_world_data=True
-        )
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 11 >>> 'TERRAIN'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'terrain':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Terrain",
-            parser_function=parse_terrain,
-            iso3Code=iso3Code,
-            parser_name="Terrain"
-        )
-
-    elif info == 'wld_terrain':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Terrain",
-            parser_function=parse_wld_terrain,
-            iso3Code=iso3Code,
-            parser_name="World Terrain",
-            is_world_data=True
-        )
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 12 >>> 'ELEVATION'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'elevation':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Elevation",
-            parser_function=parse_elevation,
-            iso3Code=iso3Code,
-            parser_name="Elevation"
-        )
-
-    elif info == 'wld_elevation':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Elevation",
-            parser_function=parse_wld_elevation,
-            iso3Code=iso3Code,
-            parser_name="World Elevation",
-            is_world_data=True
-        )
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 13 >>> 'LAND USE'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'land_use':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Land use",
-            parser_function=parse_land_use,
-            iso3Code=iso3Code,
-            parser_name="Land use"
-        )
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 13 >>> 'IRRIGATED LAND'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'irrigated_land':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Irrigated land",
-            parser_function=parse_irrigated_land,
-            iso3Code=iso3Code,
-            parser_name="Irrigated land"
-        )
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 13 >>> 'MAJOR LAKES'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'major_lakes':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Major lakes (area sq km)",
-            parser_function=parse_major_lakes,
-            iso3Code=iso3Code,
-            parser_name="Major lakes"
-        )
-
-    elif info == 'wld_major_lakes':
-        try:
-            # Try to extract 'Major lakes (area sq km)' data
-            wld_major_lakes = geography.get('Major lakes (area sq km)', {})
-            if not wld_major_lakes:
-                logging.warning(
-                    f"No 'Major lakes (area sq km)' data found for {iso3Code}")
-                return {}
-
-            # Try to parse the extracted data
-            try:
-                return parse_wld_major_lakes(major_lakes_data=wld_major_lakes)
-            except Exception as e:
-                logging.error(
-                    f"Error in 'parse_wld_major_lakes' for {iso3Code}: {e}")
-                return {}
-
-        except Exception as e:
-            logging.error(
-                f"Error extracting 'Major lakes (area sq km)' data for {iso3Code}: {e}")
-            return {}
+    handler.__name__ = f"clean_text[{key}]"
+    return handler
 
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 14 >>> 'MAJOR RIVERS'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'major_rivers':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Major rivers (by length in km)",
-            parser_function=parse_major_rivers,
-            iso3Code=iso3Code,
-            parser_name="Major rivers (by length in km)"
-        )
 
-    elif info == 'wld_major_rivers':
+def _guarded_parse(key, parser, argument):
+    def handler(geography, iso3Code):
         try:
-            # Try to extract 'Major rivers (by length in km)' data
-            wld_major_rivers = geography.get(
-                'Major rivers (by length in km)', {})
-            if not wld_major_rivers:
-                logging.warning(
-                    f"No 'Major rivers (by length in km)' data found for {iso3Code}")
+            field_data = geography.get(key, {})
+            if not field_data:
+                logging.warning(f"No '{key}' data found for {iso3Code}")
                 return {}
 
             # Try to parse the extracted data
             try:
-                return parse_wld_major_rivers(major_rivers_data=wld_major_rivers)
+                return parser(**{argument: field_data})
             except Exception as e:
-                logging.error(
-                    f"Error in 'parse_wld_major_rivers' for {iso3Code}: {e}")
+                logging.error(f"Error in '{parser.__name__}' for {iso3Code}: {e}")
                 return {}
 
         except Exception as e:
-            logging.error(
-                f"Error extracting 'Major rivers (by length in km)' data for {iso3Code}: {e}")
+            logging.error(f"Error extracting '{key}' data for {iso3Code}: {e}")
             return {}
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 15 >>> 'MAJOR WATERSHEDS'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'major_watersheds':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="'Major watersheds (area sq km)",
-            parser_function=parse_major_watersheds,
-            iso3Code=iso3Code,
-            parser_name="'Major watersheds (area sq km)"
-        )
 
-    elif info == 'wld_major_watersheds':
-        try:
-            # Try to get the 'Major watersheds (area sq km)' data from 'Geography' section
-            wld_watershed_data = data.get("Geography", {}).get(
-                'Major watersheds (area sq km)', {})
-            if not wld_watershed_data:
-                logging.warning(
-                    f"No 'Major watersheds (area sq km)' data found for {iso3Code}")
-                return {}
+    handler.__name__ = parser.__name__
+    return handler
 
-            text = wld_watershed_data.get('text', '')
-            if not text:
-                logging.warning(
-                    f"No text in 'Major watersheds (area sq km)' data for {iso3Code}")
-                return {}
-
-            # Clean the text (remove HTML tags and extra whitespace)
-            try:
-                cleaned_text = clean_text(text)
-                return cleaned_text
-            except Exception as e:
-                logging.error(
-                    f"Error cleaning 'Major watersheds (area sq km)' text for {iso3Code}: {e}")
-                return {}
 
-        except Exception as e:
-            logging.error(
-                f"Error extracting 'Major watersheds (area sq km)' data for {iso3Code}: {e}")
-            return {}
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 16 >>> 'NATURAL RESOURCES'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'natural_resources':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Natural resources",
-            parser_function=parse_natural_resources,
-            iso3Code=iso3Code,
-            parser_name="Natural resources"
-        )
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 16 >>> 'WONDERS OF THE WORLD'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'wonders_of_the_world':
-        try:
-            # Try to extract 'Wonders of the World' data
-            wonders_data = geography.get('Wonders of the World', {})
-            if not wonders_data:
-                logging.warning(
-                    f"No 'Wonders of the World' data found for {iso3Code}")
-                return {}
-
-            # Try to parse the extracted data
-            try:
-                return parse_wonders_of_the_world(wonders_data=wonders_data)
-            except Exception as e:
-                logging.error(
-                    f"Error in 'parse_wonders_of_the_world' for {iso3Code}: {e}")
-                return {}
-
-        except Exception as e:
-            logging.error(
-                f"Error extracting 'Wonders of the World' data for {iso3Code}: {e}")
-            return {}
-
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 17 >>> 'NATURAL HAZARDS'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'natural_hazards':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Natural hazards",
-            parser_function=parse_natural_hazards,
-            iso3Code=iso3Code,
-            parser_name="Natural hazards"
-        )
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 18 >>> 'MAJOR AQUIFERS'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'major_aquifers':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Major aquifers",
-            parser_function=parse_major_aquifers,
-            iso3Code=iso3Code,
-            parser_name="Major aquifers"
-        )
-
-    elif info == 'wld_major_aquifers':
-        try:
-            # Try to extract 'Major aquifers' data
-            wld_major_aquifers_data = geography.get('Major aquifers', {})
-            if not wld_major_aquifers_data:
-                logging.warning(
-                    f"No 'Major aquifers' data found for {iso3Code}")
-                return {}
+def _parse_climate(geography, iso3Code):
+    climate_data = geography.get('Climate', {})
+    if not climate_data:
+        logging.warning(f"No 'Climate' data found for {iso3Code}")
+        return {}
 
-            # Try to parse the extracted data
-            try:
-                return parse_wld_major_aquifers(aquifers_data=wld_major_aquifers_data)
-            except Exception as e:
-                logging.error(
-                    f"Error in 'parse_wld_major_aquifers' for {iso3Code}: {e}")
-                return {}
+    try:
+        return parse_text_and_note(data=climate_data, main_key='climate', iso3Code=iso3Code)
+    except Exception as e:
+        logging.error(f"Error in 'parse_text_and_note' for 'climate' data for {iso3Code}: {e}")
+        return {}
 
-        except Exception as e:
-            logging.error(
-                f"Error extracting 'Major aquifers' data for {iso3Code}: {e}")
-            return {}
 
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 19 >>> 'POPULATION DISTRIBUTION'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'population_distribution':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Population distribution",
-            parser_function=parse_population_distribution,
-            iso3Code=iso3Code,
-            parser_name="Population distribution"
-        )
+######################################################################################################################
+#   GEOGRAPHY PARSER REGISTRY
+# ---------------------------------------------------------------------------------------------------------------------
+#   Output order of return_geography_data. 'info' differs from the output key for the area fields.
+# ---------------------------------------------------------------------------------------------------------------------
+GEOGRAPHY_REGISTRY = ParserRegistry(
+    section="Geography",
+    default={},
+    require_section=True,
+    specs=[
+        # WORLD-SPECIFIC: comprehensive World geography data
+        ParserSpec('world_geography', parse_geography_world,
+                   convention=SECTION, scope=WORLD, strict_scope=True),
+        ParserSpec('geographic_overview', _clean_text_field('Geographic overview'),
+                   convention=SECTION, scope=WORLD, strict_scope=True),
+        ParserSpec('location', parse_location,
+                   "Location", scope=COUNTRY),
+        ParserSpec('geographic_coordinates', parse_geographic_coordinates,
+                   "Geographic coordinates", scope=COUNTRY),
+        ParserSpec('map_references', parse_map_references,
+                   "Map references", scope=COUNTRY),
+        ParserSpec('population_distribution', parse_population_distribution,
+                   "Population distribution"),
+        # Note: 'geo_area'
+        ParserSpec('geo_area_total_sq_km', parse_area_data,
+                   "Area.total", info='area_total'),
+        ParserSpec('geo_area_land_sq_km', parse_area_data,
+                   "Area.land", info='area_land'),
+        ParserSpec('geo_area_water_sq_km', parse_area_data,
+                   "Area.water", info='area_water'),
+        ParserSpec('geo_area_note', _strip_html_tags,
+                   "Area.note", info='area_note'),
+        ParserSpec('geo_area_comparative', parse_area_comparative,
+                   "Area - comparative", info='area_comparative'),
+        ParserSpec('coastline', parse_coastline_data,
+                   "Coastline"),
+        # Entries not applicable to World data
+        ParserSpec('land_boundaries', parse_land_boundaries_master,
+                   "Land boundaries", scope=COUNTRY),
+        ParserSpec('maritime_claims', parse_maritime_claims,
+                   "Maritime claims", scope=COUNTRY),
+        ParserSpec('climate', _parse_climate,
+                   convention=SECTION, scope=COUNTRY),
+        ParserSpec('terrain', parse_terrain,
+                   "Terrain", scope=COUNTRY),
+        ParserSpec('elevation', parse_elevation,
+                   "Elevation", scope=COUNTRY),
+        ParserSpec('land_use', parse_land_use,
+                   "Land use", scope=COUNTRY),
+        ParserSpec('major_lakes', parse_major_lakes,
+                   "Major lakes (area sq km)", scope=COUNTRY),
+        ParserSpec('major_rivers', parse_major_rivers,
+                   "Major rivers (by length in km)", scope=COUNTRY),
+        # NOTE: the leading quote is part of the historical key path, kept as-is
+        ParserSpec('major_watersheds', parse_major_watersheds,
+                   "'Major watersheds (area sq km)", scope=COUNTRY),
+        ParserSpec('natural_resources', parse_natural_resources,
+                   "Natural resources", scope=COUNTRY),
+        ParserSpec('major_aquifers', parse_major_aquifers,
+                   "Major aquifers", scope=COUNTRY),
+        # World data only
+        ParserSpec('wld_land_boundaries', _clean_text_field('Land boundaries'),
+                   convention=SECTION, scope=WORLD, strict_scope=True),
+        ParserSpec('wld_maritime_claims',
+                   _guarded_parse('Maritime claims', parse_wld_maritime_claims, 'maritime_claims_data'),
+                   convention=SECTION, scope=WORLD),
+        ParserSpec('wld_climate', parse_wld_climate,
+                   "Climate", scope=WORLD, is_world_data=True),
+        ParserSpec('wld_terrain', parse_wld_terrain,
+                   "Terrain", scope=WORLD, is_world_data=True),
+        ParserSpec('wld_elevation', parse_wld_elevation,
+                   "Elevation", scope=WORLD, is_world_data=True),
+        ParserSpec('wld_major_lakes',
+                   _guarded_parse('Major lakes (area sq km)', parse_wld_major_lakes, 'major_lakes_data'),
+                   convention=SECTION, scope=WORLD),
+        ParserSpec('wld_major_rivers',
+                   _guarded_parse('Major rivers (by length in km)', parse_wld_major_rivers, 'major_rivers_data'),
+                   convention=SECTION, scope=WORLD),
+        ParserSpec('wld_major_watersheds', _clean_text_field('Major watersheds (area sq km)'),
+                   convention=SECTION, scope=WORLD),
+        ParserSpec('wld_major_aquifers',
+                   _guarded_parse('Major aquifers', parse_wld_major_aquifers, 'aquifers_data'),
+                   convention=SECTION, scope=WORLD),
+        ParserSpec('wonders_of_the_world',
+                   _guarded_parse('Wonders of the World', parse_wonders_of_the_world, 'wonders_data'),
+                   convention=SECTION, scope=WORLD),
+        ParserSpec('irrigated_land', parse_irrigated_land,
+                   "Irrigated land"),
+        ParserSpec('natural_hazards', parse_natural_hazards,
+                   "Natural hazards"),
+        ParserSpec('geography_note', parse_geography_note,
+                   "Geography - note"),
+    ]
+)
+
+
+def get_geography(data=None, info=None, iso3Code=None):
+    """
+    Parse a single Geography field through GEOGRAPHY_REGISTRY.
 
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 20 >>> 'GEOGRAPHY NOTE'
-    # --------------------------------------------------------------------------------------------------
-    elif info == 'geography_note':
-        return extract_and_parse(
-            main_data=geography,
-            key_path="Geography - note",
-            parser_function=parse_geography_note,
-            iso3Code=iso3Code,
-            parser_name="Geography - noted"
-        )
+    Parameters:
+    - data: The dictionary containing the country's data.
+    - info: The dispatcher name to parse (e.g. 'location', 'area_total', 'wld_climate').
+    - iso3Code: The ISO3 code of the country.
 
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # If 'info' doesn't match 'location', return {} or handle other cases
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    else:
-        logging.warning(
-            f"Info type '{info}' not implemented yet for {iso3Code}")
+    Returns:
+    - The parsed field, or {} if `info` is unknown, not available for `iso3Code`
+      or the 'Geography' section is missing.
+    """
+    if info not in GEOGRAPHY_REGISTRY:
+        logging.warning(f"Info type '{info}' not implemented yet for {iso3Code}")
         return {}
-# //////////////////////////////////////////////////////////////////////////////////////////////////////
+    return GEOGRAPHY_REGISTRY.dispatch(data, info, iso3Code)
 
 
 # --------------------------------------------------------------------------------------------
@@ -2,8 +2,8 @@
 #   CORE IMPORTS
 # ---------------------------------------------------------------------------------------------------------------------
 import os
-import re
 import logging
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 # ------------------------------------------------------------------------------------------------------------------
 
 
@@ -31,7 +31,7 @@ def parse_area_comparative(area_comparative_data: dict, iso3Code: str=None, retu
             return ''
 
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = strip_tags(text, iso3Code)
         return text.strip()
 
     except Exception as e:
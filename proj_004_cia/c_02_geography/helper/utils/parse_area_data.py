@@ -1,5 +1,6 @@
 import re
 import logging
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 
 
 def parse_area_data(area_data: dict, iso3Code: str=None, return_original: bool = False)-> dict:
@@ -28,7 +29,7 @@ def parse_area_data(area_data: dict, iso3Code: str=None, return_original: bool =
             }
 
         # Clean HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = strip_tags(text, iso3Code)
 
         # Default values in case extraction fails
         area_info = {
@@ -5,6 +5,7 @@ import os
 import re
 import logging
 from proj_004_cia.c_00_transform_utils.extract_numeric_value import extract_numeric_value
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 # ------------------------------------------------------------------------------------------------------------------
 
 
@@ -40,6 +41,6 @@ def parse_coastline_data(coastline_data, iso3Code: str = None, return_original:
     # Process 'note'
     note_data = coastline_data.get('note', '')
     if note_data:
-        result['note'] = re.sub(r'<[^>]+>', '', note_data)
+        result['note'] = strip_tags(note_data, iso3Code)
 
     return result
@@ -5,6 +5,7 @@ import os
 import re
 import logging
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 # ------------------------------------------------------------------------------------------------------------------
 
 
@@ -33,7 +34,7 @@ def parse_geographic_coordinates(
             return {}
 
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = strip_tags(text, iso3Code)
 
         # Split the text into segments
         # Handle semicolons and line breaks
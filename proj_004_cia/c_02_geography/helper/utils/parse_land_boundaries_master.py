@@ -6,6 +6,7 @@ import re
 import logging
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
 from proj_004_cia.c_00_transform_utils.extract_numeric_value import extract_numeric_value
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 # ------------------------------------------------------------------------------------------------------------------
 
 
@@ -57,7 +58,7 @@ def parse_land_boundaries_master(land_boundaries_data, iso3Code: str = None, ret
     border_data = land_boundaries_data.get('border countries', {})
     border_text = border_data.get('text', '')
     if border_text:
-        border_text = re.sub(r'<[^>]+>', '', border_text)
+        border_text = strip_tags(border_text, iso3Code)
         segments = re.split(r';\s*', border_text)
         for segment in segments:
             segment = segment.strip()
@@ -80,7 +81,7 @@ def parse_land_boundaries_master(land_boundaries_data, iso3Code: str = None, ret
     # Process 'note'
     note_data = land_boundaries_data.get('note', '')
     if note_data:
-        result['notes'] = re.sub(r'<[^>]+>', '', note_data)
+        result['notes'] = strip_tags(note_data, iso3Code)
 
     # Process other territories (e.g., 'metropolitan France - total', 'French Guiana - total')
     for key, value in land_boundaries_data.items():
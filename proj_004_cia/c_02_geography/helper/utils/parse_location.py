@@ -1,6 +1,7 @@
 import re
 import logging
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 
 # Configure logging
 logging.basicConfig(level='WARNING',
@@ -24,7 +25,7 @@ def parse_location(location_data: dict, iso3Code: str = None, return_original: b
         return None
 
     # Remove HTML tags from the text
-    text = re.sub(r'<[^>]+>', '', text)
+    text = strip_tags(text, iso3Code)
 
     # Initialize a dictionary to hold location information
     location_info = {}
@@ -5,6 +5,7 @@ import os
 import re
 import logging
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 # ------------------------------------------------------------------------------------------------------------------
 
 
@@ -29,7 +30,7 @@ def parse_map_references(map_ref_data: dict, isoCode: str = None, return_origina
             return {}
 
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = strip_tags(text, isoCode)
 
         # Split the text into segments
         # Handle semicolons and line breaks
@@ -3,6 +3,7 @@
 # ---------------------------------------------------------------------------------------------------------------------
 import re
 import logging
+from proj_004_cia.c_00_transform_utils.html_tokens import html_tokens
 
 # Configure logging
 logging.basicConfig(level='WARNING',
@@ -55,36 +56,19 @@ def parse_natural_resources(natural_resources_data: dict, iso3Code: str = None,
     # Extract the text content for natural resources
     text = natural_resources_data.get('text', '')
     if text:
-        # Check if the text contains <em> tags, indicating territories
-        if '<em>' in text:
-            # Split the text by ';' to separate different regions
-            regions = text.split(';')
-            for region in regions:
-                region = region.strip()
-                if not region:
-                    continue
-                # Split each region by <em> tags
-                parts = re.split(r'<em>|</em>', region)
-                current_key = None
-                for part in parts:
-                    part = part.strip()
-                    if not part:
-                        continue
-                    if ':' in part:
-                        # This is a region name (e.g., "metropolitan France:")
-                        current_key = part.replace(
-                            ':', '').strip().replace(' ', '_').lower()
-                        result["natural_resources"][current_key] = []
-                    else:
-                        # This is the list of resources for the current region
-                        resources = [resource.strip()
-                                     for resource in part.split(',')]
-                        if current_key:
-                            result["natural_resources"][current_key].extend(
-                                resources)
+        tokens = html_tokens(text, iso3Code)
+        # <em> labels indicate territories ("<em>metropolitan France:</em> coal, ...; <em>French Guiana:</em> gold")
+        territories = [(label, body) for label, body in tokens.sections('em') if label is not None]
+        if territories:
+            for label, body in territories:
+                # Region name (e.g., "metropolitan France:") followed by its list of resources
+                current_key = label.replace(':', '').strip().replace(' ', '_').lower()
+                body = body.strip().rstrip(';').strip()
+                result["natural_resources"][current_key] = [resource.strip()
+                                                           for resource in body.split(',')] if body else []
         else:
             # If no <em> tags, treat as a simple list of natural resources
-            resources = [resource.strip() for resource in text.split(',')]
+            resources = [resource.strip() for resource in tokens.plain.split(',')]
             result["natural_resources"]["main"] = resources
 
     # Extract the note content for natural resources if present
@@ -1,7 +1,7 @@
-import re
 import logging
 from typing import Dict, Optional
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 
 # Configure logging
 logging.basicConfig(level='WARNING',
@@ -32,7 +32,7 @@ def parse_demographic_profile(demo_data: dict, iso3Code: str = None, return_orig
 
     if text and text.upper() != 'NA':
         # Clean HTML tags if present
-        text = re.sub(r'<[^>]+>', '', text).strip()
+        text = strip_tags(text, iso3Code).strip()
         result["demographic_profile"]["description"] = text
 
     return result
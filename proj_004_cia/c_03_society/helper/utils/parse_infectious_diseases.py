@@ -2,6 +2,7 @@ import re
 import logging
 from typing import Dict, Optional
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 
 # Configure logging
 logging.basicConfig(level='WARNING',
@@ -73,7 +74,7 @@ def parse_infectious_diseases(disease_data: dict, iso3Code: str = None, return_o
         if isinstance(note, dict):
             note = note.get('text', '')
         if note:
-            note = re.sub(r'<[^>]+>', '', str(note)).strip()
+            note = strip_tags(str(note), iso3Code).strip()
             result["infectious_diseases_note"] = note
 
     return result
@@ -3,6 +3,7 @@ import logging
 from typing import Dict, List, Optional
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
 from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 
 # Configure logging
 logging.basicConfig(level='WARNING',
@@ -88,7 +89,7 @@ def parse_languages(iso3Code: str, return_original: bool = False)-> dict:
     # Handle note (can be in parent languages_data or lang_content)
     note = languages_data.get('note', '') or lang_content.get('note', '')
     if note:
-        note = re.sub(r'<[^>]+>', '', note).strip()
+        note = strip_tags(note, iso3Code).strip()
         note = re.sub(r'^note\s*\d*:\s*', '', note, flags=re.IGNORECASE)
         result["languages_note"] = note
 
@@ -1,7 +1,7 @@
-import re
 import logging
 from typing import Dict, Optional
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 
 # Configure logging
 logging.basicConfig(level='WARNING',
@@ -31,7 +31,7 @@ def parse_people_note(people_data: dict, iso3Code: str = None, return_original:
 
     if text and text.upper() != 'NA':
         # Clean HTML tags
-        text = re.sub(r'<[^>]+>', '', text).strip()
+        text = strip_tags(text, iso3Code).strip()
         result["people_note"]["text"] = text
 
     return result
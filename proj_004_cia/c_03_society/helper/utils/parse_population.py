@@ -2,6 +2,7 @@ import re
 import logging
 from typing import Dict, Optional
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 
 # Configure logging
 logging.basicConfig(level='WARNING',
@@ -93,7 +94,7 @@ def parse_population(population_data: dict, iso3Code: str = None, return_origina
     if 'note' in population_data:
         note = population_data['note']
         if isinstance(note, str):
-            note = re.sub(r'<[^>]+>', '', note).strip()
+            note = strip_tags(note, iso3Code).strip()
             note = re.sub(r'^note\s*\d*:\s*', '', note, flags=re.IGNORECASE)
             result["population_note"] = note
 
@@ -3,6 +3,7 @@ import logging
 from typing import Dict, List, Optional
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
 from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 
 # Configure logging
 logging.basicConfig(level='WARNING',
@@ -91,7 +92,7 @@ def parse_religions(iso3Code: str, return_original: bool = False)-> dict:
 
     # Clean HTML from note
     if note:
-        note = re.sub(r'<[^>]+>', '', note).strip()
+        note = strip_tags(note, iso3Code).strip()
         note = re.sub(r'^note:\s*', '', note, flags=re.IGNORECASE)
         result["religions_note"] = note
 
@@ -2,6 +2,7 @@ import re
 import logging
 from typing import Dict, Optional
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.html_tokens import strip_tags
 
 # Configure logging
 logging.basicConfig(level='WARNING',
@@ -79,7 +80,7 @@ def parse_urbanization(urb_data: dict, iso3Code: str = None, return_original: bo
     if 'note' in urb_data:
         note = urb_data['note']
         if isinstance(note, str):
-            note = re.sub(r'<[^>]+>', '', note).strip()
+            note = strip_tags(note, iso3Code).strip()
             note = re.sub(r'^note\s*\d*:\s*', '', note, flags=re.IGNORECASE)
             result["urbanization_note"] = note
 
@@ -12,50 +12,77 @@ import os
 import json
 from typing import Dict, Optional
 
-# Parser imports
-from proj_004_cia.c_04_environment.helper.utils.parse_air_pollutants import parse_air_pollutants
-from proj_004_cia.c_04_environment.helper.utils.parse_climate import parse_climate
-from proj_004_cia.c_04_environment.helper.utils.parse_env_current_issues import parse_env_current_issues
-from proj_004_cia.c_04_environment.helper.utils.parse_env_international_agreements import parse_env_international_agreements
-from proj_004_cia.c_04_environment.helper.utils.parse_food_insecurity import parse_food_insecurity
-from proj_004_cia.c_04_environment.helper.utils.parse_geoparks import parse_geoparks
-from proj_004_cia.c_04_environment.helper.utils.parse_land_use import parse_land_use
-from proj_004_cia.c_04_environment.helper.utils.parse_major_aquifers import parse_major_aquifers
-from proj_004_cia.c_04_environment.helper.utils.parse_major_lakes import parse_major_lakes
-from proj_004_cia.c_04_environment.helper.utils.parse_major_rivers import parse_major_rivers
-from proj_004_cia.c_04_environment.helper.utils.parse_major_watersheds import parse_major_watersheds
-from proj_004_cia.c_04_environment.helper.utils.parse_revenue_from_coal import parse_revenue_from_coal
-from proj_004_cia.c_04_environment.helper.utils.parse_revenue_from_forest import parse_revenue_from_forest
-from proj_004_cia.c_04_environment.helper.utils.parse_total_renewable_water import parse_total_renewable_water
-from proj_004_cia.c_04_environment.helper.utils.parse_total_water_withdrawal import parse_total_water_withdrawal
-from proj_004_cia.c_04_environment.helper.utils.parse_urbanization import parse_urbanization
-from proj_004_cia.c_04_environment.helper.utils.parse_waste_and_recycling import parse_waste_and_recycling
-from proj_004_cia.c_04_environment.helper.utils.parse_world_biomes import parse_world_biomes
-from proj_004_cia.c_04_environment.helper.utils.parse_marine_fisheries import parse_marine_fisheries
+from proj_004_cia.c_00_transform_utils.parser_registry import LazyParser, ParserRegistry, ParserSpec, SUBTREE_ISO3
 
+# Parser imports
+parse_air_pollutants = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_air_pollutants')
+parse_climate = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_climate')
+parse_env_current_issues = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_env_current_issues')
+parse_env_international_agreements = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_env_international_agreements')
+parse_food_insecurity = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_food_insecurity')
+parse_geoparks = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_geoparks')
+parse_land_use = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_land_use')
+parse_major_aquifers = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_major_aquifers')
+parse_major_lakes = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_major_lakes')
+parse_major_rivers = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_major_rivers')
+parse_major_watersheds = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_major_watersheds')
+parse_revenue_from_coal = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_revenue_from_coal')
+parse_revenue_from_forest = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_revenue_from_forest')
+parse_total_renewable_water = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_total_renewable_water')
+parse_total_water_withdrawal = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_total_water_withdrawal')
+parse_urbanization = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_urbanization')
+parse_waste_and_recycling = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_waste_and_recycling')
+parse_world_biomes = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_world_biomes')
+parse_marine_fisheries = LazyParser('proj_004_cia.c_04_environment.helper.utils.parse_marine_fisheries')
+
+
+# Environment parser registry, in return_environment_data output order
+ENVIRONMENT_REGISTRY = ParserRegistry(
+    section="Environment",
+    specs=[
+        ParserSpec('air_pollutants', parse_air_pollutants,
+                   "Air pollutants", convention=SUBTREE_ISO3),
+        ParserSpec('climate', parse_climate,
+                   "Climate", convention=SUBTREE_ISO3),
+        ParserSpec('env_current_issues', parse_env_current_issues,
+                   "Environment - current issues", convention=SUBTREE_ISO3),
+        ParserSpec('env_international_agreements', parse_env_international_agreements,
+                   "Environment - international agreements", convention=SUBTREE_ISO3),
+        ParserSpec('food_insecurity', parse_food_insecurity,
+                   "Food insecurity", convention=SUBTREE_ISO3),
+        ParserSpec('geoparks', parse_geoparks,
+                   "Geoparks", convention=SUBTREE_ISO3),
+        ParserSpec('land_use', parse_land_use,
+                   "Land use", convention=SUBTREE_ISO3),
+        ParserSpec('major_aquifers', parse_major_aquifers,
+                   "Major aquifers", convention=SUBTREE_ISO3),
+        ParserSpec('major_lakes', parse_major_lakes,
+                   "Major lakes (area sq km)", convention=SUBTREE_ISO3),
+        ParserSpec('major_rivers', parse_major_rivers,
+                   "Major rivers (by length in km)", convention=SUBTREE_ISO3),
+        ParserSpec('major_watersheds', parse_major_watersheds,
+                   "Major watersheds (area sq km)", convention=SUBTREE_ISO3),
+        ParserSpec('revenue_from_coal', parse_revenue_from_coal,
+                   "Revenue from coal", convention=SUBTREE_ISO3),
+        ParserSpec('revenue_from_forest', parse_revenue_from_forest,
+                   "Revenue from forest resources", convention=SUBTREE_ISO3),
+        ParserSpec('total_renewable_water', parse_total_renewable_water,
+                   "Total renewable water resources", convention=SUBTREE_ISO3),
+        ParserSpec('total_water_withdrawal', parse_total_water_withdrawal,
+                   "Total water withdrawal", convention=SUBTREE_ISO3),
+        ParserSpec('urbanization', parse_urbanization,
+                   "Urbanization", convention=SUBTREE_ISO3),
+        ParserSpec('waste_and_recycling', parse_waste_and_recycling,
+                   "Waste and recycling", convention=SUBTREE_ISO3),
+        ParserSpec('world_biomes', parse_world_biomes,
+                   "World biomes", convention=SUBTREE_ISO3),
+        ParserSpec('marine_fisheries', parse_marine_fisheries,
+                   "Marine fisheries", convention=SUBTREE_ISO3),
+    ]
+)
 
 # Valid info parameters
-VALID_INFO_PARAMS = {
-    'air_pollutants',
-    'climate',
-    'env_current_issues',
-    'env_international_agreements',
-    'food_insecurity',
-    'geoparks',
-    'land_use',
-    'major_aquifers',
-    'major_lakes',
-    'major_rivers',
-    'major_watersheds',
-    'revenue_from_coal',
-    'revenue_from_forest',
-    'total_renewable_water',
-    'total_water_withdrawal',
-    'urbanization',
-    'waste_and_recycling',
-    'world_biomes',
-    'marine_fisheries',
-}
+VALID_INFO_PARAMS = frozenset(spec.info for spec in ENVIRONMENT_REGISTRY)
 
 
 def get_environment(data: dict = None, info: str = None, iso3Code: str = None) -> Optional[Dict]:
@@ -69,135 +96,8 @@ def get_environment(data: dict = None, info: str = None, iso3Code: str = None) -
 
     Returns:
         Parsed data dictionary for the requested field, or None if invalid info
-
-    Raises:
-        ValueError: If info parameter is not recognized
     """
-    if data is None:
-        return None
-
-    if info is None or info not in VALID_INFO_PARAMS:
-        return None
-
-    # Get Environment section
-    env_data = data.get("Environment", {})
-
-    # Route to appropriate parser
-    if info == 'air_pollutants':
-        return parse_air_pollutants(
-            env_data.get("Air pollutants", {}),
-            iso3Code
-        )
-
-    if info == 'climate':
-        return parse_climate(
-            env_data.get("Climate", {}),
-            iso3Code
-        )
-
-    if info == 'env_current_issues':
-        return parse_env_current_issues(
-            env_data.get("Environment - current issues", {}),
-            iso3Code
-        )
-
-    if info == 'env_international_agreements':
-        return parse_env_international_agreements(
-            env_data.get("Environment - international agreements", {}),
-            iso3Code
-        )
-
-    if info == 'food_insecurity':
-        return parse_food_insecurity(
-            env_data.get("Food insecurity", {}),
-            iso3Code
-        )
-
-    if info == 'geoparks':
-        return parse_geoparks(
-            env_data.get("Geoparks", {}),
-            iso3Code
-        )
-
-    if info == 'land_use':
-        return parse_land_use(
-            env_data.get("Land use", {}),
-            iso3Code
-        )
-
-    if info == 'major_aquifers':
-        return parse_major_aquifers(
-            env_data.get("Major aquifers", {}),
-            iso3Code
-        )
-
-    if info == 'major_lakes':
-        return parse_major_lakes(
-            env_data.get("Major lakes (area sq km)", {}),
-            iso3Code
-        )
-
-    if info == 'major_rivers':
-        return parse_major_rivers(
-            env_data.get("Major rivers (by length in km)", {}),
-            iso3Code
-        )
-
-    if info == 'major_watersheds':
-        return parse_major_watersheds(
-            env_data.get("Major watersheds (area sq km)", {}),
-            iso3Code
-        )
-
-    if info == 'revenue_from_coal':
-        return parse_revenue_from_coal(
-            env_data.get("Revenue from coal", {}),
-            iso3Code
-        )
-
-    if info == 'revenue_from_forest':
-        return parse_revenue_from_forest(
-            env_data.get("Revenue from forest resources", {}),
-            iso3Code
-        )
-
-    if info == 'total_renewable_water':
-        return parse_total_renewable_water(
-            env_data.get("Total renewable water resources", {}),
-            iso3Code
-        )
-
-    if info == 'total_water_withdrawal':
-        return parse_total_water_withdrawal(
-            env_data.get("Total water withdrawal", {}),
-            iso3Code
-        )
-
-    if info == 'urbanization':
-        return parse_urbanization(
-            env_data.get("Urbanization", {}),
-            iso3Code
-        )
-
-    if info == 'waste_and_recycling':
-        return parse_waste_and_recycling(
-            env_data.get("Waste and recycling", {}),
-            iso3Code
-        )
-
-    if info == 'world_biomes':
-        return parse_world_biomes(
-            env_data.get("World biomes", {}),
-            iso3Code
-        )
-
-    if info == 'marine_fisheries':
-        return parse_marine_fisheries(
-            env_data.get("Marine fisheries", {}),
-            iso3Code
-        )
-
-    return None
+    return ENVIRONMENT_REGISTRY.dispatch(data, info, iso3Code)
 
 
 ######################################################################################################################
@@ -5,426 +5,206 @@ import os
 import re
 import json
 import logging
+# ---------------------------------------------------------------------------------------------------------------------
+from proj_004_cia.c_00_transform_utils.parser_registry import (
+    LazyParser, ParserRegistry, ParserSpec, COUNTRY, ISO3, SUBTREE)
 # --------------------------------------------------------------------------------------------------
 # NOTE: "Administrative divisions"
-from proj_004_cia.c_05_government.helper.utils.parse_admin_divisions import parse_admin_divisions
+parse_admin_divisions = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_admin_divisions')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Capital"
-from proj_004_cia.c_05_government.helper.utils.parse_capital import parse_capital
+parse_capital = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_capital')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Citizenship"
-from proj_004_cia.c_05_government.helper.utils.parse_citizenship import parse_citizenship
+parse_citizenship = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_citizenship')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Constitution"
-from proj_004_cia.c_05_government.helper.utils.parse_constitution import parse_constitution
+parse_constitution = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_constitution')
 # --------------------------------------------------------------------------------------------------
 
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Country name"
-from proj_004_cia.c_05_government.helper.utils.parse_country_name import parse_country_name
+parse_country_name = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_country_name')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Dependency status"
-from proj_004_cia.c_05_government.helper.utils.parse_dependency_status import parse_dependency_status
+parse_dependency_status = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_dependency_status')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Dependent areas"
-from proj_004_cia.c_05_government.helper.utils.parse_dependent_areas import parse_dependent_areas
+parse_dependent_areas = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_dependent_areas')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Diplomatic representation from the US"
-from proj_004_cia.c_05_government.helper.utils.parse_diplomatic_representation_from_us import parse_diplomatic_representation_from_us
+parse_diplomatic_representation_from_us = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_diplomatic_representation_from_us')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Diplomatic representation in the US"
-from proj_004_cia.c_05_government.helper.utils.parse_diplomatic_representation_in_us import parse_diplomatic_representation_in_us
+parse_diplomatic_representation_in_us = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_diplomatic_representation_in_us')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Executive branch"
-from proj_004_cia.c_05_government.helper.utils.parse_executive_branch import parse_executive_branch
+parse_executive_branch = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_executive_branch')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Flag description"
-from proj_004_cia.c_05_government.helper.utils.parse_flag_description import parse_flag_description
+parse_flag_description = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_flag_description')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Government - note"
-from proj_004_cia.c_05_government.helper.utils.parse_government_note import parse_government_note
+parse_government_note = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_government_note')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Government type"
-from proj_004_cia.c_05_government.helper.utils.parse_government_type import parse_government_type
+parse_government_type = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_government_type')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Independence"
-from proj_004_cia.c_05_government.helper.utils.parse_independence import parse_independence
+parse_independence = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_independence')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "International law organization participation"
-from proj_004_cia.c_05_government.helper.utils.parse_international_law_org_participation import parse_international_law_org_participation
+parse_international_law_org_participation = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_international_law_org_participation')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "International organization participation"
-from proj_004_cia.c_05_government.helper.utils.parse_international_org_participation import parse_international_org_participation
+parse_international_org_participation = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_international_org_participation')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Judicial branch"
-from proj_004_cia.c_05_government.helper.utils.parse_judicial_branch import parse_judicial_branch
+parse_judicial_branch = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_judicial_branch')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Legal system"
-from proj_004_cia.c_05_government.helper.utils.parse_legal_system import parse_legal_system
+parse_legal_system = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_legal_system')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Legislative branch"
-from proj_004_cia.c_05_government.helper.utils.parse_legislative_branch import parse_legislative_branch
+parse_legislative_branch = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_legislative_branch')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Member states"
-from proj_004_cia.c_05_government.helper.utils.parse_member_states import parse_member_states
+parse_member_states = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_member_states')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "National anthem"
-from proj_004_cia.c_05_government.helper.utils.parse_national_anthem import parse_national_anthem
+parse_national_anthem = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_national_anthem')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "National heritage"
-from proj_004_cia.c_05_government.helper.utils.parse_national_heritage import parse_national_heritage
+parse_national_heritage = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_national_heritage')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "National holiday"
-from proj_004_cia.c_05_government.helper.utils.parse_national_holiday import parse_national_holiday
+parse_national_holiday = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_national_holiday')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "National symbol(s)"
-from proj_004_cia.c_05_government.helper.utils.parse_national_symbols import parse_national_symbols
+parse_national_symbols = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_national_symbols')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Political parties"
-from proj_004_cia.c_05_government.helper.utils.parse_political_parties import parse_political_parties
+parse_political_parties = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_political_parties')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Political structure"
-from proj_004_cia.c_05_government.helper.utils.parse_political_structure import parse_political_structure
+parse_political_structure = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_political_structure')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Suffrage"
-from proj_004_cia.c_05_government.helper.utils.parse_suffrage import parse_suffrage
+parse_suffrage = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_suffrage')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Union name"
-from proj_004_cia.c_05_government.helper.utils.parse_union_name import parse_union_name
+parse_union_name = LazyParser('proj_004_cia.c_05_government.helper.utils.parse_union_name')
 # --------------------------------------------------------------------------------------------------
 
 # //////////////////////////////////////////////////////////////////////////////////////////////////
 
 
-def get_government(data=None, info=None, iso3Code=None):
-
-    # 0
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: GOVERNMENT DATA
-    # --------------------------------------------------------------------------------------------------
-    gov_data = data.get("Government", {})
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-
-    # 1
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 1 >>> 'Administrative divisions'
-    # --------------------------------------------------------------------------------------------------
-    admin_divisions_data = gov_data.get("Administrative divisions", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'admin_divisions':
-        return parse_admin_divisions(iso3Code)
-
-    # 2
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 2 >>> 'Capital'
-    # --------------------------------------------------------------------------------------------------
-    capital_data = gov_data.get("Capital", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'capital':
-        return parse_capital(iso3Code)
-
-    # 3
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 3 >>> 'Citizenship'
-    # --------------------------------------------------------------------------------------------------
-    citizenship_data = gov_data.get("Citizenship", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'citizenship':
-        return parse_citizenship(iso3Code)
-
-    # 4
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 4 >>> 'Constitution'
-    # --------------------------------------------------------------------------------------------------
-    constitution_data = gov_data.get("Constitution", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'constitution':
-        return parse_constitution(iso3Code)
-
-    # 5
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 5 >>> 'Country name'
-    # --------------------------------------------------------------------------------------------------
-    country_name_data = gov_data.get("Country name", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'country_name':
-        return parse_country_name(iso3Code)
-
-    # 6
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 6 >>> 'Dependency status'
-    # --------------------------------------------------------------------------------------------------
-    dependency_status_data = gov_data.get("Dependency status", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'dependency_status':
-        return parse_dependency_status(
-            dependency_status_data
-        )
-
-    # 7
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 7 >>> 'Dependent areas'
-    # --------------------------------------------------------------------------------------------------
-    dependent_areas_data = gov_data.get("Dependent areas", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'dependent_areas':
-        return parse_dependent_areas(
-            dependent_areas_data
-        )
-
-    # 8
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 8 >>> 'Diplomatic representation from the US'
-    # --------------------------------------------------------------------------------------------------
-    diplomatic_rep_from_us_data = gov_data.get(
-        "Diplomatic representation from the US", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'diplomatic_representation_from_us':
-        return parse_diplomatic_representation_from_us(iso3Code)
-
-    # 9
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 9 >>> 'Diplomatic representation in the US'
-    # --------------------------------------------------------------------------------------------------
-    diplomatic_rep_in_us_data = gov_data.get(
-        "Diplomatic representation in the US", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'diplomatic_representation_in_us':
-        return parse_diplomatic_representation_in_us(iso3Code)
-
-    # 10
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 10 >>> 'Executive branch'
-    # --------------------------------------------------------------------------------------------------
-    executive_branch_data = gov_data.get("Executive branch", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'executive_branch':
-        return parse_executive_branch(iso3Code)
-
-    # 11
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 11 >>> 'Flag description'
-    # --------------------------------------------------------------------------------------------------
-    flag_description_data = gov_data.get("Flag description", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'flag_description':
-        return parse_flag_description(iso3Code)
-
-    # 12
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 12 >>> 'Government - note'
-    # --------------------------------------------------------------------------------------------------
-    government_note_data = gov_data.get("Government - note", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'government_note':
-        return parse_government_note(
-            government_note_data
-        )
-
-    # 13
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 13 >>> 'Government type'
-    # --------------------------------------------------------------------------------------------------
-    government_type_data = gov_data.get("Government type", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'government_type':
-        return parse_government_type(iso3Code)
-
-    # 14
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 14 >>> 'Independence'
-    # --------------------------------------------------------------------------------------------------
-    independence_data = gov_data.get("Independence", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'independence':
-        return parse_independence(iso3Code)
-
-    # 15
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 15 >>> 'International law organization participation'
-    # --------------------------------------------------------------------------------------------------
-    intl_law_org_participation_data = gov_data.get(
-        "International law organization participation", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'international_law_org_participation':
-        return parse_international_law_org_participation(
-            intl_law_org_participation_data
-        )
-
-    # 16
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 16 >>> 'International organization participation'
-    # --------------------------------------------------------------------------------------------------
-    intl_org_participation_data = gov_data.get(
-        "International organization participation", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'international_org_participation':
-        return parse_international_org_participation(
-            intl_org_participation_data
-        )
-
-    # 17
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 17 >>> 'Judicial branch'
-    # --------------------------------------------------------------------------------------------------
-    judicial_branch_data = gov_data.get("Judicial branch", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'judicial_branch':
-        return parse_judicial_branch(iso3Code)
-
-    # 18
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 18 >>> 'Legal system'
-    # --------------------------------------------------------------------------------------------------
-    legal_system_data = gov_data.get("Legal system", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'legal_system':
-        return parse_legal_system(iso3Code)
-
-    # 19
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 19 >>> 'Legislative branch'
-    # --------------------------------------------------------------------------------------------------
-    legislative_branch_data = gov_data.get("Legislative branch", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'legislative_branch':
-        return parse_legislative_branch(iso3Code)
-
-    # 20
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 20 >>> 'Member states'
-    # --------------------------------------------------------------------------------------------------
-    member_states_data = gov_data.get("Member states", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'member_states':
-        return parse_member_states(
-            member_states_data
-        )
-
-    # 21
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 21 >>> 'National anthem'
-    # --------------------------------------------------------------------------------------------------
-    national_anthem_data = gov_data.get("National anthem", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'national_anthem':
-        return parse_national_anthem(iso3Code)
-
-    # 22
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 22 >>> 'National heritage'
-    # --------------------------------------------------------------------------------------------------
-    national_heritage_data = gov_data.get("National heritage", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'national_heritage':
-        return parse_national_heritage(iso3Code)
-
-    # 23
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 23 >>> 'National holiday'
-    # --------------------------------------------------------------------------------------------------
-    national_holiday_data = gov_data.get("National holiday", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'national_holiday':
-        return parse_national_holiday(iso3Code)
-
-    # 24
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 24 >>> 'National symbol(s)'
-    # --------------------------------------------------------------------------------------------------
-    national_symbols_data = gov_data.get("National symbol(s)", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'national_symbols':
-        return parse_national_symbols(iso3Code)
-
-    # 25
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 25 >>> 'Political parties'
-    # --------------------------------------------------------------------------------------------------
-    political_parties_data = gov_data.get("Political parties", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'political_parties':
-        return parse_political_parties(iso3Code)
-
-    # 26
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 26 >>> 'Political structure'
-    # --------------------------------------------------------------------------------------------------
-    political_structure_data = gov_data.get("Political structure", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'political_structure':
-        return parse_political_structure(
-            political_structure_data
-        )
-
-    # 27
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 27 >>> 'Suffrage'
-    # --------------------------------------------------------------------------------------------------
-    suffrage_data = gov_data.get("Suffrage", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'suffrage':
-        return parse_suffrage(iso3Code)
+# //////////////////////////////////////////////////////////////////////////////////////////////////
+#   GOVERNMENT PARSER REGISTRY
+# --------------------------------------------------------------------------------------------------
+GOVERNMENT_REGISTRY = ParserRegistry(
+    section="Government",
+    default_scope=COUNTRY,
+    specs=[
+        ParserSpec('admin_divisions', parse_admin_divisions,
+                   "Administrative divisions", convention=ISO3),
+        ParserSpec('capital', parse_capital,
+                   "Capital", convention=ISO3),
+        ParserSpec('citizenship', parse_citizenship,
+                   "Citizenship", convention=ISO3),
+        ParserSpec('constitution', parse_constitution,
+                   "Constitution", convention=ISO3),
+        ParserSpec('country_name', parse_country_name,
+                   "Country name", convention=ISO3),
+        ParserSpec('dependency_status', parse_dependency_status,
+                   "Dependency status", convention=SUBTREE),
+        ParserSpec('dependent_areas', parse_dependent_areas,
+                   "Dependent areas", convention=SUBTREE),
+        ParserSpec('diplomatic_representation_from_us', parse_diplomatic_representation_from_us,
+                   "Diplomatic representation from the US", convention=ISO3),
+        ParserSpec('diplomatic_representation_in_us', parse_diplomatic_representation_in_us,
+                   "Diplomatic representation in the US", convention=ISO3),
+        ParserSpec('executive_branch', parse_executive_branch,
+                   "Executive branch", convention=ISO3),
+        ParserSpec('flag_description', parse_flag_description,
+                   "Flag description", convention=ISO3),
+        ParserSpec('government_note', parse_government_note,
+                   "Government - note", convention=SUBTREE),
+        ParserSpec('government_type', parse_government_type,
+                   "Government type", convention=ISO3),
+        ParserSpec('independence', parse_independence,
+                   "Independence", convention=ISO3),
+        ParserSpec('international_law_org_participation', parse_international_law_org_participation,
+                   "International law organization participation", convention=SUBTREE),
+        ParserSpec('international_org_participation', parse_international_org_participation,
+                   "International organization participation", convention=SUBTREE),
+        ParserSpec('judicial_branch', parse_judicial_branch,
+                   "Judicial branch", convention=ISO3),
+        ParserSpec('legal_system', parse_legal_system,
+                   "Legal system", convention=ISO3),
+        ParserSpec('legislative_branch', parse_legislative_branch,
+                   "Legislative branch", convention=ISO3),
+        ParserSpec('member_states', parse_member_states,
+                   "Member states", convention=SUBTREE),
+        ParserSpec('national_anthem', parse_national_anthem,
+                   "National anthem", convention=ISO3),
+        ParserSpec('national_heritage', parse_national_heritage,
+                   "National heritage", convention=ISO3),
+        ParserSpec('national_holiday', parse_national_holiday,
+                   "National holiday", convention=ISO3),
+        ParserSpec('national_symbols', parse_national_symbols,
+                   "National symbol(s)", convention=ISO3),
+        ParserSpec('political_parties', parse_political_parties,
+                   "Political parties", convention=ISO3),
+        ParserSpec('political_structure', parse_political_structure,
+                   "Political structure", convention=SUBTREE),
+        ParserSpec('suffrage', parse_suffrage,
+                   "Suffrage", convention=ISO3),
+        ParserSpec('union_name', parse_union_name,
+                   "Union name", convention=SUBTREE),
+    ]
+)
 
-    # 28
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 28 >>> 'Union name'
-    # --------------------------------------------------------------------------------------------------
-    union_name_data = gov_data.get("Union name", {})
-    # --------------------------------------------------------------------------------------------------
 
-    if info == 'union_name':
-        return parse_union_name(
-            union_name_data
-        )
+def get_government(data=None, info=None, iso3Code=None):
+    """
+    Parse a single Government field through GOVERNMENT_REGISTRY.
+
+    Parameters:
+    - data: The dictionary containing the country's data.
+    - info: The output key to parse (e.g. 'capital').
+    - iso3Code: The ISO3 code of the country.
+
+    Returns:
+    - The parsed field, or None if `info` is unknown or not available for `iso3Code`.
+    """
+    return GOVERNMENT_REGISTRY.dispatch(data, info, iso3Code)
 
 
 ######################################################################################################################
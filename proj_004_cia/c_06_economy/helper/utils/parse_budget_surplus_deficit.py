@@ -9,7 +9,7 @@ logging.basicConfig(level='WARNING',
 logger = logging.getLogger(__name__)
 
 
-def parse_budget_surplus_deficit(iso3Code: str, return_original: bool = False)-> dict:
+def parse_budget_surplus_deficit(iso3Code: str, return_original: bool = False, pass_data: dict = None)-> dict:
     """
     Parse budget surplus/deficit data from CIA World Factbook for a given country.
 
@@ -17,6 +17,7 @@ def parse_budget_surplus_deficit(iso3Code: str, return_original: bool = False)->
 
     Args:
         iso3Code: ISO 3166-1 alpha-3 country code (e.g., 'USA', 'CHN', 'WLD')
+        pass_data: Already-extracted raw subtree; skips reloading the country file
 
     Returns:
         Dictionary with structured budget surplus/deficit data:
@@ -35,16 +36,17 @@ def parse_budget_surplus_deficit(iso3Code: str, return_original: bool = False)->
     """
     result = {}
 
-    # Load raw country data
-    try:
-        raw_data = load_country_data(iso3Code)
-    except Exception as e:
-        logger.error(f"Failed to load data for {iso3Code}: {e}")
-        return result
+    # Load raw country data, unless the caller already extracted the subtree
+    if pass_data is None:
+        try:
+            raw_data = load_country_data(iso3Code)
+        except Exception as e:
+            logger.error(f"Failed to load data for {iso3Code}: {e}")
+            return result
 
-    # Navigate to Economy -> Budget surplus (+) or deficit (-)
-    economy_section = raw_data.get('Economy', {})
-    pass_data = economy_section.get('Budget surplus (+) or deficit (-)', {})
+        # Navigate to Economy -> Budget surplus (+) or deficit (-)
+        economy_section = raw_data.get('Economy', {})
+        pass_data = economy_section.get('Budget surplus (+) or deficit (-)', {})
 
     if return_original:
         return pass_data
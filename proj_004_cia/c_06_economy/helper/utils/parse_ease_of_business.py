@@ -9,7 +9,7 @@ logging.basicConfig(level='WARNING',
 logger = logging.getLogger(__name__)
 
 
-def parse_ease_of_business(iso3Code: str, return_original: bool = False)-> dict:
+def parse_ease_of_business(iso3Code: str, return_original: bool = False, pass_data: dict = None)-> dict:
     """
     Parse ease of doing business index data from CIA World Factbook for a given country.
 
@@ -17,6 +17,7 @@ def parse_ease_of_business(iso3Code: str, return_original: bool = False)-> dict:
 
     Args:
         iso3Code: ISO 3166-1 alpha-3 country code (e.g., 'USA', 'CHN', 'WLD')
+        pass_data: Already-extracted raw subtree; skips reloading the country file
 
     Returns:
         Dictionary with structured ease of business data:
@@ -36,16 +37,17 @@ def parse_ease_of_business(iso3Code: str, return_original: bool = False)-> dict:
     """
     result = {}
 
-    # Load raw country data
-    try:
-        raw_data = load_country_data(iso3Code)
-    except Exception as e:
-        logger.error(f"Failed to load data for {iso3Code}: {e}")
-        return result
+    # Load raw country data, unless the caller already extracted the subtree
+    if pass_data is None:
+        try:
+            raw_data = load_country_data(iso3Code)
+        except Exception as e:
+            logger.error(f"Failed to load data for {iso3Code}: {e}")
+            return result
 
-    # Navigate to Economy -> Ease of Doing Business Index scores
-    economy_section = raw_data.get('Economy', {})
-    pass_data = economy_section.get('Ease of Doing Business Index scores', {})
+        # Navigate to Economy -> Ease of Doing Business Index scores
+        economy_section = raw_data.get('Economy', {})
+        pass_data = economy_section.get('Ease of Doing Business Index scores', {})
 
     if return_original:
         return pass_data
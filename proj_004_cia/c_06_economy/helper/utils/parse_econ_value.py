@@ -2,8 +2,8 @@
 Helper function to parse economy values into structured components.
 Extracts numeric value, unit, year, and estimate flag from CIA energy text.
 """
-import re
 import logging
+from proj_004_cia.c_00_transform_utils.parse_quantity import parse_quantity
 from typing import Dict, Any, Optional
 
 logging.basicConfig(level='WARNING', format='%(asctime)s - %(levelname)s - %(message)s')
@@ -41,90 +41,8 @@ def parse_econ_value(text: str, return_original: bool = False)-> Dict[str, Any]:
     if return_original:
         return text
 
-    result = {
-        'value': None,
-        'raw_value': None,
-        'magnitude': None,
-        'unit': None,
-        'year': None,
-        'is_estimate': False,
-        'text': None
-    }
-
-    if not text or not isinstance(text, str):
-        return result
-
-    try:
-        # Clean text
-        clean_text = text.strip()
-        result['text'] = clean_text
-
-        # Check for estimate
-        result['is_estimate'] = 'est.' in clean_text.lower() or 'est)' in clean_text.lower()
-
-        # Extract year from parenthesis - patterns like (2022 est.) or (2022)
-        year_match = re.search(r'\((\d{4})(?:\s*est\.?)?\)', clean_text)
-        if year_match:
-            result['year'] = int(year_match.group(1))
-
-        # Remove the year/estimate portion for further parsing
-        text_without_year = re.sub(r'\s*\([^)]*\)\s*$', '', clean_text).strip()
-
-        # Magnitude multipliers
-        magnitudes = {
-            'trillion': 1_000_000_000_000,
-            'billion': 1_000_000_000,
-            'million': 1_000_000,
-            'thousand': 1_000,
-        }
-
-        multiplier = 1
-        magnitude_found = None
-        working_text = text_without_year.lower()
-
-        for mag, mult in magnitudes.items():
-            if mag in working_text:
-                multiplier = mult
-                magnitude_found = mag
-                break
-
-        result['magnitude'] = magnitude_found
-
-        # Extract numeric value - handle patterns like "4.941" or "20,879" or "94"
-        # Also handle currency: "$3.052 trillion" or "-$818.822 billion"
-        num_match = re.search(r'^[\s]*(-?\$?-?\d+(?:,\d{3})*(?:\.\d+)?)', text_without_year)
-        if num_match:
-            raw_value_str = num_match.group(1).replace(',', '').replace('$', '')
-            raw_value = float(raw_value_str)
-            result['raw_value'] = raw_value
-            result['value'] = raw_value * multiplier
-
-            # Extract unit - everything after the number and magnitude
-            unit_text = text_without_year[num_match.end():].strip()
-
-            # Remove magnitude word from unit
-            if magnitude_found:
-                unit_text = re.sub(rf'\b{magnitude_found}\b', '', unit_text, flags=re.IGNORECASE).strip()
-
-            # Clean up unit
-            unit_text = re.sub(r'^[\s,]+', '', unit_text)  # Remove leading comma/space
-            unit_text = re.sub(r'[\s,]+$', '', unit_text)  # Remove trailing comma/space
-
-            if unit_text:
-                result['unit'] = unit_text
-
-        # Handle percentage values
-        if result['value'] is None:
-            pct_match = re.search(r'(\d+(?:\.\d+)?)\s*%', clean_text)
-            if pct_match:
-                result['raw_value'] = float(pct_match.group(1))
-                result['value'] = result['raw_value']
-                result['unit'] = '%'
-
-    except Exception as e:
-        logging.error(f"Error parsing economy value '{text}': {e}")
-
-    return result
+    # Shared memoized engine; see c_00_transform_utils/parse_quantity.py
+    return parse_quantity(text, 'economy')
 
 
 def extract_energy_field(data: dict, field_key: str, output_prefix: str) -> Dict[str, Any]:
@@ -9,7 +9,7 @@ logging.basicConfig(level='WARNING',
 logger = logging.getLogger(__name__)
 
 
-def parse_exports_partners(iso3Code: str, return_original: bool = False)-> dict:
+def parse_exports_partners(iso3Code: str, return_original: bool = False, pass_data: dict = None)-> dict:
     """
     Parse exports partners data from CIA World Factbook for a given country.
 
@@ -20,6 +20,7 @@ def parse_exports_partners(iso3Code: str, return_original: bool = False)-> dict:
 
     Args:
         iso3Code: ISO 3166-1 alpha-3 country code (e.g., 'USA', 'CHN', 'WLD')
+        pass_data: Already-extracted raw subtree; skips reloading the country file
 
     Returns:
         Dictionary with structured exports partners data:
@@ -42,16 +43,17 @@ def parse_exports_partners(iso3Code: str, return_original: bool = False)-> dict:
     """
     result = {}
 
-    # Load raw country data
-    try:
-        raw_data = load_country_data(iso3Code)
-    except Exception as e:
-        logger.error(f"Failed to load data for {iso3Code}: {e}")
-        return result
+    # Load raw country data, unless the caller already extracted the subtree
+    if pass_data is None:
+        try:
+            raw_data = load_country_data(iso3Code)
+        except Exception as e:
+            logger.error(f"Failed to load data for {iso3Code}: {e}")
+            return result
 
-    # Navigate to Economy -> Exports - partners
-    economy_section = raw_data.get('Economy', {})
-    pass_data = economy_section.get('Exports - partners', {})
+        # Navigate to Economy -> Exports - partners
+        economy_section = raw_data.get('Economy', {})
+        pass_data = economy_section.get('Exports - partners', {})
 
     if return_original:
         return pass_data
@@ -15,17 +15,19 @@ KEY_MAPPING = {
     "investment in inventories": "gdp_investment_inventories"
 }
 
-def parse_gdp_composition_by_end_use(iso3Code: str, return_original: bool = False)-> dict:
+def parse_gdp_composition_by_end_use(iso3Code: str, return_original: bool = False, pass_data: dict = None)-> dict:
     """Parse GDP composition by end use data from CIA World Factbook for a given country."""
     result = {}
-    try:
-        raw_data = load_country_data(iso3Code)
-    except Exception as e:
-        logger.error(f"Failed to load data for {iso3Code}: {e}")
-        return result
-    
-    economy_section = raw_data.get('Economy', {})
-    pass_data = economy_section.get('GDP - composition, by end use', {})
+    # Load raw country data, unless the caller already extracted the subtree
+    if pass_data is None:
+        try:
+            raw_data = load_country_data(iso3Code)
+        except Exception as e:
+            logger.error(f"Failed to load data for {iso3Code}: {e}")
+            return result
+
+        economy_section = raw_data.get('Economy', {})
+        pass_data = economy_section.get('GDP - composition, by end use', {})
 
     if return_original:
         return pass_data
@@ -8,17 +8,19 @@ logger = logging.getLogger(__name__)
 
 KEY_MAPPING = {"agriculture": "gdp_agriculture", "industry": "gdp_industry", "services": "gdp_services"}
 
-def parse_gdp_composition_sector_of_origin(iso3Code: str, return_original: bool = False)-> dict:
+def parse_gdp_composition_sector_of_origin(iso3Code: str, return_original: bool = False, pass_data: dict = None)-> dict:
     """Parse GDP composition by sector of origin data from CIA World Factbook."""
     result = {}
-    try:
-        raw_data = load_country_data(iso3Code)
-    except Exception as e:
-        logger.error(f"Failed to load data for {iso3Code}: {e}")
-        return result
-    
-    economy_section = raw_data.get('Economy', {})
-    pass_data = economy_section.get('GDP - composition, by sector of origin', {})
+    # Load raw country data, unless the caller already extracted the subtree
+    if pass_data is None:
+        try:
+            raw_data = load_country_data(iso3Code)
+        except Exception as e:
+            logger.error(f"Failed to load data for {iso3Code}: {e}")
+            return result
+
+        economy_section = raw_data.get('Economy', {})
+        pass_data = economy_section.get('GDP - composition, by sector of origin', {})
 
     if return_original:
         return pass_data
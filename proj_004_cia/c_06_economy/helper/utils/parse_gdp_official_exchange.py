@@ -1,6 +1,6 @@
-import re
 import logging
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.year_series import extract_year_series
 from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
 
 # Configure logging
@@ -9,7 +9,7 @@ logging.basicConfig(level='WARNING',
 logger = logging.getLogger(__name__)
 
 
-def parse_gdp_official_exchange(iso3Code: str, return_original: bool = False)-> dict:
+def parse_gdp_official_exchange(iso3Code: str, return_original: bool = False, pass_data: dict = None)-> dict:
     """
     Parse GDP (official exchange rate) data from CIA World Factbook for a given country.
 
@@ -20,6 +20,7 @@ def parse_gdp_official_exchange(iso3Code: str, return_original: bool = False)->
 
     Args:
         iso3Code: ISO 3166-1 alpha-3 country code (e.g., 'USA', 'CHN', 'WLD')
+        pass_data: Already-extracted raw subtree; skips reloading the country file
 
     Returns:
         Dictionary with structured GDP official exchange data:
@@ -42,16 +43,17 @@ def parse_gdp_official_exchange(iso3Code: str, return_original: bool = False)->
     """
     result = {}
 
-    # Load raw country data
-    try:
-        raw_data = load_country_data(iso3Code)
-    except Exception as e:
-        logger.error(f"Failed to load data for {iso3Code}: {e}")
-        return result
+    # Load raw country data, unless the caller already extracted the subtree
+    if pass_data is None:
+        try:
+            raw_data = load_country_data(iso3Code)
+        except Exception as e:
+            logger.error(f"Failed to load data for {iso3Code}: {e}")
+            return result
 
-    # Navigate to Economy -> GDP (official exchange rate)
-    economy_section = raw_data.get('Economy', {})
-    pass_data = economy_section.get('GDP (official exchange rate)', {})
+        # Navigate to Economy -> GDP (official exchange rate)
+        economy_section = raw_data.get('Economy', {})
+        pass_data = economy_section.get('GDP (official exchange rate)', {})
 
     if return_original:
         return pass_data
@@ -61,17 +63,10 @@ def parse_gdp_official_exchange(iso3Code: str, return_original: bool = False)->
         return result
 
     try:
-        yearly_data = []
-        for k, v in pass_data.items():
-            if isinstance(v, dict) and 'text' in v:
-                year_match = re.search(r'(\d{4})', k)
-                if year_match:
-                    year = int(year_match.group(1))
-                    text = v.get('text', '')
-                    if text:
-                        yearly_data.append({'year': year, 'value': clean_text(text)})
-        if yearly_data:
-            yearly_data.sort(key=lambda x: x['year'], reverse=True)
+        # "<Metric> <Year>" entries; the text is kept as the value
+        series = extract_year_series(pass_data, profile=None)
+        if series:
+            yearly_data = [{'year': year, 'value': clean_text(text)} for year, text in zip(series.years, series.texts)]
             result['gdp_official_exchange_data'] = yearly_data
             result['gdp_official_exchange_latest'] = yearly_data[0]['value']
             result['gdp_official_exchange_latest_year'] = yearly_data[0]['year']
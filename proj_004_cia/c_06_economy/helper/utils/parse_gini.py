@@ -1,7 +1,6 @@
-import re
 import logging
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
-from proj_004_cia.c_06_economy.helper.utils.parse_econ_value import parse_econ_value
+from proj_004_cia.c_00_transform_utils.year_series import extract_year_series
 from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
 
 # Configure logging
@@ -10,7 +9,7 @@ logging.basicConfig(level='WARNING',
 logger = logging.getLogger(__name__)
 
 
-def parse_gini(iso3Code: str, return_original: bool = False)-> dict:
+def parse_gini(iso3Code: str, return_original: bool = False, pass_data: dict = None)-> dict:
     """
     Parse Gini Index data from CIA World Factbook for a given country.
 
@@ -22,6 +21,7 @@ def parse_gini(iso3Code: str, return_original: bool = False)-> dict:
 
     Args:
         iso3Code: ISO 3166-1 alpha-3 country code (e.g., 'USA', 'CHN', 'WLD')
+        pass_data: Already-extracted raw subtree; skips reloading the country file
 
     Returns:
         Dictionary with structured Gini Index data:
@@ -43,16 +43,17 @@ def parse_gini(iso3Code: str, return_original: bool = False)-> dict:
     """
     result = {}
 
-    # Load raw country data
-    try:
-        raw_data = load_country_data(iso3Code)
-    except Exception as e:
-        logger.error(f"Failed to load data for {iso3Code}: {e}")
-        return result
+    # Load raw country data, unless the caller already extracted the subtree
+    if pass_data is None:
+        try:
+            raw_data = load_country_data(iso3Code)
+        except Exception as e:
+            logger.error(f"Failed to load data for {iso3Code}: {e}")
+            return result
 
-    # Navigate to Economy -> Gini Index coefficient
-    economy_section = raw_data.get('Economy', {})
-    pass_data = economy_section.get('Gini Index coefficient - distribution of family income', {})
+        # Navigate to Economy -> Gini Index coefficient
+        economy_section = raw_data.get('Economy', {})
+        pass_data = economy_section.get('Gini Index coefficient - distribution of family income', {})
 
     if return_original:
         return pass_data
@@ -62,31 +63,11 @@ def parse_gini(iso3Code: str, return_original: bool = False)-> dict:
         return result
 
     try:
-        yearly_data = []
-        for k, v in pass_data.items():
-            if k == 'note':
-                if isinstance(v, str) and v.strip():
-                    result['gini_note'] = clean_text(v)
-                continue
-            if isinstance(v, dict) and 'text' in v:
-                year_match = re.search(r'(\d{4})', k)
-                if year_match:
-                    year = int(year_match.group(1))
-                    text = v.get('text', '')
-                    if text:
-                        parsed = parse_econ_value(text)
-                        entry = {'year': year}
-                        if parsed['value'] is not None:
-                            entry['value'] = parsed['value']
-                        if parsed['is_estimate']:
-                            entry['is_estimate'] = parsed['is_estimate']
-                        yearly_data.append(entry)
-        if yearly_data:
-            yearly_data.sort(key=lambda x: x['year'], reverse=True)
-            result['gini_data'] = yearly_data
-            if yearly_data[0].get('value') is not None:
-                result['gini_latest_value'] = yearly_data[0]['value']
-            result['gini_latest_year'] = yearly_data[0]['year']
+        note = pass_data.get('note')
+        if isinstance(note, str) and note.strip():
+            result['gini_note'] = clean_text(note)
+        # "<Metric> <Year>" entries -> gini_data / _latest_value / _latest_year
+        result.update(extract_year_series(pass_data).to_fields('gini', include_unit=False))
     except Exception as e:
         logger.error(f"Error parsing gini for {iso3Code}: {e}")
 
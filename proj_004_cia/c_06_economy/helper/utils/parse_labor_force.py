@@ -10,7 +10,7 @@ logging.basicConfig(level='WARNING',
 logger = logging.getLogger(__name__)
 
 
-def parse_labor_force(iso3Code: str, return_original: bool = False)-> dict:
+def parse_labor_force(iso3Code: str, return_original: bool = False, pass_data: dict = None)-> dict:
     """
     Parse labor force data from CIA World Factbook for a given country.
 
@@ -22,6 +22,7 @@ def parse_labor_force(iso3Code: str, return_original: bool = False)-> dict:
 
     Args:
         iso3Code: ISO 3166-1 alpha-3 country code (e.g., 'USA', 'CHN', 'WLD')
+        pass_data: Already-extracted raw subtree; skips reloading the country file
 
     Returns:
         Dictionary with structured labor force data:
@@ -44,16 +45,17 @@ def parse_labor_force(iso3Code: str, return_original: bool = False)-> dict:
     """
     result = {}
 
-    # Load raw country data
-    try:
-        raw_data = load_country_data(iso3Code)
-    except Exception as e:
-        logger.error(f"Failed to load data for {iso3Code}: {e}")
-        return result
+    # Load raw country data, unless the caller already extracted the subtree
+    if pass_data is None:
+        try:
+            raw_data = load_country_data(iso3Code)
+        except Exception as e:
+            logger.error(f"Failed to load data for {iso3Code}: {e}")
+            return result
 
-    # Navigate to Economy -> Labor force
-    economy_section = raw_data.get('Economy', {})
-    pass_data = economy_section.get('Labor force', {})
+        # Navigate to Economy -> Labor force
+        economy_section = raw_data.get('Economy', {})
+        pass_data = economy_section.get('Labor force', {})
 
     if return_original:
         return pass_data
@@ -10,7 +10,7 @@ logging.basicConfig(level='WARNING',
 logger = logging.getLogger(__name__)
 
 
-def parse_labor_force_by_occupation(iso3Code: str, return_original: bool = False)-> Dict[str, Any]:
+def parse_labor_force_by_occupation(iso3Code: str, return_original: bool = False, pass_data: dict = None)-> Dict[str, Any]:
     """
     Parse labor force by occupation data from CIA World Factbook for a given country.
 
@@ -20,6 +20,7 @@ def parse_labor_force_by_occupation(iso3Code: str, return_original: bool = False
 
     Args:
         iso3Code: ISO 3166-1 alpha-3 country code (e.g., 'USA', 'CHN', 'WLD')
+        pass_data: Already-extracted raw subtree; skips reloading the country file
 
     Returns:
         Dictionary with structured labor force occupation data:
@@ -41,16 +42,17 @@ def parse_labor_force_by_occupation(iso3Code: str, return_original: bool = False
     """
     result = {}
 
-    # Load raw country data
-    try:
-        raw_data = load_country_data(iso3Code)
-    except Exception as e:
-        logger.error(f"Failed to load data for {iso3Code}: {e}")
-        return result
+    # Load raw country data, unless the caller already extracted the subtree
+    if pass_data is None:
+        try:
+            raw_data = load_country_data(iso3Code)
+        except Exception as e:
+            logger.error(f"Failed to load data for {iso3Code}: {e}")
+            return result
 
-    # Navigate to Economy -> Labor force - by occupation
-    economy_section = raw_data.get('Economy', {})
-    pass_data = economy_section.get('Labor force - by occupation', {})
+        # Navigate to Economy -> Labor force - by occupation
+        economy_section = raw_data.get('Economy', {})
+        pass_data = economy_section.get('Labor force - by occupation', {})
 
     if return_original:
         return pass_data
@@ -1,7 +1,6 @@
-import re
 import logging
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
-from proj_004_cia.c_06_economy.helper.utils.parse_econ_value import parse_econ_value
+from proj_004_cia.c_00_transform_utils.year_series import extract_year_series
 from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
 
 # Configure logging
@@ -10,7 +9,7 @@ logging.basicConfig(level='WARNING',
 logger = logging.getLogger(__name__)
 
 
-def parse_real_gdp_growth_rate(iso3Code: str, return_original: bool = False)-> dict:
+def parse_real_gdp_growth_rate(iso3Code: str, return_original: bool = False, pass_data: dict = None)-> dict:
     """
     Parse real GDP growth rate data from CIA World Factbook for a given country.
 
@@ -22,6 +21,7 @@ def parse_real_gdp_growth_rate(iso3Code: str, return_original: bool = False)-> d
 
     Args:
         iso3Code: ISO 3166-1 alpha-3 country code (e.g., 'USA', 'CHN', 'WLD')
+        pass_data: Already-extracted raw subtree; skips reloading the country file
 
     Returns:
         Dictionary with structured GDP growth rate data:
@@ -44,16 +44,17 @@ def parse_real_gdp_growth_rate(iso3Code: str, return_original: bool = False)-> d
     """
     result = {}
 
-    # Load raw country data
-    try:
-        raw_data = load_country_data(iso3Code)
-    except Exception as e:
-        logger.error(f"Failed to load data for {iso3Code}: {e}")
-        return result
+    # Load raw country data, unless the caller already extracted the subtree
+    if pass_data is None:
+        try:
+            raw_data = load_country_data(iso3Code)
+        except Exception as e:
+            logger.error(f"Failed to load data for {iso3Code}: {e}")
+            return result
 
-    # Navigate to Economy -> Real GDP growth rate
-    economy_section = raw_data.get('Economy', {})
-    pass_data = economy_section.get('Real GDP growth rate', {})
+        # Navigate to Economy -> Real GDP growth rate
+        economy_section = raw_data.get('Economy', {})
+        pass_data = economy_section.get('Real GDP growth rate', {})
 
     if return_original:
         return pass_data
@@ -63,35 +64,11 @@ def parse_real_gdp_growth_rate(iso3Code: str, return_original: bool = False)-> d
         return result
 
     try:
-        yearly_data = []
-        for k, v in pass_data.items():
-            if k == 'note':
-                if isinstance(v, str) and v.strip():
-                    result['gdp_growth_note'] = clean_text(v)
-                continue
-            if isinstance(v, dict) and 'text' in v:
-                year_match = re.search(r'(\d{4})', k)
-                if year_match:
-                    year = int(year_match.group(1))
-                    text = v.get('text', '')
-                    if text:
-                        parsed = parse_econ_value(text)
-                        entry = {'year': year}
-                        if parsed['value'] is not None:
-                            entry['value'] = parsed['value']
-                        if parsed['unit']:
-                            entry['unit'] = parsed['unit']
-                        if parsed['is_estimate']:
-                            entry['is_estimate'] = parsed['is_estimate']
-                        yearly_data.append(entry)
-        if yearly_data:
-            yearly_data.sort(key=lambda x: x['year'], reverse=True)
-            result['gdp_growth_data'] = yearly_data
-            if yearly_data[0].get('value') is not None:
-                result['gdp_growth_latest_value'] = yearly_data[0]['value']
-            result['gdp_growth_latest_year'] = yearly_data[0]['year']
-            if yearly_data[0].get('unit'):
-                result['gdp_growth_unit'] = yearly_data[0]['unit']
+        note = pass_data.get('note')
+        if isinstance(note, str) and note.strip():
+            result['gdp_growth_note'] = clean_text(note)
+        # "<Metric> <Year>" entries -> gdp_growth_data / _latest_value / _latest_year / _unit
+        result.update(extract_year_series(pass_data).to_fields('gdp_growth'))
     except Exception as e:
         logger.error(f"Error parsing real_gdp_growth_rate for {iso3Code}: {e}")
 
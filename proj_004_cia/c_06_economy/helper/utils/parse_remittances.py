@@ -2,6 +2,7 @@ import re
 import logging
 from typing import Dict, Any
 from proj_004_cia.c_00_transform_utils.clean_text import clean_text
+from proj_004_cia.c_00_transform_utils.year_series import extract_year_series
 from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
 
 # Configure logging
@@ -9,8 +10,10 @@ logging.basicConfig(level='WARNING',
                     format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_PERCENT_OF_GDP_RE = re.compile(r"([\d.]+)% of GDP \((\d{4})")
 
-def parse_remittances(iso3Code: str, return_original: bool = False)-> Dict[str, Any]:
+
+def parse_remittances(iso3Code: str, return_original: bool = False, pass_data: dict = None)-> Dict[str, Any]:
     """
     Parse remittances data from CIA World Factbook for a given country.
 
@@ -21,6 +24,7 @@ def parse_remittances(iso3Code: str, return_original: bool = False)-> Dict[str,
 
     Args:
         iso3Code: ISO 3166-1 alpha-3 country code (e.g., 'USA', 'CHN', 'WLD')
+        pass_data: Already-extracted raw subtree; skips reloading the country file
 
     Returns:
         Dictionary with structured remittances data:
@@ -42,16 +46,17 @@ def parse_remittances(iso3Code: str, return_original: bool = False)-> Dict[str,
     """
     result = {}
 
-    # Load raw country data
-    try:
-        raw_data = load_country_data(iso3Code)
-    except Exception as e:
-        logger.error(f"Failed to load data for {iso3Code}: {e}")
-        return result
+    # Load raw country data, unless the caller already extracted the subtree
+    if pass_data is None:
+        try:
+            raw_data = load_country_data(iso3Code)
+        except Exception as e:
+            logger.error(f"Failed to load data for {iso3Code}: {e}")
+            return result
 
-    # Navigate to Economy -> Remittances
-    economy_section = raw_data.get('Economy', {})
-    pass_data = economy_section.get('Remittances', {})
+        # Navigate to Economy -> Remittances
+        economy_section = raw_data.get('Economy', {})
+        pass_data = economy_section.get('Remittances', {})
 
     if return_original:
         return pass_data
@@ -61,35 +66,23 @@ def parse_remittances(iso3Code: str, return_original: bool = False)-> Dict[str,
         return result
 
     try:
+        if "note" in pass_data:
+            result["remittances_note"] = clean_text(pass_data["note"])
+
+        # "<Metric> <Year>" entries, each text like "3.4% of GDP (2023 est.)"
+        series = extract_year_series(pass_data, profile=None)
         yearly_data = []
-        for key, value in pass_data.items():
-            if key == "note":
-                # Process 'note' field
-                result["remittances_note"] = clean_text(value)
-                continue
-
-            # Extract the year from the key
-            year_match = re.search(r'\d{4}', key)
-            if not year_match:
-                logger.warning(f"No year found in key: {key}")
-                continue
-
-            year = int(year_match.group(0))
-
-            # Process 'text' field for percentage and year
-            text = value.get("text", "")
-            match = re.match(r"([\d.]+)% of GDP \((\d{4})", text)
+        for year, text in zip(series.years, series.texts):
+            match = _PERCENT_OF_GDP_RE.match(text)
             if match:
-                percentage = float(match.group(1))
                 yearly_data.append({
                     "year": year,
-                    "percentage_of_gdp": percentage
+                    "percentage_of_gdp": float(match.group(1))
                 })
             else:
                 logger.warning(f"Unexpected format in 'text' data: {text}")
 
         if yearly_data:
-            yearly_data.sort(key=lambda x: x['year'], reverse=True)
             result['remittances_data'] = yearly_data
             result['remittances_latest_value'] = yearly_data[0]['percentage_of_gdp']
             result['remittances_latest_year'] = yearly_data[0]['year']
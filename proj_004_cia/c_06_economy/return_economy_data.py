@@ -12,8 +12,9 @@
 import json
 import os
 # get_economy ------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_06_economy.helper.get_economy import get_economy
+from proj_004_cia.c_06_economy.helper.get_economy import ECONOMY_REGISTRY
 from proj_004_cia.c_00_transform_utils.clean_output import clean_output
+from proj_004_cia.c_00_transform_utils.compact_records import apply_representation
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 #   CORE FUNCTION
 # --------------------------------------------------------------------------------------------------------------------
@@ -21,109 +22,21 @@ from proj_004_cia.c_00_transform_utils.clean_output import clean_output
 
 def return_economy_data(
     data: dict,
-    iso3Code: str
+    iso3Code: str,
+    fields=None,
+    representation: str = 'dict'
 ):
 
     # 6. ECONOMY
     # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
     # --------------------------------------------------------------------------------------------------------------------------
+    # WORLD-SPECIFIC: WLD gets only 'world_economy'; every other country gets the per-field pack.
+    # See ECONOMY_REGISTRY in get_economy for the field list and order.
     # --------------------------------------------------------------------------------------------------------------------------
-    # Initialize the dictionary to hold geography data
-    cia_pack = {}
+    cia_pack = ECONOMY_REGISTRY.parse_section(data, iso3Code, fields=fields)
 
-    # WORLD-SPECIFIC: Use comprehensive World parser
-    if iso3Code == 'WLD':
-        cia_pack['world_economy'] = get_economy(
-            data=data, info='world_economy', iso3Code=iso3Code)
-        return clean_output(cia_pack)
-
-    # Note: 'agricultural_products'
-    cia_pack['agricultural_products'] = get_economy(
-        data=data, info='agricultural_products', iso3Code=iso3Code)
-    # Note: 'argicultural_products_2'
-    cia_pack['argicultural_products_2'] = get_economy(
-        data=data, info='argicultural_products_2', iso3Code=iso3Code)
-    # Note: 'average_household_exp'
-    cia_pack['average_household_exp'] = get_economy(
-        data=data, info='average_household_exp', iso3Code=iso3Code)
-    # Note: 'budget'
-    cia_pack['budget'] = get_economy(
-        data=data, info='budget', iso3Code=iso3Code)
-    # Note: 'budget_surplus_deficit'
-    cia_pack['budget_surplus_deficit'] = get_economy(
-        data=data, info='budget_surplus_deficit', iso3Code=iso3Code)
-    # Note: 'credit_ratings'
-    cia_pack['credit_ratings'] = get_economy(
-        data=data, info='credit_ratings', iso3Code=iso3Code)
-    # Note: 'current_account_balance'
-    cia_pack['current_account_balance'] = get_economy(
-        data=data, info='current_account_balance', iso3Code=iso3Code)
-    # Note: 'debt_external'
-    cia_pack['debt_external'] = get_economy(
-        data=data, info='debt_external', iso3Code=iso3Code)
-    # Note: 'economic_overview'
-    cia_pack['economic_overview'] = get_economy(
-        data=data, info='economic_overview', iso3Code=iso3Code)
-    # Note: 'exports'
-    cia_pack['exports'] = get_economy(
-        data=data, info='exports', iso3Code=iso3Code)
-    # Note: 'exports_commodities'
-    cia_pack['exports_commodities'] = get_economy(
-        data=data, info='exports_commodities', iso3Code=iso3Code)
-    # Note: 'exports_partners'
-    cia_pack['exports_partners'] = get_economy(
-        data=data, info='exports_partners', iso3Code=iso3Code)
-    # Note: 'gdp_composition_by_end_use'
-    cia_pack['gdp_composition_by_end_use'] = get_economy(
-        data=data, info='gdp_composition_by_end_use', iso3Code=iso3Code)
-    # Note: 'gdp_composition_sector_of_origin'
-    cia_pack['gdp_composition_sector_of_origin'] = get_economy(
-        data=data, info='gdp_composition_sector_of_origin', iso3Code=iso3Code)
-    # Note: 'gini'
-    cia_pack['gini'] = get_economy(
-        data=data, info='gini', iso3Code=iso3Code)
-    # Note: 'household_income'
-    cia_pack['household_income'] = get_economy(
-        data=data, info='household_income', iso3Code=iso3Code)
-    # Note: 'imports'
-    cia_pack['imports'] = get_economy(
-        data=data, info='imports', iso3Code=iso3Code)
-    # Note: 'imports_commodities'
-    cia_pack['imports_commodities'] = get_economy(
-        data=data, info='imports_commodities', iso3Code=iso3Code)
-    # Note: 'imports_partners'
-    cia_pack['imports_partners'] = get_economy(
-        data=data, info='imports_partners', iso3Code=iso3Code)
-    # Note: 'industrial_production'
-    cia_pack['industrial_production'] = get_economy(
-        data=data, info='industrial_production', iso3Code=iso3Code)
-    # Note: 'industries'
-    cia_pack['industries'] = get_economy(
-        data=data, info='industries', iso3Code=iso3Code)
-    # Note: 'inflation_rate'
-    cia_pack['inflation_rate'] = get_economy(
-        data=data, info='inflation_rate', iso3Code=iso3Code)
-    # Note: 'labor_force_by_occupation'
-    cia_pack['labor_force_by_occupation'] = get_economy(
-        data=data, info='labor_force_by_occupation', iso3Code=iso3Code)
-    # Note: 'public_debt'
-    cia_pack['public_debt'] = get_economy(
-        data=data, info='public_debt', iso3Code=iso3Code)
-    # Note: 'remittances'
-    cia_pack['remittances'] = get_economy(
-        data=data, info='remittances', iso3Code=iso3Code)
-    # Note: 'reserves_of_foreign_exchange_and_gold'
-    cia_pack['reserves_of_foreign_exchange_and_gold'] = get_economy(
-        data=data, info='reserves_of_foreign_exchange_and_gold', iso3Code=iso3Code)
-    # Note: 'unemployment_rate'
-    cia_pack['unemployment_rate'] = get_economy(
-        data=data, info='unemployment_rate', iso3Code=iso3Code)
-    # Note: 'youth_unemployment_rate'
-    cia_pack['youth_unemployment_rate'] = get_economy(
-        data=data, info='youth_unemployment_rate', iso3Code=iso3Code)
-
-    # Return the compiled geography data
-    return clean_output(cia_pack)
+    # Return the compiled economy data
+    return apply_representation(clean_output(cia_pack), representation)
 
 
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
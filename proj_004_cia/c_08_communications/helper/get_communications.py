@@ -5,46 +5,49 @@ import os
 import re
 import json
 import logging
+# ---------------------------------------------------------------------------------------------------------------------
+from proj_004_cia.c_00_transform_utils.parser_registry import (
+    LazyParser, ParserRegistry, ParserSpec, COUNTRY, WORLD, ISO3)
 # --------------------------------------------------------------------------------------------------
 # NOTE: "Broadband - fixed subscriptions"
 # >>> ['broadband_note', 'broadband_subs_per_100', 'broadband_total']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_08_communications.helper.utils.parse_broadband_fixed import parse_broadband_fixed
+parse_broadband_fixed = LazyParser('proj_004_cia.c_08_communications.helper.utils.parse_broadband_fixed')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Broadcast media"
 # >>> ['broadcast_media]
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_08_communications.helper.utils.parse_broadband_media import parse_broadband_media
+parse_broadband_media = LazyParser('proj_004_cia.c_08_communications.helper.utils.parse_broadband_media')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Communications - note"
 # >>> ['communications_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_08_communications.helper.utils.parse_communications_note import parse_communications_note
+parse_communications_note = LazyParser('proj_004_cia.c_08_communications.helper.utils.parse_communications_note')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Internet country code"
 # >>> ['internet_country_code', 'internet_country_code_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_08_communications.helper.utils.parse_internet_code import parse_internet_code
+parse_internet_code = LazyParser('proj_004_cia.c_08_communications.helper.utils.parse_internet_code')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Internet users"
 # >>> ['internet_users_note', 'internet_users_percent', 'internet_users_total']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_08_communications.helper.utils.parse_internet_users import parse_internet_users
+parse_internet_users = LazyParser('proj_004_cia.c_08_communications.helper.utils.parse_internet_users')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Telecommunication systems"
 # >>> ['telecom_domestic', 'telecom_general_assessment', 'telecom_international', 'telecom_note', 'telecom_overseas_departments']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_08_communications.helper.utils.parse_tele_systems import parse_tele_systems
+parse_tele_systems = LazyParser('proj_004_cia.c_08_communications.helper.utils.parse_tele_systems')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Telephones - fixed lines"
 # >>> ['fixed_phone_note', 'fixed_phone_subs_per_100', 'fixed_phone_total_subs']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_08_communications.helper.utils.parse_phone_fixed_lines import parse_phone_fixed_lines
+parse_phone_fixed_lines = LazyParser('proj_004_cia.c_08_communications.helper.utils.parse_phone_fixed_lines')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Telephones - mobile cellular"
 # >>> ['mobile_phone_note', 'mobile_phone_subs_per_100', 'mobile_phone_total_subs']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_08_communications.helper.utils.parse_phone_mobile_cellular import parse_phone_mobile_cellular
+parse_phone_mobile_cellular = LazyParser('proj_004_cia.c_08_communications.helper.utils.parse_phone_mobile_cellular')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # -------------------------------------------------------------------------------------------------
 # #////////////////////////////////////////////////////////////////////////////////////////////////
@@ -52,121 +55,51 @@ from proj_004_cia.c_08_communications.helper.utils.parse_phone_mobile_cellular i
 # //////////////////////////////////////////////////////////////////////////////////////////////////
 
 
-from proj_004_cia.c_08_communications.helper.utils.parse_communications_world import parse_communications_world
-
+parse_communications_world = LazyParser('proj_004_cia.c_08_communications.helper.utils.parse_communications_world')
 
-def get_communications(data=None, info=None, iso3Code=None):
-
-    # 0
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: COMMUNICATIONS DATA
-    # --------------------------------------------------------------------------------------------------
-    comms_data = data.get("Communications", {})
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-
-    # WORLD-SPECIFIC: Return comprehensive World communications data
-    if info == 'world_communications' and iso3Code == 'WLD':
-        return parse_communications_world(iso3Code)
-
-    # 1
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 1 >>> 'Broadband - fixed subscriptions'
-    # --------------------------------------------------------------------------------------------------
-    broadband_fixed_subscriptions_data = comms_data.get(
-        "Broadband - fixed subscriptions", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'broadband_fixed':
-        return parse_broadband_fixed(iso3Code)
 
-    # 2
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 2 >>> 'Broadcast media'
-    # --------------------------------------------------------------------------------------------------
-    broadcast_media_data = comms_data.get("Broadcast media", {})
-    # --------------------------------------------------------------------------------------------------
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'broadband_media':
-        return parse_broadband_media(iso3Code)
-
-    # 3
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 3 >>> 'Communications - note'
-    # --------------------------------------------------------------------------------------------------
-    communications_note_data = comms_data.get("Communications - note", {})
-    # --------------------------------------------------------------------------------------------------
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'communications_note':
-        return parse_communications_note(iso3Code)
-
-    # 4
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 4 >>> 'Internet country code'
-    # --------------------------------------------------------------------------------------------------
-    internet_country_code_data = comms_data.get("Internet country code", {})
-    # --------------------------------------------------------------------------------------------------
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'internet_code':
-        return parse_internet_code(iso3Code)
-
-    # 5
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 5 >>> 'Internet users'
-    # --------------------------------------------------------------------------------------------------
-    internet_users_data = comms_data.get("Internet users", {})
-    # --------------------------------------------------------------------------------------------------
-    # "note" - 'internet_users_note'
-    # "percent of population" - 'internet_users_percent'
-    # "total" - 'internet_users_total'
-    # --------------------------------------------------------------------------------------------------
-    # ['internet_users_note', 'internet_users_percent', 'internet_users_total']
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'internet_users':
-        return parse_internet_users(iso3Code)
-
-    # 6
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 6 >>> 'Telecommunication systems'
-    # --------------------------------------------------------------------------------------------------
-    telecommunication_systems_data = comms_data.get(
-        "Telecommunication systems", {})
-    # --------------------------------------------------------------------------------------------------
-    # "domestic" - 'telecom_domestic'
-    # "general assessment" - 'telecom_general_assessment'
-    # "international" - 'telecom_international'
-    # "note" - 'telecom_note'
-    # "overseas departments" - 'telecom_overseas_departments'
-    # --------------------------------------------------------------------------------------------------
-    # ['telecom_domestic', 'telecom_general_assessment', 'telecom_international', 'telecom_note', 'telecom_overseas_departments']
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'tele_systems':
-        return parse_tele_systems(iso3Code)
+# //////////////////////////////////////////////////////////////////////////////////////////////////
+#   COMMUNICATIONS PARSER REGISTRY
+# --------------------------------------------------------------------------------------------------
+COMMUNICATIONS_REGISTRY = ParserRegistry(
+    section="Communications",
+    default_scope=COUNTRY,
+    specs=[
+        ParserSpec('world_communications', parse_communications_world,
+                   "Communications", convention=ISO3, scope=WORLD, strict_scope=True),
+        ParserSpec('broadband_fixed', parse_broadband_fixed,
+                   "Broadband - fixed subscriptions", convention=ISO3),
+        ParserSpec('broadband_media', parse_broadband_media,
+                   "Broadcast media", convention=ISO3),
+        ParserSpec('communications_note', parse_communications_note,
+                   "Communications - note", convention=ISO3),
+        ParserSpec('internet_code', parse_internet_code,
+                   "Internet country code", convention=ISO3),
+        ParserSpec('internet_users', parse_internet_users,
+                   "Internet users", convention=ISO3),
+        ParserSpec('tele_systems', parse_tele_systems,
+                   "Telecommunication systems", convention=ISO3),
+        ParserSpec('phone_fixed_lines', parse_phone_fixed_lines,
+                   "Telephones - fixed lines", convention=ISO3),
+        ParserSpec('phone_mobile_cellular', parse_phone_mobile_cellular,
+                   "Telephones - mobile cellular", convention=ISO3),
+    ]
+)
 
-    # 7
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 7 >>> 'Telephones - fixed lines'
-    # --------------------------------------------------------------------------------------------------
-    telephones_fixed_lines_data = comms_data.get(
-        "Telephones - fixed lines", {})
-    # --------------------------------------------------------------------------------------------------
-    # "note" - 'fixed_phone_note'
-    # "subscriptions per 100 inhabitants" - 'fixed_phone_subs_per_100'
-    # "total subscriptions" - 'fixed_phone_total_subs'
-    # --------------------------------------------------------------------------------------------------
-    # ['fixed_phone_note', 'fixed_phone_subs_per_100', 'fixed_phone_total_subs']
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'phone_fixed_lines':
-        return parse_phone_fixed_lines(iso3Code)
 
-    # 8
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 8 >>> 'Telephones - mobile cellular'
-    # --------------------------------------------------------------------------------------------------
-    telephones_mobile_cellular_data = comms_data.get(
-        "Telephones - mobile cellular", {})
-    # --------------------------------------------------------------------------------------------------
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'phone_mobile_cellular':
-        return parse_phone_mobile_cellular(iso3Code)
+def get_communications(data=None, info=None, iso3Code=None):
+    """
+    Parse a single Communications field through COMMUNICATIONS_REGISTRY.
+
+    Parameters:
+    - data: The dictionary containing the country's data.
+    - info: The output key to parse (e.g. 'internet_users', 'world_communications').
+    - iso3Code: The ISO3 code of the country.
+
+    Returns:
+    - The parsed field, or None if `info` is unknown or not available for `iso3Code`.
+    """
+    return COMMUNICATIONS_REGISTRY.dispatch(data, info, iso3Code)
 
 
 ######################################################################################################################
@@ -5,78 +5,81 @@ import os
 import re
 import json
 import logging
+# ---------------------------------------------------------------------------------------------------------------------
+from proj_004_cia.c_00_transform_utils.parser_registry import (
+    LazyParser, ParserRegistry, ParserSpec, COUNTRY, WORLD, ISO3)
 # --------------------------------------------------------------------------------------------------
 # NOTE: "Airports" - ['airports', 'airports_note']
 # >>> ['airports', 'airports_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_airports import parse_airports
+parse_airports = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_airports')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Airports - with paved runways"
 # >>> ['paved_runways_total', 'paved_runways_1_2']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_airports_paved import parse_airports_paved
+parse_airports_paved = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_airports_paved')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Airports - with unpaved runways"
 # >>>  ['unpaved_runways_total', 'unpaved_runways_0_1', 'unpaved_runways_1_2', 'unpaved_runways_under_914_m']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_airports_unpaved import parse_airports_unpaved
+parse_airports_unpaved = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_airports_unpaved')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Civil aircraft registration country code prefix"
 # >>> ['civil_reg_code']
-from proj_004_cia.c_09_transportation.helper.utils.parse_civil_reg_code import parse_civil_reg_code
+parse_civil_reg_code = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_civil_reg_code')
 # --------------------------------------------------------------------------------------------------
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Heliports"
 # >>> ['heliports']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_heliports import parse_heliports
+parse_heliports = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_heliports')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Merchant marine"
 # >>> ['merchant_marine_total', 'merchant_marine_by_type', 'merchant_marine_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_merchant_marine import parse_merchant_marine
+parse_merchant_marine = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_merchant_marine')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "National air transport system"
 # >>> [ 'annual_freight', 'annual_passenger', 'inventory_aircraft', 'num_reg_aircraft']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_air_system import parse_air_system
+parse_air_system = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_air_system')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Pipelines"
 # >>> ["pipelines"]
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_pipelines import parse_pipelines
+parse_pipelines = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_pipelines')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Ports"
 # >>> ['key_ports', 'large_ports', 'medium_ports', 'ports_with_oil_terminals',
 # 'ports_size_unknown', 'small_ports', 'total_ports', 'very_small_ports']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_ports import parse_ports
+parse_ports = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_ports')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Ports and terminals"
 # >>> ['major_seaports']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_ports_and_terminals import parse_ports_and_terminals
+parse_ports_and_terminals = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_ports_and_terminals')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Railways"
 # >>> ['railways_broad', 'railways_dual', 'railways_narrow', 'railways_note', 'railways_standard', 'railways_total']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_railways import parse_railways
+parse_railways = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_railways')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Roadways"
 # >>> ['turkish_roadways', 'non_urban_roadways', 'roadways_note', 'paved_roadways',
 # 'private_forest_roadways', 'total_roadways', 'unpaved_roadways', 'urban_roadways']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_roadways import parse_roadways
+parse_roadways = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_roadways')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Transportation - note"
 # >>> ['transportation_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_transportation_note import parse_transportation_note
+parse_transportation_note = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_transportation_note')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Waterways"
 # >>> ['waterways', 'waterways_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_09_transportation.helper.utils.parse_waterways import parse_waterways
+parse_waterways = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_waterways')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # -------------------------------------------------------------------------------------------------
 # #////////////////////////////////////////////////////////////////////////////////////////////////
@@ -84,165 +87,63 @@ from proj_004_cia.c_09_transportation.helper.utils.parse_waterways import parse_
 # //////////////////////////////////////////////////////////////////////////////////////////////////
 
 
-from proj_004_cia.c_09_transportation.helper.utils.parse_transportation_world import parse_transportation_world
-
-
-def get_transportation(data=None, info=None, iso3Code=None):
-
-    # 0
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: TRANSPORTATION DATA
-    # --------------------------------------------------------------------------------------------------
-    transport_data = data.get("Transportation", {})
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-
-    # WORLD-SPECIFIC: Return comprehensive World transportation data
-    if info == 'world_transportation' and iso3Code == 'WLD':
-        return parse_transportation_world(iso3Code)
-
-    # 1
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 1 >>> 'Airports'
-    # --------------------------------------------------------------------------------------------------
-    airports_data = transport_data.get("Airports", {})
-    # --------------------------------------------------------------------------------------------------
-    # ['airports', 'airports_note']
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'airports':
-        return parse_airports(iso3Code)
-
-    # 2
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 2 >>> 'Airports - with paved runways'
-    # --------------------------------------------------------------------------------------------------
-    airports_paved_data = transport_data.get(
-        "Airports - with paved runways", {})
-    # --------------------------------------------------------------------------------------------------
-    # ['paved_runways_total', 'paved_runways_1_2']
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'airports_paved':
-        return parse_airports_paved(iso3Code)
-
-    # 3
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 3 >>> 'Airports - with unpaved runways'
-    # --------------------------------------------------------------------------------------------------
-    airports_unpaved_data = transport_data.get(
-        "Airports - with unpaved runways", {})
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'airports_unpaved':
-        return parse_airports_unpaved(iso3Code)
-
-    # 4
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 4 >>> 'Civil aircraft registration country code prefix'
-    # --------------------------------------------------------------------------------------------------
-    civil_aircraft_code_prefix_data = transport_data.get(
-        "Civil aircraft registration country code prefix", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'civil_reg_code':
-        return parse_civil_reg_code(iso3Code)
-
-    # 5
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 5 >>> 'Heliports'
-    # --------------------------------------------------------------------------------------------------
-    heliports_data = transport_data.get("Heliports", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'heliports':
-        return parse_heliports(iso3Code)
-
-    # 6
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 6 >>> 'Merchant marine'
-    # --------------------------------------------------------------------------------------------------
-    merchant_marine_data = transport_data.get("Merchant marine", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'merchant_marine':
-        return parse_merchant_marine(iso3Code)
-
-    #####################################################################################################
-    #####################################################################################################
-
-    # 7
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 7 >>> 'National air transport system'
-    # --------------------------------------------------------------------------------------------------
-    national_air_transport_system_data = transport_data.get(
-        "National air transport system", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'air_system':
-        return parse_air_system(iso3Code)
-
-    # 8
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 8 >>> 'Pipelines'
-    # --------------------------------------------------------------------------------------------------
-    pipelines_data = transport_data.get("Pipelines", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'pipelines':
-        return parse_pipelines(iso3Code)
-
-    # 9
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 9 >>> 'Ports'
-    # --------------------------------------------------------------------------------------------------
-    ports_data = transport_data.get("Ports", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'ports':
-        return parse_ports(iso3Code)
+parse_transportation_world = LazyParser('proj_004_cia.c_09_transportation.helper.utils.parse_transportation_world')
 
-    # 10
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 10 >>> 'Ports and terminals'
-    # --------------------------------------------------------------------------------------------------
-    ports_terminals_data = transport_data.get("Ports and terminals", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'ports_and_terminals':
-        return parse_ports_and_terminals(iso3Code)
 
-    # 11
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 11 >>> 'Railways'
-    # --------------------------------------------------------------------------------------------------
-    railways_data = transport_data.get("Railways", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'railways':
-        return parse_railways(iso3Code)
-
-    # 12
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 12 >>> 'Roadways'
-    # --------------------------------------------------------------------------------------------------
-    roadways_data = transport_data.get("Roadways", {})
-    # --------------------------------------------------------------------------------------------------
-
-    if info == 'roadways':
-        return parse_roadways(iso3Code)
+# //////////////////////////////////////////////////////////////////////////////////////////////////
+#   TRANSPORTATION PARSER REGISTRY
+# --------------------------------------------------------------------------------------------------
+TRANSPORTATION_REGISTRY = ParserRegistry(
+    section="Transportation",
+    default_scope=COUNTRY,
+    specs=[
+        ParserSpec('world_transportation', parse_transportation_world,
+                   "Transportation", convention=ISO3, scope=WORLD, strict_scope=True),
+        ParserSpec('airports', parse_airports,
+                   "Airports", convention=ISO3),
+        ParserSpec('airports_paved', parse_airports_paved,
+                   "Airports - with paved runways", convention=ISO3),
+        ParserSpec('airports_unpaved', parse_airports_unpaved,
+                   "Airports - with unpaved runways", convention=ISO3),
+        ParserSpec('civil_reg_code', parse_civil_reg_code,
+                   "Civil aircraft registration country code prefix", convention=ISO3),
+        ParserSpec('heliports', parse_heliports,
+                   "Heliports", convention=ISO3),
+        ParserSpec('merchant_marine', parse_merchant_marine,
+                   "Merchant marine", convention=ISO3),
+        ParserSpec('air_system', parse_air_system,
+                   "National air transport system", convention=ISO3),
+        ParserSpec('pipelines', parse_pipelines,
+                   "Pipelines", convention=ISO3),
+        ParserSpec('ports', parse_ports,
+                   "Ports", convention=ISO3),
+        ParserSpec('ports_and_terminals', parse_ports_and_terminals,
+                   "Ports and terminals", convention=ISO3),
+        ParserSpec('railways', parse_railways,
+                   "Railways", convention=ISO3),
+        ParserSpec('roadways', parse_roadways,
+                   "Roadways", convention=ISO3),
+        ParserSpec('transportation_note', parse_transportation_note,
+                   "Transportation - note", convention=ISO3),
+        ParserSpec('waterways', parse_waterways,
+                   "Waterways", convention=ISO3),
+    ]
+)
 
-    # 13
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 13 >>> 'Transportation - note'
-    # --------------------------------------------------------------------------------------------------
-    transportation_note_data = transport_data.get("Transportation - note", {})
-    # --------------------------------------------------------------------------------------------------
-    # ['transportation_note']
-    if info == 'transportation_note':
-        return parse_transportation_note(iso3Code)
 
-    # 14
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 14 >>> 'Waterways'
-    # --------------------------------------------------------------------------------------------------
-    waterways_data = transport_data.get("Waterways", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'waterways':
-        return parse_waterways(iso3Code)
+def get_transportation(data=None, info=None, iso3Code=None):
+    """
+    Parse a single Transportation field through TRANSPORTATION_REGISTRY.
+
+    Parameters:
+    - data: The dictionary containing the country's data.
+    - info: The output key to parse (e.g. 'airports', 'world_transportation').
+    - iso3Code: The ISO3 code of the country.
+
+    Returns:
+    - The parsed field, or None if `info` is unknown or not available for `iso3Code`.
+    """
+    return TRANSPORTATION_REGISTRY.dispatch(data, info, iso3Code)
 
 
 ######################################################################################################################
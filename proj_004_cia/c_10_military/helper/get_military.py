@@ -6,135 +6,93 @@ import re
 import json
 import logging
 # ---------------------------------------------------------------------------------------------------------------------
+from proj_004_cia.c_00_transform_utils.parser_registry import (
+    LazyParser, ParserRegistry, ParserSpec, COUNTRY, WORLD, ISO3)
+# ---------------------------------------------------------------------------------------------------------------------
 # --------------------------------------------------------------------------------------------------
 # NOTE: "Military - note"
 # >>> ['mil_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_10_military.helper.utils.parse_military_note import parse_military_note
+parse_military_note = LazyParser('proj_004_cia.c_10_military.helper.utils.parse_military_note')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Military and security forces"
 # >>> ['mil_forces', 'mil_forces_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_10_military.helper.utils.parse_military_forces import parse_military_forces
+parse_military_forces = LazyParser('proj_004_cia.c_10_military.helper.utils.parse_military_forces')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Military and security service personnel strengths"
 # >>> ['mil_person', 'mil_person_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_10_military.helper.utils.parse_military_personnel import parse_military_personnel
+parse_military_personnel = LazyParser('proj_004_cia.c_10_military.helper.utils.parse_military_personnel')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Military deployments"
 # >>> ['mil_deploy', 'mil_deploy_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_10_military.helper.utils.parse_deployments import parse_deployments
+parse_deployments = LazyParser('proj_004_cia.c_10_military.helper.utils.parse_deployments')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Military equipment inventories and acquisitions"
 # >>> ['mil_equip', 'mil_equip_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_10_military.helper.utils.parse_military_inventories import parse_military_inventories
+parse_military_inventories = LazyParser('proj_004_cia.c_10_military.helper.utils.parse_military_inventories')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Military service age and obligation"
 # >>> ['mil_age', 'mil_age_note']
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_10_military.helper.utils.parse_military_age import parse_military_age
+parse_military_age = LazyParser('proj_004_cia.c_10_military.helper.utils.parse_military_age')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # NOTE: "Military expenditures"
 # >>> ['mil_expend', 'mil_expend_note'] - also has yearly figures but we will use world bank data for that
 # --------------------------------------------------------------------------------------------------
-from proj_004_cia.c_10_military.helper.utils.parse_military_expenditures import parse_military_expenditures
+parse_military_expenditures = LazyParser('proj_004_cia.c_10_military.helper.utils.parse_military_expenditures')
 # -=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-=-
 # #////////////////////////////////////////////////////////////////////////////////////////////////
 
 # //////////////////////////////////////////////////////////////////////////////////////////////////
 
 
-from proj_004_cia.c_10_military.helper.utils.parse_military_world import parse_military_world
-
+parse_military_world = LazyParser('proj_004_cia.c_10_military.helper.utils.parse_military_world')
 
-def get_military(data=None, info=None, iso3Code=None):
 
-    # 0
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: Military and Security DATA
-    # --------------------------------------------------------------------------------------------------
-    mil_data = data.get("Military and Security", {})
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-
-    # WORLD-SPECIFIC: Return comprehensive World military data
-    if info == 'world_military' and iso3Code == 'WLD':
-        return parse_military_world(iso3Code)
-
-    # 1
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 1 >>> 'Military - note'
-    # --------------------------------------------------------------------------------------------------
-    mil_note_data = mil_data.get("Military - note", {})
-    # --------------------------------------------------------------------------------------------------
-    # ['mil_note']
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'military_note':
-        return parse_military_note(iso3Code)
-
-    # 2
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 2 >>> 'Military and security forces'
-    # --------------------------------------------------------------------------------------------------
-    military_security_forces_data = mil_data.get(
-        "Military and security forces", {})
-    # --------------------------------------------------------------------------------------------------
-    # ['mil_forces', 'mil_forces_note']
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'military_forces':
-        return parse_military_forces(iso3Code)
-
-    # 3
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 3 >>> 'Military and security service personnel strengths'
-    # --------------------------------------------------------------------------------------------------
-    military_personnel_strengths_data = mil_data.get(
-        "Military and security service personnel strengths", {})
-    # --------------------------------------------------------------------------------------------------
-    # ['mil_person', 'mil_person_note']
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'military_personnel':
-        return parse_military_personnel(iso3Code)
-
-    # 4
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 4 >>> 'Military deployments'
-    # --------------------------------------------------------------------------------------------------
-    military_deployments_data = mil_data.get("Military deployments", {})
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'deployments':
-        return parse_deployments(iso3Code)
-
-    # 5
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 5 >>> 'Military equipment inventories and acquisitions'
-    # --------------------------------------------------------------------------------------------------
-    military_equipment_inventories_data = mil_data.get(
-        "Military equipment inventories and acquisitions", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'military_inventories':
-        return parse_military_inventories(iso3Code)
+# //////////////////////////////////////////////////////////////////////////////////////////////////
+#   MILITARY AND SECURITY PARSER REGISTRY
+# --------------------------------------------------------------------------------------------------
+MILITARY_REGISTRY = ParserRegistry(
+    section="Military and Security",
+    default_scope=COUNTRY,
+    specs=[
+        ParserSpec('world_military', parse_military_world,
+                   "Military and Security", convention=ISO3, scope=WORLD, strict_scope=True),
+        ParserSpec('military_note', parse_military_note,
+                   "Military - note", convention=ISO3),
+        ParserSpec('military_forces', parse_military_forces,
+                   "Military and security forces", convention=ISO3),
+        ParserSpec('military_personnel', parse_military_personnel,
+                   "Military and security service personnel strengths", convention=ISO3),
+        ParserSpec('deployments', parse_deployments,
+                   "Military deployments", convention=ISO3),
+        ParserSpec('military_inventories', parse_military_inventories,
+                   "Military equipment inventories and acquisitions", convention=ISO3),
+        ParserSpec('military_expenditures', parse_military_expenditures,
+                   "Military expenditures", convention=ISO3),
+        ParserSpec('military_age', parse_military_age,
+                   "Military service age and obligation", convention=ISO3),
+    ]
+)
 
-    # 6
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 6 >>> 'Military expenditures'
-    # --------------------------------------------------------------------------------------------------
-    military_expenditures_data = mil_data.get("Military expenditures", {})
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'military_expenditures':
-        return parse_military_expenditures(iso3Code)
 
-    # 7
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 7 >>> 'Military service age and obligation'
-    # --------------------------------------------------------------------------------------------------
-    military_service_age_obligation_data = mil_data.get(
-        "Military service age and obligation", {})
-    # --------------------------------------------------------------------------------------------------
-    if info == 'military_age':
-        return parse_military_age(iso3Code)
+def get_military(data=None, info=None, iso3Code=None):
+    """
+    Parse a single Military and Security field through MILITARY_REGISTRY.
+
+    Parameters:
+    - data: The dictionary containing the country's data.
+    - info: The output key to parse (e.g. 'military_age', 'world_military').
+    - iso3Code: The ISO3 code of the country.
+
+    Returns:
+    - The parsed field, or None if `info` is unknown or not available for `iso3Code`.
+    """
+    return MILITARY_REGISTRY.dispatch(data, info, iso3Code)
 
 
 ######################################################################################################################
@@ -12,8 +12,9 @@
 import json
 import os
 # get_military ------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_10_military.helper.get_military import get_military
+from proj_004_cia.c_10_military.helper.get_military import MILITARY_REGISTRY
 from proj_004_cia.c_00_transform_utils.clean_output import clean_output
+from proj_004_cia.c_00_transform_utils.compact_records import apply_representation
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 #   CORE FUNCTION
 # ------------------------------------------------------------------------------------------------------------------
@@ -22,46 +23,20 @@ from proj_004_cia.c_00_transform_utils.clean_output import clean_output
 
 def return_military_data(
     data: dict,
-    iso3Code: str
+    iso3Code: str,
+    fields=None,
+    representation: str = 'dict'
 ):
 
     # 10. MILITARY
     # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
     # --------------------------------------------------------------------------------------------------------------------------
+    # Fields, output order and WLD handling are declared in MILITARY_REGISTRY (get_military)
     # --------------------------------------------------------------------------------------------------------------------------
-    # Initialize the dictionary to hold geography data
-    cia_pack = {}
+    cia_pack = MILITARY_REGISTRY.parse_section(data, iso3Code, fields=fields)
 
-    # WORLD-SPECIFIC: Use comprehensive World parser
-    if iso3Code == 'WLD':
-        cia_pack['world_military'] = get_military(
-            data=data, info='world_military', iso3Code=iso3Code)
-        return clean_output(cia_pack)
-
-    # Note: 'military_note'
-    cia_pack['military_note'] = get_military(
-        data=data, info='military_note', iso3Code=iso3Code)
-    # Note: 'military_forces'
-    cia_pack['military_forces'] = get_military(
-        data=data, info='military_forces', iso3Code=iso3Code)
-    # Note: 'military_personnel'
-    cia_pack['military_personnel'] = get_military(
-        data=data, info='military_personnel', iso3Code=iso3Code)
-    # Note: 'deployments'
-    cia_pack['deployments'] = get_military(
-        data=data, info='deployments', iso3Code=iso3Code)
-    # Note: 'military_inventories'
-    cia_pack['military_inventories'] = get_military(
-        data=data, info='military_inventories', iso3Code=iso3Code)
-    # Note: 'military_expenditures'
-    cia_pack['military_expenditures'] = get_military(
-        data=data, info='military_expenditures', iso3Code=iso3Code)
-    # Note: 'military_age'
-    cia_pack['military_age'] = get_military(
-        data=data, info='military_age', iso3Code=iso3Code)
-
-    # Return the compiled geography data
-    return clean_output(cia_pack)
+    # Return the compiled military data
+    return apply_representation(clean_output(cia_pack), representation)
 
 
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
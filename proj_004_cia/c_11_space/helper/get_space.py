@@ -6,28 +6,29 @@ import re
 import json
 import logging
 # ---------------------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_00_transform_utils.extract_and_parse import extract_and_parse
+from proj_004_cia.c_00_transform_utils.parser_registry import LazyParser, ParserRegistry, ParserSpec, ISO3, COUNTRY, WORLD
 # ---------------------------------------------------------------------------------------------------------------------
 # -----------------------------------------------------------------------------------------------------
-from proj_004_cia.c_11_space.helper.utils.parse_space import parse_space
-from proj_004_cia.c_11_space.helper.utils.parse_space_world import parse_space_world
+parse_space = LazyParser('proj_004_cia.c_11_space.helper.utils.parse_space')
+parse_space_world = LazyParser('proj_004_cia.c_11_space.helper.utils.parse_space_world')
 # //////////////////////////////////////////////////////////////////////////////////////////////////
 
 
-def get_space(data=None, info=None, iso3Code=None):
-
-    # 0
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: Space DATA
-    # --------------------------------------------------------------------------------------------------
-    space_data = data.get("Space", {})
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'space':
+SPACE_REGISTRY = ParserRegistry(
+    section="Space",
+    specs=[
         # Use World-specific parser for WLD
-        if iso3Code == 'WLD':
-            return parse_space_world(iso3Code)
+        ParserSpec('space', parse_space_world, convention=ISO3, scope=WORLD),
+        ParserSpec('space', parse_space, convention=ISO3, scope=COUNTRY),
+    ]
+)
 
-        return parse_space(iso3Code)
+
+def get_space(data=None, info=None, iso3Code=None):
+    """
+    Parse a single Space field through SPACE_REGISTRY.
+    """
+    return SPACE_REGISTRY.dispatch(data, info, iso3Code)
 
 
 ######################################################################################################################
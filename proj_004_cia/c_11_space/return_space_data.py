@@ -12,8 +12,9 @@
 import json
 import os
 # get_space ------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_11_space.helper.get_space import get_space
+from proj_004_cia.c_11_space.helper.get_space import SPACE_REGISTRY
 from proj_004_cia.c_00_transform_utils.clean_output import clean_output
+from proj_004_cia.c_00_transform_utils.compact_records import apply_representation
 
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 #   CORE FUNCTION
@@ -23,22 +24,20 @@ from proj_004_cia.c_00_transform_utils.clean_output import clean_output
 
 def return_space_data(
     data: dict,
-    iso3Code: str
+    iso3Code: str,
+    fields=None,
+    representation: str = 'dict'
 ):
 
     # 11. SPACE
     # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
     # --------------------------------------------------------------------------------------------------------------------------
     # --------------------------------------------------------------------------------------------------------------------------
-    # Initialize the dictionary to hold geography data
-    cia_pack = {}
-
-    # Note: 'space'
-    cia_pack['space'] = get_space(
-        data=data, info='space', iso3Code=iso3Code)
+    # Fields and WLD handling are declared in SPACE_REGISTRY (get_space)
+    cia_pack = SPACE_REGISTRY.parse_section(data, iso3Code, fields=fields)
 
     # Return the compiled geography data
-    return clean_output(cia_pack)
+    return apply_representation(clean_output(cia_pack), representation)
 
 
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
@@ -6,29 +6,38 @@ import re
 import json
 import logging
 # ---------------------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_00_transform_utils.extract_and_parse import extract_and_parse
+from proj_004_cia.c_00_transform_utils.parser_registry import (
+    LazyParser, ParserRegistry, ParserSpec, ISO3)
 # ---------------------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_12_terrorism.helper.utils.parse_terrorism import parse_terrorism
+parse_terrorism = LazyParser('proj_004_cia.c_12_terrorism.helper.utils.parse_terrorism')
 # //////////////////////////////////////////////////////////////////////////////////////////////////
 
 
-def get_terrorism(data=None, info=None, iso3Code=None):
+# //////////////////////////////////////////////////////////////////////////////////////////////////
+#   TERRORISM PARSER REGISTRY
+# --------------------------------------------------------------------------------------------------
+TERRORISM_REGISTRY = ParserRegistry(
+    section="Terrorism",
+    specs=[
+        ParserSpec('terrorism', parse_terrorism,
+                   "Terrorism", convention=ISO3),
+    ]
+)
 
-    # 0
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: Terrorism DATA
-    # --------------------------------------------------------------------------------------------------
-    terror_data = data.get("Terrorism", {})
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
 
-    # 1
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: 1 >>> 'Terrorist group(s)'
-    # --------------------------------------------------------------------------------------------------
+def get_terrorism(data=None, info=None, iso3Code=None):
+    """
+    Parse a single Terrorism field through TERRORISM_REGISTRY.
+
+    Parameters:
+    - data: The dictionary containing the country's data.
+    - info: The output key to parse (e.g. 'terrorism').
+    - iso3Code: The ISO3 code of the country.
 
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'terrorism':
-        return parse_terrorism(iso3Code)
+    Returns:
+    - The parsed field, or None if `info` is unknown or not available for `iso3Code`.
+    """
+    return TERRORISM_REGISTRY.dispatch(data, info, iso3Code)
 
 
 ######################################################################################################################
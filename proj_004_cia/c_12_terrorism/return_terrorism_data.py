@@ -12,8 +12,9 @@
 import json
 import os
 # get_terrorism ------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_12_terrorism.helper.get_terrorism import get_terrorism
+from proj_004_cia.c_12_terrorism.helper.get_terrorism import TERRORISM_REGISTRY
 from proj_004_cia.c_00_transform_utils.clean_output import clean_output
+from proj_004_cia.c_00_transform_utils.compact_records import apply_representation
 
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 #   CORE FUNCTION
@@ -23,22 +24,20 @@ from proj_004_cia.c_00_transform_utils.clean_output import clean_output
 
 def return_terrorism_data(
     data: dict,
-    iso3Code: str
+    iso3Code: str,
+    fields=None,
+    representation: str = 'dict'
 ):
 
     # 12. TERRORISM
     # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
     # --------------------------------------------------------------------------------------------------------------------------
+    # Fields, output order and WLD handling are declared in TERRORISM_REGISTRY (get_terrorism)
     # --------------------------------------------------------------------------------------------------------------------------
-    # Initialize the dictionary to hold geography data
-    cia_pack = {}
+    cia_pack = TERRORISM_REGISTRY.parse_section(data, iso3Code, fields=fields)
 
-    # Note: 'terrorism'
-    cia_pack['terrorism'] = get_terrorism(
-        data=data, info='terrorism', iso3Code=iso3Code)
-
-    # Return the compiled geography data
-    return clean_output(cia_pack)
+    # Return the compiled terrorism data
+    return apply_representation(clean_output(cia_pack), representation)
 
 
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
@@ -6,62 +6,50 @@ import re
 import json
 import logging
 # ---------------------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_00_transform_utils.extract_and_parse import extract_and_parse
+from proj_004_cia.c_00_transform_utils.parser_registry import (
+    LazyParser, ParserRegistry, ParserSpec, COUNTRY, WORLD, ISO3)
 # ---------------------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_13_issues.helper.utils.parse_displaced_persons import parse_displaced_persons
-from proj_004_cia.c_13_issues.helper.utils.parse_illicit_drugs import parse_illicit_drugs
-from proj_004_cia.c_13_issues.helper.utils.parse_international import parse_international
-from proj_004_cia.c_13_issues.helper.utils.parse_trafficking import parse_trafficking
-from proj_004_cia.c_13_issues.helper.utils.parse_issues_world import parse_issues_world
+parse_displaced_persons = LazyParser('proj_004_cia.c_13_issues.helper.utils.parse_displaced_persons')
+parse_illicit_drugs = LazyParser('proj_004_cia.c_13_issues.helper.utils.parse_illicit_drugs')
+parse_international = LazyParser('proj_004_cia.c_13_issues.helper.utils.parse_international')
+parse_trafficking = LazyParser('proj_004_cia.c_13_issues.helper.utils.parse_trafficking')
+parse_issues_world = LazyParser('proj_004_cia.c_13_issues.helper.utils.parse_issues_world')
 
 
-def get_issues(data=None, info=None, iso3Code=None):
-
-    # 0
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # NOTE: Transnational Issues DATA
-    # --------------------------------------------------------------------------------------------------
-    issues_data = data.get("Transnational Issues", {})
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
+# //////////////////////////////////////////////////////////////////////////////////////////////////
+#   TRANSNATIONAL ISSUES PARSER REGISTRY
+# --------------------------------------------------------------------------------------------------
+ISSUES_REGISTRY = ParserRegistry(
+    section="Transnational Issues",
+    default_scope=COUNTRY,
+    specs=[
+        ParserSpec('world_issues', parse_issues_world,
+                   "Transnational Issues", convention=ISO3, scope=WORLD, strict_scope=True),
+        ParserSpec('international_issues', parse_international,
+                   "Disputes - international", convention=ISO3),
+        ParserSpec('illicit_drugs', parse_illicit_drugs,
+                   "Illicit drugs", convention=ISO3),
+        ParserSpec('displaced_persons', parse_displaced_persons,
+                   "Refugees and internally displaced persons", convention=ISO3),
+        ParserSpec('trafficking', parse_trafficking,
+                   "Trafficking in persons", convention=ISO3),
+    ]
+)
 
-    # WORLD-SPECIFIC: Return all issues in one comprehensive dict
-    if info == 'world_issues' and iso3Code == 'WLD':
-        return parse_issues_world(iso3Code)
-
-    # 1
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    international_data = issues_data.get("Disputes - international", {})
-    # --------------------------------------------------------------------------------------------------
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'international_issues':
-        return parse_international(iso3Code)
 
-    # 2
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    # --------------------------------------------------------------------------------------------------
-    drugs_data = issues_data.get("Illicit drugs", {})
-    # --------------------------------------------------------------------------------------------------
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'illicit_drugs':
-        return parse_illicit_drugs(iso3Code)
+def get_issues(data=None, info=None, iso3Code=None):
+    """
+    Parse a single Transnational Issues field through ISSUES_REGISTRY.
 
-    # 3
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    displaced_data = issues_data.get(
-        "Refugees and internally displaced persons", {})
-    # --------------------------------------------------------------------------------------------------
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'displaced_persons':
-        return parse_displaced_persons(iso3Code)
+    Parameters:
+    - data: The dictionary containing the country's data.
+    - info: The output key to parse (e.g. 'illicit_drugs', 'world_issues').
+    - iso3Code: The ISO3 code of the country.
 
-    # 4
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    traffick_data = issues_data.get("Trafficking in persons", {})
-    # --------------------------------------------------------------------------------------------------
-    # ['trafficked']
-    # //////////////////////////////////////////////////////////////////////////////////////////////////
-    if info == 'trafficking':
-        return parse_trafficking(iso3Code)
+    Returns:
+    - The parsed field, or None if `info` is unknown or not available for `iso3Code`.
+    """
+    return ISSUES_REGISTRY.dispatch(data, info, iso3Code)
 
 
 ######################################################################################################################
@@ -12,8 +12,9 @@
 import json
 import os
 # get_issues ------------------------------------------------------------------------------------------------------
-from proj_004_cia.c_13_issues.helper.get_issues import get_issues
+from proj_004_cia.c_13_issues.helper.get_issues import ISSUES_REGISTRY
 from proj_004_cia.c_00_transform_utils.clean_output import clean_output
+from proj_004_cia.c_00_transform_utils.compact_records import apply_representation
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 #   CORE FUNCTION
 # ------------------------------------------------------------------------------------------------------------------
@@ -22,39 +23,20 @@ from proj_004_cia.c_00_transform_utils.clean_output import clean_output
 
 def return_issues_data(
     data: dict,
-    iso3Code: str
+    iso3Code: str,
+    fields=None,
+    representation: str = 'dict'
 ):
 
     # 13. ISSUES
     # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
     # --------------------------------------------------------------------------------------------------------------------------
+    # Fields, output order and WLD handling are declared in ISSUES_REGISTRY (get_issues)
     # --------------------------------------------------------------------------------------------------------------------------
-    # Initialize the dictionary to hold geography data
-    cia_pack = {}
+    cia_pack = ISSUES_REGISTRY.parse_section(data, iso3Code, fields=fields)
 
-    # WORLD-SPECIFIC: Use comprehensive World parser
-    if iso3Code == 'WLD':
-        cia_pack['world_issues'] = get_issues(
-            data=data, info='world_issues', iso3Code=iso3Code)
-        return clean_output(cia_pack)
-
-    # Conditional inclusion for individual countries
-
-    # Note: 'international_issues'
-    cia_pack['international_issues'] = get_issues(
-        data=data, info='international_issues', iso3Code=iso3Code)
-    # Note: 'illicit_drugs'
-    cia_pack['illicit_drugs'] = get_issues(
-        data=data, info='illicit_drugs', iso3Code=iso3Code)
-    # Note: 'displaced_persons'
-    cia_pack['displaced_persons'] = get_issues(
-        data=data, info='displaced_persons', iso3Code=iso3Code)
-    # Note: 'trafficking'
-    cia_pack['trafficking'] = get_issues(
-        data=data, info='trafficking', iso3Code=iso3Code)
-
-    # Return the compiled geography data
-    return clean_output(cia_pack)
+    # Return the compiled issues data
+    return apply_representation(clean_output(cia_pack), representation)
 
 
 # //////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
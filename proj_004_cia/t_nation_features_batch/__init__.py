@@ -0,0 +1,27 @@
+"""
+t_nation_features_batch - Single-pass extraction of every nation feature
+
+The u_nation_feature_strings, v_nation_features_dicts and w_nation_feature_arrays
+extractors each loop over every country and run a whole return_*_data section
+to keep one key. This module discovers all of them, groups them by the parser
+they need and parses each (country, parser) pair once. country_pool spreads
+the countries of a single feature over worker processes (workers=).
+feature_store writes the saved features (pickle / JSON, .py opt-in) with a
+manifest and loads them back with load_feature(name). feature_matrix flattens
+the numeric dict features into a cached countries x columns NumPy matrix for
+vectorized ranking and correlation.
+
+Usage:
+    from proj_004_cia.t_nation_features_batch.run_all_features import run_all_features
+
+    results = run_all_features()               # every feature, saved to each package's _outputs/
+    results['array']['industries']['NGA']      # same value as get_industries()['NGA']
+
+    from proj_004_cia.t_nation_features_batch.feature_store import load_feature
+    load_feature('industries')['NGA']          # read back from w_nation_feature_arrays/_outputs/
+
+    from proj_004_cia.t_nation_features_batch.feature_matrix import extract_feature_matrix
+    extract_feature_matrix().top('population.total', 5)
+
+    python -m proj_004_cia.t_nation_features_batch.run_all_features --kinds dict array --no-save
+"""
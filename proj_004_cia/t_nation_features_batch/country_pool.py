@@ -0,0 +1,129 @@
+"""
+Country Pool
+
+Runs one feature (parser, extractor and value function) over many countries,
+serially or spread over a process pool, for the three base extractors.
+
+With more than one worker the countries are cut into chunks and handed to a
+ProcessPoolExecutor; executor.map returns the chunks in submission order, so
+the values come back in country order whatever order the workers finish in.
+Each worker flushes the parsed-section cache at the end of its chunk. A
+failing country yields a CountryError carrying the worker's traceback, and
+the progress callback is called in the calling process as results arrive.
+"""
+
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from proj_004_cia.__config.config import Config
+from proj_004_cia.a_04_iso_to_cia_code.parsed_section_cache import country_parser, flush_parsed_section_cache
+
+# (countries done, countries total)
+ProgressCallback = Callable[[int, int], None]
+
+
+class CountryError(NamedTuple):
+    """A country a feature could not be extracted for."""
+    iso3Code: str
+    message: str
+    traceback: str
+
+    def __str__(self) -> str:
+        return f"{self.iso3Code}: {self.message}"
+
+
+# (iso3Code, value, None) or (iso3Code, None, CountryError)
+CountryResult = Tuple[str, Any, Optional[CountryError]]
+
+
+def resolve_workers(workers: Optional[int], n_countries: int) -> int:
+    """Worker processes to use: `workers` (default Config.FEATURE_EXTRACT_WORKERS), at most one per country."""
+    if workers is None:
+        workers = Config.FEATURE_EXTRACT_WORKERS
+    return max(1, min(workers, n_countries))
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   WORKER
+# ---------------------------------------------------------------------------------------------------------------------
+
+# country_parser() of each parser function, built once per process
+_COUNTRY_PARSERS: Dict[Callable, Callable[[str], Any]] = {}
+
+
+def _country_parser(parser_func: Callable) -> Callable[[str], Any]:
+    parse_country = _COUNTRY_PARSERS.get(parser_func)
+    if parse_country is None:
+        parse_country = _COUNTRY_PARSERS[parser_func] = country_parser(parser_func)
+    return parse_country
+
+
+def _extract_country(parse_country: Callable[[str], Any], extractor_func: Callable, value_func: Callable,
+                     iso3Code: str) -> CountryResult:
+    try:
+        return iso3Code, value_func(extractor_func, parse_country(iso3Code)), None
+    except Exception as e:
+        return iso3Code, None, CountryError(iso3Code, str(e), traceback.format_exc())
+
+
+def _extract_chunk(parser_func: Callable, extractor_func: Callable, value_func: Callable,
+                   iso3Codes: Sequence[str]) -> List[CountryResult]:
+    """Worker entry point: one chunk of countries, then the chunk's new cache entries are written."""
+    parse_country = _country_parser(parser_func)
+    results = [_extract_country(parse_country, extractor_func, value_func, iso3Code) for iso3Code in iso3Codes]
+    flush_parsed_section_cache()
+    return results
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   POOL
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def iter_country_values(parser_func: Callable,
+                        extractor_func: Callable,
+                        value_func: Callable,
+                        countries: Sequence[str],
+                        workers: Optional[int] = None,
+                        progress: Optional[ProgressCallback] = None,
+                        chunksize: Optional[int] = None) -> Iterator[CountryResult]:
+    """
+    Yield value_func(extractor_func, parsed) for every country, in the order of `countries`.
+
+    Args:
+        parser_func: (raw_data, iso3Code) -> parsed data; module-level (picklable) when workers > 1
+        extractor_func: parsed data -> raw feature value; module-level when workers > 1
+        value_func: (extractor_func, parsed) -> stored value
+        countries: ISO3 codes
+        workers: Worker processes (default: Config.FEATURE_EXTRACT_WORKERS); 1 = in this process
+        progress: Called with (countries done, total) in this process
+        chunksize: Countries per task (default: about four tasks per worker)
+
+    Yields:
+        (iso3Code, value, None), or (iso3Code, None, CountryError) when the country failed
+    """
+    countries = list(countries)
+    total = len(countries)
+    workers = resolve_workers(workers, total)
+
+    if workers <= 1:
+        parse_country = _country_parser(parser_func)
+        for done, iso3Code in enumerate(countries, 1):
+            yield _extract_country(parse_country, extractor_func, value_func, iso3Code)
+            if progress is not None:
+                progress(done, total)
+        flush_parsed_section_cache()
+        return
+
+    chunksize = chunksize or max(1, total // (workers * 4))
+    chunks = [countries[start:start + chunksize] for start in range(0, total, chunksize)]
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for results in executor.map(_extract_chunk, [parser_func] * len(chunks), [extractor_func] * len(chunks),
+                                    [value_func] * len(chunks), chunks):
+            for result in results:
+                yield result
+                done += 1
+                if progress is not None:
+                    progress(done, total)
@@ -0,0 +1,681 @@
+"""
+Feature Matrix
+
+Countries x numeric columns view of the v_nation_features_dicts features, for
+ranking and correlation work.
+
+Each dict feature is flattened into typed numeric columns: every number in a
+country's dict becomes a value in the column named after its path, and the
+year and estimate flag stored next to it (a 'year' / 'timestamp' / 'date' key
+or an '<x>_year' key beside '<x>_value', 'is_estimate' / '<x>_is_estimate')
+go into the matching cells of the year and estimate arrays. Unit strings are
+kept per column. The arrays are dense, one row per country:
+
+    values      float64   NaN where the country has no value (mask: missing())
+    years       int32     YEAR_UNKNOWN (0) where no year is given
+    estimates   bool      True where the value is flagged as an estimate
+
+extract_feature_matrix() runs the dict extractors in one pass (run_feature_specs)
+and caches the matrix on disk (.npz, or parquet when pyarrow is installed). The
+cache key covers each country's raw-data stamp, the parser code of every section
+and the extractor code, so a changed input rebuilds it; checking it discovers
+and parses nothing.
+
+Usage:
+    from proj_004_cia.t_nation_features_batch.feature_matrix import extract_feature_matrix
+
+    matrix = extract_feature_matrix()
+    matrix.top('population.total', 5)                 # [('CHN', 1416043270.0), ...]
+    ranks = matrix.rank()                             # 1 = highest, ties share the best rank
+    names, corr = matrix.correlation(['birth_rate', 'gini.gini_latest', 'median_age.total'])
+    frame = matrix.to_dataframe(metadata=True)        # pandas, nullable dtypes
+
+    python -m proj_004_cia.t_nation_features_batch.feature_matrix --top population.total
+"""
+
+import os
+import re
+import json
+import math
+import hashlib
+import functools
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from proj_004_cia.__config.config import Config
+from proj_004_cia.__logger.logger import app_logger
+from proj_004_cia.a_04_iso_to_cia_code.content_hash import hash_source_trees
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import ISO3_TO_CIA, country_source_stamp
+from proj_004_cia.a_04_iso_to_cia_code.parsed_section_cache import enable_parsed_section_cache, parser_version
+from proj_004_cia.t_nation_features_batch.feature_specs import DICT
+from proj_004_cia.t_nation_features_batch.feature_store import default_output_dir
+from proj_004_cia.t_nation_features_batch.run_all_features import (
+    discover_feature_specs, run_feature_specs, select_feature_specs
+)
+
+MATRIX_VERSION = 1
+NPZ = 'npz'
+PARQUET = 'parquet'
+CACHE_FORMATS = (NPZ, PARQUET)
+_EXTENSIONS = {NPZ: '.npz', PARQUET: '.parquet'}
+
+# years cell of a value without a year
+YEAR_UNKNOWN = 0
+
+# Keys of a dict holding the year / estimate flag / unit of its numbers, and the suffixes that attach
+# them to the '<stem>_value' key beside them
+_VALUE_KEY = 'value'
+_YEAR_KEYS = ('year', 'timestamp', 'date', 'est_year')
+_ESTIMATE_KEY = 'is_estimate'
+_UNIT_KEY = 'unit'
+_SUFFIXES = (
+    ('_is_estimate', 'estimate'),
+    ('_value', 'value'),
+    ('_year', 'year'),
+    ('_date', 'year'),
+    ('_timestamp', 'year'),
+    ('_unit', 'unit'),
+)
+_METADATA_KEYS = frozenset(_YEAR_KEYS + (_ESTIMATE_KEY, _UNIT_KEY))
+_YEAR_PATTERN = re.compile(r'(?<!\d)(1[6-9]\d\d|2\d\d\d)(?!\d)')
+
+
+class FeatureColumn(NamedTuple):
+    """
+    One numeric column of the matrix.
+
+    Attributes:
+        name: '<feature>.<path>' (the feature name is not repeated when the path starts with it)
+        feature: Dict feature the column comes from
+        path: Keys leading to the number in a country's dict
+        unit: Most common unit string of the column's values (None when none is given)
+        integer: Every value is an int (int64 in to_dataframe)
+    """
+    name: str
+    feature: str
+    path: Tuple[str, ...]
+    unit: Optional[str]
+    integer: bool
+
+
+# (value, year or None, estimate flag or None, unit or None)
+FlatValue = Tuple[float, Optional[int], Optional[bool], Optional[str]]
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   FLATTEN
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def parse_year(value: Any) -> Optional[int]:
+    """Year of a year / timestamp / date field (2024, '2024', '2019 est.', 'FY2019'), None otherwise."""
+    if _is_number(value):
+        return int(value) if value == int(value) and 1600 <= value <= 2999 else None
+    if isinstance(value, str):
+        match = _YEAR_PATTERN.search(value)
+        return int(match.group(1)) if match else None
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_suffix(key: str) -> Tuple[Optional[str], Optional[str]]:
+    # ('<stem>', role) of a '<stem>_value' / '<stem>_year' / ... key, (None, None) otherwise
+    for suffix, role in _SUFFIXES:
+        if key.endswith(suffix) and len(key) > len(suffix):
+            return key[:-len(suffix)], role
+    return None, None
+
+
+def _flatten_dict(data: Dict[str, Any],
+                  path: Tuple[str, ...],
+                  year: Optional[int],
+                  estimate: Optional[bool],
+                  unit: Optional[str],
+                  out: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], FlatValue]]) -> None:
+    # The dict's own year / estimate / unit apply to its numbers, then to nested dicts
+    for key in _YEAR_KEYS:
+        own_year = parse_year(data.get(key))
+        if own_year is not None:
+            year = own_year
+            break
+    if isinstance(data.get(_ESTIMATE_KEY), bool):
+        estimate = data[_ESTIMATE_KEY]
+    if isinstance(data.get(_UNIT_KEY), str) and data[_UNIT_KEY]:
+        unit = data[_UNIT_KEY]
+
+    # '<stem>_year' / '<stem>_is_estimate' / '<stem>_unit' beside '<stem>_value'
+    stems: Dict[str, Dict[str, Any]] = {}
+    for key, value in data.items():
+        stem, role = _split_suffix(key)
+        if stem is not None:
+            stems.setdefault(stem, {})[role] = value
+    for stem, fields in stems.items():
+        # A year with no number of its own (urban_population_year) dates the whole dict
+        if 'value' not in fields and stem not in data and 'year' in fields and year is None:
+            year = parse_year(fields['year'])
+
+    for key, value in data.items():
+        if key in _METADATA_KEYS:
+            continue
+        stem, role = _split_suffix(key)
+        if isinstance(value, dict):
+            _flatten_dict(value, path + (key,), year, estimate, unit, out)
+        elif not _is_number(value):
+            continue
+        elif key == _VALUE_KEY:
+            out[path] = (path + (key,), (value, year, estimate, unit))
+        elif role == 'value':
+            fields = stems[stem]
+            stem_year = parse_year(fields.get('year'))
+            stem_estimate = fields.get('estimate')
+            stem_unit = fields.get('unit')
+            out[path + (stem,)] = (path + (key,), (
+                value,
+                year if stem_year is None else stem_year,
+                stem_estimate if isinstance(stem_estimate, bool) else estimate,
+                stem_unit if isinstance(stem_unit, str) and stem_unit else unit,
+            ))
+        elif role is None:
+            out[path + (key,)] = (path + (key,), (value, year, estimate, unit))
+
+
+def column_name(feature: str, path: Sequence[str]) -> str:
+    """'<feature>.<path>', without repeating a feature name the path starts with."""
+    if path and path[0] == feature:
+        path = path[1:]
+    return '.'.join((feature,) + tuple(path))
+
+
+def flatten_feature_value(feature: str, value: Any) -> Dict[str, Tuple[Tuple[str, ...], FlatValue]]:
+    """
+    {column name: (path of the number in `value`, (value, year, estimate, unit))} of one country's dict.
+
+    Examples:
+        >>> flatten_feature_value('birth_rate', {'birth_rate': {'value': 12.2, 'unit': 'births/1,000 population',
+        ...                                                     'timestamp': '2024', 'is_estimate': True}})
+        {'birth_rate': (('birth_rate', 'value'), (12.2, 2024, True, 'births/1,000 population'))}
+    """
+    if not isinstance(value, dict):
+        return {}
+    flat: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], FlatValue]] = {}
+    _flatten_dict(value, (), None, None, None, flat)
+    return {column_name(feature, stem_path): entry for stem_path, entry in flat.items()}
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   MATRIX
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+class FeatureMatrix:
+    """
+    Dense countries x columns arrays of the numeric dict features.
+
+    Attributes:
+        countries: ISO3 code of each row
+        columns: FeatureColumn of each column
+        values: float64 (countries, columns), NaN where missing
+        years: int32, YEAR_UNKNOWN where no year is given
+        estimates: bool, True where the value is an estimate
+        key: Cache key of the inputs the matrix was built from ('' when built from given data)
+    """
+
+    def __init__(self, countries: Sequence[str], columns: Sequence[FeatureColumn], values: np.ndarray,
+                 years: np.ndarray, estimates: np.ndarray, key: str = ''):
+        self.countries = list(countries)
+        self.columns = list(columns)
+        self.values = values
+        self.years = years
+        self.estimates = estimates
+        self.key = key
+        self._column_index = {column.name: i for i, column in enumerate(self.columns)}
+        self._country_index = {iso3Code: i for i, iso3Code in enumerate(self.countries)}
+
+    def __repr__(self) -> str:
+        return (f"FeatureMatrix({len(self.countries)} countries x {len(self.columns)} columns, "
+                f"{int((~self.missing()).sum()):,} values)")
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.values.shape
+
+    @property
+    def names(self) -> List[str]:
+        return [column.name for column in self.columns]
+
+    def column_index(self, name: str) -> int:
+        """
+        Raises:
+            KeyError: If there is no such column
+        """
+        try:
+            return self._column_index[name]
+        except KeyError:
+            raise KeyError(f"No feature matrix column {name!r}") from None
+
+    def _indices(self, names: Optional[Iterable[str]]) -> List[int]:
+        if names is None:
+            return list(range(len(self.columns)))
+        if isinstance(names, str):
+            names = [names]
+        return [self.column_index(name) for name in names]
+
+    def missing(self) -> np.ndarray:
+        """Boolean mask, True where a country has no value."""
+        return np.isnan(self.values)
+
+    def masked(self) -> np.ma.MaskedArray:
+        """values as a numpy masked array."""
+        return np.ma.masked_invalid(self.values, copy=False)
+
+    def column(self, name: str) -> np.ma.MaskedArray:
+        """One column as a masked array, in country order."""
+        return np.ma.masked_invalid(self.values[:, self.column_index(name)])
+
+    def country(self, iso3Code: str) -> Dict[str, float]:
+        """{column name: value} of one country's present values."""
+        row = self.values[self._country_index[iso3Code.upper()]]
+        return {self.columns[i].name: float(row[i]) for i in np.flatnonzero(~np.isnan(row))}
+
+    def select(self, names: Optional[Iterable[str]] = None,
+               countries: Optional[Iterable[str]] = None) -> 'FeatureMatrix':
+        """The matrix restricted to some columns and / or countries (in the given order)."""
+        cols = self._indices(names)
+        rows = (list(range(len(self.countries))) if countries is None
+                else [self._country_index[iso3Code.upper()] for iso3Code in countries])
+        grid = np.ix_(rows, cols)
+        return FeatureMatrix([self.countries[i] for i in rows], [self.columns[i] for i in cols],
+                             self.values[grid], self.years[grid], self.estimates[grid], self.key)
+
+    # -----------------------------------------------------------------------------------------------------------------
+    #   Ranking and correlation
+    # -----------------------------------------------------------------------------------------------------------------
+
+    def rank(self, names: Optional[Iterable[str]] = None, descending: bool = True) -> np.ndarray:
+        """
+        Rank of every country in each column: 1 = highest (lowest when not descending), equal values share
+        the best rank of their group (1, 2, 2, 4), NaN where the value is missing.
+
+        Returns:
+            float64 (countries, columns)
+        """
+        values = self.values[:, self._indices(names)]
+        keys = -values if descending else values
+        # NaN sorts last
+        order = np.argsort(keys, axis=0, kind='stable')
+        ordered = np.take_along_axis(keys, order, axis=0)
+        starts = np.ones(ordered.shape, dtype=bool)
+        starts[1:] = ordered[1:] != ordered[:-1]
+        positions = np.arange(ordered.shape[0], dtype=np.float64)[:, None]
+        group_start = np.maximum.accumulate(np.where(starts, positions, 0.0), axis=0)
+        ranks = np.empty(values.shape, dtype=np.float64)
+        np.put_along_axis(ranks, order, group_start + 1.0, axis=0)
+        ranks[np.isnan(values)] = np.nan
+        return ranks
+
+    def top(self, name: str, n: int = 10, descending: bool = True) -> List[Tuple[str, float]]:
+        """(iso3Code, value) of the first n countries of a column; missing values are left out."""
+        values = self.values[:, self.column_index(name)]
+        present = np.flatnonzero(~np.isnan(values))
+        keys = -values[present] if descending else values[present]
+        order = present[np.argsort(keys, kind='stable')][:n]
+        return [(self.countries[i], float(values[i])) for i in order]
+
+    def correlation(self, names: Optional[Iterable[str]] = None,
+                    min_periods: int = 3) -> Tuple[List[str], np.ndarray]:
+        """
+        Pearson correlation of every pair of columns over the countries that have both values.
+
+        Args:
+            names: Columns (default all)
+            min_periods: Fewer shared countries than this gives NaN
+
+        Returns:
+            (column names, float64 (columns, columns) matrix)
+        """
+        cols = self._indices(names)
+        values = self.values[:, cols]
+        present = ~np.isnan(values)
+        weights = present.astype(np.float64)
+
+        # Standardised first, so the pairwise sums below do not cancel on large magnitudes
+        counts = weights.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(counts > 0, np.nansum(values, axis=0) / counts, 0.0)
+            centered = np.where(present, values - mean, 0.0)
+            scale = np.sqrt((centered ** 2).sum(axis=0) / np.maximum(counts, 1.0))
+            z = centered / np.where(scale > 0, scale, 1.0)
+
+            n = weights.T @ weights
+            sums = z.T @ weights                    # [i, j]: sum of column i over countries that also have j
+            squares = (z ** 2).T @ weights
+            products = z.T @ z
+            covariance = products - sums * sums.T / n
+            variance = squares - sums ** 2 / n
+            corr = covariance / np.sqrt(variance * variance.T)
+
+        valid = (n >= max(min_periods, 2)) & (variance > 0) & (variance.T > 0)
+        corr = np.where(valid, np.clip(corr, -1.0, 1.0), np.nan)
+        diagonal = np.diag_indices_from(corr)
+        corr[diagonal] = np.where(valid[diagonal], 1.0, np.nan)
+        return [self.columns[i].name for i in cols], corr
+
+    # -----------------------------------------------------------------------------------------------------------------
+    #   pandas
+    # -----------------------------------------------------------------------------------------------------------------
+
+    def to_dataframe(self, metadata: bool = False):
+        """
+        pandas DataFrame indexed by ISO3 code, one masked (nullable Int64 / Float64) column per matrix column.
+
+        Args:
+            metadata: Add '<name>.year' (Int32) and '<name>.estimate' (boolean) after each column
+        """
+        # Imported here: pandas is only needed by callers that want a DataFrame
+        import pandas as pd
+
+        missing = self.missing()
+        data = {}
+        for i, column in enumerate(self.columns):
+            mask = missing[:, i]
+            if column.integer:
+                data[column.name] = pd.arrays.IntegerArray(
+                    np.where(mask, 0, self.values[:, i]).astype(np.int64), mask.copy())
+            else:
+                data[column.name] = pd.arrays.FloatingArray(
+                    np.where(mask, 0.0, self.values[:, i]), mask.copy())
+            if metadata:
+                years = self.years[:, i]
+                data[f"{column.name}.year"] = pd.arrays.IntegerArray(years.copy(), years == YEAR_UNKNOWN)
+                data[f"{column.name}.estimate"] = pd.arrays.BooleanArray(self.estimates[:, i].copy(), mask.copy())
+        return pd.DataFrame(data, index=pd.Index(self.countries, name='iso3Code'))
+
+
+def build_feature_matrix(features: Dict[str, Dict[str, Any]],
+                         countries: Optional[Iterable[str]] = None,
+                         key: str = '') -> FeatureMatrix:
+    """
+    Flatten dict features into a FeatureMatrix.
+
+    Args:
+        features: {feature name: {iso3Code: dict}}, e.g. run_feature_specs(...)['dict'] or
+                  load_all_features('dict')['dict']
+        countries: Row order (default: every country of the features, in first-seen order)
+        key: Stored as FeatureMatrix.key
+    """
+    if countries is None:
+        countries = list(dict.fromkeys(iso3Code for data in features.values() for iso3Code in data))
+    else:
+        countries = list(countries)
+    row_of = {iso3Code: row for row, iso3Code in enumerate(countries)}
+
+    # {column name: [feature, path, [(row, FlatValue)]]} in feature, then first-seen order
+    cells: Dict[str, List[Any]] = {}
+    for feature, data in features.items():
+        for iso3Code, value in data.items():
+            row = row_of.get(iso3Code)
+            if row is None:
+                continue
+            for name, (path, flat) in flatten_feature_value(feature, value).items():
+                entry = cells.get(name)
+                if entry is None:
+                    entry = cells[name] = [feature, path, []]
+                entry[2].append((row, flat))
+
+    shape = (len(countries), len(cells))
+    values = np.full(shape, np.nan, dtype=np.float64)
+    years = np.full(shape, YEAR_UNKNOWN, dtype=np.int32)
+    estimates = np.zeros(shape, dtype=bool)
+    columns = []
+    for col, (name, (feature, path, entries)) in enumerate(cells.items()):
+        rows = np.fromiter((row for row, _ in entries), dtype=np.intp, count=len(entries))
+        values[rows, col] = [flat[0] for _, flat in entries]
+        years[rows, col] = [YEAR_UNKNOWN if flat[1] is None else flat[1] for _, flat in entries]
+        estimates[rows, col] = [bool(flat[2]) for _, flat in entries]
+        units = Counter(flat[3] for _, flat in entries if flat[3])
+        integer = all(isinstance(flat[0], int) for _, flat in entries)
+        columns.append(FeatureColumn(name, feature, path, units.most_common(1)[0][0] if units else None, integer))
+    return FeatureMatrix(countries, columns, values, years, estimates, key)
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   DISK CACHE
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+# Packages holding the dict extractors and the code that runs them; the parsers they call are covered
+# by the parser_version() of every section (c_XX packages, c_00_transform_utils and the raw-data loaders)
+_FEATURE_CODE_PACKAGES = ('v_nation_features_dicts', 't_nation_features_batch')
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@functools.lru_cache(maxsize=None)
+def feature_code_version() -> str:
+    """
+    Hash of the code a dict feature can run, computed once per process.
+
+    Covers every section's parser code rather than only the sections the selected features
+    read, so the key can be built without discovering (importing and calling) the get_* functions.
+    """
+    # Imported here: the section -> return_*_data map lives in z_reports, above this package
+    from proj_004_cia.z_reports.category_sections import CATEGORY_PARSERS
+
+    parsers = '|'.join(parser_version(section) for section in CATEGORY_PARSERS)
+    return hash_source_trees([os.path.join(_PACKAGE_ROOT, package) for package in _FEATURE_CODE_PACKAGES],
+                             salt=f"{MATRIX_VERSION}|{np.__version__}|{parsers}")
+
+
+def matrix_cache_key(names: Optional[Iterable[str]] = None, countries: Optional[Sequence[str]] = None) -> str:
+    """
+    Hash of everything a matrix is built from: the requested features and countries, each country's
+    raw-data stamp (country_source_stamp: raw file or packed stamp) and feature_code_version().
+
+    Nothing is parsed or imported beyond the section map; a key check costs one stat per country.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(feature_code_version().encode())
+    digest.update(('*' if names is None else '|'.join(sorted(set(names)))).encode('utf-8'))
+    digest.update(('*' if countries is None else '|'.join(countries)).encode('utf-8'))
+    for iso3Code in (countries if countries is not None else ISO3_TO_CIA):
+        digest.update(f"{iso3Code}|{country_source_stamp(iso3Code)}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def default_cache_path(cache_format: Optional[str] = None) -> str:
+    """Config.FEATURE_MATRIX_CACHE_PATH, or feature_matrix.<format> in v_nation_features_dicts/_outputs/."""
+    cache_format = cache_format or Config.FEATURE_MATRIX_CACHE_FORMAT
+    if Config.FEATURE_MATRIX_CACHE_PATH:
+        return Config.FEATURE_MATRIX_CACHE_PATH
+    return os.path.join(default_output_dir(DICT), f"feature_matrix{_EXTENSIONS.get(cache_format, '.npz')}")
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _metadata(matrix: FeatureMatrix) -> str:
+    return json.dumps({
+        'version': MATRIX_VERSION,
+        'key': matrix.key,
+        'generated': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'columns': [[column.name, column.feature, list(column.path), column.unit, column.integer]
+                    for column in matrix.columns],
+    }, ensure_ascii=False)
+
+
+def _from_metadata(metadata: str, countries: Sequence[str], values: np.ndarray, years: np.ndarray,
+                   estimates: np.ndarray) -> FeatureMatrix:
+    meta = json.loads(metadata)
+    if meta.get('version') != MATRIX_VERSION:
+        raise ValueError(f"Feature matrix version {meta.get('version')} (expected {MATRIX_VERSION})")
+    columns = [FeatureColumn(name, feature, tuple(path), unit, integer)
+               for name, feature, path, unit, integer in meta['columns']]
+    return FeatureMatrix(countries, columns, values, years, estimates, meta['key'])
+
+
+def save_feature_matrix(matrix: FeatureMatrix, path: str) -> str:
+    """
+    Write the matrix to `path`: parquet when the path ends in .parquet (needs pyarrow), .npz otherwise.
+
+    Returns:
+        The path written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+
+    if path.endswith(_EXTENSIONS[PARQUET]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        arrays = {'iso3Code': pa.array(matrix.countries, type=pa.string())}
+        missing = matrix.missing()
+        for i, column in enumerate(matrix.columns):
+            arrays[column.name] = pa.array(matrix.values[:, i], mask=missing[:, i])
+            arrays[f"{column.name}.year"] = pa.array(matrix.years[:, i])
+            arrays[f"{column.name}.estimate"] = pa.array(matrix.estimates[:, i])
+        table = pa.table(arrays).replace_schema_metadata({'feature_matrix': _metadata(matrix)})
+        pq.write_table(table, tmp_path)
+    else:
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, values=matrix.values, years=matrix.years, estimates=matrix.estimates,
+                     countries=np.array(matrix.countries, dtype=str), metadata=np.array(_metadata(matrix)))
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_feature_matrix(path: str) -> FeatureMatrix:
+    """
+    Read a matrix written by save_feature_matrix.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If it is not a feature matrix of this version
+    """
+    if path.endswith(_EXTENSIONS[PARQUET]):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        metadata = (table.schema.metadata or {}).get(b'feature_matrix')
+        if metadata is None:
+            raise ValueError(f"Not a feature matrix: {path}")
+        names = [entry[0] for entry in json.loads(metadata)['columns']]
+        shape = (table.num_rows, len(names))
+        values = np.empty(shape, dtype=np.float64)
+        years = np.empty(shape, dtype=np.int32)
+        estimates = np.empty(shape, dtype=bool)
+        for i, name in enumerate(names):
+            values[:, i] = table.column(name).to_numpy(zero_copy_only=False).astype(np.float64)
+            years[:, i] = table.column(f"{name}.year").to_numpy(zero_copy_only=False)
+            estimates[:, i] = table.column(f"{name}.estimate").to_numpy(zero_copy_only=False)
+        countries = table.column('iso3Code').to_pylist()
+        return _from_metadata(metadata.decode('utf-8'), countries, values, years, estimates)
+
+    with np.load(path, allow_pickle=False) as data:
+        try:
+            return _from_metadata(str(data['metadata']), data['countries'].tolist(), data['values'],
+                                  data['years'], data['estimates'])
+        except KeyError as e:
+            raise ValueError(f"Not a feature matrix: {path} ({e})") from None
+
+
+def _cache_path(path: Optional[str]) -> str:
+    if path is not None:
+        return path
+    cache_format = Config.FEATURE_MATRIX_CACHE_FORMAT
+    if cache_format not in CACHE_FORMATS:
+        raise ValueError(f"Unknown feature matrix cache format {cache_format!r}; choose from {CACHE_FORMATS}")
+    if cache_format == PARQUET and not parquet_available():
+        cache_format = NPZ
+    return default_cache_path(cache_format)
+
+
+def extract_feature_matrix(names: Optional[Iterable[str]] = None,
+                           countries: Optional[Sequence[str]] = None,
+                           use_cache: Optional[bool] = None,
+                           path: Optional[str] = None,
+                           verbose: bool = False) -> FeatureMatrix:
+    """
+    Run the dict extractors (one pass over the countries) and flatten them into a FeatureMatrix.
+
+    Args:
+        names: Dict features to include (default all)
+        countries: ISO3 codes (default: every code of ISO3_TO_CIA)
+        use_cache: Read / write the disk cache (default Config.FEATURE_MATRIX_CACHE_ENABLED)
+        path: Cache file (default: see default_cache_path; parquet falls back to .npz without pyarrow)
+        verbose: Print whether the cache was used
+
+    Returns:
+        The matrix, read from the cache when its key still matches the inputs
+    """
+    if use_cache is None:
+        use_cache = Config.FEATURE_MATRIX_CACHE_ENABLED
+    names = list(names) if names is not None else None
+    countries = list(countries) if countries is not None else None
+
+    key = matrix_cache_key(names, countries)
+    if use_cache:
+        path = _cache_path(path)
+        if os.path.exists(path):
+            try:
+                matrix = load_feature_matrix(path)
+            except (OSError, ValueError) as e:
+                if app_logger:
+                    app_logger.warning(f"Feature matrix cache not read ({path}): {e}")
+            else:
+                if matrix.key == key:
+                    if verbose:
+                        print(f"Feature matrix read from {path}")
+                    return matrix
+
+    specs = select_feature_specs(discover_feature_specs(), [DICT], names)
+    enable_parsed_section_cache()
+    results = run_feature_specs(specs, countries, verbose=verbose)
+    matrix = build_feature_matrix(results.get(DICT, {}), countries, key)
+    if use_cache:
+        try:
+            save_feature_matrix(matrix, path)
+            if verbose:
+                print(f"Feature matrix written to {path}")
+        except (OSError, ImportError) as e:
+            if app_logger:
+                app_logger.warning(f"Feature matrix cache not written ({path}): {e}")
+    return matrix
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   MAIN
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the countries x numeric dict-feature matrix")
+    parser.add_argument('--features', nargs='*', default=None, help="dict feature names (default: all)")
+    parser.add_argument('--path', default=None, help="cache file (.npz or .parquet)")
+    parser.add_argument('--no-cache', action='store_true', help="always extract, do not read or write the cache")
+    parser.add_argument('--columns', action='store_true', help="list the columns")
+    parser.add_argument('--top', default=None, help="print the top countries of a column")
+    parser.add_argument('-n', type=int, default=10, help="countries for --top")
+    args = parser.parse_args()
+
+    matrix = extract_feature_matrix(args.features, use_cache=not args.no_cache, path=args.path, verbose=True)
+    print(matrix)
+    if args.columns:
+        missing = matrix.missing()
+        for i, column in enumerate(matrix.columns):
+            print(f"{column.name:<60}{int((~missing[:, i]).sum()):5d}  {column.unit or ''}")
+    if args.top:
+        for rank, (iso3Code, value) in enumerate(matrix.top(args.top, args.n), 1):
+            print(f"{rank:4d}  {iso3Code}  {value:,.{0 if math.isclose(value, round(value)) else 2}f}")
@@ -0,0 +1,96 @@
+"""
+Feature Specs
+
+What an extract_feature / extract_dict_feature / extract_string_feature call
+needs, recorded as a FeatureSpec, so the batch runner can run many features
+from one parse of each country.
+
+Inside capture_feature_specs(), the base extractors record their arguments
+with record_feature_spec() and return an empty result instead of looping over
+the countries; calling an extractor module's get_*() function there is how its
+feature is discovered.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional
+
+STRING = 'string'
+DICT = 'dict'
+ARRAY = 'array'
+KINDS = (STRING, DICT, ARRAY)
+
+
+class _Missing:
+    """Type of MISSING; pickles by name, so the sentinel is still MISSING when it comes back from a worker."""
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return 'MISSING'
+
+    def __reduce__(self) -> str:
+        return 'MISSING'
+
+
+# Returned by a value function for a country that is left out of the feature (string features)
+MISSING = _Missing()
+
+
+class FeatureSpec(NamedTuple):
+    """
+    One feature, as the base extractors run it.
+
+    Attributes:
+        kind: STRING, DICT or ARRAY
+        name: feature_name passed to the base extractor
+        parser_func: (raw_data, iso3Code) -> parsed data; features sharing it share one parse
+        extractor_func: parsed data -> raw feature value
+        value_func: (extractor_func, parsed) -> stored value, or MISSING to leave the country out
+        error_value: Stored when loading, parsing or extracting fails (MISSING = left out)
+        sort_codes: Results keyed in sorted ISO3 order instead of ISO3_TO_CIA order
+        save_func: (data, feature_name, output_dir, formats) -> path, or None when the kind is not saved
+    """
+    kind: str
+    name: str
+    parser_func: Callable[[dict, str], Any]
+    extractor_func: Callable[[Any], Any]
+    value_func: Callable[[Callable, Any], Any]
+    error_value: Any
+    sort_codes: bool = False
+    save_func: Optional[Callable[..., str]] = None
+
+
+_capture = threading.local()
+
+
+@contextmanager
+def capture_feature_specs() -> Iterator[List[FeatureSpec]]:
+    """
+    Collect the FeatureSpec of every base extractor call made inside the block (this thread only).
+
+    Example:
+        >>> with capture_feature_specs() as specs:
+        ...     get_industries()
+        >>> specs[0].name
+        'industries'
+    """
+    previous = getattr(_capture, 'specs', None)
+    _capture.specs = []
+    try:
+        yield _capture.specs
+    finally:
+        _capture.specs = previous
+
+
+def record_feature_spec(spec: FeatureSpec) -> bool:
+    """
+    Record `spec` when a capture is active.
+
+    Returns:
+        True if it was recorded; the base extractor then returns an empty result
+    """
+    specs = getattr(_capture, 'specs', None)
+    if specs is None:
+        return False
+    specs.append(spec)
+    return True
@@ -0,0 +1,369 @@
+"""
+Feature Store
+
+Output backend of the three base extractors' save functions, and the reader
+for what they wrote.
+
+A saved feature is one {iso3Code: value} dict, written to its output directory
+(each package's _outputs/ by default) in one or more formats:
+
+    pickle   <name>.pkl   pickle protocol 5; the fastest to load
+    json     <name>.json  compact UTF-8 JSON, for other tools
+    py       <name>.py    the historical Python-literal module; opt-in only
+
+and recorded in that directory's manifest.json (kind, generation time,
+country counts and the file of each format). load_feature() reads a feature
+through the manifest, preferring pickle, and keeps recently loaded features
+in an in-memory LRU keyed by file stamp, so a rewritten file is re-read.
+
+Usage:
+    from proj_004_cia.t_nation_features_batch.feature_store import load_feature, load_all_features
+
+    industries = load_feature('industries')               # {iso3Code: [...]}
+    climate = load_feature('climate', kind='dict')        # 'climate' is both a string and a dict feature
+    features = load_all_features()                        # {kind: {name: data}}
+"""
+
+import os
+import ast
+import json
+import pickle
+import threading
+from datetime import datetime
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from proj_004_cia.__config.config import Config
+from proj_004_cia.a_04_iso_to_cia_code.lock_file import LockFile
+from proj_004_cia.t_nation_features_batch.feature_specs import ARRAY, DICT, KINDS, STRING
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_LOCK_NAME = 'manifest.lock'
+MANIFEST_VERSION = 1
+
+PICKLE = 'pickle'
+JSON = 'json'
+PY = 'py'
+FORMATS = (PICKLE, JSON, PY)
+_EXTENSIONS = {PICKLE: '.pkl', JSON: '.json', PY: '.py'}
+# Read order of load_feature: the first format a feature was saved in wins
+_LOAD_ORDER = (PICKLE, JSON, PY)
+
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_PACKAGES = {
+    STRING: 'u_nation_feature_strings',
+    DICT: 'v_nation_features_dicts',
+    ARRAY: 'w_nation_feature_arrays',
+}
+
+
+def default_output_dir(kind: str) -> str:
+    """The _outputs/ directory of the package that extracts `kind` features."""
+    return os.path.join(_PACKAGE_ROOT, OUTPUT_PACKAGES[kind], '_outputs')
+
+
+def output_formats(formats: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Formats to write: `formats`, or Config.FEATURE_OUTPUT_FORMATS ('pickle,json' unless set).
+
+    Raises:
+        ValueError: On an unknown format
+    """
+    if formats is None:
+        formats = [name.strip() for name in Config.FEATURE_OUTPUT_FORMATS.split(',') if name.strip()]
+    formats = list(dict.fromkeys(formats))
+    unknown = [name for name in formats if name not in FORMATS]
+    if unknown or not formats:
+        raise ValueError(f"Unknown feature output format(s) {unknown}; choose from {FORMATS}")
+    return formats
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   MANIFEST
+# ---------------------------------------------------------------------------------------------------------------------
+
+_MANIFEST_LOCK = threading.Lock()
+# {manifest path: ((mtime_ns, size), manifest)}
+_MANIFESTS: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _write_tmp(path: str, write: Callable[[Any], None], mode: str = 'wb') -> str:
+    """Write next to `path` under a temporary name and return that name (removed again on failure)."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+            write(f)
+    except BaseException:
+        _remove_quietly(tmp_path)
+        raise
+    return tmp_path
+
+
+def _write_atomic(path: str, write: Callable[[Any], None], mode: str = 'wb') -> None:
+    os.replace(_write_tmp(path, write, mode), path)
+
+
+def read_manifest(output_dir: str) -> Dict[str, Any]:
+    """The directory's manifest ({'version', 'features': {name: entry}}), empty when there is none."""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    stamp = _stamp(path)
+    with _MANIFEST_LOCK:
+        cached = _MANIFESTS.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+    manifest = {'version': MANIFEST_VERSION, 'features': {}}
+    if stamp is not None:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                loaded = json.load(f)
+            if loaded.get('version') == MANIFEST_VERSION:
+                manifest = loaded
+        except (OSError, ValueError):
+            pass
+    with _MANIFEST_LOCK:
+        _MANIFESTS[path] = (stamp, manifest)
+    return manifest
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   SAVE
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def save_feature_files(data: Dict[str, Any],
+                       feature_name: str,
+                       output_dir: str,
+                       kind: str,
+                       formats: Optional[Iterable[str]] = None,
+                       python_source: Optional[Callable[[], str]] = None) -> str:
+    """
+    Write a feature in every requested format and record it in the directory's manifest.
+
+    Args:
+        data: {iso3Code: value}
+        feature_name: File name stem
+        output_dir: Directory to write to (created if needed)
+        kind: STRING, DICT or ARRAY
+        formats: See output_formats
+        python_source: Builds the .py module text; required for the 'py' format
+
+    Returns:
+        Path of the file written in the first format
+    """
+    formats = output_formats(formats)
+    os.makedirs(output_dir, exist_ok=True)
+
+    if PY in formats and python_source is None:
+        raise ValueError(f"No Python source given for the 'py' output of {feature_name}")
+
+    # Every format is written to a temporary file first and only moved into place once all of them
+    # succeeded, so a failing format leaves neither stray files nor a manifest entry behind
+    files = {}
+    staged = []
+    try:
+        for name in formats:
+            filename = f"{feature_name}{_EXTENSIONS[name]}"
+            path = os.path.join(output_dir, filename)
+            if name == PICKLE:
+                tmp_path = _write_tmp(path, lambda f: pickle.dump(data, f, protocol=5))
+            elif name == JSON:
+                tmp_path = _write_tmp(path, lambda f: json.dump(data, f, ensure_ascii=False, separators=(',', ':'),
+                                                                default=str), 'w')
+            else:
+                tmp_path = _write_tmp(path, lambda f: f.write(python_source()), 'w')
+            staged.append((tmp_path, path))
+            files[name] = filename
+    except BaseException:
+        for tmp_path, _ in staged:
+            _remove_quietly(tmp_path)
+        raise
+    for tmp_path, path in staged:
+        os.replace(tmp_path, path)
+
+    # Read-merge-write under the directory's lock file, so entries of concurrent savers (other threads
+    # or processes) are never lost; the memo is dropped to re-read what they wrote
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    with LockFile(os.path.join(output_dir, MANIFEST_LOCK_NAME)):
+        with _MANIFEST_LOCK:
+            _MANIFESTS.pop(manifest_path, None)
+        manifest = read_manifest(output_dir)
+        features = dict(manifest['features'])
+        features[feature_name] = {
+            'kind': kind,
+            'generated': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'countries': len(data),
+            'non_empty': sum(1 for value in data.values() if value),
+            'files': files,
+        }
+        new_manifest = {'version': MANIFEST_VERSION, 'features': dict(sorted(features.items()))}
+        _write_atomic(manifest_path, lambda f: json.dump(new_manifest, f, indent=2, ensure_ascii=False), 'w')
+
+    return os.path.join(output_dir, files[formats[0]])
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   LOAD
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _output_dirs(kind: Optional[str], output_dir: Optional[str]) -> List[str]:
+    if output_dir is not None:
+        return [output_dir]
+    return [default_output_dir(k) for k in ((kind,) if kind else KINDS)]
+
+
+def list_features(kind: Optional[str] = None, output_dir: Optional[str] = None) -> List[Tuple[str, str]]:
+    """(kind, name) of every saved feature, in kind then name order."""
+    features = []
+    for directory in _output_dirs(kind, output_dir):
+        for name, entry in read_manifest(directory)['features'].items():
+            if kind is None or entry['kind'] == kind:
+                features.append((entry['kind'], name))
+    return sorted(features, key=lambda item: (KINDS.index(item[0]) if item[0] in KINDS else len(KINDS), item[1]))
+
+
+def feature_file(name: str, kind: Optional[str] = None, output_dir: Optional[str] = None) -> Tuple[str, str]:
+    """
+    (format, path) load_feature reads for a feature.
+
+    Raises:
+        KeyError: If no manifest lists the feature
+        ValueError: If several kinds have a feature of that name and no kind is given
+    """
+    matches = []
+    for directory in _output_dirs(kind, output_dir):
+        entry = read_manifest(directory)['features'].get(name)
+        if entry is not None and (kind is None or entry['kind'] == kind):
+            matches.append((directory, entry))
+    if not matches:
+        raise KeyError(f"No saved feature named {name!r}" + (f" of kind {kind!r}" if kind else ""))
+    if len(matches) > 1:
+        raise ValueError(f"Feature {name!r} exists for kinds {[entry['kind'] for _, entry in matches]}; pass kind=")
+
+    directory, entry = matches[0]
+    for file_format in _LOAD_ORDER:
+        if file_format in entry['files']:
+            return file_format, os.path.join(directory, entry['files'][file_format])
+    raise KeyError(f"Feature {name!r} has no readable file")
+
+
+class _NonFiniteFloats(ast.NodeTransformer):
+    # python_literal spells NaN / infinities float('nan') / float('inf'), which literal_eval rejects
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if (isinstance(node.func, ast.Name) and node.func.id == 'float' and len(node.args) == 1
+                and not node.keywords and isinstance(node.args[0], ast.Constant)
+                and node.args[0].value in ('nan', 'inf', '-inf')):
+            return ast.copy_location(ast.Constant(float(node.args[0].value)), node)
+        return node
+
+
+def _read_python_literal(path: str) -> Any:
+    """The literal assigned in a generated .py output (the module is parsed, not imported)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            return ast.literal_eval(_NonFiniteFloats().visit(node.value))
+    raise ValueError(f"No feature literal in {path}")
+
+
+def _read_feature_file(file_format: str, path: str) -> Any:
+    if file_format == PICKLE:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    if file_format == JSON:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return _read_python_literal(path)
+
+
+_FEATURE_LOCK = threading.Lock()
+# {(path, mtime_ns, size): data}, most recently used last
+_FEATURES: 'OrderedDict[Tuple[str, int, int], Any]' = OrderedDict()
+
+
+def load_feature(name: str, kind: Optional[str] = None, output_dir: Optional[str] = None) -> Dict[str, Any]:
+    """
+    A saved feature's {iso3Code: value} dict.
+
+    Served from an in-memory LRU (Config.FEATURE_LOAD_CACHE_MAX_ENTRIES features) while the file is
+    unchanged; the returned dict is shared between callers and must be treated as read-only.
+
+    Args:
+        name: Feature name, as passed to the base extractor
+        kind: STRING, DICT or ARRAY; needed when several kinds share the name
+        output_dir: Directory holding the manifest (default: the packages' _outputs/)
+
+    Raises:
+        KeyError / ValueError: See feature_file
+    """
+    file_format, path = feature_file(name, kind, output_dir)
+    stamp = _stamp(path)
+    if stamp is None:
+        raise KeyError(f"Feature file missing: {path}")
+    key = (path,) + stamp
+
+    with _FEATURE_LOCK:
+        data = _FEATURES.get(key)
+        if data is not None:
+            _FEATURES.move_to_end(key)
+            return data
+
+    data = _read_feature_file(file_format, path)
+    with _FEATURE_LOCK:
+        _FEATURES[key] = data
+        while len(_FEATURES) > max(0, Config.FEATURE_LOAD_CACHE_MAX_ENTRIES):
+            _FEATURES.popitem(last=False)
+    return data
+
+
+def load_all_features(kind: Optional[str] = None, output_dir: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """{kind: {name: data}} of every saved feature (see load_feature)."""
+    features: Dict[str, Dict[str, Any]] = {}
+    for feature_kind, name in list_features(kind, output_dir):
+        features.setdefault(feature_kind, {})[name] = load_feature(name, feature_kind, output_dir)
+    return features
+
+
+def clear_feature_cache() -> None:
+    """Forget every loaded feature and manifest."""
+    with _FEATURE_LOCK:
+        _FEATURES.clear()
+    with _MANIFEST_LOCK:
+        _MANIFESTS.clear()
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   MAIN
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="List or load the saved nation features")
+    parser.add_argument('names', nargs='*', help="features to load (default: list them)")
+    parser.add_argument('--kind', choices=KINDS, default=None)
+    parser.add_argument('--output-dir', default=None, help="directory holding a manifest.json")
+    args = parser.parse_args()
+
+    if not args.names:
+        for feature_kind, name in list_features(args.kind, args.output_dir):
+            file_format, path = feature_file(name, feature_kind, args.output_dir)
+            print(f"{feature_kind:<7}{name:<40}{file_format:<8}{path}")
+    for name in args.names:
+        data = load_feature(name, args.kind, args.output_dir)
+        print(f"{name}: {len(data)} countries, e.g. {next(iter(data.items()), None)}")
@@ -0,0 +1,238 @@
+"""
+Run All Features
+
+Single-pass runner for every nation feature extractor.
+
+discover_feature_specs() imports each extract_* module of the three feature
+packages and calls its get_*() function inside capture_feature_specs(), so the
+base extractor records what it would run instead of running it.
+run_feature_specs() then runs each distinct parser once per country (through
+the parsed-section cache) and hands the parsed section to every feature that
+needs it.
+The values (and the left-out countries of string features) are the ones the
+per-feature get_*() functions return.
+"""
+
+import os
+import copy
+import time
+import inspect
+import pkgutil
+import importlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import ISO3_TO_CIA
+from proj_004_cia.a_04_iso_to_cia_code.parsed_section_cache import (
+    country_parser, enable_parsed_section_cache, flush_parsed_section_cache
+)
+from proj_004_cia.t_nation_features_batch.feature_specs import (
+    KINDS, MISSING, FeatureSpec, capture_feature_specs
+)
+from proj_004_cia.t_nation_features_batch.feature_store import FORMATS
+
+FEATURE_PACKAGES = (
+    'proj_004_cia.u_nation_feature_strings',
+    'proj_004_cia.v_nation_features_dicts',
+    'proj_004_cia.w_nation_feature_arrays',
+)
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   DISCOVERY
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def discover_feature_specs(packages: Sequence[str] = FEATURE_PACKAGES) -> List[FeatureSpec]:
+    """
+    FeatureSpec of every get_*() function defined in the packages' extract_* modules.
+
+    Returns:
+        Specs in package, module and definition order
+    """
+    specs = []
+    for package_name in packages:
+        package = importlib.import_module(package_name)
+        for module_info in sorted(pkgutil.iter_modules(package.__path__), key=lambda info: info.name):
+            if not module_info.name.startswith('extract_'):
+                continue
+            module = importlib.import_module(f"{package_name}.{module_info.name}")
+            for name, function in vars(module).items():
+                if (name.startswith('get_') and inspect.isfunction(function)
+                        and function.__module__ == module.__name__):
+                    with capture_feature_specs() as captured:
+                        function()
+                    specs.extend(captured)
+    return specs
+
+
+def select_feature_specs(specs: Iterable[FeatureSpec],
+                         kinds: Optional[Iterable[str]] = None,
+                         names: Optional[Iterable[str]] = None) -> List[FeatureSpec]:
+    """Specs of the given kinds and / or feature names (None = all)."""
+    kinds = set(kinds) if kinds else None
+    names = set(names) if names else None
+    return [spec for spec in specs
+            if (kinds is None or spec.kind in kinds) and (names is None or spec.name in names)]
+
+
+def group_by_parser(specs: Iterable[FeatureSpec]) -> Dict[Callable, List[FeatureSpec]]:
+    """{parser_func: specs} - each group costs one parse per country."""
+    groups: Dict[Callable, List[FeatureSpec]] = {}
+    for spec in specs:
+        groups.setdefault(spec.parser_func, []).append(spec)
+    return groups
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   SINGLE PASS
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def run_feature_specs(specs: Sequence[FeatureSpec],
+                      countries: Optional[Iterable[str]] = None,
+                      verbose: bool = False) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Extract many features in one pass over the countries.
+
+    Args:
+        specs: Features to extract (see discover_feature_specs)
+        countries: ISO3 codes (default: every code of ISO3_TO_CIA, in its order)
+        verbose: Print parse counts and failures
+
+    Returns:
+        {kind: {feature_name: {iso3Code: value}}}
+    """
+    groups = group_by_parser(specs)
+    parsers = {parser_func: country_parser(parser_func) for parser_func in groups}
+    results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for spec in specs:
+        results.setdefault(spec.kind, {})[spec.name] = {}
+
+    parses = 0
+    country_count = 0
+    errors: List[str] = []
+    for iso3Code in (countries if countries is not None else ISO3_TO_CIA.keys()):
+        country_count += 1
+        for parser_func, group in groups.items():
+            parsed, failed = None, False
+            try:
+                parsed = parsers[parser_func](iso3Code)
+                parses += 1
+            except Exception as e:
+                failed = True
+                errors.append(f"{iso3Code} {getattr(parser_func, '__name__', parser_func)}: {e}")
+
+            for spec in group:
+                if failed:
+                    value = copy.copy(spec.error_value)
+                else:
+                    try:
+                        value = spec.value_func(spec.extractor_func, parsed)
+                    except Exception as e:
+                        value = copy.copy(spec.error_value)
+                        errors.append(f"{iso3Code} {spec.kind}:{spec.name}: {e}")
+                if value is not MISSING:
+                    results[spec.kind][spec.name][iso3Code] = value
+
+    flush_parsed_section_cache()
+
+    for spec in specs:
+        if spec.sort_codes:
+            feature = results[spec.kind][spec.name]
+            results[spec.kind][spec.name] = dict(sorted(feature.items()))
+
+    if verbose:
+        print(f"{len(specs)} features, {len(groups)} parsers: {parses:,} parses "
+              f"(one pass per feature: {len(specs) * country_count:,})")
+        if errors:
+            print(f"Errors: {len(errors)}")
+            for error in errors[:5]:
+                print(f"  - {error}")
+
+    return results
+
+
+def save_feature_results(specs: Sequence[FeatureSpec],
+                         results: Dict[str, Dict[str, Dict[str, Any]]],
+                         output_dir: Optional[str] = None,
+                         formats: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Write every result with its package's saver.
+
+    Args:
+        output_dir: Base directory (one sub-directory per kind); None = each package's _outputs/
+        formats: Output formats (see feature_store.output_formats)
+
+    Returns:
+        Paths written
+    """
+    paths = []
+    for spec in specs:
+        if spec.save_func is None:
+            continue
+        directory = os.path.join(output_dir, spec.kind) if output_dir else None
+        paths.append(spec.save_func(results[spec.kind][spec.name], spec.name, directory, formats))
+    return paths
+
+
+def run_all_features(kinds: Optional[Iterable[str]] = None,
+                     names: Optional[Iterable[str]] = None,
+                     countries: Optional[Iterable[str]] = None,
+                     save: bool = True,
+                     output_dir: Optional[str] = None,
+                     formats: Optional[Iterable[str]] = None,
+                     verbose: bool = True) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Discover, extract (single pass) and save every nation feature.
+
+    Args:
+        kinds: Feature kinds to run ('string', 'dict', 'array'; default all)
+        names: Feature names to run (default all)
+        countries: ISO3 codes (default all)
+        save: Write the outputs
+        output_dir: See save_feature_results
+        formats: See save_feature_results
+        verbose: Print progress
+
+    Returns:
+        {kind: {feature_name: {iso3Code: value}}}
+    """
+    start = time.perf_counter()
+    enable_parsed_section_cache()
+    specs = select_feature_specs(discover_feature_specs(), kinds, names)
+    results = run_feature_specs(specs, countries, verbose=verbose)
+    if save:
+        paths = save_feature_results(specs, results, output_dir, formats)
+        if verbose:
+            print(f"Saved {len(paths)} files")
+    if verbose:
+        print(f"Done in {time.perf_counter() - start:.1f} s")
+    return results
+
+
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+#   MAIN
+# ///////////////////////////////////////////////////////////////////////////////////////////////////////////////////////////
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Extract every nation feature in one pass over the countries")
+    parser.add_argument('--kinds', nargs='*', choices=KINDS, default=None, help="feature kinds (default: all)")
+    parser.add_argument('--features', nargs='*', default=None, help="feature names (default: all)")
+    parser.add_argument('--countries', nargs='*', default=None, help="ISO3 codes (default: all)")
+    parser.add_argument('--output-dir', default=None, help="base output directory (default: each package's _outputs/)")
+    parser.add_argument('--formats', nargs='*', choices=FORMATS, default=None,
+                        help="output formats (default: Config.FEATURE_OUTPUT_FORMATS)")
+    parser.add_argument('--no-save', action='store_true', help="extract only")
+    parser.add_argument('--list', action='store_true', help="list the discovered features and their parsers")
+    args = parser.parse_args()
+
+    if args.list:
+        specs = select_feature_specs(discover_feature_specs(), args.kinds, args.features)
+        for parser_func, group in group_by_parser(specs).items():
+            print(f"{parser_func.__module__}.{parser_func.__name__}")
+            for spec in group:
+                print(f"    {spec.kind:<7} {spec.name}")
+    else:
+        run_all_features(args.kinds, args.features, args.countries, save=not args.no_save,
+                         output_dir=args.output_dir, formats=args.formats)
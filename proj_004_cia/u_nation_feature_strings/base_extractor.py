@@ -5,15 +5,32 @@ This module provides helper functions to extract single-value string fields
 across all countries in a consistent format.
 """
 
-from typing import Dict, Callable, Optional, Any
-from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import ISO3_TO_CIA, load_country_data
+import os
+import json
+from datetime import datetime
+from typing import Dict, Callable, Iterable, List, Optional, Any
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import ISO3_TO_CIA
+from proj_004_cia.t_nation_features_batch.country_pool import CountryError, ProgressCallback, iter_country_values
+from proj_004_cia.t_nation_features_batch.feature_store import save_feature_files
+from proj_004_cia.t_nation_features_batch.feature_specs import MISSING, STRING, FeatureSpec, record_feature_spec
+
+
+def string_value(extractor_func: Callable, parsed_data: Any) -> Any:
+    """One country's value: the stripped string, or MISSING when there is none."""
+    value = extractor_func(parsed_data)
+    if value and isinstance(value, str):
+        return value.strip()
+    return MISSING
 
 
 def extract_string_feature(
     parser_func: Callable,
     extractor_func: Callable[[Dict], Optional[str]],
     feature_name: str,
-    verbose: bool = False
+    verbose: bool = False,
+    workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    errors: Optional[List[CountryError]] = None
 ) -> Dict[str, str]:
     """
     Extract a string feature for all countries.
@@ -23,6 +40,10 @@ def extract_string_feature(
         extractor_func: Function to extract string from parsed data
         feature_name: Name of the feature for logging
         verbose: Whether to print progress
+        workers: Worker processes (default: Config.FEATURE_EXTRACT_WORKERS); countries are spread over a
+                 process pool in chunks and the result keeps the serial country order
+        progress: Called with (countries done, total) as countries finish
+        errors: List that receives a CountryError (with the worker's traceback) per failed country
 
     Returns:
         Dictionary mapping ISO3 codes to string values
@@ -38,32 +59,30 @@ def extract_string_feature(
         ...     'capital'
         ... )
     """
+    if record_feature_spec(FeatureSpec(STRING, feature_name, parser_func, extractor_func,
+                                       string_value, MISSING, sort_codes=True,
+                                       save_func=save_string_feature)):
+        return {}
+
     results = {}
     success_count = 0
     empty_count = 0
     error_count = 0
 
-    for iso3Code in sorted(ISO3_TO_CIA.keys()):
-        try:
-            # Load raw country data
-            raw_data = load_country_data(iso3Code)
-
-            # Parse the data
-            parsed_data = parser_func(raw_data, iso3Code)
-
-            # Extract the string value
-            string_value = extractor_func(parsed_data)
-
-            if string_value and isinstance(string_value, str):
-                results[iso3Code] = string_value.strip()
-                success_count += 1
-            else:
-                empty_count += 1
-
-        except Exception as e:
+    # return_*_data sections come from the parsed-section cache when unchanged
+    for iso3Code, value, error in iter_country_values(parser_func, extractor_func, string_value,
+                                                      sorted(ISO3_TO_CIA.keys()), workers, progress):
+        if error is not None:
             if verbose:
-                print(f"Error processing {iso3Code}: {e}")
+                print(f"Error processing {error}")
+            if errors is not None:
+                errors.append(error)
             error_count += 1
+        elif value is not MISSING:
+            results[iso3Code] = value
+            success_count += 1
+        else:
+            empty_count += 1
 
     if verbose:
         total = len(ISO3_TO_CIA)
@@ -77,6 +96,44 @@ def extract_string_feature(
     return results
 
 
+def save_string_feature(
+    data: Dict[str, str],
+    feature_name: str,
+    output_dir: str = None,
+    formats: Optional[Iterable[str]] = None
+) -> str:
+    """
+    Save an extracted string feature (pickle and JSON by default, plus a manifest entry).
+
+    Args:
+        data: Dictionary of ISO3 -> string
+        feature_name: Name of the feature (used for filename)
+        output_dir: Output directory (defaults to _outputs/)
+        formats: Any of 'pickle', 'json', 'py' (default: Config.FEATURE_OUTPUT_FORMATS);
+                 'py' writes the Python-literal module
+
+    Returns:
+        Path of the file written in the first format
+    """
+    if output_dir is None:
+        output_dir = os.path.join(os.path.dirname(__file__), "_outputs")
+
+    def python_source() -> str:
+        var_name = feature_name.upper()
+        return f'''"""
+Nation Feature String: {feature_name}
+
+Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Countries with data: {len(data)} / {len(ISO3_TO_CIA)}
+
+Each key is an ISO3 country code, each value is the {feature_name} string.
+"""
+
+{var_name} = {json.dumps(data, indent=4, ensure_ascii=False)}
+'''
+    return save_feature_files(data, feature_name, output_dir, STRING, formats, python_source)
+
+
 def extract_text_field(data: Dict, field_name: str) -> Optional[str]:
     """
     Extract a text field from parsed data dictionary.
@@ -6,30 +6,38 @@ Common functions for extracting array features from parsed CIA data.
 
 import os
 import sys
-import json
 from datetime import datetime
-from typing import Dict, List, Any, Callable, Optional
+from typing import Dict, Iterable, List, Any, Callable, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, ISO3_TO_CIA
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import ISO3_TO_CIA
+from proj_004_cia.c_00_transform_utils.python_literal import python_literal
+from proj_004_cia.t_nation_features_batch.country_pool import CountryError, ProgressCallback, iter_country_values
+from proj_004_cia.t_nation_features_batch.feature_store import save_feature_files
+from proj_004_cia.t_nation_features_batch.feature_specs import ARRAY, FeatureSpec, record_feature_spec
 
 
 def to_python_format(data: Any) -> str:
     """Convert data to Python-friendly string format."""
-    json_str = json.dumps(data, indent=4, ensure_ascii=False, default=str)
-    json_str = json_str.replace(': null', ': None')
-    json_str = json_str.replace(': true', ': True')
-    json_str = json_str.replace(': false', ': False')
-    return json_str
+    return python_literal(data)
+
+
+def array_value(extractor_func: Callable, parsed: Any) -> List:
+    """One country's value: the extracted array, or [] when it is empty."""
+    array_data = extractor_func(parsed)
+    return array_data if array_data else []
 
 
 def extract_feature(
     parser_func: Callable,
     extractor_func: Callable,
     feature_name: str,
-    verbose: bool = False
+    verbose: bool = False,
+    workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    errors: Optional[List[CountryError]] = None
 ) -> Dict[str, List]:
     """
     Extract a feature array for all countries.
@@ -39,27 +47,37 @@ def extract_feature(
         extractor_func: Function to extract the specific array from parsed data
         feature_name: Name of the feature for logging
         verbose: If True, print progress and errors
+        workers: Worker processes (default: Config.FEATURE_EXTRACT_WORKERS); countries are spread over a
+                 process pool in chunks and the result keeps the serial country order
+        progress: Called with (countries done, total) as countries finish
+        errors: List that receives a CountryError (with the worker's traceback) per failed country
 
     Returns:
         Dictionary with ISO3 codes as keys and arrays as values
     """
+    if record_feature_spec(FeatureSpec(ARRAY, feature_name, parser_func, extractor_func,
+                                       array_value, [], save_func=save_feature)):
+        return {}
+
     results = {}
-    errors = []
-
-    for iso3Code in ISO3_TO_CIA.keys():
-        try:
-            raw_data = load_country_data(iso3Code)
-            parsed = parser_func(raw_data, iso3Code)
-            array_data = extractor_func(parsed)
-            results[iso3Code] = array_data if array_data else []
-        except Exception as e:
-            errors.append(f"{iso3Code}: {str(e)}")
+    failures = []
+
+    # return_*_data sections come from the parsed-section cache when unchanged
+    for iso3Code, value, error in iter_country_values(parser_func, extractor_func, array_value,
+                                                      list(ISO3_TO_CIA.keys()), workers, progress):
+        if error is None:
+            results[iso3Code] = value
+        else:
+            failures.append(error)
             results[iso3Code] = []
 
-    if verbose and errors:
-        print(f"Errors extracting {feature_name}: {len(errors)}")
-        for err in errors[:3]:
-            print(f"  - {err}")
+    if errors is not None:
+        errors.extend(failures)
+
+    if verbose and failures:
+        print(f"Errors extracting {feature_name}: {len(failures)}")
+        for failure in failures[:3]:
+            print(f"  - {failure}")
 
     return results
 
@@ -67,30 +85,29 @@ def extract_feature(
 def save_feature(
     data: Dict[str, List],
     feature_name: str,
-    output_dir: str = None
+    output_dir: str = None,
+    formats: Optional[Iterable[str]] = None
 ) -> str:
     """
-    Save extracted feature to a Python file.
+    Save an extracted array feature (pickle and JSON by default, plus a manifest entry).
 
     Args:
         data: Dictionary of ISO3 -> array
         feature_name: Name of the feature (used for filename)
         output_dir: Output directory (defaults to _outputs/)
+        formats: Any of 'pickle', 'json', 'py' (default: Config.FEATURE_OUTPUT_FORMATS);
+                 'py' writes the Python-literal module
 
     Returns:
-        Path to saved file
+        Path of the file written in the first format
     """
     if output_dir is None:
         output_dir = os.path.join(os.path.dirname(__file__), "_outputs")
-    os.makedirs(output_dir, exist_ok=True)
 
-    filename = f"{feature_name}.py"
-    filepath = os.path.join(output_dir, filename)
-
-    non_empty = sum(1 for v in data.values() if v)
-    var_name = feature_name.upper()
-
-    content = f'''"""
+    def python_source() -> str:
+        non_empty = sum(1 for v in data.values() if v)
+        var_name = feature_name.upper()
+        return f'''"""
 Nation Feature Array: {feature_name}
 
 Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
@@ -101,11 +118,7 @@ Each key is an ISO3 country code, each value is an array of {feature_name}.
 
 {var_name} = {to_python_format(data)}
 '''
-
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
-
-    return filepath
+    return save_feature_files(data, feature_name, output_dir, ARRAY, formats, python_source)
 
 
 def run_extraction(
@@ -114,7 +127,8 @@ def run_extraction(
     feature_name: str,
     output_dir: str = None,
     save: bool = True,
-    verbose: bool = True
+    verbose: bool = True,
+    workers: Optional[int] = None
 ) -> Dict[str, List]:
     """
     Run full extraction pipeline for a feature.
@@ -126,6 +140,7 @@ def run_extraction(
         output_dir: Output directory for saving (defaults to _outputs/)
         save: If True, save to file
         verbose: If True, print progress
+        workers: Worker processes (see extract_feature)
 
     Returns:
         Dictionary with ISO3 codes as keys and arrays as values
@@ -134,7 +149,7 @@ def run_extraction(
         print(f"Extracting: {feature_name}")
         print("-" * 50)
 
-    data = extract_feature(parser_func, extractor_func, feature_name, verbose=verbose)
+    data = extract_feature(parser_func, extractor_func, feature_name, verbose=verbose, workers=workers)
 
     if verbose:
         non_empty = sum(1 for v in data.values() if v)
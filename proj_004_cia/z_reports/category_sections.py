@@ -19,41 +19,32 @@ import sys
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from typing import Dict, List, Callable
+from typing import Dict, List, Callable, Optional
 from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
+from proj_004_cia.c_00_transform_utils.parser_registry import LazyParser
+
+# Map raw category names to parser functions.
+# Bound lazily: a section's parser modules are only imported the first time it is parsed.
+_RETURN_MODULES: Dict[str, str] = {
+    'Introduction': 'proj_004_cia.c_01_intoduction.return_introduction_data',
+    'Geography': 'proj_004_cia.c_02_geography.return_geography_data',
+    'People and Society': 'proj_004_cia.c_03_society.return_society_data',
+    'Environment': 'proj_004_cia.c_04_environment.return_environment_data',
+    'Government': 'proj_004_cia.c_05_government.return_government_data',
+    'Economy': 'proj_004_cia.c_06_economy.return_economy_data',
+    'Energy': 'proj_004_cia.c_07_energy.return_energy_data',
+    'Communications': 'proj_004_cia.c_08_communications.return_communications_data',
+    'Transportation': 'proj_004_cia.c_09_transportation.return_transportation_data',
+    'Military and Security': 'proj_004_cia.c_10_military.return_military_data',
+    'Space': 'proj_004_cia.c_11_space.return_space_data',
+    'Terrorism': 'proj_004_cia.c_12_terrorism.return_terrorism_data',
+    'Transnational Issues': 'proj_004_cia.c_13_issues.return_issues_data',
+}
 
-# Import all return_*_data functions for parsed data
-from proj_004_cia.c_01_intoduction.return_introduction_data import return_introduction_data
-from proj_004_cia.c_02_geography.return_geography_data import return_geography_data
-from proj_004_cia.c_03_society.return_society_data import return_society_data
-from proj_004_cia.c_04_environment.return_environment_data import return_environment_data
-from proj_004_cia.c_05_government.return_government_data import return_government_data
-from proj_004_cia.c_06_economy.return_economy_data import return_economy_data
-from proj_004_cia.c_07_energy.return_energy_data import return_energy_data
-from proj_004_cia.c_08_communications.return_communications_data import return_communications_data
-from proj_004_cia.c_09_transportation.return_transportation_data import return_transportation_data
-from proj_004_cia.c_10_military.return_military_data import return_military_data
-from proj_004_cia.c_11_space.return_space_data import return_space_data
-from proj_004_cia.c_12_terrorism.return_terrorism_data import return_terrorism_data
-from proj_004_cia.c_13_issues.return_issues_data import return_issues_data
-
-
-# Map raw category names to parser functions
 CATEGORY_PARSERS: Dict[str, Callable] = {
-    'Introduction': return_introduction_data,
-    'Geography': return_geography_data,
-    'People and Society': return_society_data,
-    'Environment': return_environment_data,
-    'Government': return_government_data,
-    'Economy': return_economy_data,
-    'Energy': return_energy_data,
-    'Communications': return_communications_data,
-    'Transportation': return_transportation_data,
-    'Military and Security': return_military_data,
-    'Space': return_space_data,
-    'Terrorism': return_terrorism_data,
-    'Transnational Issues': return_issues_data,
+    category: LazyParser(module_name) for category, module_name in _RETURN_MODULES.items()
 }
+_MODULE_CATEGORIES: Dict[str, str] = {module_name: category for category, module_name in _RETURN_MODULES.items()}
 
 
 def _build_raw_categories() -> Dict[str, List[str]]:
@@ -82,19 +73,35 @@ def _build_parsed_categories() -> Dict[str, List[str]]:
     return categories
 
 
-# Build the category dictionaries
-RAW_CATEGORIES: Dict[str, List[str]] = _build_raw_categories()
-PARSED_CATEGORIES: Dict[str, List[str]] = _build_parsed_categories()
+# The category dictionaries are built on first access (PARSED_CATEGORIES runs every
+# section parser over USA), not when this module is imported
+_LAZY_CATEGORIES: Dict[str, Callable[[], Dict[str, List[str]]]] = {
+    'RAW_CATEGORIES': _build_raw_categories,
+    'PARSED_CATEGORIES': _build_parsed_categories,
+}
+
+
+def _categories(name: str) -> Dict[str, List[str]]:
+    value = globals().get(name)
+    if value is None:
+        value = globals()[name] = _LAZY_CATEGORIES[name]()
+    return value
+
+
+def __getattr__(name: str):
+    if name in _LAZY_CATEGORIES:
+        return _categories(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_raw_sections(category: str) -> List[str]:
     """Get list of raw section keys for a category."""
-    return RAW_CATEGORIES.get(category, [])
+    return _categories('RAW_CATEGORIES').get(category, [])
 
 
 def get_parsed_sections(category: str) -> List[str]:
     """Get list of parsed output keys for a category."""
-    return PARSED_CATEGORIES.get(category, [])
+    return _categories('PARSED_CATEGORIES').get(category, [])
 
 
 def get_parser(category: str) -> Callable:
@@ -102,29 +109,52 @@ def get_parser(category: str) -> Callable:
     return CATEGORY_PARSERS.get(category)
 
 
+def get_return_module(category: str) -> Optional[str]:
+    """Dotted path of the return_*_data module that parses a category."""
+    return _RETURN_MODULES.get(category)
+
+
+def category_of_parser(parser: Callable) -> Optional[str]:
+    """
+    Category parsed by a return_*_data function (or its LazyParser), None for any other callable.
+
+    Examples:
+        >>> from proj_004_cia.c_06_economy.return_economy_data import return_economy_data
+        >>> category_of_parser(return_economy_data)
+        'Economy'
+    """
+    module_name = getattr(parser, 'module_name', None) or getattr(parser, '__module__', None)
+    category = _MODULE_CATEGORIES.get(module_name)
+    if category is None or getattr(parser, '__name__', None) != module_name.rsplit('.', 1)[-1]:
+        return None
+    return category
+
+
 def list_all_raw() -> None:
     """Print all raw categories and sections."""
+    raw_categories = _categories('RAW_CATEGORIES')
     print("\nRAW Categories and Sections:")
     print("=" * 60)
-    for cat in sorted(RAW_CATEGORIES.keys()):
+    for cat in sorted(raw_categories.keys()):
         print(f"\n{cat}:")
-        for sec in RAW_CATEGORIES[cat]:
+        for sec in raw_categories[cat]:
             print(f"    - {sec}")
 
 
 def list_all_parsed() -> None:
     """Print all parsed categories and sections."""
+    parsed_categories = _categories('PARSED_CATEGORIES')
     print("\nPARSED Categories and Sections:")
     print("=" * 60)
-    for cat in sorted(PARSED_CATEGORIES.keys()):
+    for cat in sorted(parsed_categories.keys()):
         print(f"\n{cat}:")
-        for sec in PARSED_CATEGORIES[cat]:
+        for sec in parsed_categories[cat]:
             print(f"    - {sec}")
 
 
 if __name__ == "__main__":
-    print("RAW_CATEGORIES =", RAW_CATEGORIES)
-    print("\nPARSED_CATEGORIES =", PARSED_CATEGORIES)
+    print("RAW_CATEGORIES =", _categories('RAW_CATEGORIES'))
+    print("\nPARSED_CATEGORIES =", _categories('PARSED_CATEGORIES'))
     print("\n" + "=" * 60)
     list_all_raw()
     print("\n" + "=" * 60)
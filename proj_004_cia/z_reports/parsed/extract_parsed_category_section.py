@@ -4,7 +4,9 @@ Extract Parsed Category Section Data
 Extracts parsed/processed CIA World Factbook data for a specific category
 and optionally a specific section across all countries.
 
-Uses the return_*_data() functions to get fully parsed data.
+Uses the return_*_data() functions to get fully parsed data, read from the
+parsed-section cache (a_04_iso_to_cia_code/parsed_section_cache.py) when the
+raw section and the parser code are unchanged.
 
 Usage:
     python extract_parsed_category_section.py <category> [section]
@@ -23,10 +25,13 @@ from proj_004_cia.z_reports.category_sections import (
     get_parser,
     list_all_parsed
 )
-from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, ISO3_TO_CIA
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import ISO3_TO_CIA
+from proj_004_cia.c_00_transform_utils.python_literal import python_literal
+from proj_004_cia.a_04_iso_to_cia_code.parsed_section_cache import (
+    cached_parse, enable_parsed_section_cache, flush_parsed_section_cache
+)
 import os
 import sys
-import json
 import re
 from datetime import datetime
 from typing import Dict, Any, Optional
@@ -61,10 +66,10 @@ def extract_parsed_section(category: str, section: Optional[str] = None) -> tupl
     results = {}
     errors = []
 
+    enable_parsed_section_cache()
     for iso3Code in ISO3_TO_CIA.keys():
         try:
-            data = load_country_data(iso3Code)
-            parsed = parser(data, iso3Code)
+            parsed = cached_parse(category, parser, iso3Code)
 
             if section and isinstance(parsed, dict):
                 results[iso3Code] = parsed.get(section, None)
@@ -75,17 +80,13 @@ def extract_parsed_section(category: str, section: Optional[str] = None) -> tupl
             errors.append(f"{iso3Code}: {str(e)}")
             results[iso3Code] = None
 
+    flush_parsed_section_cache()
     return results, errors
 
 
 def to_python_format(data: Any) -> str:
     """Convert data to Python-friendly string format (None instead of null, etc.)."""
-    json_str = json.dumps(data, indent=4, ensure_ascii=False, default=str)
-    # Convert JSON syntax to Python syntax
-    json_str = json_str.replace(': null', ': None')
-    json_str = json_str.replace(': true', ': True')
-    json_str = json_str.replace(': false', ': False')
-    return json_str
+    return python_literal(data)
 
 
 def save_report(data: Dict[str, Any], category: str, section: Optional[str], output_dir: str) -> str:
@@ -15,7 +15,6 @@ Output:
 
 import os
 import sys
-import json
 import re
 from datetime import datetime
 from typing import Dict, Any, Union
@@ -23,7 +22,8 @@ from typing import Dict, Any, Union
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
-from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, ISO3_TO_CIA
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_section, ISO3_TO_CIA
+from proj_004_cia.c_00_transform_utils.python_literal import python_literal
 from proj_004_cia.z_reports.category_sections import RAW_CATEGORIES, get_raw_sections, list_all_raw
 
 
@@ -50,8 +50,7 @@ def extract_raw_section(category: str, section: str) -> tuple:
 
     for iso3Code in ISO3_TO_CIA.keys():
         try:
-            data = load_country_data(iso3Code)
-            cat_data = data.get(category, {})
+            cat_data = load_country_section(iso3Code, category, {})
             section_data = cat_data.get(section, None)
 
             if section_data is not None:
@@ -68,12 +67,7 @@ def extract_raw_section(category: str, section: str) -> tuple:
 
 def to_python_format(data: Any) -> str:
     """Convert data to Python-friendly string format (None instead of null, etc.)."""
-    json_str = json.dumps(data, indent=4, ensure_ascii=False, default=str)
-    # Convert JSON syntax to Python syntax
-    json_str = json_str.replace(': null', ': None')
-    json_str = json_str.replace(': true', ': True')
-    json_str = json_str.replace(': false', ': False')
-    return json_str
+    return python_literal(data)
 
 
 def save_report(data: Dict[str, Any], category: str, section: str, output_dir: str) -> str:
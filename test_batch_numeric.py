@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Unit tests for c_00_transform_utils.batch_numeric: the NumPy columns must agree,
+element by element, with extract_numeric_value and parse_percentage_data.
+"""
+
+import sys
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from proj_004_cia.c_00_transform_utils.batch_numeric import extract_numeric_values, parse_percentage_values
+from proj_004_cia.c_00_transform_utils.extract_numeric_value import extract_numeric_value
+from proj_004_cia.c_00_transform_utils.parse_percentage_data import parse_percentage_data
+from proj_004_cia.c_00_transform_utils.quantity_tokenizer import (
+    STATUS_BARE_NUMBER, STATUS_EMPTY, STATUS_NO_MATCH, STATUS_PARSED, STATUS_RANGE, STATUS_SPECIAL,
+    read_numeric, read_numeric_text, read_percentage, read_percentage_text, tokenize_quantity
+)
+
+PLAIN_TEXTS = [
+    '12,429', '0.6', '2023', '4.88% (2023 est.)', '4.88 %(2023 EST)', '15.2% (2022)', '7 (2021 est.)', '31%',
+]
+NUMERIC_TEXTS = [
+    '15-25 years', '2.5 million', '$1.234 trillion (2023 est.)', '1,234.5', 'between 5 and 9',
+    '10 to 20 km', 'NA', 'negligible', 'none', '', None, 42, 'no data',
+]
+PERCENT_TEXTS = [
+    '15.2% (2023 est.)', '4.1% annual average', '0.3 percent monthly', 'about 3', '-1.5% (2020)',
+    'NA', '', None, 'no data',
+]
+
+
+def _same(column_value, expected):
+    if expected is None:
+        return math.isnan(column_value)
+    return column_value == pytest.approx(expected)
+
+
+def test_numeric_columns_match_extract_numeric_value():
+    columns = extract_numeric_values(NUMERIC_TEXTS)
+    assert {len(column) for column in columns.values()} == {len(NUMERIC_TEXTS)}
+    for i, text in enumerate(NUMERIC_TEXTS):
+        assert _same(columns['value'][i], extract_numeric_value(text)), text
+
+
+def test_numeric_columns_describe_ranges_and_statuses():
+    columns = extract_numeric_values(['15-25 years', '2.5 million', 'NA', None, 'no data'])
+    assert list(columns['status']) == [STATUS_RANGE, STATUS_PARSED, STATUS_SPECIAL, STATUS_EMPTY, STATUS_NO_MATCH]
+    assert (columns['min'][0], columns['max'][0], columns['value'][0]) == (15, 25, 20)
+    assert list(columns['is_range']) == [True, False, False, False, False]
+    assert columns['multiplier'][1] == 1_000_000 and columns['value'][1] == 2_500_000
+    assert np.isnan(columns['min'][1])
+
+    assert math.isnan(extract_numeric_values(['15-25 years'], allow_ranges=False)['max'][0])
+
+
+@pytest.mark.parametrize('return_decimal', [True, False])
+def test_percentage_columns_match_parse_percentage_data(return_decimal):
+    columns = parse_percentage_values(PERCENT_TEXTS, return_decimal=return_decimal)
+    for i, text in enumerate(PERCENT_TEXTS):
+        expected = parse_percentage_data(text, return_decimal=return_decimal)
+        assert _same(columns['value'][i], expected.get('value')), text
+        assert _same(columns['percentage'][i], expected.get('percentage')), text
+        assert columns['year'][i] == (expected.get('year') or 0), text
+        assert columns['period'][i] == expected.get('period'), text
+        assert columns['is_estimate'][i] == expected.get('is_estimate', False), text
+        assert bool(expected) == (columns['status'][i] in (STATUS_PARSED, STATUS_BARE_NUMBER)), text
+
+
+def test_percentage_year_can_be_left_out():
+    columns = parse_percentage_values(['15.2% (2023 est.)'], extract_year=False)
+    assert columns['year'][0] == 0 and columns['value'][0] == pytest.approx(0.152)
+
+
+
+@pytest.mark.parametrize('text', PLAIN_TEXTS + ['1,2345', '-1.5%', '.5%', '4.88% (2023 est.) note'])
+def test_plain_quantities_read_like_their_tokens(text):
+    tokens = tokenize_quantity(text)
+    assert read_numeric_text(text) == read_numeric(tokens)
+    assert read_numeric_text(text, unit='km', allow_ranges=False) == read_numeric(tokens, unit='km', allow_ranges=False)
+    assert read_percentage_text(text) == read_percentage(tokens)
+
+
+def test_plain_quantities_skip_the_tokenizer():
+    tokenize_quantity.cache_clear()
+    for text in PLAIN_TEXTS:
+        read_numeric_text(text)
+        read_percentage_text(text)
+    assert tokenize_quantity.cache_info().currsize == 0
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the nearest-rank percentile of benchmark_parsers (the p50 / p95 of each parser).
+
+Nearest rank: the smallest value with at least pct% of the values at or below it,
+i.e. sorted_values[ceil(pct / 100 * N) - 1].
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from proj_004_cia.a_06_parser_benchmark.benchmark_parsers import _percentile
+
+
+@pytest.mark.parametrize('values, pct, expected', [
+    ([], 50, 0.0),
+    ([7.0], 50, 7.0),
+    ([7.0], 99, 7.0),
+    ([1.0, 2.0, 3.0, 4.0], 50, 2.0),
+    ([1.0, 2.0, 3.0, 4.0], 100, 4.0),
+    ([1.0, 2.0, 3.0, 4.0], 0, 1.0),
+    # pct * N lands exactly on a rank: no rounding up to the next one
+    (list(range(1, 11)), 50, 5),
+    (list(range(1, 11)), 90, 9),
+    (list(range(1, 21)), 95, 19),
+    # otherwise the next rank up
+    (list(range(1, 11)), 95, 10),
+    (list(range(1, 11)), 51, 6),
+    ([10.0, 20.0, 30.0], 50, 20.0),
+])
+def test_nearest_rank_percentile(values, pct, expected):
+    assert _percentile(values, pct) == expected
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
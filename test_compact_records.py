@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Unit tests for c_00_transform_utils.compact_records and representation='compact' of
+the return_*_data functions: compact records must read and expand exactly like the
+dict output.
+"""
+
+import sys
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from proj_004_cia.c_00_transform_utils.compact_records import (
+    CompactRecord, apply_representation, compact_output, expand_output
+)
+from proj_004_cia.c_06_economy.return_economy_data import return_economy_data
+
+SERIES = {
+    'current_account_data': [{'year': 2023, 'value': -818.8e9, 'unit': 'USD', 'is_estimate': True},
+                             {'year': 2022, 'value': -971.6e9, 'unit': 'USD', 'is_estimate': True}],
+    'by_partner': {'United States': 0.16, 'Mexico': 0.15},
+    'notes': {'note 1': 'keys with spaces stay a dict', 'items': ['a', {'class': 'keyword key'}]},
+}
+ECONOMY = {
+    'Economy': {
+        'Real GDP growth rate': {
+            'Real GDP growth rate 2023': {'text': '2.54% (2023 est.)'},
+            'Real GDP growth rate 2022': {'text': '1.94% (2022 est.)'},
+        },
+        'Inflation rate (consumer prices)': {'Inflation rate (consumer prices) 2023': {'text': '4.12% (2023 est.)'}},
+        'Exports - partners': {'text': 'Canada 17%, Mexico 16%, China 7% (2022)'},
+    }
+}
+
+
+def test_compact_output_reads_like_the_dicts_and_expands_back():
+    compact = compact_output(SERIES)
+    assert isinstance(compact, CompactRecord) and compact == SERIES
+    record = compact['current_account_data'][0]
+    assert isinstance(record, CompactRecord)
+    assert (record['value'], record.year, record.get('unit'), record.get('missing', 'x')) == (-818.8e9, 2023, 'USD', 'x')
+    assert list(record) == ['year', 'value', 'unit', 'is_estimate'] and len(record) == 4
+    assert type(record) is type(compact['current_account_data'][1])
+
+    # Keys that cannot be slots keep the record a dict
+    assert type(compact['by_partner']) is dict and type(compact['notes']) is dict
+    assert type(compact['notes']['items'][1]) is dict
+
+    assert expand_output(compact) == SERIES
+    assert json.dumps(compact.to_dict()) == json.dumps(SERIES)
+
+
+def test_records_are_read_only_and_pickle():
+    record = compact_output({'year': 2023, 'value': 1.2})
+    with pytest.raises(AttributeError):
+        record.value = 2
+    with pytest.raises(KeyError):
+        record['unit']
+    assert pickle.loads(pickle.dumps(record)) == {'year': 2023, 'value': 1.2}
+
+
+def test_short_strings_are_interned():
+    first = compact_output({'unit': ''.join(['U', 'SD'])})
+    second = compact_output({'unit': ''.join(['US', 'D'])})
+    assert first.unit is second.unit
+
+
+def test_return_data_compact_round_trips_to_the_dict_output():
+    as_dicts = return_economy_data(ECONOMY, 'USA')
+    compact = return_economy_data(ECONOMY, 'USA', representation='compact')
+    assert isinstance(compact['inflation_rate']['inflation_data'][0], CompactRecord)
+    assert expand_output(compact) == as_dicts
+    assert json.dumps(expand_output(compact), sort_keys=True) == json.dumps(as_dicts, sort_keys=True)
+
+    with pytest.raises(ValueError):
+        apply_representation(as_dicts, 'columns')
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit tests for CountryDataCache and load_country_data, on a temp _raw_data folder (see conftest.raw_folder).
+
+Entries are stamped with the source file's (mtime_ns, size): a rewritten country file
+must never be served from the cache.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from conftest import FRA, USA, rewrite_country
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import (
+    CountryDataCache, load_country_data, load_country_section
+)
+
+UPDATED = dict(USA, Economy={'Real GDP growth rate': {'text': '2.8% (2024 est.)'}})
+
+
+def test_cache_hits_until_the_file_changes(raw_folder):
+    cache = CountryDataCache(tokenize_at_load=False)
+    first = cache.get('usa')
+    assert first == USA
+    assert cache.get('USA') is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    rewrite_country(raw_folder / 'north-america' / 'us.json', UPDATED)
+    assert cache.get('USA') == UPDATED
+    assert cache.stats()['invalidations'] == 1
+
+
+def test_cache_evicts_least_recently_used(raw_folder):
+    cache = CountryDataCache(max_entries=1, tokenize_at_load=False)
+    cache.get('USA')
+    cache.get('FRA')
+    assert 'FRA' in cache and 'USA' not in cache
+    assert cache.stats()['evictions'] == 1
+
+
+def test_peek_does_not_serve_a_stale_stamp(raw_folder):
+    cache = CountryDataCache(tokenize_at_load=False)
+    cache.get('USA')
+    stat = (raw_folder / 'north-america' / 'us.json').stat()
+    assert cache.peek('USA', (stat.st_mtime_ns, stat.st_size)) == USA
+    assert cache.peek('USA', (stat.st_mtime_ns + 1, stat.st_size)) is None
+
+
+def test_load_country_data_shares_the_cached_dict_unless_asked_not_to(raw_folder):
+    shared = load_country_data('USA')
+    assert load_country_data('usa') is shared
+    private = load_country_data('USA', use_cache=False)
+    assert private == shared and private is not shared
+
+    rewrite_country(raw_folder / 'north-america' / 'us.json', UPDATED)
+    assert load_country_data('USA') == UPDATED
+    assert load_country_section('USA', 'Economy') == UPDATED['Economy']
+    assert load_country_section('FRA', 'Energy', default={}) == {}
+
+
+def test_unknown_or_missing_country_raises(raw_folder):
+    with pytest.raises(ValueError):
+        load_country_data('XXX')
+    with pytest.raises(FileNotFoundError):
+        load_country_data('DEU')
+    assert load_country_data('FRA') == FRA
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Unit tests for a_04_iso_to_cia_code.country_pack, packing a temp _raw_data folder (see conftest.raw_folder).
+
+The pack must decode to exactly the raw files, section by section, and must never
+be trusted for a country whose raw file changed after it was built.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from conftest import FRA, USA, rewrite_country
+from proj_004_cia.__config.config import Config
+from proj_004_cia.a_04_iso_to_cia_code import country_pack
+from proj_004_cia.a_04_iso_to_cia_code.country_pack import CountryPack, build_country_pack, get_country_pack
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data, load_country_section
+
+
+@pytest.fixture
+def pack_path(raw_folder, tmp_path, monkeypatch):
+    path = tmp_path / 'corpus.pack'
+    monkeypatch.setattr(Config, 'COUNTRY_PACK_ENABLED', True)
+    monkeypatch.setattr(Config, 'COUNTRY_PACK_PATH', str(path))
+    monkeypatch.setitem(country_pack._PACK_STATE, 'key', None)
+    monkeypatch.setitem(country_pack._PACK_STATE, 'pack', None)
+    yield path
+    pack = country_pack._PACK_STATE['pack']
+    if pack is not None:
+        pack.close()
+
+
+def test_pack_round_trips_sections_in_file_order(pack_path):
+    stats = build_country_pack()
+    assert (stats['countries'], stats['sections']) == (2, 3)
+    assert 'DEU' in stats['skipped']
+
+    pack = CountryPack(str(pack_path))
+    try:
+        assert pack.countries() == ['FRA', 'USA']
+        assert pack.section_names('usa') == ['Introduction', 'Economy']
+        assert list(pack.read_country('USA')) == list(USA)
+        assert pack.read_country('USA') == USA
+        assert pack.read_section('FRA', 'Economy') == FRA['Economy']
+        assert pack.read_section('FRA', 'Energy', default={}) == {}
+        with pytest.raises(KeyError):
+            pack.read_section('DEU', 'Economy')
+    finally:
+        pack.close()
+
+
+def test_loaders_read_the_pack_while_the_raw_files_are_unchanged(pack_path, raw_folder):
+    build_country_pack()
+    pack = get_country_pack()
+    assert pack is not None and get_country_pack() is pack
+
+    # Only the pack is deployed: the loaders fall back to its stamps
+    for path in raw_folder.rglob('*.json'):
+        path.unlink()
+    assert load_country_section('USA', 'Economy') == USA['Economy']
+    assert load_country_data('FRA', use_cache=False) == FRA
+
+
+def test_pack_is_bypassed_for_a_rewritten_country_file(pack_path, raw_folder):
+    build_country_pack()
+    updated = dict(USA, Economy={'Real GDP growth rate': {'text': '2.8% (2024 est.)'}})
+    rewrite_country(raw_folder / 'north-america' / 'us.json', updated)
+
+    assert load_country_section('USA', 'Economy') == updated['Economy']
+    assert load_country_data('USA', use_cache=False) == updated
+    assert load_country_section('FRA', 'Economy') == FRA['Economy']
+
+
+def test_rebuilt_pack_is_reopened(pack_path, raw_folder):
+    build_country_pack()
+    first = get_country_pack()
+    rewrite_country(raw_folder / 'europe' / 'fr.json', {'Energy': {}})
+    build_country_pack()
+    assert get_country_pack() is not first
+    assert get_country_pack().read_country('FRA') == {'Energy': {}}
+
+
+def test_unreadable_pack_is_ignored(pack_path):
+    pack_path.write_bytes(b'NOTAPACK' + bytes(64))
+    with pytest.raises(ValueError):
+        CountryPack(str(pack_path))
+    assert get_country_pack() is None
+    assert load_country_section('USA', 'Economy') == USA['Economy']
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
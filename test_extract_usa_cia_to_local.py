@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for b_01_extract.extract_usa_cia_to_local's incremental rebuild, run on
+a process pool over a temp _raw_data folder (see conftest.raw_folder).
+
+Workers plan their own country; a partial rebuild re-parses only the stale
+sections and merges them into the sections saved by the previous run.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from conftest import USA, rewrite_country, write_country
+from proj_004_cia.b_01_extract.extract_usa_cia_to_local import extract_usa_cia_to_local
+from proj_004_cia.b_01_extract.rebuild_manifest import RebuildManifest
+
+GEOGRAPHY = {'Location': {'text': 'North America, bordering both the North Atlantic Ocean and the North Pacific Ocean'}}
+
+
+@pytest.fixture
+def extract(raw_folder, tmp_path):
+    write_country(raw_folder, 'USA', dict(USA, Geography=GEOGRAPHY))
+    save_dir = tmp_path / '_data_per_country'
+    save_dir.mkdir()
+
+    def run(**kwargs):
+        return extract_usa_cia_to_local(countries=['USA', 'FRA'], enable_performance_monitoring=False,
+                                        raw_data_folder=str(raw_folder), local_usa_cia_save_dir=str(save_dir),
+                                        **kwargs)
+    run.save_dir = save_dir
+    return run
+
+
+def test_pool_rebuilds_only_stale_sections_on_the_saved_ones(extract, raw_folder):
+    first = extract(workers=2)
+    assert (first['processed'], first['errors'], first['workers']) == (2, 0, 2)
+    assert first['rebuilt_sections'] == {'FRA': ['introduction', 'geography', 'government'],
+                                         'USA': ['introduction', 'geography', 'government']}
+
+    second = extract(workers=2)
+    assert (second['processed'], second['rebuilt_sections'], second['unchanged']) == (0, {}, ['FRA', 'USA'])
+
+    # Untouched sections come from the saved sections, never from re-parsing or the .py output
+    manifest = RebuildManifest.load(str(extract.save_dir))
+    saved = manifest.load_sections('USA')
+    saved['introduction'] = {'background': 'carried “over”'}
+    manifest.save_sections('USA', saved)
+
+    moved = {'Location': {'text': 'North America, between Canada and Mexico'}}
+    rewrite_country(raw_folder / 'north-america' / 'us.json', dict(USA, Geography=moved))
+    third = extract(workers=2)
+    assert (third['rebuilt_sections'], third['unchanged']) == ({'USA': ['geography']}, ['FRA'])
+
+    merged = RebuildManifest.load(str(extract.save_dir)).load_sections('USA')
+    assert merged['introduction'] == {'background': 'carried “over”'}
+    assert merged['geography']['location'] == 'North America, between Canada and Mexico'
+    assert merged['government'] == saved['government']
+    assert 'carried "over"' in (extract.save_dir / 'USA_cia_meta.py').read_text(encoding='utf-8')
+    assert extract(workers=2)['unchanged'] == ['FRA', 'USA']
+
+
+def test_dry_run_reports_the_plan_without_writing(extract):
+    result = extract(workers=2, dry_run=True)
+    assert result['status'] == 'dry_run'
+    assert result['would_rebuild'] == {'FRA': ['introduction', 'geography', 'government'],
+                                       'USA': ['introduction', 'geography', 'government']}
+    assert list(extract.save_dir.iterdir()) == []
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Unit tests for t_nation_features_batch.feature_matrix's disk cache, on a temp
+_raw_data folder (see conftest.raw_folder): a cache hit must not discover or run
+any extractor, and a changed raw file must rebuild the matrix.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from conftest import rewrite_country, write_country
+from proj_004_cia.__config.config import Config
+from proj_004_cia.t_nation_features_batch import feature_matrix
+from proj_004_cia.t_nation_features_batch.feature_matrix import extract_feature_matrix, matrix_cache_key
+
+GINI = 'Gini Index coefficient - distribution of family income'
+COUNTRIES = ['USA', 'FRA']
+
+
+def _economy(gini_text):
+    return {'Economy': {GINI: {f'{GINI} 2022': {'text': gini_text}}}}
+
+
+@pytest.fixture
+def gini_folder(raw_folder, monkeypatch):
+    monkeypatch.setattr(Config, 'PARSED_CACHE_ENABLED', False)
+    monkeypatch.setenv('PARSED_CACHE_ENABLED', 'false')
+    write_country(raw_folder, 'USA', _economy('41.3 (2022 est.)'))
+    write_country(raw_folder, 'FRA', _economy('31.5 (2022 est.)'))
+    return raw_folder
+
+
+def test_key_follows_the_raw_stamps_and_the_request(gini_folder):
+    key = matrix_cache_key(['gini'], COUNTRIES)
+    assert matrix_cache_key(['gini', 'gini'], COUNTRIES) == key
+    assert matrix_cache_key(['budget'], COUNTRIES) != key
+    assert matrix_cache_key(['gini'], ['USA']) != key
+
+    rewrite_country(gini_folder / 'europe' / 'fr.json', _economy('29.8 (2022 est.)'))
+    assert matrix_cache_key(['gini'], COUNTRIES) != key
+
+
+def test_hit_skips_discovery_and_a_raw_change_rebuilds(gini_folder, tmp_path, monkeypatch):
+    path = str(tmp_path / 'matrix.npz')
+    discovered = []
+    discover = feature_matrix.discover_feature_specs
+    monkeypatch.setattr(feature_matrix, 'discover_feature_specs', lambda: discovered.append(1) or discover())
+
+    first = extract_feature_matrix(['gini'], COUNTRIES, use_cache=True, path=path)
+    assert first.countries == COUNTRIES and len(discovered) == 1
+    gini_column = next(name for name in first.names if 'latest' in name)
+    assert first.country('USA')[gini_column] == 41.3
+
+    cached = extract_feature_matrix(['gini'], COUNTRIES, use_cache=True, path=path)
+    assert len(discovered) == 1
+    assert cached.key == first.key and cached.country('FRA') == first.country('FRA')
+
+    rewrite_country(gini_folder / 'europe' / 'fr.json', _economy('29.8 (2022 est.)'))
+    rebuilt = extract_feature_matrix(['gini'], COUNTRIES, use_cache=True, path=path)
+    assert len(discovered) == 2
+    assert rebuilt.country('FRA')[gini_column] == 29.8
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Unit tests for t_nation_features_batch.feature_store, on features saved to a temp directory.
+"""
+
+import sys
+import math
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from proj_004_cia.__config.config import Config
+from proj_004_cia.c_00_transform_utils.python_literal import python_literal
+from proj_004_cia.t_nation_features_batch import feature_store
+from proj_004_cia.t_nation_features_batch.feature_specs import ARRAY, DICT
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    feature_store.clear_feature_cache()
+    yield
+    feature_store.clear_feature_cache()
+
+
+def _python_source(name, data):
+    return lambda: f'"""Nation Feature Dictionary: {name}"""\n\n{name.upper()} = {python_literal(data)}\n'
+
+
+def test_python_literal_round_trips_non_finite_floats(tmp_path):
+    data = {'USA': {'rate': math.nan, 'bounds': [math.inf, -math.inf, 1.5, None], 'note': "float('nan')"}}
+    feature_store.save_feature_files(data, 'rates', str(tmp_path), DICT, ['py'], _python_source('rates', data))
+
+    loaded = feature_store.load_feature('rates', output_dir=str(tmp_path))
+    assert math.isnan(loaded['USA']['rate'])
+    assert loaded['USA']['bounds'] == [math.inf, -math.inf, 1.5, None]
+    assert loaded['USA']['note'] == "float('nan')"
+
+
+def test_json_writes_non_json_values_as_strings(tmp_path):
+    data = {'USA': {'updated': date(2024, 1, 31), 'value': 1.5}}
+    feature_store.save_feature_files(data, 'updates', str(tmp_path), DICT, ['json'])
+
+    loaded = feature_store.load_feature('updates', output_dir=str(tmp_path))
+    assert loaded == {'USA': {'updated': '2024-01-31', 'value': 1.5}}
+
+
+def test_failed_format_leaves_no_files_or_manifest_entry(tmp_path):
+    data = {'USA': {'value': 1.5}}
+
+    def broken_source():
+        raise RuntimeError('source failed')
+
+    with pytest.raises(RuntimeError):
+        feature_store.save_feature_files(data, 'broken', str(tmp_path), DICT, ['pickle', 'json', 'py'],
+                                         broken_source)
+    assert list(tmp_path.iterdir()) == []
+    assert feature_store.read_manifest(str(tmp_path))['features'] == {}
+
+    with pytest.raises(ValueError):
+        feature_store.save_feature_files(data, 'broken', str(tmp_path), DICT, ['pickle', 'py'])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_manifest_merges_entries_and_replaces_a_resaved_feature(tmp_path):
+    output_dir = str(tmp_path)
+    feature_store.save_feature_files({'USA': {'a': 1}, 'FRA': {}}, 'alpha', output_dir, DICT, ['pickle'])
+    feature_store.save_feature_files({'USA': ['x']}, 'beta', output_dir, ARRAY, ['json'])
+    feature_store.save_feature_files({'USA': {'a': 2}}, 'alpha', output_dir, DICT, ['json', 'pickle'])
+
+    features = feature_store.read_manifest(output_dir)['features']
+    assert list(features) == ['alpha', 'beta']
+    assert features['alpha']['files'] == {'json': 'alpha.json', 'pickle': 'alpha.pkl'}
+    assert (features['alpha']['countries'], features['alpha']['non_empty']) == (1, 1)
+    assert feature_store.list_features(output_dir=output_dir) == [(DICT, 'alpha'), (ARRAY, 'beta')]
+    assert feature_store.feature_file('alpha', output_dir=output_dir) == ('pickle', str(tmp_path / 'alpha.pkl'))
+    with pytest.raises(KeyError):
+        feature_store.feature_file('alpha', kind=ARRAY, output_dir=output_dir)
+
+
+def test_loaded_features_are_cached_until_rewritten(tmp_path):
+    output_dir = str(tmp_path)
+    feature_store.save_feature_files({'USA': {'a': 1}}, 'alpha', output_dir, DICT, ['pickle'])
+    first = feature_store.load_feature('alpha', output_dir=output_dir)
+    assert feature_store.load_feature('alpha', output_dir=output_dir) is first
+
+    feature_store.save_feature_files({'USA': {'a': 2, 'b': 3}}, 'alpha', output_dir, DICT, ['pickle'])
+    assert feature_store.load_feature('alpha', output_dir=output_dir) == {'USA': {'a': 2, 'b': 3}}
+
+
+def test_feature_cache_evicts_least_recently_loaded(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'FEATURE_LOAD_CACHE_MAX_ENTRIES', 2)
+    output_dir = str(tmp_path)
+    for name in ('alpha', 'beta', 'gamma'):
+        feature_store.save_feature_files({'USA': {name: 1}}, name, output_dir, DICT, ['pickle'])
+
+    alpha = feature_store.load_feature('alpha', output_dir=output_dir)
+    beta = feature_store.load_feature('beta', output_dir=output_dir)
+    assert feature_store.load_feature('alpha', output_dir=output_dir) is alpha
+    feature_store.load_feature('gamma', output_dir=output_dir)
+
+    assert feature_store.load_feature('alpha', output_dir=output_dir) is alpha
+    assert feature_store.load_feature('beta', output_dir=output_dir) is not beta
+
+
+def _save_features(output_dir, names):
+    for name in names:
+        feature_store.save_feature_files({'USA': {'name': name}}, name, output_dir, DICT, ['json'])
+
+
+def test_concurrent_savers_keep_every_manifest_entry(tmp_path):
+    names = [[f"feature_{worker}_{i}" for i in range(10)] for worker in range(4)]
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        for future in [pool.submit(_save_features, str(tmp_path), chunk) for chunk in names]:
+            future.result()
+
+    saved = feature_store.read_manifest(str(tmp_path))['features']
+    assert sorted(saved) == sorted(name for chunk in names for name in chunk)
+    assert not (tmp_path / feature_store.MANIFEST_LOCK_NAME).exists()
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Regression test for the get_* dispatchers against the pre-registry if-chains.
+
+test_data/get_dispatch_baseline.json holds a digest of json.dumps(get_*(data, info, iso3Code)) for
+every info the section registries know, for WLD and USA, taken from the if-chain implementation.
+Every info must still resolve for every country (only the world_* entries and the two WLD-only
+geography texts are gated to WLD), so the digests must not change.
+
+Re-record after an intended output change:
+    python test_get_dispatch_baseline.py --write
+"""
+
+import os
+import sys
+import json
+import hashlib
+import logging
+import importlib
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+BASELINE_PATH = PROJECT_ROOT / 'test_data' / 'get_dispatch_baseline.json'
+
+DISPATCHERS = {
+    'get_introduction': ('proj_004_cia.c_01_intoduction.helper.get_introduction', 'INTRODUCTION_REGISTRY'),
+    'get_geography': ('proj_004_cia.c_02_geography.helper.get_geography', 'GEOGRAPHY_REGISTRY'),
+    'get_society': ('proj_004_cia.c_03_society.helper.get_society', 'SOCIETY_REGISTRY'),
+    'get_environment': ('proj_004_cia.c_04_environment.helper.get_environment', 'ENVIRONMENT_REGISTRY'),
+    'get_government': ('proj_004_cia.c_05_government.helper.get_government', 'GOVERNMENT_REGISTRY'),
+    'get_economy': ('proj_004_cia.c_06_economy.helper.get_economy', 'ECONOMY_REGISTRY'),
+    'get_energy': ('proj_004_cia.c_07_energy.helper.get_energy', 'ENERGY_REGISTRY'),
+    'get_communications': ('proj_004_cia.c_08_communications.helper.get_communications', 'COMMUNICATIONS_REGISTRY'),
+    'get_transportation': ('proj_004_cia.c_09_transportation.helper.get_transportation', 'TRANSPORTATION_REGISTRY'),
+    'get_military': ('proj_004_cia.c_10_military.helper.get_military', 'MILITARY_REGISTRY'),
+    'get_space': ('proj_004_cia.c_11_space.helper.get_space', 'SPACE_REGISTRY'),
+    'get_terrorism': ('proj_004_cia.c_12_terrorism.helper.get_terrorism', 'TERRORISM_REGISTRY'),
+    'get_issues': ('proj_004_cia.c_13_issues.helper.get_issues', 'ISSUES_REGISTRY'),
+}
+
+
+def digest(value) -> str:
+    text = json.dumps(value, default=str, ensure_ascii=False)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def dispatch_digests(countries):
+    """{'ISO|get_x|info': digest (or 'ERR <type>')} of every registered info."""
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
+
+    digests = {}
+    for iso3Code in countries:
+        data = load_country_data(iso3Code)
+        for function_name, (module_name, registry_name) in DISPATCHERS.items():
+            module = importlib.import_module(module_name)
+            function = getattr(module, function_name)
+            for info in dict.fromkeys(spec.info for spec in getattr(module, registry_name)):
+                try:
+                    result = digest(function(data, info, iso3Code))
+                except Exception as e:
+                    result = f"ERR {type(e).__name__}"
+                digests[f"{iso3Code}|{function_name}|{info}"] = result
+    return digests
+
+
+@pytest.fixture(scope='module')
+def baseline():
+    with open(BASELINE_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope='module')
+def current(baseline):
+    logging.disable(logging.CRITICAL)
+    try:
+        return dispatch_digests(baseline['countries'])
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def test_every_baseline_info_is_still_registered(baseline, current):
+    missing = sorted(set(baseline['digests']) - set(current))
+    assert not missing, f"{len(missing)} get_* infos no longer registered: {missing[:10]}"
+
+
+@pytest.mark.parametrize('iso3Code', ['WLD', 'USA'])
+def test_get_dispatch_matches_baseline(baseline, current, iso3Code):
+    changed = [key for key, value in baseline['digests'].items()
+               if key.startswith(f"{iso3Code}|") and current.get(key) != value]
+    assert not changed, f"{len(changed)} get_* results differ from the baseline: {changed[:10]}"
+
+
+def test_world_entries_stay_gated_to_wld():
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
+    from proj_004_cia.c_06_economy.helper.get_economy import get_economy
+
+    data = load_country_data('USA')
+    assert get_economy(data, 'world_economy', 'USA') is None
+    assert get_economy(load_country_data('WLD'), 'exports', 'WLD') is not None
+
+
+@pytest.mark.parametrize('info, key_path', [
+    ('current_account_balance', 'Current account balance'),
+    ('debt_external', 'Debt - external'),
+    ('exports', 'Exports'),
+    ('inflation_rate', 'Inflation rate (consumer prices)'),
+    ('public_debt', 'Public debt'),
+    ('unemployment_rate', 'Unemployment rate'),
+])
+def test_economy_parsers_read_the_callers_data(info, key_path):
+    # The pass_data parsers must parse the subtree they are handed, not reload the country file
+    from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import load_country_data
+    from proj_004_cia.c_06_economy.helper.get_economy import get_economy
+
+    usa, fra = load_country_data('USA'), load_country_data('FRA')
+    data = dict(usa, Economy=dict(usa['Economy'], **{key_path: fra['Economy'][key_path]}))
+    result = get_economy(data, info, 'USA')
+    assert result and result == get_economy(fra, info, 'FRA')
+    assert result != get_economy(usa, info, 'USA')
+
+
+if __name__ == '__main__':
+    if '--write' in sys.argv:
+        logging.disable(logging.CRITICAL)
+        countries = ['WLD', 'USA']
+        os.makedirs(BASELINE_PATH.parent, exist_ok=True)
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'countries': countries, 'digests': dispatch_digests(countries)}, f, indent=1)
+        print(f"Wrote {BASELINE_PATH}")
+    else:
+        sys.exit(pytest.main([__file__, '-q']))
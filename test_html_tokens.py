@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for c_00_transform_utils.html_tokens: the plain text must be exactly what
+re.sub(r'<[^>]+>', '', raw) gives, and parsers must get the tokens built when the
+country was loaded.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from conftest import write_country
+from proj_004_cia.a_04_iso_to_cia_code import iso3Code_to_cia_code
+from proj_004_cia.a_04_iso_to_cia_code.iso3Code_to_cia_code import CountryDataCache, load_country_data
+from proj_004_cia.c_00_transform_utils import html_tokens as html_tokens_module
+from proj_004_cia.c_00_transform_utils.html_tokens import (
+    BREAK, html_tokens, strip_tags, tokenize_country, tokenize_html
+)
+
+RESOURCES = '<em>metropolitan France:</em> coal, timber; <em>French Guiana</em><em>:</em> gold'
+NOTE = 'leased by the US<br><br><strong>note:</strong> <b>see</b> <a href="#x">Cuba</a>'
+TEXTS = [
+    RESOURCES,
+    NOTE,
+    '<p>wrapped <small>fine print</small></p>',
+    '<strong>outer <em>inner</em> tail</strong> after',
+    '<em>unclosed label text',
+    'stray </strong> close and a < b comparison',
+    '< not a tag > and <BR/> upper case',
+    'no markup at all',
+    '',
+]
+
+
+@pytest.mark.parametrize('text', TEXTS)
+def test_plain_text_is_the_tag_stripped_raw(text):
+    tokens = tokenize_html(text)
+    assert tokens.plain == re.sub(r'<[^>]+>', '', text)
+    assert ''.join(segment for _, segment in tokens.segments) == tokens.plain
+    assert tokens.has_markup == ('<' in text and tokens.plain != text)
+
+
+def test_labelled_runs_sections_and_lines():
+    tokens = tokenize_html(RESOURCES)
+    assert tokens.sections('em') == [('metropolitan France:', ' coal, timber; '), ('French Guiana:', ' gold')]
+    assert tokens.labelled('em') == ['metropolitan France:', 'French Guiana:']
+    assert tokens.without('em') == ' coal, timber;  gold'
+
+    note = tokenize_html(NOTE)
+    assert note.lines() == ['leased by the US', '', 'note: see Cuba']
+    assert note.sections('strong') == [(None, 'leased by the US\n\n'), ('note:', ' see Cuba')]
+    assert note.labelled('b') == ['see']
+    assert (BREAK, '') in note.segments
+
+    nested = tokenize_html('<strong>outer <em>inner</em> tail</strong> after')
+    assert nested.segments == (('strong', 'outer '), ('em', 'inner'), ('strong', ' tail'), (None, ' after'))
+
+
+def test_tokenize_country_collects_each_markup_string_once():
+    data = {'Geography': {'Natural resources': {'text': RESOURCES}, 'Note': [NOTE, 'plain', RESOURCES]}}
+    tokens = tokenize_country(data)
+    assert sorted(tokens) == sorted([RESOURCES, NOTE])
+    assert tokens[NOTE].plain == strip_tags(NOTE)
+
+
+def test_parsers_reuse_the_tokens_built_at_load(raw_folder, monkeypatch):
+    write_country(raw_folder, 'FRA', {'Geography': {'Natural resources': {'text': RESOURCES}}})
+    cache = CountryDataCache(tokenize_at_load=True)
+    monkeypatch.setattr(iso3Code_to_cia_code, 'COUNTRY_DATA_CACHE', cache)
+    # html_tokens binds the cache's lookup on first use
+    monkeypatch.setattr(html_tokens_module, '_peek_country_tokens', None)
+
+    assert html_tokens(RESOURCES, 'FRA') is not html_tokens(RESOURCES, 'FRA')
+    load_country_data('FRA')
+    loaded = cache.peek_tokens('FRA')[RESOURCES]
+    assert html_tokens(RESOURCES, 'FRA') is loaded
+    assert html_tokens(NOTE, 'FRA') is not html_tokens(NOTE, 'FRA')
+    assert strip_tags(RESOURCES, 'FRA') == loaded.plain
+    assert html_tokens(42).plain == '42'
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
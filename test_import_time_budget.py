@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Import-time budget for the section dispatchers.
+
+Imports each section entry point in a fresh interpreter under `python -X importtime`
+and fails when:
+    - importing it pulls in any helper/utils/parse_* module (parsers must stay lazy), or
+    - its cumulative import time (best of a few runs) exceeds the budget.
+
+Budget override:
+    CIA_IMPORT_BUDGET_MS=300 python test_import_time_budget.py
+"""
+
+import os
+import re
+import sys
+import subprocess
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# Cumulative import time allowed per entry point, in milliseconds
+IMPORT_BUDGET_MS = float(os.environ.get('CIA_IMPORT_BUDGET_MS', 200))
+RUNS = int(os.environ.get('CIA_IMPORT_BUDGET_RUNS', 3))
+
+ENTRY_POINTS = [
+    'proj_004_cia.c_01_intoduction.return_introduction_data',
+    'proj_004_cia.c_02_geography.return_geography_data',
+    'proj_004_cia.c_03_society.return_society_data',
+    'proj_004_cia.c_04_environment.return_environment_data',
+    'proj_004_cia.c_05_government.return_government_data',
+    'proj_004_cia.c_06_economy.return_economy_data',
+    'proj_004_cia.c_07_energy.return_energy_data',
+    'proj_004_cia.c_08_communications.return_communications_data',
+    'proj_004_cia.c_09_transportation.return_transportation_data',
+    'proj_004_cia.c_10_military.return_military_data',
+    'proj_004_cia.c_11_space.return_space_data',
+    'proj_004_cia.c_12_terrorism.return_terrorism_data',
+    'proj_004_cia.c_13_issues.return_issues_data',
+    'proj_004_cia.z_reports.category_sections',
+]
+
+_IMPORTTIME_LINE = re.compile(r'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)\s*$')
+_PARSER_MODULE = re.compile(r'\.helper\.utils\.parse_')
+
+
+def measure_import(module_name: str):
+    """
+    Import `module_name` in a fresh interpreter.
+
+    Returns:
+        (cumulative import time in ms, list of every module it imported)
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get('PYTHONPATH')]))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module_name} failed:\n{result.stderr[-2000:]}")
+
+    cumulative_us = None
+    modules = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        modules.append(match.group(4))
+        if match.group(4) == module_name and len(match.group(3)) <= 1:
+            cumulative_us = int(match.group(2))
+    if cumulative_us is None:
+        raise RuntimeError(f"No importtime entry for {module_name}")
+    return cumulative_us / 1000, modules
+
+
+def check_entry_point(module_name: str):
+    """Return (best time in ms, eagerly imported parser modules) for one entry point."""
+    best_ms = None
+    parser_modules = []
+    for _ in range(RUNS):
+        elapsed_ms, modules = measure_import(module_name)
+        best_ms = elapsed_ms if best_ms is None else min(best_ms, elapsed_ms)
+        parser_modules = [m for m in modules if _PARSER_MODULE.search(m)]
+    return best_ms, parser_modules
+
+
+def test_import_time_budget():
+    failures = []
+    for module_name in ENTRY_POINTS:
+        best_ms, parser_modules = check_entry_point(module_name)
+        if parser_modules:
+            failures.append(f"{module_name} eagerly imports {len(parser_modules)} parser modules "
+                            f"(e.g. {parser_modules[0]})")
+        if best_ms > IMPORT_BUDGET_MS:
+            failures.append(f"{module_name} takes {best_ms:.1f} ms to import (budget {IMPORT_BUDGET_MS:.0f} ms)")
+    assert not failures, "\n".join(failures)
+
+
+if __name__ == "__main__":
+    failed = False
+    print(f"Import budget: {IMPORT_BUDGET_MS:.0f} ms, best of {RUNS} runs")
+    print("=" * 100)
+    for module_name in ENTRY_POINTS:
+        best_ms, parser_modules = check_entry_point(module_name)
+        ok = best_ms <= IMPORT_BUDGET_MS and not parser_modules
+        failed = failed or not ok
+        print(f"{'OK  ' if ok else 'FAIL'} {best_ms:8.1f} ms  {len(parser_modules):3d} parser modules  {module_name}")
+    print("=" * 100)
+    sys.exit(1 if failed else 0)
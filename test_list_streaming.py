@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the streaming list parsers (iter_text_to_list, iter_list_from_string)
+and c_00_transform_utils.aggregate_items: the generators must yield exactly the
+items of the list parsers, which must match the implementations before the rewrite.
+"""
+
+import sys
+import itertools
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from conftest import write_country
+from proj_004_cia.a_06_parser_benchmark.benchmark_list_streaming import compare_outputs
+from proj_004_cia.c_00_transform_utils.aggregate_items import (
+    count_field_items, count_items, iter_field_texts, iter_items, unique_items
+)
+from proj_004_cia.c_00_transform_utils.parse_list_from_string import iter_list_from_string, parse_list_from_string
+from proj_004_cia.c_00_transform_utils.parse_text_to_list import iter_text_to_list, parse_text_to_list
+
+TEXTS = [
+    'coal, iron ore (hematite, magnetite), timber',
+    'petroleum; natural gas; and fish etc.',
+    'English 78.2%, Spanish 13.4% (includes Puerto Rico), other 8.4% (2017 est.)',
+    '• rice • wheat • maize',
+    '1. agriculture 2. industry 3. services',
+    'gold | silver | copper',
+    'bauxite\ngold\n\ndiamonds',
+    'tourism - textiles - wine among others',
+    '(unbalanced (parentheses), ok); second',
+    '<em>metropolitan France:</em> coal, timber',
+    'single item',
+    '   ',
+    '',
+    None,
+    42,
+]
+
+
+def _option_sets(option_names):
+    for values in itertools.product((True, False), repeat=len(option_names)):
+        yield dict(zip(option_names, values))
+
+
+@pytest.mark.parametrize('options', list(_option_sets(['respect_parentheses', 'smart_splitting', 'clean_items'])))
+def test_iter_text_to_list_yields_the_list_parser_items(options):
+    for text in TEXTS:
+        assert list(iter_text_to_list(text, **options)) == parse_text_to_list(text, **options), text
+
+
+@pytest.mark.parametrize('options', list(_option_sets(['strip_items', 'remove_empty', 'clean_items',
+                                                       'smart_delimiters'])))
+def test_iter_list_from_string_yields_the_list_parser_items(options):
+    for delimiter in (',', ';'):
+        for text in TEXTS:
+            assert list(iter_list_from_string(text, delimiter, **options)) == \
+                parse_list_from_string(text, delimiter, **options), text
+
+
+def test_list_parsers_match_the_previous_implementations():
+    assert compare_outputs([text for text in TEXTS if isinstance(text, str)]) == {
+        'parse_text_to_list': [], 'parse_list_from_string': []}
+
+
+def test_aggregation_streams_into_sets_and_counters():
+    texts = ['coal, coal, timber', None, 'timber; gold']
+    assert list(iter_items(texts)) == ['coal', 'coal', 'timber', 'timber', 'gold']
+    assert unique_items(texts) == {'coal', 'timber', 'gold'}
+    assert count_items(texts) == Counter({'timber': 2, 'coal': 1, 'gold': 1})
+    assert count_items(texts, per_text=False) == Counter({'coal': 2, 'timber': 2, 'gold': 1})
+    assert unique_items(['coal; and timber etc.'], splitter=iter_list_from_string) == {'coal', 'timber'}
+
+
+def test_field_texts_are_loaded_one_country_at_a_time(raw_folder):
+    write_country(raw_folder, 'USA', {'Geography': {'Natural resources': {'text': 'coal, copper, timber'}}})
+    write_country(raw_folder, 'FRA', {'Geography': {'Natural resources': {'text': 'coal, timber, gypsum'}}})
+    countries = ['USA', 'FRA', 'DEU', 'XXX']
+
+    assert list(iter_field_texts(('Geography', 'Natural resources'), countries, with_code=True)) == [
+        ('USA', 'coal, copper, timber'), ('FRA', 'coal, timber, gypsum')]
+    assert count_field_items(('Geography', 'Natural resources'), countries) == Counter(
+        {'coal': 2, 'timber': 2, 'copper': 1, 'gypsum': 1})
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Unit tests for a_04_iso_to_cia_code.parsed_section_cache, on caches in a temp directory.
+
+Covers the two hashes an entry is served under (raw subtree, parser code), corrupt
+data files, compaction / invalidation, and cached_parse end to end.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from proj_004_cia.__config.config import Config
+from proj_004_cia.a_04_iso_to_cia_code import parsed_section_cache
+from proj_004_cia.a_04_iso_to_cia_code.parsed_section_cache import (
+    ParsedSectionCache, cached_parse, enable_parsed_section_cache, hash_raw_section
+)
+from proj_004_cia.b_01_extract import rebuild_manifest
+
+ECONOMY = {'Real GDP (purchasing power parity)': {'text': '$25.676 trillion (2023 est.)'}}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ParsedSectionCache(str(tmp_path / 'cache'))
+    yield cache
+    cache.close()
+
+
+def _reopen(cache):
+    cache.close()
+    return ParsedSectionCache(cache.directory)
+
+
+def test_flushed_entries_are_served_by_a_new_process(cache):
+    cache.put('usa', 'Economy', 'raw1', 'parser1', {'gdp': 25.676})
+    assert cache.get('USA', 'Economy', 'raw1', 'parser1') == (True, {'gdp': 25.676})
+    assert cache.flush() == 1
+
+    reopened = _reopen(cache)
+    assert reopened.get('USA', 'Economy', 'raw1', 'parser1') == (True, {'gdp': 25.676})
+    assert (reopened.hits, reopened.misses) == (1, 0)
+    reopened.close()
+
+
+def test_changed_raw_section_or_parser_code_is_a_miss(cache):
+    cache.put('USA', 'Economy', 'raw1', 'parser1', {'gdp': 25.676})
+    cache.flush()
+
+    reopened = _reopen(cache)
+    assert reopened.get('USA', 'Economy', 'raw2', 'parser1') == (False, None)
+    assert reopened.get('USA', 'Economy', 'raw1', 'parser2') == (False, None)
+    assert reopened.get('FRA', 'Economy', 'raw1', 'parser1') == (False, None)
+    assert reopened.misses == 3
+    reopened.close()
+
+
+def test_corrupt_data_file_is_a_miss(cache):
+    cache.put('USA', 'Economy', 'raw1', 'parser1', {'note': 'x' * 200})
+    cache.flush()
+    offset, length = cache.entries()['USA|Economy'][2:4]
+    data_path = Path(cache.data_path(cache.stats()['generation']))
+    cache.close()
+
+    # A flipped byte inside the string still unpickles; only the checksum catches it
+    blob = bytearray(data_path.read_bytes())
+    blob[offset + length // 2] ^= 0x01
+    data_path.write_bytes(bytes(blob))
+
+    reopened = ParsedSectionCache(cache.directory)
+    assert reopened.get('USA', 'Economy', 'raw1', 'parser1') == (False, None)
+    reopened.close()
+
+
+def test_compaction_drops_overwritten_blobs(cache):
+    for value in range(5):
+        cache.put('USA', 'Economy', 'raw1', 'parser1', {'gdp': value, 'pad': 'x' * 1000})
+        cache.flush()
+    cache.put('FRA', 'Economy', 'raw1', 'parser1', {'gdp': 3.1})
+    cache.flush()
+    old_generation = cache.stats()['generation']
+
+    result = cache.compact()
+    assert result['entries_before'] == result['entries_after'] == 2
+    assert result['bytes_after'] < result['bytes_before']
+    assert not Path(cache.data_path(old_generation)).exists()
+
+    reopened = _reopen(cache)
+    assert reopened.get('USA', 'Economy', 'raw1', 'parser1') == (True, {'gdp': 4, 'pad': 'x' * 1000})
+    assert reopened.get('FRA', 'Economy', 'raw1', 'parser1') == (True, {'gdp': 3.1})
+    reopened.close()
+
+
+def test_invalidate_by_section_keeps_the_others(cache):
+    cache.put('USA', 'Economy', 'raw1', 'parser1', 1)
+    cache.put('USA', 'Energy', 'raw1', 'parser1', 2)
+    cache.flush()
+    cache.put('FRA', 'Economy', 'raw1', 'parser1', 3)
+
+    cache.invalidate(sections=['Economy'])
+    assert sorted(cache.entries()) == ['USA|Energy']
+    assert cache.get('FRA', 'Economy', 'raw1', 'parser1') == (False, None)
+
+
+def test_raw_hash_is_shared_with_the_rebuild_manifest():
+    data = {'Economy': ECONOMY}
+    assert hash_raw_section(ECONOMY) == rebuild_manifest.hash_raw_section(data, 'economy')
+    # Key order is part of the content: parsers walk the sections in file order
+    assert hash_raw_section({'a': 1, 'b': 2}) != hash_raw_section({'b': 2, 'a': 1})
+
+
+def test_cache_is_off_until_an_entry_point_enables_it(monkeypatch):
+    monkeypatch.setattr(Config, 'PARSED_CACHE_ENABLED', False)
+    monkeypatch.setenv('PARSED_CACHE_ENABLED', 'false')
+    assert enable_parsed_section_cache() is False
+    assert parsed_section_cache.get_parsed_section_cache() is None
+
+    monkeypatch.delenv('PARSED_CACHE_ENABLED')
+    assert enable_parsed_section_cache() is True
+    assert os.environ['PARSED_CACHE_ENABLED'] == 'true'
+
+
+@pytest.fixture
+def shared_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'PARSED_CACHE_ENABLED', True)
+    monkeypatch.setattr(Config, 'PARSED_CACHE_DIR', str(tmp_path / 'shared'))
+    monkeypatch.setitem(parsed_section_cache._CACHE_STATE, 'cache', None)
+    monkeypatch.setitem(parsed_section_cache._CACHE_STATE, 'directory', None)
+    yield
+    cache = parsed_section_cache._CACHE_STATE['cache']
+    if cache is not None:
+        cache.close()
+
+
+def test_cached_parse_reparses_after_a_parser_or_raw_change(shared_cache, monkeypatch):
+    calls = []
+
+    def parse_economy(data, iso3Code):
+        calls.append(iso3Code)
+        return {'iso3Code': iso3Code, 'fields': sorted(data['Economy'])}
+
+    data = {'Economy': ECONOMY}
+    first = cached_parse('Economy', parse_economy, 'USA', data)
+    assert cached_parse('Economy', parse_economy, 'USA', data) == first
+    assert calls == ['USA']
+
+    changed = {'Economy': dict(ECONOMY, **{'Inflation rate (consumer prices)': {'text': '4.1%'}})}
+    assert cached_parse('Economy', parse_economy, 'USA', changed)['fields'] != first['fields']
+    assert calls == ['USA', 'USA']
+
+    monkeypatch.setattr(parsed_section_cache, 'parser_version', lambda section: 'edited parser code')
+    cached_parse('Economy', parse_economy, 'USA', data)
+    assert calls == ['USA', 'USA', 'USA']
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
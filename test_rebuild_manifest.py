@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Unit tests for b_01_extract.rebuild_manifest: which _data_per_country sections an
+incremental extract run re-parses, and the parsed sections a partial rebuild
+merges into, on manifests in a temp directory.
+"""
+
+import os
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from proj_004_cia.a_04_iso_to_cia_code.content_hash import shared_parser_sources
+from proj_004_cia.b_01_extract.rebuild_manifest import (
+    MANIFEST_FILE_NAME, MANIFEST_VERSION, RebuildManifest, hash_header, hash_parser_sources, plan_country
+)
+from proj_004_cia.c_06_economy.return_economy_data import return_economy_data
+from proj_004_cia.c_07_energy.return_energy_data import return_energy_data
+
+DATA = {
+    'Economy': {'Real GDP growth rate': {'text': '2.5% (2023 est.)'}},
+    'Energy': {'Electricity access': {'text': '100% (2022)'}},
+}
+SECTIONS = [('economy', return_economy_data), ('energy', return_energy_data)]
+HEADER = hash_header('United States of America', 'North America')
+# As parsed: write_country_meta_file turns the curly quotes straight in the .py output
+META = {'country_name': 'United States', 'economy': {'note': '\u201cadvanced\u201d economy'}, 'energy': {}}
+CHANGED = dict(DATA, Energy={'Electricity access': {'text': '99% (2023)'}})
+
+
+@pytest.fixture
+def output_path(tmp_path):
+    path = tmp_path / 'USA_cia_meta.py'
+    path.write_text('USA_cia_meta = ' + json.dumps({'economy': {}, 'energy': {}}), encoding='utf-8')
+    return path
+
+
+def _recorded(tmp_path, output_path):
+    manifest = RebuildManifest.load(str(tmp_path))
+    current, stale, _ = plan_country(manifest, 'USA', DATA, str(output_path), HEADER, SECTIONS)
+    assert stale == ['economy', 'energy']
+    manifest.record('USA', output_path.name, HEADER, current)
+    manifest.save_sections('USA', META)
+    manifest.save()
+    return RebuildManifest.load(str(tmp_path))
+
+
+def test_unchanged_country_rebuilds_nothing(tmp_path, output_path):
+    manifest = _recorded(tmp_path, output_path)
+    _, stale, _ = plan_country(manifest, 'USA', DATA, str(output_path), HEADER, SECTIONS)
+    assert stale == []
+
+
+def test_raw_change_rebuilds_only_that_section_on_the_saved_sections(tmp_path, output_path):
+    manifest = _recorded(tmp_path, output_path)
+    _, stale, previous = plan_country(manifest, 'USA', CHANGED, str(output_path), HEADER, SECTIONS)
+    assert stale == ['energy']
+    assert previous == META
+    assert previous['economy']['note'] == '\u201cadvanced\u201d economy'
+
+
+def test_header_change_force_or_missing_output_rebuilds_everything(tmp_path, output_path):
+    manifest = _recorded(tmp_path, output_path)
+    other_header = hash_header('United States', 'North America')
+    assert plan_country(manifest, 'USA', DATA, str(output_path), other_header, SECTIONS)[1] == ['economy', 'energy']
+    assert plan_country(manifest, 'USA', DATA, str(output_path), HEADER, SECTIONS, force=True)[1] == [
+        'economy', 'energy']
+
+    output_path.unlink()
+    assert plan_country(manifest, 'USA', DATA, str(output_path), HEADER, SECTIONS)[1] == ['economy', 'energy']
+
+
+def test_missing_or_unreadable_saved_sections_rebuild_everything(tmp_path, output_path):
+    manifest = _recorded(tmp_path, output_path)
+    sections_path = Path(manifest.sections_path('USA'))
+    sections_path.write_bytes(b'not a pickle')
+    _, stale, previous = plan_country(manifest, 'USA', CHANGED, str(output_path), HEADER, SECTIONS)
+    assert stale == ['economy', 'energy'] and previous is None
+
+    sections_path.unlink()
+    _, stale, previous = plan_country(manifest, 'USA', CHANGED, str(output_path), HEADER, SECTIONS)
+    assert stale == ['economy', 'energy'] and previous is None
+
+
+def test_parser_change_marks_the_section_stale(tmp_path, output_path):
+    manifest = _recorded(tmp_path, output_path)
+    manifest.countries['USA']['sections']['economy']['parser'] = 'older parser code'
+    _, stale, _ = plan_country(manifest, 'USA', DATA, str(output_path), HEADER, SECTIONS)
+    assert stale == ['economy']
+
+
+def test_parser_hash_covers_the_raw_data_loaders():
+    loaders = [path for path in shared_parser_sources() if os.path.isfile(path)]
+    assert {os.path.basename(path) for path in loaders} == {'iso3Code_to_cia_code.py', 'country_pack.py'}
+    assert hash_parser_sources('proj_004_cia.c_06_economy') != hash_parser_sources('proj_004_cia.c_07_energy')
+
+
+def test_manifest_of_another_version_starts_empty(tmp_path):
+    (tmp_path / MANIFEST_FILE_NAME).write_text(
+        json.dumps({'version': MANIFEST_VERSION - 1, 'countries': {'USA': {}}}), encoding='utf-8')
+    assert RebuildManifest.load(str(tmp_path)).countries == {}
+
+    (tmp_path / MANIFEST_FILE_NAME).write_text('{', encoding='utf-8')
+    assert RebuildManifest.load(str(tmp_path)).countries == {}
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Unit tests for a_06_parser_benchmark.regex_profiler: importing the package must not
+install anything, and patterns compiled while profiling must keep working as
+re.Pattern objects after the profiler is disabled.
+"""
+
+import re
+import sys
+import pickle
+import subprocess
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from proj_004_cia.a_06_parser_benchmark.regex_profiler import regex_profile
+
+
+def _compile_in_package(source):
+    namespace = {'__name__': 'proj_004_cia.profiled_module'}
+    exec(source, namespace)
+    return namespace
+
+
+def test_package_import_installs_nothing():
+    code = ('import re, sys; search = re.search; import proj_004_cia; '
+            'print(re.search is search, "proj_004_cia.__config.config" in sys.modules)')
+    result = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    assert result.stdout.split() == ['True', 'False']
+
+
+def test_patterns_are_recorded_per_caller():
+    # Compiles are re cache misses
+    re.purge()
+    with regex_profile() as profiler:
+        namespace = _compile_in_package("import re\n"
+                                        "NUMBER = re.compile(r'\\d+')\n"
+                                        "found = NUMBER.findall('a1b22')\n"
+                                        "swapped = re.sub(NUMBER, '#', 'x9')\n")
+    assert (namespace['found'], namespace['swapped']) == (['1', '22'], 'x#')
+    stats = profiler.to_json()['patterns']
+    assert [entry['pattern'] for entry in stats] == [r'\d+']
+    assert stats[0]['calls'] == 3 and stats[0]['compiles'] == 1
+    assert stats[0]['callers'][0]['caller'] == 'profiled_module:<module>'
+    assert not hasattr(re.search, '__wrapped__')
+
+
+def test_profiled_patterns_stay_patterns_after_disable():
+    with regex_profile():
+        pattern = _compile_in_package("import re\nNUMBER = re.compile(r'\\d+')\n")['NUMBER']
+
+    assert isinstance(pattern, re.Pattern) and type(pattern) is not re.Pattern
+    assert re.compile(pattern) is pattern
+    assert re.sub(pattern, '#', 'a12b') == 'a#b'
+    assert pattern.fullmatch('42') and pattern.pattern == r'\d+'
+    assert pickle.loads(pickle.dumps(pattern)) == pattern
+    with pytest.raises(ValueError):
+        re.compile(pattern, re.IGNORECASE)
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Unit tests for c_00_transform_utils.year_series and the economy parsers built on it:
+"<Metric> <Year>" siblings are read newest year first into the historical
+<prefix>_data / _latest_value / _latest_year / _unit output.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from proj_004_cia.c_00_transform_utils.year_series import (
+    YearSeries, extract_year_series, stack_year_series, year_of_key
+)
+from proj_004_cia.c_06_economy.helper.utils.parse_inflation_rate import parse_inflation_rate
+
+EXPORTS = {
+    'Exports 2021': {'text': '$2.567 trillion (2021 est.)'},
+    'Exports 2023': {'text': '$3.052 trillion (2023 est.)'},
+    'Exports 2022': {'text': '$2.995 trillion (2022 est.)'},
+    'note': 'balance of payments basis',
+    'Exports': {'text': '$1 trillion'},
+    'Exports 2020': {'text': ''},
+}
+
+
+def test_series_is_newest_first_and_skips_notes_and_yearless_keys():
+    series = extract_year_series(EXPORTS)
+    assert series.years == [2023, 2022, 2021]
+    assert series.values == [3.052e12, 2.995e12, 2.567e12]
+    assert series.units == [None] * 3
+    assert series.is_estimate == [True] * 3
+    assert series.texts[0] == '$3.052 trillion (2023 est.)'
+    assert list(series)[0] == (2023, 3.052e12, None, True)
+
+
+def test_to_fields_builds_the_standard_block():
+    fields = extract_year_series(EXPORTS).to_fields('exports')
+    # Dollar amounts carry no unit in the economy profile: the key is left out, not None
+    assert fields['exports_data'][0] == {'year': 2023, 'value': 3.052e12, 'is_estimate': True}
+    assert (fields['exports_latest_value'], fields['exports_latest_year']) == (3.052e12, 2023)
+    assert 'exports_unit' not in fields
+
+    rates = extract_year_series({'Unemployment rate 2023': {'text': '3.6% (2023 est.)'},
+                                 'Unemployment rate 2022': {'text': '3.6% (2022 est.)'}})
+    assert rates.to_fields('rate')['rate_unit'] == '%'
+    without_units = rates.to_fields('rate', include_unit=False)
+    assert 'rate_unit' not in without_units and 'unit' not in without_units['rate_data'][0]
+    assert extract_year_series({}).to_fields('exports') == {}
+    assert extract_year_series(None).to_fields('exports') == {}
+
+
+def test_text_only_series_keeps_years_and_texts():
+    series = extract_year_series({'Remittances 2022': {'text': '0.03% of GDP (2022 est.)'}}, profile=None)
+    assert (series.years, series.values, series.texts) == ([2022], [None], ['0.03% of GDP (2022 est.)'])
+    assert series.to_records() == [{'year': 2022}]
+
+
+def test_year_of_key_reads_the_first_four_digits():
+    assert year_of_key('Real GDP (purchasing power parity) 2023') == 2023
+    assert year_of_key('Exports') is None
+
+
+def test_stack_year_series_gives_long_columns():
+    columns = stack_year_series({'USA': extract_year_series(EXPORTS), 'FRA': YearSeries([2023], [None])})
+    assert list(columns['iso3Code']) == ['USA'] * 3 + ['FRA']
+    assert list(columns['year']) == [2023, 2022, 2021, 2023] and columns['year'].dtype == np.int32
+    assert columns['value'][0] == 3.052e12 and np.isnan(columns['value'][3])
+
+
+def test_parser_output_on_the_shared_series():
+    inflation = parse_inflation_rate('USA', pass_data={
+        'Inflation rate (consumer prices) 2022': {'text': '8% (2022 est.)'},
+        'Inflation rate (consumer prices) 2023': {'text': '4.12% (2023 est.)'},
+        'note': 'annual % change based on consumer prices',
+    })
+    assert inflation == {
+        'inflation_note': 'annual % change based on consumer prices',
+        'inflation_data': [{'year': 2023, 'value': 4.12, 'unit': '%', 'is_estimate': True},
+                           {'year': 2022, 'value': 8.0, 'unit': '%', 'is_estimate': True}],
+        'inflation_latest_value': 4.12,
+        'inflation_latest_year': 2023,
+        'inflation_unit': '%',
+    }
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))